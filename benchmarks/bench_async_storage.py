@@ -0,0 +1,130 @@
+"""
+Benchmark: N uploads de vídeo contra um stand-in local do GCS (FakeGCSServer,
+com latência simulada por request), com I/O bloqueante dentro do event loop
+(como GCSStorage.store_stream em uma view ASGI) vs. AsyncGCSStorage.
+
+Além do tempo total mede o maior atraso do event loop durante os uploads:
+é o tempo em que nenhuma outra request do worker seria atendida.
+
+    python benchmarks/bench_async_storage.py [--uploads 20] [--size-kib 1024]
+        [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import http.client
+import sys
+import time
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+
+from src.core._shared.infra.storage.async_gcs_storage import (  # noqa: E402
+    AsyncGCSStorage,
+)
+from src.core._shared.infra.storage.fake_gcs_server import (  # noqa: E402
+    FakeGCSServer,
+)
+
+BUCKET = "codeflix"
+CHUNK_SIZE = 256 * 1024
+
+
+def blocking_upload(url: str, name: str, content: bytes) -> None:
+    connection = http.client.HTTPConnection(urlsplit(url).netloc)
+    connection.request(
+        "POST",
+        f"/upload/storage/v1/b/{BUCKET}/o?uploadType=resumable&name={quote(name)}",
+    )
+    response = connection.getresponse()
+    response.read()
+    location = urlsplit(response.headers["Location"])
+    session = f"{location.path}?{location.query}"
+
+    for offset in range(0, len(content), CHUNK_SIZE):
+        chunk = content[offset : offset + CHUNK_SIZE]
+        connection.request(
+            "PUT",
+            session,
+            body=chunk,
+            headers={
+                "Content-Range": f"bytes {offset}-{offset + len(chunk) - 1}"
+                f"/{len(content)}"
+            },
+        )
+        connection.getresponse().read()
+    connection.close()
+
+
+async def measure(upload_all) -> tuple[float, float]:
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal max_lag
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, time.perf_counter() - start - 0.001)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await upload_all()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticker_task
+    return elapsed, max_lag
+
+
+async def main(uploads: int, size: int, latency: float) -> None:
+    # Servidor em outro thread/loop: o loop medido é só o do "worker"
+    with FakeGCSServer(latency=latency).running_in_thread() as server:
+        await run(server, uploads, size, latency)
+
+
+async def run(server: FakeGCSServer, uploads: int, size: int, latency: float) -> None:
+    content = b"x" * size
+    names = [f"videos/{i}/video.mp4" for i in range(uploads)]
+
+    async def blocking():
+        for name in names:
+            blocking_upload(server.url, name, content)
+
+    storage = AsyncGCSStorage(
+        bucket=BUCKET, endpoint=server.url, max_connections=uploads
+    )
+    storage.CHUNK_SIZE = CHUNK_SIZE
+    # Aquecimento: imports tardios do httpx e criação do pool acontecem uma
+    # vez por processo, não a cada upload
+    await storage.store(Path("warmup"), b"")
+
+    async def concurrent():
+        await asyncio.gather(
+            *(storage.store_stream(Path(name), [content]) for name in names)
+        )
+
+    print(
+        f"{uploads} uploads de {size // 1024} KiB, "
+        f"latência {latency * 1000:.0f} ms/request"
+    )
+    for label, upload_all in [("bloqueante", blocking), ("async", concurrent)]:
+        elapsed, max_lag = await measure(upload_all)
+        print(
+            f"  {label:<10} total {elapsed * 1000:8.1f} ms"
+            f"   maior atraso do loop {max_lag * 1000:8.1f} ms"
+        )
+    await storage.close()
+
+    assert all(server.objects[(BUCKET, name)] == content for name in names)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--uploads", type=int, default=20)
+    parser.add_argument("--size-kib", type=int, default=1024)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.uploads, args.size_kib * 1024, args.latency_ms / 1000))
@@ -0,0 +1,100 @@
+"""
+Micro-benchmark: serialização de uma página de listagem com o plano de campos
+pré-computado (ListResponseSerializer) vs. to_representation do DRF por item.
+
+    python benchmarks/bench_list_serializer.py [--page-size 1000] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import timeit
+from pathlib import Path
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_project.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from src.core._shared.application.use_cases.list_use_case import (  # noqa: E402
+    ListOutputMeta,
+    ListResponse,
+)
+from src.core.category.application.use_cases.list_category import (  # noqa: E402
+    CategoryOutput,
+)
+from src.core.genre.application.use_cases.list_genre import GenreOutput  # noqa: E402
+from src.django_project.category_app.serializers import (  # noqa: E402
+    CategoryResponseSerializer,
+    ListCategoryResponseSerializer,
+)
+from src.django_project.genre_app.serializers import (  # noqa: E402
+    GenreOutputSerializer,
+    ListGenreOutputSerializer,
+)
+
+
+def drf_per_item(item_serializer, response: ListResponse) -> list[dict]:
+    return [item_serializer.to_representation(item) for item in response.data]
+
+
+def bench(name, list_serializer, item_serializer, items, repeat):
+    response = ListResponse(data=items, meta=ListOutputMeta(total=len(items)))
+    assert list_serializer(response).data["data"] == drf_per_item(
+        item_serializer(), response
+    )
+
+    drf = min(
+        timeit.repeat(
+            lambda: drf_per_item(item_serializer(), response), number=1, repeat=repeat
+        )
+    )
+    fast = min(
+        timeit.repeat(lambda: list_serializer(response).data, number=1, repeat=repeat)
+    )
+    print(
+        f"{name:<10} items={len(items):<6} drf={drf * 1000:8.2f}ms "
+        f"fast={fast * 1000:8.2f}ms speedup={drf / fast:5.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    categories = [
+        CategoryOutput(
+            id=uuid4(),
+            name=f"Category {i}",
+            description="Description",
+            is_active=True,
+        )
+        for i in range(args.page_size)
+    ]
+    genres = [
+        GenreOutput(
+            id=uuid4(),
+            name=f"Genre {i}",
+            categories={uuid4() for _ in range(3)},
+            is_active=True,
+        )
+        for i in range(args.page_size)
+    ]
+
+    bench(
+        "category",
+        ListCategoryResponseSerializer,
+        CategoryResponseSerializer,
+        categories,
+        args.repeat,
+    )
+    bench("genre", ListGenreOutputSerializer, GenreOutputSerializer, genres, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,2 @@
 DEFAULT_PAGINATION_SIZE = 2
+MAX_PAGINATION_SIZE = 1000
@@ -1,14 +1,22 @@
+import base64
+import binascii
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Generic, TypeVar, Protocol
+from typing import Any, Generic, TypeVar, Protocol
+from uuid import UUID
 
 from src import config
+from src.core._shared.application.use_cases.exceptions import InvalidCursor
+from src.core._shared.domain.pagination import Page, PageQuery, SortDirection
 
 
 @dataclass
 class ListRequest:
     order_by: str = "name"
     current_page: int = 1
+    cursor: str | None = None
+    per_page: int | None = None
 
 
 @dataclass
@@ -16,6 +24,7 @@ class ListOutputMeta:
     current_page: int = 1
     per_page: int = config.DEFAULT_PAGINATION_SIZE
     total: int = 0
+    next_cursor: str | None = None
 
 
 T = TypeVar("T")
@@ -24,7 +33,10 @@ Output = TypeVar("Output")
 
 
 class Repository(Protocol[Entity]):
-    def list(self) -> list[Entity]:
+    def paginate(self, query: PageQuery) -> Page[Entity]:
+        ...
+
+    async def apaginate(self, query: PageQuery) -> Page[Entity]:
         ...
 
 
@@ -37,29 +49,109 @@ class ListUseCase(Generic[Entity, Output], ABC):
         pass
 
     def execute(self, request: ListRequest) -> "ListResponse[Output]":
-        entities = self.repository.list()
-        ordered_entities = sorted(
-            entities,
-            key=lambda entity: getattr(entity, request.order_by),
-        )
-        page_offset = (request.current_page - 1) * config.DEFAULT_PAGINATION_SIZE
-        entities_page = ordered_entities[
-            page_offset : page_offset + config.DEFAULT_PAGINATION_SIZE
-        ]
+        # Ordenação e paginação são delegadas ao repositório (ORDER BY/LIMIT)
+        query = build_page_query(request)
+        return self._to_response(request, query, self._paginate(request, query))
+
+    async def aexecute(self, request: ListRequest) -> "ListResponse[Output]":
+        query = build_page_query(request)
+        page = await self._apaginate(request, query)
+        return self._to_response(request, query, page)
+
+    def _paginate(self, request: ListRequest, query: PageQuery) -> Page[Entity]:
+        return self.repository.paginate(query)
+
+    async def _apaginate(self, request: ListRequest, query: PageQuery) -> Page[Entity]:
+        return await self.repository.apaginate(query)
+
+    def _to_response(
+        self, request: ListRequest, query: PageQuery, page: Page[Entity]
+    ) -> "ListResponse[Output]":
+        next_cursor = None
+        if page.has_next and page.items:
+            last = page.items[-1]
+            next_cursor = encode_cursor(
+                query.order_by, query.direction, getattr(last, query.order_by), last.id
+            )
 
         return ListResponse(
-            data=sorted(
-                [self._to_output(entity) for entity in entities_page],
-                key=lambda output: getattr(output, request.order_by),
-            ),
+            data=[self._to_output(entity) for entity in page.items],
             meta=ListOutputMeta(
-                current_page=request.current_page,
-                per_page=config.DEFAULT_PAGINATION_SIZE,
-                total=len(entities),
+                current_page=max(request.current_page, 1),
+                per_page=query.limit,
+                total=page.total,
+                next_cursor=next_cursor,
             ),
         )
 
 
+def build_page_query(request: ListRequest) -> PageQuery:
+    order_by, direction = request.order_by, SortDirection.ASC
+    if order_by.startswith("-"):
+        order_by, direction = order_by[1:], SortDirection.DESC
+
+    current_page = max(request.current_page, 1)
+    # Tamanho da página escolhido pelo cliente, limitado pelo servidor
+    per_page = request.per_page
+    if per_page is None:
+        per_page = config.DEFAULT_PAGINATION_SIZE
+    per_page = min(max(per_page, 1), config.MAX_PAGINATION_SIZE)
+    if request.cursor:
+        # Com cursor a página é definida pelo keyset, não pelo OFFSET
+        return PageQuery(
+            order_by=order_by,
+            direction=direction,
+            limit=per_page,
+            after=decode_cursor(request.cursor, order_by, direction),
+        )
+
+    return PageQuery(
+        order_by=order_by,
+        direction=direction,
+        offset=(current_page - 1) * per_page,
+        limit=per_page,
+    )
+
+
+def encode_cursor(
+    order_by: str, direction: SortDirection, value: Any, id: UUID
+) -> str:
+    payload = json.dumps([order_by, direction.value, value, str(id)], default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(
+    cursor: str, order_by: str, direction: SortDirection
+) -> tuple[Any, UUID]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursor(f"Invalid cursor: {cursor}")
+
+    # Cursor vem do cliente: formato [order_by, direção, valor, id], com
+    # valor escalar e não nulo, antes de chegar ao ORM
+    if not (
+        isinstance(payload, list)
+        and len(payload) == 4
+        and all(isinstance(item, str) for item in payload[:2])
+        and isinstance(payload[2], (str, int, float))
+        and isinstance(payload[3], str)
+    ):
+        raise InvalidCursor(f"Invalid cursor: {cursor}")
+
+    cursor_order_by, cursor_direction, value, id = payload
+    try:
+        id = UUID(id)
+    except ValueError:
+        raise InvalidCursor(f"Invalid cursor: {cursor}")
+
+    # O cursor só é válido para a mesma ordenação que o gerou
+    if (cursor_order_by, cursor_direction) != (order_by, direction.value):
+        raise InvalidCursor("Cursor does not match the requested ordering")
+
+    return value, id
+
+
 @dataclass
 class ListResponse(Generic[Output]):
     data: list[Output] = field(default_factory=list)
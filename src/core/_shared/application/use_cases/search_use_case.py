@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from typing import Protocol
+from uuid import UUID
+
+from src.core._shared.application.use_cases.list_use_case import (
+    Entity,
+    ListOutputMeta,
+    ListRequest,
+    ListResponse,
+    ListUseCase,
+    Output,
+    build_page_query,
+)
+from src.core._shared.domain.search import SearchEngine
+
+
+@dataclass
+class SearchRequest:
+    text: str
+    current_page: int = 1
+    per_page: int | None = None
+
+
+class SearchableRepository(Protocol[Entity]):
+    def get_by_ids(self, ids: set[UUID]) -> list[Entity]: ...
+
+
+class SearchUseCase(ListUseCase[Entity, Output]):
+    """
+    Busca textual paginada por número de página, em ordem de relevância.
+
+    Reaproveita o _to_output do caso de uso de listagem da entidade, ex.:
+    class SearchCategory(SearchUseCase[Category, CategoryOutput], ListCategory)
+    """
+
+    entity_type: str
+
+    def __init__(
+        self, repository: SearchableRepository[Entity], search_engine: SearchEngine
+    ) -> None:
+        super().__init__(repository)
+        self.search_engine = search_engine
+
+    def execute(self, request: SearchRequest) -> ListResponse[Output]:
+        query = build_page_query(
+            ListRequest(current_page=request.current_page, per_page=request.per_page)
+        )
+        page = self.search_engine.search(
+            self.entity_type, request.text, offset=query.offset, limit=query.limit
+        )
+
+        # Uma busca em lote; a ordem de relevância vem do motor de busca
+        entities = {
+            entity.id: entity for entity in self.repository.get_by_ids(set(page.items))
+        }
+        return ListResponse(
+            data=[self._to_output(entities[id]) for id in page.items if id in entities],
+            meta=ListOutputMeta(
+                current_page=max(request.current_page, 1),
+                per_page=query.limit,
+                total=page.total,
+            ),
+        )
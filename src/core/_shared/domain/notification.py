@@ -10,6 +10,10 @@ class Notification:
     def add_error(self, error: str) -> None:
         self._errors.append(error)
 
+    @property
+    def errors(self) -> List[str]:
+        return list(self._errors)
+
     @property
     def messages(self) -> str:
         return ",".join(self._errors)
@@ -0,0 +1,57 @@
+import heapq
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Generic, Iterable, TypeVar
+from uuid import UUID
+
+from src import config
+
+T = TypeVar("T")
+
+
+class SortDirection(str, Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+@dataclass
+class PageQuery:
+    order_by: str = "name"
+    direction: SortDirection = SortDirection.ASC
+    offset: int = 0
+    limit: int = config.DEFAULT_PAGINATION_SIZE
+    # Keyset: (valor de order_by, id) do último item da página anterior
+    after: tuple[Any, UUID] | None = None
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T] = field(default_factory=list)
+    total: int = 0
+    has_next: bool = False
+
+
+def paginate_in_memory(entities: Iterable[T], query: PageQuery) -> Page[T]:
+    # Seleção parcial: O(n log k), com k = offset + limit, sem ordenar tudo
+    entities = list(entities)
+    key = lambda entity: (getattr(entity, query.order_by), entity.id)
+    descending = query.direction == SortDirection.DESC
+
+    candidates = entities
+    if query.after is not None:
+        after = tuple(query.after)
+        candidates = [
+            entity
+            for entity in entities
+            if (key(entity) < after if descending else key(entity) > after)
+        ]
+
+    size = query.offset + query.limit
+    select = heapq.nlargest if descending else heapq.nsmallest
+    ordered = select(size + 1, candidates, key=key)
+
+    return Page(
+        items=ordered[query.offset : size],
+        total=len(entities),
+        has_next=len(ordered) > size,
+    )
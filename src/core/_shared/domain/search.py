@@ -0,0 +1,56 @@
+import re
+import unicodedata
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable
+from uuid import UUID
+
+from src.core._shared.domain.pagination import Page
+
+MIN_PREFIX_LENGTH = 3
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+    entity_type: str
+    entity_id: UUID
+    # title pesa mais que body no ranking
+    title: str
+    body: str = ""
+
+
+class SearchEngine(ABC):
+    @abstractmethod
+    def index(self, documents: Iterable[SearchDocument]) -> None:
+        """Insere ou substitui os documentos (chave: entity_type + entity_id)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, entity_type: str, entity_ids: Iterable[UUID]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def search(
+        self, entity_type: str, text: str, offset: int = 0, limit: int = 10
+    ) -> Page[UUID]:
+        """
+        Ids que contêm todos os termos, por relevância. O último termo vale
+        como prefixo se tiver ao menos MIN_PREFIX_LENGTH caracteres.
+        """
+        raise NotImplementedError
+
+
+def normalize_text(text: str) -> str:
+    # Minúsculas e sem acentos: "Ação" e "acao" são o mesmo termo
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def search_terms(text: str) -> list[str]:
+    return re.findall(r"\w+", normalize_text(text))
+
+
+def is_prefix(term: str) -> bool:
+    # Prefixos curtos expandem para boa parte do vocabulário e obrigam a
+    # ranquear quase todo o índice; abaixo disso o termo precisa ser exato
+    return len(term) >= MIN_PREFIX_LENGTH
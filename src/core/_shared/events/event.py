@@ -1,17 +1,23 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import TypeVar
 
 
 @dataclass(frozen=True, kw_only=True)
 class Event(ABC):
+    # Identidade da mensagem publicada (ex.: id da linha do outbox), usada pelos
+    # consumidores para descartar reentregas; não faz parte do payload
+    message_id: str | None = field(default=None, compare=False, repr=False)
+
     @property
     def type(self) -> str:
         return self.__class__.__name__
 
     @property
     def payload(self) -> dict:
-        return asdict(self)
+        payload = asdict(self)
+        del payload["message_id"]
+        return payload
 
     def __str__(self) -> str:
         return f"{self.type}: {self.payload}"
@@ -20,11 +20,15 @@ logger = logging.getLogger(__name__)
 
 
 class MessageBus(AbstractMessageBus):
-    def __init__(self):
+    def __init__(self, raise_errors: bool = False):
+        # raise_errors: propaga falhas dos handlers (ex.: relay do outbox faz retry)
+        self.raise_errors = raise_errors
         self.handlers: dict[Type[TEvent], List[Handler[TEvent]]] = {
             AudioVideoMediaUpdatedIntegrationEvent: [
                 PublishAudioVideoMediaUpdatedHandler(
-                    dispatcher=RabbitMQDispatcher(queue="videos.new")
+                    dispatcher=RabbitMQDispatcher(
+                        queue="videos.new", confirm_delivery=True
+                    )
                 ),
             ],
             AudioVideoMediaUpdated: [
@@ -38,5 +42,7 @@ class MessageBus(AbstractMessageBus):
                 try:
                     handler.handle(event)
                 except Exception:
+                    if self.raise_errors:
+                        raise
                     logger.exception("Exception handling event %s", event)
                     continue
@@ -0,0 +1,115 @@
+import copy
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable
+
+# Sentinela para diferenciar "não está no cache" de um valor None
+MISSING = object()
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """Retorna o valor ou MISSING"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class LocalLRUCache(CacheBackend):
+    """
+    LRU em memória do processo com TTL por entrada.
+
+    Guarda e devolve cópias: entidades são mutáveis e os casos de uso alteram
+    o objeto recebido antes de chamar update.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return MISSING
+
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TieredCache(CacheBackend):
+    """
+    Cache em camadas: local (L1) na frente de um cache compartilhado (L2).
+    Um acerto no L2 repopula o L1; escrita e invalidação atingem as duas camadas.
+    """
+
+    def __init__(self, local: CacheBackend, shared: CacheBackend):
+        self.local = local
+        self.shared = shared
+
+    def get(self, key: str) -> Any:
+        value = self.local.get(key)
+        if value is not MISSING:
+            return value
+
+        value = self.shared.get(key)
+        if value is not MISSING:
+            self.local.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.shared.set(key, value)
+        self.local.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self.shared.delete(key)
+        self.local.delete(key)
+
+    def clear(self) -> None:
+        self.shared.clear()
+        self.local.clear()
@@ -0,0 +1,118 @@
+import threading
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from src.core._shared.infra.cache.backends import MISSING, CacheBackend
+
+
+@dataclass
+class CacheMetrics:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class RepositoryCache:
+    """
+    Cache de entidades por id de um agregado, compartilhado pelo processo.
+
+    Repositórios são instanciados a cada request; o RepositoryCache é criado
+    uma vez por agregado e mantém o backend e as métricas de hit/miss.
+    """
+
+    def __init__(self, namespace: str, backend: CacheBackend):
+        self.namespace = namespace
+        self.backend = backend
+        self._metrics = CacheMetrics()
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        with self._lock:
+            return CacheMetrics(**vars(self._metrics))
+
+    def get(self, id: UUID) -> Any:
+        value = self.backend.get(self._key(id))
+        with self._lock:
+            if value is MISSING:
+                self._metrics.misses += 1
+            else:
+                self._metrics.hits += 1
+        return value
+
+    def set(self, id: UUID, entity: Any) -> None:
+        self.backend.set(self._key(id), entity)
+
+    def invalidate(self, id: UUID) -> None:
+        self.backend.delete(self._key(id))
+        with self._lock:
+            self._metrics.invalidations += 1
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self._metrics = CacheMetrics()
+
+    def _key(self, id: UUID) -> str:
+        return f"repository:{self.namespace}:{id}"
+
+
+class CachedRepository:
+    """
+    Decorator read-through para repositórios: get_by_id consulta o cache antes
+    do repositório e save/update/delete invalidam a entrada. Os demais métodos
+    (list, paginate, find_missing_ids...) são delegados ao repositório.
+
+    aget_by_id/asave fazem o mesmo para as views async; o acesso ao cache
+    continua síncrono (L1 em memória; o L2 deve ser um backend de baixa latência).
+    """
+
+    def __init__(self, repository, cache: RepositoryCache):
+        self.repository = repository
+        self.cache = cache
+
+    def get_by_id(self, id: UUID):
+        entity = self.cache.get(id)
+        if entity is not MISSING:
+            return entity
+
+        entity = self.repository.get_by_id(id)
+        # Ausências não são cacheadas: o id pode ser criado logo em seguida
+        if entity is not None:
+            self.cache.set(id, entity)
+        return entity
+
+    async def aget_by_id(self, id: UUID):
+        entity = self.cache.get(id)
+        if entity is not MISSING:
+            return entity
+
+        entity = await self.repository.aget_by_id(id)
+        if entity is not None:
+            self.cache.set(id, entity)
+        return entity
+
+    def save(self, entity) -> None:
+        self.repository.save(entity)
+        self.cache.invalidate(entity.id)
+
+    async def asave(self, entity) -> None:
+        await self.repository.asave(entity)
+        self.cache.invalidate(entity.id)
+
+    def update(self, entity) -> None:
+        self.repository.update(entity)
+        self.cache.invalidate(entity.id)
+
+    def delete(self, id: UUID) -> None:
+        self.repository.delete(id)
+        self.cache.invalidate(id)
+
+    def __getattr__(self, name: str):
+        return getattr(self.repository, name)
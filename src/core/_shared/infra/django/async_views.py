@@ -0,0 +1,106 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldError
+from django.http import HttpRequest, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import serializers
+from rest_framework.status import (
+    HTTP_201_CREATED,
+    HTTP_400_BAD_REQUEST,
+)
+
+from src.core._shared.application.use_cases.exceptions import InvalidCursor
+from src.core._shared.application.use_cases.list_use_case import (
+    ListRequest,
+    ListResponse,
+    ListUseCase,
+)
+from src.core._shared.infra.django.serializers import ListRequestSerializer
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncCollectionView(View, ABC):
+    """
+    GET <recurso>/ (lista paginada) e POST <recurso>/ (criação) com handlers
+    async: sob ASGI a request não ocupa uma thread enquanto o corpo chega ou
+    a resposta é enviada, só durante as consultas ao banco.
+
+    Reaproveita os use cases (aexecute) e os serializers das views DRF; sem
+    ETag, que continua disponível nas rotas síncronas.
+    """
+
+    list_request_serializer: type[serializers.Serializer] = ListRequestSerializer
+    create_request_serializer: type[serializers.Serializer]
+    create_response_serializer: type[serializers.Serializer]
+    # Erros de validação do use case de criação respondidos com 400
+    create_errors: tuple[type[Exception], ...] = ()
+
+    @abstractmethod
+    def _get_list_use_case(self) -> ListUseCase:
+        pass
+
+    @abstractmethod
+    def _get_list_response_serializer(self, output: ListResponse):
+        pass
+
+    @abstractmethod
+    def _get_create_use_case(self):
+        pass
+
+    @abstractmethod
+    def _to_create_input(self, data: dict) -> Any:
+        pass
+
+    def _to_list_request(self, data: dict) -> ListRequest:
+        return ListRequest(**data)
+
+    async def get(self, request: HttpRequest) -> JsonResponse:
+        serializer = self.list_request_serializer(data=request.GET)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+        try:
+            output = await self._get_list_use_case().aexecute(
+                self._to_list_request(serializer.validated_data)
+            )
+        except InvalidCursor as error:
+            return error_response(str(error))
+        except FieldError:
+            return error_response("Invalid order_by")
+
+        return JsonResponse(self._get_list_response_serializer(output).data)
+
+    async def post(self, request: HttpRequest) -> JsonResponse:
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return error_response("Invalid JSON body")
+
+        serializer = self.create_request_serializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+        try:
+            output = await self._get_create_use_case().aexecute(
+                self._to_create_input(serializer.validated_data)
+            )
+        except self.create_errors as error:
+            return error_response(str(error))
+
+        return JsonResponse(
+            self.create_response_serializer(output).data, status=HTTP_201_CREATED
+        )
+
+
+def error_response(message: str) -> JsonResponse:
+    return JsonResponse({"error": message}, status=HTTP_400_BAD_REQUEST)
+
+
+async def run_sync(function: Callable[[], Any]) -> Any:
+    # Etapas com transaction.atomic: na thread do ORM, fora do event loop
+    return await sync_to_async(function)()
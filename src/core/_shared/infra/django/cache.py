@@ -0,0 +1,125 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.fields.related_descriptors import ManyToManyDescriptor
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from src.core._shared.infra.cache.backends import (
+    MISSING,
+    CacheBackend,
+    LocalLRUCache,
+    TieredCache,
+)
+from src.core._shared.infra.cache.cached_repository import RepositoryCache
+
+DEFAULT_REPOSITORY_CACHE = {
+    "CACHE_ALIAS": "default",
+    "LOCAL_MAX_SIZE": 1024,
+    "LOCAL_TTL": 5,
+    "SHARED_TTL": 300,
+}
+
+
+class DjangoCache(CacheBackend):
+    """Cache compartilhado entre processos via backend de cache do Django"""
+
+    def __init__(self, alias: str = "default", ttl: float | None = 300):
+        self.alias = alias
+        self.ttl = ttl
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get(self, key: str) -> Any:
+        return self.cache.get(key, MISSING)
+
+    def set(self, key: str, value: Any) -> None:
+        self.cache.set(key, value, timeout=self.ttl)
+
+    def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+def repository_cache(namespace: str) -> RepositoryCache:
+    config = {**DEFAULT_REPOSITORY_CACHE, **getattr(settings, "REPOSITORY_CACHE", {})}
+    shared_ttl = config["SHARED_TTL"]
+    if isinstance(caches[config["CACHE_ALIAS"]], LocMemCache):
+        # LocMem é por processo: invalidações de outros workers não chegam,
+        # então a entrada não pode viver mais que no cache local
+        shared_ttl = min(shared_ttl, config["LOCAL_TTL"])
+
+    return RepositoryCache(
+        namespace,
+        TieredCache(
+            local=LocalLRUCache(
+                max_size=config["LOCAL_MAX_SIZE"], ttl=config["LOCAL_TTL"]
+            ),
+            shared=DjangoCache(alias=config["CACHE_ALIAS"], ttl=shared_ttl),
+        ),
+    )
+
+
+def invalidate_on_change(
+    cache: RepositoryCache, model: type[Model], related: str = "pk"
+) -> None:
+    """
+    Invalida a entrada do agregado sempre que o model muda, inclusive em
+    escritas que não passam pelo CachedRepository (consumer, admin) e em
+    deletes em cascata por ForeignKey, que enviam post_delete. Linhas de
+    relações M2M ficam a cargo de invalidate_on_m2m_change.
+    `related` aponta para o id do agregado a partir do model alterado.
+    """
+
+    def receiver(sender, instance, **kwargs):
+        aggregate_id = getattr(instance, related, None)
+        if aggregate_id is not None:
+            _invalidate(cache, aggregate_id)
+
+    post_save.connect(receiver, sender=model, weak=False)
+    post_delete.connect(receiver, sender=model, weak=False)
+
+
+def invalidate_on_m2m_change(
+    cache: RepositoryCache, relation: ManyToManyDescriptor
+) -> None:
+    """
+    Invalida o agregado quando a relação M2M (ex.: Video.categories) muda,
+    por qualquer um dos lados, ou quando o model relacionado é apagado.
+    """
+    through = relation.through
+    aggregate_field = through._meta.get_field(relation.field.m2m_field_name())
+    related_field = relation.field.m2m_reverse_field_name()
+
+    def m2m_receiver(sender, instance, action, reverse, pk_set, **kwargs):
+        if not action.startswith("post_"):
+            return
+        # reverse: a alteração partiu do outro lado (ex.: category.genre_set)
+        for aggregate_id in (pk_set or []) if reverse else [instance.pk]:
+            _invalidate(cache, aggregate_id)
+
+    def delete_receiver(sender, instance, **kwargs):
+        # O cascade apaga as linhas do through sem enviar m2m_changed: os
+        # agregados afetados são lidos antes, enquanto as linhas existem
+        aggregate_ids = through.objects.filter(**{related_field: instance}).values_list(
+            aggregate_field.attname, flat=True
+        )
+        for aggregate_id in aggregate_ids:
+            _invalidate(cache, aggregate_id)
+
+    m2m_changed.connect(m2m_receiver, sender=through, weak=False)
+    pre_delete.connect(delete_receiver, sender=relation.field.related_model, weak=False)
+
+
+def _invalidate(cache: RepositoryCache, aggregate_id) -> None:
+    # De novo após o commit: uma leitura concorrente pode ter recolocado no
+    # cache o valor anterior enquanto a transação estava aberta
+    cache.invalidate(aggregate_id)
+    transaction.on_commit(lambda: cache.invalidate(aggregate_id))
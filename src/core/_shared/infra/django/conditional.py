@@ -0,0 +1,65 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import QuerySet
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from src.core._shared.domain.pagination import PageQuery
+from src.core._shared.infra.django.pagination import paginate_queryset
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    last_modified: datetime | None = None
+
+
+def entity_validators(queryset: QuerySet, pk) -> Validators | None:
+    # Só as colunas de versão: não carrega a linha inteira
+    row = queryset.filter(pk=pk).values_list("version", "updated_at").first()
+    if row is None:
+        return None
+
+    version, updated_at = row
+    return Validators(etag=f'"{pk}-{version}"', last_modified=updated_at)
+
+
+def page_validators(queryset: QuerySet, query: PageQuery) -> Validators:
+    # Mesma página que o repositório devolveria, lendo apenas (pk, versão)
+    page = paginate_queryset(queryset.values("pk", "version"), query)
+
+    digest = hashlib.sha1(f"{page.total}:{page.has_next}".encode())
+    for row in page.items:
+        digest.update(f"|{row['pk']}:{row['version']}".encode())
+
+    # Sem Last-Modified: exclusões e itens que entram na página com updated_at
+    # antigo não avançam max(updated_at), o que geraria 304 indevidos
+    return Validators(etag=f'"{digest.hexdigest()}"')
+
+
+def not_modified(request: Request, validators: Validators) -> Response | None:
+    """Resposta 304 se If-None-Match/If-Modified-Since ainda são válidos"""
+    response = get_conditional_response(
+        request,
+        etag=validators.etag,
+        last_modified=_timestamp(validators.last_modified),
+    )
+    if response is None:
+        return None
+
+    return with_validators(Response(status=response.status_code), validators)
+
+
+def with_validators(response: Response, validators: Validators) -> Response:
+    response["ETag"] = validators.etag
+    if validators.last_modified is not None:
+        response["Last-Modified"] = http_date(_timestamp(validators.last_modified))
+    return response
+
+
+def _timestamp(value: datetime | None) -> int | None:
+    return int(value.timestamp()) if value is not None else None
@@ -0,0 +1,59 @@
+from typing import AsyncIterator, Iterable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest, StreamingHttpResponse
+from rest_framework import serializers
+from rest_framework.request import Request
+
+from src.core._shared.infra.django.serializers import build_representation
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+EXPORT_CHUNK_SIZE = 1000
+# Linhas agrupadas por escrita: menos chamadas ao servidor sem atrasar o 1º byte
+LINES_PER_WRITE = 100
+
+
+def ndjson_response(
+    request: Request | HttpRequest,
+    items: Iterable,
+    serializer_class: type[serializers.Serializer],
+    filename: str,
+) -> StreamingHttpResponse:
+    represent = build_representation(serializer_class)
+    response = stream_ndjson(request, (represent(item) for item in items))
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def stream_ndjson(
+    request: Request | HttpRequest, rows: Iterable[dict]
+) -> StreamingHttpResponse:
+    chunks = iter_ndjson(rows)
+    # Sob ASGI um iterador síncrono é consumido inteiro antes do envio: o
+    # iterador assíncrono mantém o streaming
+    if isinstance(getattr(request, "_request", request), ASGIRequest):
+        chunks = aiter_ndjson(chunks)
+    return StreamingHttpResponse(chunks, content_type=NDJSON_CONTENT_TYPE)
+
+
+def iter_ndjson(rows: Iterable[dict]) -> Iterator[bytes]:
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+
+    lines = []
+    for row in rows:
+        lines.append(encoder.encode(row))
+        if len(lines) == LINES_PER_WRITE:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def aiter_ndjson(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    # Cada bloco é gerado na thread síncrona, onde o cursor do ORM foi aberto;
+    # o loop envia um bloco antes de pedir o próximo
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while (chunk := await next_chunk(chunks, None)) is not None:
+        yield chunk
@@ -0,0 +1,99 @@
+from typing import Callable
+
+from django.db import models
+from django.db.models.fields.related_descriptors import ManyToManyDescriptor
+from django.db.models.signals import m2m_changed, pre_delete
+from django.utils import timezone
+
+
+class VersionedModel(models.Model):
+    """
+    Versão e data de alteração por registro, usadas como validadores HTTP
+    (ETag/Last-Modified).
+
+    save() incrementa a versão no banco (F expression, sem perder incrementos
+    concorrentes) e relê o valor gravado. Atualizações via QuerySet.update()
+    devem usar bump_version(); relações M2M, bump_version_on_m2m_change().
+    """
+
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        bumped = not self._state.adding
+        if bumped:
+            self.version = models.F("version") + 1
+        self.updated_at = timezone.now()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "version", "updated_at"}
+
+        super().save(*args, **kwargs)
+        if bumped:
+            self.refresh_from_db(fields=["version"])
+
+
+def bump_version() -> dict:
+    return {"version": models.F("version") + 1, "updated_at": timezone.now()}
+
+
+def bump_version_on_m2m_change(relation: ManyToManyDescriptor) -> None:
+    """
+    Incrementa a versão do agregado (ex.: Genre.categories) quando a relação
+    muda por qualquer um dos lados ou quando o model relacionado é apagado:
+    as linhas do through fazem parte da representação e, portanto, do ETag.
+    """
+    model = relation.field.model
+
+    def bump(aggregate_ids):
+        model.objects.filter(pk__in=aggregate_ids).update(**bump_version())
+
+    on_m2m_change(relation, bump)
+
+
+def on_m2m_change(
+    relation: ManyToManyDescriptor,
+    handler: Callable[[list], None],
+    forward: bool = True,
+) -> None:
+    """
+    Chama handler(ids dos agregados) quando a relação M2M muda ou quando o
+    model relacionado é apagado (o cascade apaga as linhas do through sem
+    enviar m2m_changed). forward=False ignora as alterações feitas pelo
+    próprio agregado (ex.: genre.categories.set() no repositório).
+    """
+    through = relation.through
+    aggregate_field = through._meta.get_field(relation.field.m2m_field_name())
+    related_field = relation.field.m2m_reverse_field_name()
+
+    def aggregate_ids_of(related):
+        return list(
+            through.objects.filter(**{related_field: related}).values_list(
+                aggregate_field.attname, flat=True
+            )
+        )
+
+    def m2m_receiver(sender, instance, action, reverse, pk_set, **kwargs):
+        if not reverse and not forward:
+            return
+        if action in ("post_add", "post_remove") and pk_set:
+            # reverse: a alteração partiu do outro lado (ex.: category.genres)
+            aggregate_ids = list(pk_set) if reverse else [instance.pk]
+        elif action == "pre_clear":
+            # clear() não informa pk_set: lido antes, enquanto as linhas existem
+            aggregate_ids = aggregate_ids_of(instance) if reverse else [instance.pk]
+        else:
+            return
+        if aggregate_ids:
+            handler(aggregate_ids)
+
+    def delete_receiver(sender, instance, **kwargs):
+        if aggregate_ids := aggregate_ids_of(instance):
+            handler(aggregate_ids)
+
+    m2m_changed.connect(m2m_receiver, sender=through, weak=False)
+    pre_delete.connect(delete_receiver, sender=relation.field.related_model, weak=False)
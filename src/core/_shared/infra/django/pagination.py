@@ -0,0 +1,71 @@
+from typing import Iterator
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Model, Q, QuerySet
+
+from src.core._shared.application.use_cases.exceptions import InvalidCursor
+from src.core._shared.domain.pagination import Page, PageQuery, SortDirection
+
+
+def paginate_queryset(queryset: QuerySet, query: PageQuery) -> Page[Model]:
+    # ORDER BY <campo>, id LIMIT/OFFSET + COUNT(*): o custo depende do tamanho da página
+    rows = list(_page_slice(queryset, query))
+    return _to_page(rows, queryset.count(), query)
+
+
+async def apaginate_queryset(queryset: QuerySet, query: PageQuery) -> Page[Model]:
+    # Mesmas consultas de paginate_queryset, via iteração async do ORM
+    rows = [row async for row in _page_slice(queryset, query)]
+    return _to_page(rows, await queryset.acount(), query)
+
+
+def _page_slice(queryset: QuerySet, query: PageQuery) -> QuerySet:
+    descending = query.direction == SortDirection.DESC
+    prefix = "-" if descending else ""
+
+    ordered = queryset
+    if query.after is not None:
+        # Keyset: (campo, id) > (valor, id) evita OFFSET crescente em páginas profundas
+        value, last_id = query.after
+        value = _to_field_value(queryset.model, query.order_by, value)
+        lookup = "lt" if descending else "gt"
+        ordered = ordered.filter(
+            Q(**{f"{query.order_by}__{lookup}": value})
+            | Q(**{query.order_by: value, f"pk__{lookup}": last_id})
+        )
+    ordered = ordered.order_by(f"{prefix}{query.order_by}", f"{prefix}pk")
+
+    return ordered[query.offset : query.offset + query.limit + 1]
+
+
+def _to_field_value(model: type[Model], field_name: str, value):
+    # O valor do cursor vem do cliente: convertido pelo campo antes do filtro
+    try:
+        field = model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return value
+    try:
+        return field.to_python(value)
+    except ValidationError:
+        raise InvalidCursor(f"Invalid cursor value for {field_name}: {value!r}")
+
+
+def _to_page(rows: list[Model], total: int, query: PageQuery) -> Page[Model]:
+    return Page(
+        items=rows[: query.limit],
+        total=total,
+        has_next=len(rows) > query.limit,
+    )
+
+
+def iter_batches(queryset: QuerySet, chunk_size: int) -> Iterator[list[Model]]:
+    # iterator(): cursor do lado do servidor (PostgreSQL) / fetchmany, sem cache
+    # do queryset, então a memória fica limitada a um lote
+    batch = []
+    for row in queryset.iterator(chunk_size=chunk_size):
+        batch.append(row)
+        if len(batch) == chunk_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,236 @@
+import functools
+import logging
+from collections import defaultdict
+from typing import Iterable
+from uuid import UUID
+
+from django.db import connections
+
+from src.core._shared.domain.pagination import Page
+from src.core._shared.domain.search import (
+    SearchDocument,
+    SearchEngine,
+    is_prefix,
+    normalize_text,
+    search_terms,
+)
+from src.core._shared.infra.search.null_search_engine import NullSearchEngine
+
+logger = logging.getLogger(__name__)
+
+# Pesos de title e body no ranking (bm25 no SQLite, setweight A/B no Postgres)
+TITLE_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+# Documentos por INSERT (limite de parâmetros por comando do SQLite)
+INDEX_BATCH_SIZE = 500
+
+
+class SQLiteSearchEngine(SearchEngine):
+    """
+    Índice FTS5 (tabela search_entry_fts, criada pelo search_app).
+
+    A busca lê só o FTS5 (entity_type/entity_id são colunas UNINDEXED): um JOIN
+    faria o SQLite partir da outra tabela e avaliar o MATCH linha a linha.
+    search_entry mapeia (entity_type, entity_id) -> rowid com índice único,
+    para atualizar e remover sem varrer o índice.
+    """
+
+    def __init__(self, using: str = "default"):
+        self.using = using
+
+    def index(self, documents: Iterable[SearchDocument]) -> None:
+        # Documentos por tipo, em lotes: 3 comandos por lote, não 2 por documento
+        by_type: dict[str, list[SearchDocument]] = defaultdict(list)
+        for document in documents:
+            by_type[str(document.entity_type)].append(document)
+
+        with connections[self.using].cursor() as cursor:
+            for entity_type, typed_documents in by_type.items():
+                for start in range(0, len(typed_documents), INDEX_BATCH_SIZE):
+                    batch = typed_documents[start : start + INDEX_BATCH_SIZE]
+                    self._index_batch(cursor, entity_type, batch)
+
+    @staticmethod
+    def _index_batch(cursor, entity_type: str, documents: list[SearchDocument]):
+        ids = [document.entity_id.hex for document in documents]
+        placeholders = ", ".join(["%s"] * len(ids))
+        cursor.execute(
+            "INSERT INTO search_entry (entity_type, entity_id) VALUES "
+            + ", ".join(["(%s, %s)"] * len(ids))
+            + " ON CONFLICT (entity_type, entity_id) DO NOTHING",
+            [value for entity_id in ids for value in (entity_type, entity_id)],
+        )
+        cursor.execute(
+            "SELECT entity_id, id FROM search_entry "
+            f"WHERE entity_type = %s AND entity_id IN ({placeholders})",
+            [entity_type, *ids],
+        )
+        rowids = dict(cursor.fetchall())
+
+        # Um id repetido no lote fica com a última versão do documento
+        rows = {
+            rowids[document.entity_id.hex]: (
+                document.title,
+                document.body,
+                entity_type,
+                document.entity_id.hex,
+            )
+            for document in documents
+        }
+        cursor.execute(
+            "INSERT OR REPLACE INTO search_entry_fts "
+            "(rowid, title, body, entity_type, entity_id) VALUES "
+            + ", ".join(["(%s, %s, %s, %s, %s)"] * len(rows)),
+            [value for rowid, row in rows.items() for value in (rowid, *row)],
+        )
+
+    def remove(self, entity_type: str, entity_ids: Iterable[UUID]) -> None:
+        ids = [entity_id.hex for entity_id in entity_ids]
+        if not ids:
+            return
+
+        placeholders = ", ".join(["%s"] * len(ids))
+        entries = (
+            f"SELECT id FROM search_entry "
+            f"WHERE entity_type = %s AND entity_id IN ({placeholders})"
+        )
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM search_entry_fts WHERE rowid IN ({entries})",
+                [str(entity_type), *ids],
+            )
+            cursor.execute(
+                f"DELETE FROM search_entry WHERE id IN ({entries})",
+                [str(entity_type), *ids],
+            )
+
+    def search(
+        self, entity_type: str, text: str, offset: int = 0, limit: int = 10
+    ) -> Page[UUID]:
+        terms = search_terms(text)
+        if not terms:
+            return Page()
+
+        # Termos entre aspas: o texto do usuário nunca vira operador do FTS5
+        match = " ".join(f'"{term}"' for term in terms)
+        if is_prefix(terms[-1]):
+            match += "*"
+        matches = (
+            "FROM search_entry_fts "
+            "WHERE search_entry_fts MATCH %s AND entity_type = %s"
+        )
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) {matches}", [match, entity_type])
+            (total,) = cursor.fetchone()
+            if offset >= total:
+                return Page(total=total)
+
+            cursor.execute(
+                f"SELECT entity_id {matches} "
+                "ORDER BY bm25(search_entry_fts, %s, %s, 0, 0), rowid "
+                "LIMIT %s OFFSET %s",
+                [match, entity_type, TITLE_WEIGHT, BODY_WEIGHT, limit, offset],
+            )
+            ids = [UUID(entity_id) for (entity_id,) in cursor.fetchall()]
+
+        return Page(items=ids, total=total, has_next=offset + limit < total)
+
+
+class PostgresSearchEngine(SearchEngine):
+    """
+    tsvector com índice GIN (tabela search_entry, criada pelo search_app).
+
+    Usa a configuração 'simple' sobre o texto já normalizado (minúsculas e
+    sem acentos), igual para documentos e consultas.
+    """
+
+    def __init__(self, using: str = "default"):
+        self.using = using
+
+    def index(self, documents: Iterable[SearchDocument]) -> None:
+        rows = [
+            (
+                str(document.entity_type),
+                document.entity_id,
+                normalize_text(document.title),
+                normalize_text(document.body),
+            )
+            for document in documents
+        ]
+        if not rows:
+            return
+
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(
+                "INSERT INTO search_entry (entity_type, entity_id, document) "
+                "VALUES (%s, %s, setweight(to_tsvector('simple', %s), 'A') "
+                "|| setweight(to_tsvector('simple', %s), 'B')) "
+                "ON CONFLICT (entity_type, entity_id) "
+                "DO UPDATE SET document = EXCLUDED.document",
+                rows,
+            )
+
+    def remove(self, entity_type: str, entity_ids: Iterable[UUID]) -> None:
+        ids = list(entity_ids)
+        if not ids:
+            return
+
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM search_entry "
+                "WHERE entity_type = %s AND entity_id = ANY(%s)",
+                [str(entity_type), ids],
+            )
+
+    def search(
+        self, entity_type: str, text: str, offset: int = 0, limit: int = 10
+    ) -> Page[UUID]:
+        terms = search_terms(text)
+        if not terms:
+            return Page()
+
+        # Termos só com \w: seguros para to_tsquery
+        tsquery = " & ".join(terms)
+        if is_prefix(terms[-1]):
+            tsquery += ":*"
+        matches = (
+            "FROM search_entry, to_tsquery('simple', %s) query "
+            "WHERE entity_type = %s AND document @@ query"
+        )
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) {matches}", [tsquery, entity_type])
+            (total,) = cursor.fetchone()
+            if offset >= total:
+                return Page(total=total)
+
+            cursor.execute(
+                f"SELECT entity_id {matches} "
+                "ORDER BY ts_rank_cd(%s::float4[], document, query) DESC, entity_id "
+                "LIMIT %s OFFSET %s",
+                [tsquery, entity_type, _pg_weights(), limit, offset],
+            )
+            ids = [entity_id for (entity_id,) in cursor.fetchall()]
+
+        return Page(items=ids, total=total, has_next=offset + limit < total)
+
+
+def _pg_weights() -> list[float]:
+    # ts_rank_cd recebe os pesos na ordem {D, C, B, A}, entre 0 e 1
+    return [0.0, 0.0, BODY_WEIGHT / TITLE_WEIGHT, 1.0]
+
+
+def search_engine(using: str = "default") -> SearchEngine:
+    vendor = connections[using].vendor
+    if vendor == "postgresql":
+        return PostgresSearchEngine(using)
+    if vendor == "sqlite":
+        return SQLiteSearchEngine(using)
+    # Sem índice (a migration do search_app não cria tabelas nesse banco):
+    # escritas seguem funcionando e a busca não retorna resultados
+    _warn_unsupported(vendor)
+    return NullSearchEngine()
+
+
+@functools.cache
+def _warn_unsupported(vendor: str) -> None:
+    logger.warning(f"Full-text search is not supported on {vendor}; search disabled")
@@ -1,6 +1,8 @@
+import functools
+import operator
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Any, Callable, Generic, TypeVar
 from uuid import UUID
 
 from rest_framework import serializers
@@ -8,10 +10,31 @@ from rest_framework import serializers
 Output = TypeVar("Output")
 
 
+class PageRequestSerializer(serializers.Serializer):
+    current_page = serializers.IntegerField(default=1, min_value=1)
+    per_page = serializers.IntegerField(required=False, min_value=1)
+
+
+def order_by_field(fields: tuple[str, ...], default: str) -> serializers.ChoiceField:
+    # Só atributos da entidade: o cursor lê o valor de ordenação do último item
+    return serializers.ChoiceField(
+        choices=[f"{prefix}{field}" for field in fields for prefix in ("", "-")],
+        default=default,
+    )
+
+
+class ListRequestSerializer(PageRequestSerializer):
+    ORDER_BY_FIELDS = ("name",)
+
+    order_by = order_by_field(ORDER_BY_FIELDS, default="name")
+    cursor = serializers.CharField(required=False)
+
+
 class ListOutputMetaSerializer(serializers.Serializer):
     current_page = serializers.IntegerField()
     per_page = serializers.IntegerField()
     total = serializers.IntegerField()
+    next_cursor = serializers.CharField(allow_null=True)
 
 
 class ListResponseSerializer(serializers.Serializer):
@@ -20,13 +43,69 @@ class ListResponseSerializer(serializers.Serializer):
         raise NotImplementedError
 
     def to_representation(self, instance):
-        item_serializer = self._get_item_serializer()
+        # Campos resolvidos uma vez por classe: evita o to_representation
+        # campo a campo do DRF para cada item da página
+        represent = build_representation(type(self._get_item_serializer()))
 
         return {
-            "data": [item_serializer.to_representation(item) for item in instance.data],
+            "data": [represent(item) for item in instance.data],
             "meta": {
                 "current_page": instance.meta.current_page,
                 "per_page": instance.meta.per_page,
                 "total": instance.meta.total,
+                "next_cursor": instance.meta.next_cursor,
             },
         }
+
+
+@functools.cache
+def build_representation(
+    serializer_class: type[serializers.Serializer],
+) -> Callable[[Any], dict]:
+    """
+    Retorna uma função item -> dict equivalente ao to_representation do
+    serializer de saída, com (nome, getter, conversor) de cada campo
+    resolvidos uma vez por classe.
+
+    Os conversores reproduzem o DRF para os tipos usados nos outputs (UUID,
+    str, bool, int e listas); demais campos usam o to_representation do campo.
+    """
+    fields = tuple(
+        (name, _build_getter(field), _build_converter(field))
+        for name, field in serializer_class().fields.items()
+        if not field.write_only
+    )
+
+    def represent(item: Any) -> dict:
+        representation = {}
+        for name, get, convert in fields:
+            value = get(item)
+            representation[name] = None if value is None else convert(value)
+        return representation
+
+    return represent
+
+
+def _build_getter(field: serializers.Field) -> Callable[[Any], Any]:
+    if len(field.source_attrs) == 1:
+        return operator.attrgetter(field.source_attrs[0])
+    return field.get_attribute
+
+
+def _build_converter(field: serializers.Field) -> Callable[[Any], Any]:
+    if isinstance(field, serializers.UUIDField) and field.uuid_format == "hex_verbose":
+        return str
+    if type(field) is serializers.CharField:
+        return str
+    if type(field) is serializers.IntegerField:
+        return int
+    if type(field) is serializers.BooleanField:
+        return lambda value: value if value is True or value is False else (
+            field.to_representation(value)
+        )
+    if type(field).to_representation is serializers.ListField.to_representation:
+        child = _build_converter(field.child)
+        return lambda values: [
+            None if value is None else child(value) for value in values
+        ]
+    return field.to_representation
@@ -2,15 +2,33 @@ from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 from uuid import UUID
 
+from django.core.exceptions import FieldError
+from django.db.models import QuerySet
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.status import HTTP_200_OK
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
 
+from src.core._shared.application.use_cases.exceptions import InvalidCursor
 from src.core._shared.application.use_cases.list_use_case import (
     ListUseCase,
     ListRequest,
     ListResponse,
+    build_page_query,
+)
+from src.core._shared.application.use_cases.search_use_case import (
+    SearchRequest,
+    SearchUseCase,
+)
+from src.core._shared.infra.django.conditional import (
+    not_modified,
+    page_validators,
+    with_validators,
+)
+from src.core._shared.infra.django.serializers import (
+    ListRequestSerializer,
+    PageRequestSerializer,
 )
 
 Entity = TypeVar("Entity")
@@ -19,6 +37,7 @@ Repository = TypeVar("Repository")
 
 
 class ListViewSet(Generic[Entity, Output, Repository], viewsets.ViewSet, ABC):
+    list_request_serializer: type[ListRequestSerializer] = ListRequestSerializer
 
     @abstractmethod
     def _get_use_case(self) -> ListUseCase[Entity, Output]:
@@ -28,18 +47,77 @@ class ListViewSet(Generic[Entity, Output, Repository], viewsets.ViewSet, ABC):
     def _get_response_serializer(self, output: ListResponse[Output]):
         pass
 
+    def _get_queryset(self) -> QuerySet | None:
+        """Queryset do model (com version) para o ETag da página"""
+        return None
+
     def list(self, request: Request) -> Response:
-        order_by = request.query_params.get("order_by", "name")
+        serializer = self.list_request_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        list_request = ListRequest(**serializer.validated_data)
         use_case = self._get_use_case()
-        output: ListResponse[Output] = use_case.execute(
-            request=ListRequest(
-                order_by=order_by,
-                current_page=int(request.query_params.get("current_page", 1)),
+        try:
+            validators = self._get_validators(list_request)
+            if validators is not None:
+                # 304: nem as linhas completas nem o serializer são processados
+                response = not_modified(request, validators)
+                if response is not None:
+                    return response
+
+            output: ListResponse[Output] = use_case.execute(request=list_request)
+        except InvalidCursor as error:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"error": str(error)},
             )
-        )
         response_serializer = self._get_response_serializer(output)
 
-        return Response(
+        response = Response(
             status=HTTP_200_OK,
             data=response_serializer.data,
-        ) 
\ No newline at end of file
+        )
+        return with_validators(response, validators) if validators else response
+
+    def _get_validators(self, list_request: ListRequest):
+        queryset = self._get_queryset()
+        if queryset is None:
+            return None
+
+        try:
+            return page_validators(queryset, build_page_query(list_request))
+        except FieldError:
+            # Ordenação inválida: segue o fluxo normal, sem validadores
+            return None
+
+
+class SearchViewMixin(ABC):
+    """Ação GET <recurso>/search/?q=...: resultados por relevância, paginados"""
+
+    @abstractmethod
+    def _get_search_use_case(self) -> SearchUseCase:
+        pass
+
+    @abstractmethod
+    def _get_response_serializer(self, output: ListResponse):
+        pass
+
+    @action(detail=False, methods=["get"])
+    def search(self, request: Request) -> Response:
+        text = request.query_params.get("q", "").strip()
+        if not text:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"error": "q is required"},
+            )
+
+        serializer = PageRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        output = self._get_search_use_case().execute(
+            SearchRequest(text=text, **serializer.validated_data)
+        )
+        return Response(
+            status=HTTP_200_OK,
+            data=self._get_response_serializer(output).data,
+        )
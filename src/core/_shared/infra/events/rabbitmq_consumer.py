@@ -0,0 +1,110 @@
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import pika
+from django.db import close_old_connections
+
+from src.core._shared.events.abstract_consumer import AbstractConsumer
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrentRabbitMQConsumer(AbstractConsumer):
+    """
+    Consumidor com QoS (prefetch) e pool de workers.
+
+    A conexão pika fica na thread de I/O; as mensagens são processadas no pool
+    e o ack/nack volta para a thread de I/O via add_callback_threadsafe, só
+    depois que on_message terminou (e, portanto, após o commit no banco).
+
+    Se on_message levantar uma exceção a mensagem recebe nack: é reenfileirada
+    uma única vez, exceto para erros em permanent_errors, que são descartados.
+
+    Como em uma request do Django, cada mensagem descarta conexões de banco
+    quebradas ou além de CONN_MAX_AGE antes e depois do processamento: as
+    threads do pool vivem tanto quanto o consumidor.
+    """
+
+    permanent_errors: tuple[type[Exception], ...] = ()
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        queue: str = "",
+        prefetch_count: int = 10,
+        workers: int = 4,
+        connection_factory: Callable | None = None,
+    ):
+        self.host = host
+        self.queue = queue
+        self.prefetch_count = prefetch_count
+        self.workers = workers
+        self.connection_factory = connection_factory or (
+            lambda: pika.BlockingConnection(pika.ConnectionParameters(self.host))
+        )
+        self.connection = None
+        self.channel = None
+        self.executor: ThreadPoolExecutor | None = None
+
+    def start(self):
+        self.connection = self.connection_factory()
+        self.channel = self.connection.channel()
+
+        # Cria a fila se não existir
+        self.channel.queue_declare(queue=self.queue)
+        # Limita as mensagens não confirmadas em voo por consumidor
+        self.channel.basic_qos(prefetch_count=self.prefetch_count)
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix=f"consumer-{self.queue}"
+        )
+        self.channel.basic_consume(
+            queue=self.queue, on_message_callback=self.on_message_callback
+        )
+        print("Consumer started. Waiting for messages. To exit press CTRL+C")
+        try:
+            self.channel.start_consuming()
+        finally:
+            self._shutdown()
+
+    def on_message_callback(self, ch, method, properties, body):
+        self.executor.submit(
+            self._process, method.delivery_tag, method.redelivered, body
+        )
+
+    def stop(self):
+        # Pode ser chamado de qualquer thread (ex.: handler de SIGTERM)
+        if self.connection is not None and self.connection.is_open:
+            self.connection.add_callback_threadsafe(self.channel.stop_consuming)
+
+    def _process(self, delivery_tag: int, redelivered: bool, body: bytes) -> None:
+        close_old_connections()
+        try:
+            self.on_message(body)
+        except Exception as e:
+            requeue = not redelivered and not isinstance(e, self.permanent_errors)
+            logger.error(
+                f"Error processing message {delivery_tag} (requeue={requeue})",
+                exc_info=True,
+            )
+            callback = functools.partial(
+                self.channel.basic_nack, delivery_tag=delivery_tag, requeue=requeue
+            )
+        else:
+            callback = functools.partial(
+                self.channel.basic_ack, delivery_tag=delivery_tag
+            )
+        finally:
+            close_old_connections()
+
+        self.connection.add_callback_threadsafe(callback)
+
+    def _shutdown(self) -> None:
+        # Termina as mensagens em andamento e envia os acks pendentes antes de fechar
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+        if self.connection is not None and self.connection.is_open:
+            self.connection.process_data_events(time_limit=0)
+            self.connection.close()
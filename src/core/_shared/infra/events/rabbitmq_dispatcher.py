@@ -1,30 +1,26 @@
 import json
 
-import pika
-
 from src.core._shared.events.event import Event
 from src.core._shared.events.event_dispatcher import EventDispatcher
+from src.core._shared.infra.events.rabbitmq_publisher import RabbitMQPublisherPool
 
 
 class RabbitMQDispatcher(EventDispatcher):
-    def __init__(self, host="localhost", queue="videos.new"):
+    def __init__(
+        self,
+        host="localhost",
+        queue="videos.new",
+        confirm_delivery: bool = False,
+        pool: RabbitMQPublisherPool | None = None,
+    ):
         self.host = host
         self.queue = queue
-        self.connection = None
-        self.channel = None
+        # Pool compartilhado pelo processo: sem handshake TCP/AMQP por request
+        self.pool = pool or RabbitMQPublisherPool.for_host(host, confirm_delivery)
 
     def dispatch(self, event: Event) -> None:
-        if not self.connection:
-            self.connection = pika.BlockingConnection(
-                pika.ConnectionParameters(host=self.host)
-            )
-            self.channel = self.connection.channel()
-            self.channel.queue_declare(queue=self.queue)
-
-        self.channel.basic_publish(
-            exchange="", routing_key=self.queue, body=json.dumps(event.payload)
-        )
+        self.pool.publish(self.queue, json.dumps(event.payload), event.message_id)
         print(f"Sent: {event} to queue {self.queue}")
 
     def close(self):
-        self.connection.close()
+        self.pool.close()
@@ -0,0 +1,140 @@
+import logging
+import queue
+import threading
+from typing import Callable
+
+import pika
+from pika.exceptions import AMQPChannelError, AMQPConnectionError
+
+logger = logging.getLogger(__name__)
+
+
+class PooledChannel:
+    def __init__(self, connection, confirm_delivery: bool):
+        self.connection = connection
+        self.channel = connection.channel()
+        self.declared_queues: set[str] = set()
+        if confirm_delivery:
+            # basic_publish passa a bloquear até o ack do broker
+            self.channel.confirm_delivery()
+
+    @property
+    def is_open(self) -> bool:
+        return self.connection.is_open and self.channel.is_open
+
+    def publish(
+        self, queue_name: str, body: str, message_id: str | None = None
+    ) -> None:
+        if queue_name not in self.declared_queues:
+            self.channel.queue_declare(queue=queue_name)
+            self.declared_queues.add(queue_name)
+
+        self.channel.basic_publish(
+            exchange="",
+            routing_key=queue_name,
+            body=body,
+            properties=pika.BasicProperties(message_id=message_id),
+        )
+
+    def close(self) -> None:
+        try:
+            if self.connection.is_open:
+                self.connection.close()
+        except AMQPConnectionError:
+            logger.warning("Error closing RabbitMQ connection", exc_info=True)
+
+
+class RabbitMQPublisherPool:
+    """
+    Pool de conexões/canais de publicação reaproveitado por todo o processo.
+
+    Conexões pika não são thread-safe: cada thread usa com exclusividade um
+    canal retirado do pool e o devolve ao terminar. Canais com erro são
+    descartados e a publicação é repetida em uma nova conexão.
+    """
+
+    _instances: dict[tuple, "RabbitMQPublisherPool"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        max_size: int = 10,
+        confirm_delivery: bool = False,
+        retries: int = 1,
+        connection_factory: Callable | None = None,
+    ):
+        self.host = host
+        self.max_size = max_size
+        self.confirm_delivery = confirm_delivery
+        self.retries = retries
+        self.connection_factory = connection_factory or (
+            lambda: pika.BlockingConnection(pika.ConnectionParameters(host=self.host))
+        )
+        self._idle: queue.LifoQueue[PooledChannel] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    @classmethod
+    def for_host(
+        cls, host: str = "localhost", confirm_delivery: bool = False
+    ) -> "RabbitMQPublisherPool":
+        key = (host, confirm_delivery)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(host=host, confirm_delivery=confirm_delivery)
+            return cls._instances[key]
+
+    def publish(
+        self, queue_name: str, body: str, message_id: str | None = None
+    ) -> None:
+        attempts = self.retries + 1
+        for attempt in range(1, attempts + 1):
+            pooled = self._acquire()
+            try:
+                pooled.publish(queue_name, body, message_id)
+            except (AMQPConnectionError, AMQPChannelError):
+                # Conexão/canal quebrado: descarta e reconecta na próxima tentativa
+                self._discard(pooled)
+                if attempt == attempts:
+                    raise
+                logger.warning("RabbitMQ publish failed, reconnecting", exc_info=True)
+            except Exception:
+                self._discard(pooled)
+                raise
+            else:
+                self._release(pooled)
+                return
+
+    def close(self) -> None:
+        # Fecha apenas as conexões ociosas; novas são abertas sob demanda
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            pooled.close()
+
+    def _acquire(self) -> PooledChannel:
+        self._slots.acquire()
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if pooled.is_open:
+                return pooled
+            pooled.close()
+
+        try:
+            return PooledChannel(self.connection_factory(), self.confirm_delivery)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, pooled: PooledChannel) -> None:
+        self._idle.put(pooled)
+        self._slots.release()
+
+    def _discard(self, pooled: PooledChannel) -> None:
+        pooled.close()
+        self._slots.release()
@@ -0,0 +1,108 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Generic, Iterable, Iterator, TypeVar
+from uuid import UUID
+
+from src.core._shared.domain.pagination import (
+    Page,
+    PageQuery,
+    SortDirection,
+    paginate_in_memory,
+)
+
+T = TypeVar("T")
+
+
+class IndexedStore(Generic[T]):
+    """
+    Armazenamento dos repositórios em memória: dict por id + índices ordenados.
+
+    get/add/remove por id são O(1); cada campo em `indexes` mantém uma lista
+    ordenada de (valor, id), com busca binária, para paginar por order_by sem
+    ordenar a coleção. Campos sem índice caem em paginate_in_memory.
+
+    Atualizar uma entidade mantém a posição dela na ordem de inserção.
+    """
+
+    def __init__(self, entities: Iterable[T] = (), indexes: Iterable[str] = ()):
+        self._by_id: dict[UUID, T] = {entity.id: entity for entity in entities}
+        # Chave indexada no momento da escrita: a entidade pode ser alterada
+        # pelo chamador antes do update, então não dá para recalculá-la
+        self._keys: dict[str, dict[UUID, tuple[Any, UUID]]] = {
+            field: {
+                id: (getattr(entity, field), id) for id, entity in self._by_id.items()
+            }
+            for field in indexes
+        }
+        self._indexes: dict[str, list[tuple[Any, UUID]]] = {
+            field: sorted(keys.values()) for field, keys in self._keys.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._by_id.values())
+
+    def __getitem__(self, position: int) -> T:
+        # Acesso posicional O(n), na ordem de inserção (usado em inspeções/testes)
+        return list(self._by_id.values())[position]
+
+    def get(self, id: UUID) -> T | None:
+        return self._by_id.get(id)
+
+    def get_many(self, ids: Iterable[UUID]) -> list[T]:
+        return [self._by_id[id] for id in ids if id in self._by_id]
+
+    def add(self, entity: T) -> None:
+        """Insere ou substitui a entidade com o mesmo id"""
+        self._unindex(entity.id)
+        self._by_id[entity.id] = entity
+        for field, keys in self._keys.items():
+            key = (getattr(entity, field), entity.id)
+            keys[entity.id] = key
+            insort(self._indexes[field], key)
+
+    def remove(self, id: UUID) -> T | None:
+        self._unindex(id)
+        return self._by_id.pop(id, None)
+
+    def missing_ids(self, ids: Iterable[UUID]) -> set[UUID]:
+        return {id for id in ids if id not in self._by_id}
+
+    def paginate(self, query: PageQuery) -> Page[T]:
+        index = self._indexes.get(query.order_by)
+        if index is None:
+            return paginate_in_memory(self._by_id.values(), query)
+
+        if query.direction == SortDirection.DESC:
+            # Percorre o índice de trás para frente a partir do cursor
+            end = len(index)
+            if query.after is not None:
+                end = bisect_left(index, tuple(query.after))
+            stop = max(end - query.offset, 0)
+            start = max(stop - query.limit, 0)
+            keys = index[start:stop][::-1]
+            has_next = start > 0
+        else:
+            begin = 0
+            if query.after is not None:
+                begin = bisect_right(index, tuple(query.after))
+            start = begin + query.offset
+            stop = start + query.limit
+            keys = index[start:stop]
+            has_next = stop < len(index)
+
+        return Page(
+            items=[self._by_id[id] for _, id in keys],
+            total=len(self._by_id),
+            has_next=has_next,
+        )
+
+    def _unindex(self, id: UUID) -> None:
+        for field, keys in self._keys.items():
+            key = keys.pop(id, None)
+            if key is None:
+                continue
+
+            index = self._indexes[field]
+            del index[bisect_left(index, key)]
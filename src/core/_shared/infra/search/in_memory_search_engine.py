@@ -0,0 +1,66 @@
+from typing import Iterable
+from uuid import UUID
+
+from src.core._shared.domain.pagination import Page
+from src.core._shared.domain.search import (
+    SearchDocument,
+    SearchEngine,
+    is_prefix,
+    search_terms,
+)
+
+TITLE_WEIGHT = 10
+
+
+class InMemorySearchEngine(SearchEngine):
+    """Varredura linear dos documentos: para testes e execução local"""
+
+    def __init__(self):
+        self.documents: dict[tuple[str, UUID], tuple[list[str], list[str]]] = {}
+
+    def index(self, documents: Iterable[SearchDocument]) -> None:
+        for document in documents:
+            self.documents[(document.entity_type, document.entity_id)] = (
+                search_terms(document.title),
+                search_terms(document.body),
+            )
+
+    def remove(self, entity_type: str, entity_ids: Iterable[UUID]) -> None:
+        for entity_id in entity_ids:
+            self.documents.pop((entity_type, entity_id), None)
+
+    def search(
+        self, entity_type: str, text: str, offset: int = 0, limit: int = 10
+    ) -> Page[UUID]:
+        terms = search_terms(text)
+        if not terms:
+            return Page()
+
+        scored = []
+        for (document_type, entity_id), (title, body) in self.documents.items():
+            if document_type != entity_type:
+                continue
+
+            score = 0
+            for position, term in enumerate(terms):
+                prefix = position == len(terms) - 1 and is_prefix(term)
+                hits = _count(title, term, prefix) * TITLE_WEIGHT
+                hits += _count(body, term, prefix)
+                if not hits:
+                    break
+                score += hits
+            else:
+                scored.append((-score, entity_id))
+
+        scored.sort()
+        return Page(
+            items=[entity_id for _, entity_id in scored[offset : offset + limit]],
+            total=len(scored),
+            has_next=offset + limit < len(scored),
+        )
+
+
+def _count(words: list[str], term: str, prefix: bool) -> int:
+    if prefix:
+        return sum(word.startswith(term) for word in words)
+    return words.count(term)
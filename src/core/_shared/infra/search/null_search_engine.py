@@ -0,0 +1,20 @@
+from typing import Iterable
+from uuid import UUID
+
+from src.core._shared.domain.pagination import Page
+from src.core._shared.domain.search import SearchDocument, SearchEngine
+
+
+class NullSearchEngine(SearchEngine):
+    """Sem índice: para bancos sem busca textual suportada. Nenhum resultado"""
+
+    def index(self, documents: Iterable[SearchDocument]) -> None:
+        pass
+
+    def remove(self, entity_type: str, entity_ids: Iterable[UUID]) -> None:
+        pass
+
+    def search(
+        self, entity_type: str, text: str, offset: int = 0, limit: int = 10
+    ) -> Page[UUID]:
+        return Page()
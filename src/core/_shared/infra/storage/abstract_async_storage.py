@@ -0,0 +1,97 @@
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, BinaryIO, Iterable
+
+from src.core._shared.infra.storage.abstract_storage import (
+    AbstractStorage,
+    StoredBlob,
+    blob_path,
+    staging_path,
+)
+
+# Arquivo (com .read), iterável síncrono ou assíncrono de blocos de bytes
+AsyncStream = BinaryIO | Iterable[bytes] | AsyncIterable[bytes]
+
+
+class AbstractAsyncStorage(ABC):
+    """
+    Contraparte async do AbstractStorage: as transferências são aguardadas
+    sem bloquear o event loop, que segue atendendo outras requests.
+    """
+
+    CHUNK_SIZE = AbstractStorage.CHUNK_SIZE
+
+    @abstractmethod
+    async def store(
+        self, file_path: Path, content: bytes, content_type: str = ""
+    ) -> str:
+        pass
+
+    @abstractmethod
+    async def store_stream(
+        self, file_path: Path, stream: AsyncStream, content_type: str = ""
+    ) -> str:
+        pass
+
+    @abstractmethod
+    async def retrieve(self, file_path: Path) -> bytes:
+        pass
+
+    @abstractmethod
+    async def delete(self, file_path: Path) -> None:
+        pass
+
+    @abstractmethod
+    async def exists(self, file_path: Path) -> bool:
+        pass
+
+    @abstractmethod
+    async def move(self, source: Path, destination: Path) -> None:
+        pass
+
+    async def store_blob(
+        self, stream: AsyncStream, content_type: str = ""
+    ) -> StoredBlob:
+        """Mesmo layout endereçado por conteúdo de AbstractStorage.store_blob"""
+        digest = hashlib.sha256()
+
+        async def hashed_chunks() -> AsyncIterator[bytes]:
+            async for chunk in aiter_chunks(stream, self.CHUNK_SIZE):
+                digest.update(chunk)
+                yield chunk
+
+        staging = staging_path()
+        await self.store_stream(staging, hashed_chunks(), content_type)
+
+        checksum = digest.hexdigest()
+        path = blob_path(checksum)
+        if await self.exists(path):
+            await self.delete(staging)
+            return StoredBlob(checksum=checksum, path=path, created=False)
+
+        await self.move(staging, path)
+        return StoredBlob(checksum=checksum, path=path, created=True)
+
+
+async def aiter_chunks(
+    stream: AsyncStream, chunk_size: int = AbstractAsyncStorage.CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    if hasattr(stream, "__aiter__"):
+        async for chunk in stream:
+            if chunk:
+                yield chunk
+        return
+
+    # Arquivos e geradores síncronos (ex.: UploadedFile.chunks()) leem do
+    # disco: cada leitura vai para uma thread e o loop fica livre entre blocos
+    if hasattr(stream, "read"):
+        while chunk := await asyncio.to_thread(stream.read, chunk_size):
+            yield chunk
+        return
+
+    chunks = iter(stream)
+    while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+        if chunk:
+            yield chunk
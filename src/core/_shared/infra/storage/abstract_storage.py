@@ -1,13 +1,112 @@
+import hashlib
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from mimetypes import MimeTypes
 from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+from uuid import uuid4
+
+from src.core._shared.infra.storage.byte_range import ByteRange
+
+# Arquivo (com .read) ou iterável de blocos de bytes
+Stream = BinaryIO | Iterable[bytes]
+
+BLOBS_PATH = Path("blobs/sha256")
+STAGING_PATH = Path("blobs/staging")
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    checksum: str
+    path: Path
+    # False quando o conteúdo já existia e a cópia enviada foi descartada
+    created: bool
+
+
+def blob_path(checksum: str) -> Path:
+    # Prefixo de 2 caracteres: evita diretórios com milhões de entradas
+    return BLOBS_PATH / checksum[:2] / checksum
+
+
+def staging_path() -> Path:
+    return STAGING_PATH / uuid4().hex
 
 
 class AbstractStorage(ABC):
+    # Múltiplo de 256 KiB, exigido pelos uploads resumíveis do GCS
+    CHUNK_SIZE = 1024 * 1024
+
     @abstractmethod
     def store(self, file_path: Path, content: bytes, content_type: str = "") -> str:
         pass
 
+    @abstractmethod
+    def store_stream(
+        self, file_path: Path, stream: Stream, content_type: str = ""
+    ) -> str:
+        pass
+
     @abstractmethod
     def retrieve(self, file_path: Path) -> bytes:
         pass
+
+    @abstractmethod
+    def delete(self, file_path: Path) -> None:
+        pass
+
+    @abstractmethod
+    def size(self, file_path: Path) -> int:
+        """Tamanho do arquivo em bytes; FileNotFoundError se não existir"""
+        pass
+
+    @abstractmethod
+    def open_range(self, file_path: Path, byte_range: ByteRange) -> BinaryIO:
+        """Abre só o intervalo para leitura em blocos, sem carregar o arquivo"""
+        pass
+
+    @abstractmethod
+    def exists(self, file_path: Path) -> bool:
+        pass
+
+    @abstractmethod
+    def move(self, source: Path, destination: Path) -> None:
+        """Renomeia sem reenviar o conteúdo (rename local, cópia no servidor)"""
+        pass
+
+    def store_blob(self, stream: Stream, content_type: str = "") -> StoredBlob:
+        """
+        Armazena o conteúdo em blobs/sha256/<aa>/<sha256>, calculando o hash
+        durante o streaming. O upload vai para uma área de staging e só é
+        movido se o blob ainda não existir: duplicatas não ocupam espaço.
+        """
+        digest = hashlib.sha256()
+
+        def hashed_chunks() -> Iterator[bytes]:
+            for chunk in iter_chunks(stream, self.CHUNK_SIZE):
+                digest.update(chunk)
+                yield chunk
+
+        staging = staging_path()
+        self.store_stream(staging, hashed_chunks(), content_type)
+
+        checksum = digest.hexdigest()
+        path = blob_path(checksum)
+        if self.exists(path):
+            self.delete(staging)
+            return StoredBlob(checksum=checksum, path=path, created=False)
+
+        self.move(staging, path)
+        return StoredBlob(checksum=checksum, path=path, created=True)
+
+
+def iter_chunks(
+    stream: Stream, chunk_size: int = AbstractStorage.CHUNK_SIZE
+) -> Iterator[bytes]:
+    if hasattr(stream, "read"):
+        while chunk := stream.read(chunk_size):
+            yield chunk
+        return
+
+    for chunk in stream:
+        if chunk:
+            yield chunk
@@ -0,0 +1,270 @@
+import asyncio
+import mimetypes
+import ssl
+import weakref
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable
+from urllib.parse import quote
+
+import certifi
+import httpx
+from django.conf import settings
+
+from src.core._shared.infra.storage.abstract_async_storage import (
+    AbstractAsyncStorage,
+    AsyncStream,
+    aiter_chunks,
+)
+
+TokenProvider = Callable[[], Awaitable[str]]
+
+
+class GCSRequestError(Exception):
+    def __init__(self, response: httpx.Response) -> None:
+        super().__init__(f"GCS request failed with status {response.status_code}")
+        self.status = response.status_code
+
+
+class AsyncGCSStorage(AbstractAsyncStorage):
+    """
+    Storage GCS sem bloquear o event loop: upload resumível pela JSON API,
+    download e remoção pela XML API, tudo sobre o pool de conexões do httpx.
+    """
+
+    ENDPOINT = "https://storage.googleapis.com"
+    # Blocos intermediários do upload resumível: múltiplos de 256 KiB
+    UPLOAD_GRANULARITY = 256 * 1024
+    # Reenvios de um bloco quando o servidor responde 308 sem progresso
+    MAX_UPLOAD_RETRIES = 5
+    RETRY_BACKOFF = 0.5
+
+    def __init__(
+        self,
+        bucket: str | None = None,
+        endpoint: str = ENDPOINT,
+        token_provider: TokenProvider | None = None,
+        max_connections: int = 10,
+        timeout: float = 60.0,
+    ) -> None:
+        self.bucket = bucket or settings.CLOUD_STORAGE_BUCKET_NAME
+        self.endpoint = endpoint.rstrip("/")
+        self.max_connections = max_connections
+        self.timeout = timeout
+        # Carregar as CAs leva centenas de ms: feito uma vez, fora do event loop
+        self._verify = (
+            ssl.create_default_context(cafile=certifi.where())
+            if self.endpoint.startswith("https://")
+            else False
+        )
+        # Um pool por event loop, junto do finalizador que o fecha
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            tuple[httpx.AsyncClient, AsyncIterator[None]],
+        ] = weakref.WeakKeyDictionary()
+
+        # No GCS real usa as credenciais padrão (GOOGLE_APPLICATION_CREDENTIALS);
+        # endpoints locais (emuladores, testes) dispensam autenticação
+        if token_provider is None and self.endpoint == self.ENDPOINT:
+            token_provider = default_token_provider()
+        self.token_provider = token_provider
+
+        assert self.CHUNK_SIZE % self.UPLOAD_GRANULARITY == 0
+
+    async def store(
+        self, file_path: Path, content: bytes, content_type: str = ""
+    ) -> str:
+        name = str(file_path)
+        response = await self._request(
+            "POST",
+            f"/upload/storage/v1/b/{self.bucket}/o"
+            f"?uploadType=media&name={quote(name, safe='')}",
+            {"Content-Type": self._content_type(file_path, content_type)},
+            content,
+        )
+        self._raise_for_status(response, 200, 201)
+        return self._public_url(name)
+
+    async def store_stream(
+        self, file_path: Path, stream: AsyncStream, content_type: str = ""
+    ) -> str:
+        name = str(file_path)
+        session = await self._start_resumable_upload(
+            name, self._content_type(file_path, content_type)
+        )
+
+        # Envia blocos de CHUNK_SIZE enquanto houver mais dados atrás deles;
+        # o último bloco vai com o tamanho total e fecha a sessão
+        offset = 0
+        buffer = bytearray()
+        async for chunk in aiter_chunks(stream, self.CHUNK_SIZE):
+            buffer += chunk
+            while len(buffer) > self.CHUNK_SIZE:
+                committed = await self._upload_chunk(
+                    session, bytes(buffer[: self.CHUNK_SIZE]), offset, None
+                )
+                del buffer[: committed - offset]
+                offset = committed
+
+        total = offset + len(buffer)
+        while (
+            committed := await self._upload_chunk(session, bytes(buffer), offset, total)
+        ) < total:
+            del buffer[: committed - offset]
+            offset = committed
+
+        return self._public_url(name)
+
+    async def retrieve(self, file_path: Path) -> bytes:
+        response = await self._request("GET", self._object_target(str(file_path)))
+        if response.status_code == 404:
+            raise FileNotFoundError(
+                f"File {file_path} not found in bucket {self.bucket}"
+            )
+        self._raise_for_status(response, 200)
+        return response.content
+
+    async def delete(self, file_path: Path) -> None:
+        response = await self._request("DELETE", self._object_target(str(file_path)))
+        if response.status_code != 404:
+            self._raise_for_status(response, 200, 204)
+
+    async def exists(self, file_path: Path) -> bool:
+        response = await self._request("HEAD", self._object_target(str(file_path)))
+        if response.status_code == 404:
+            return False
+        self._raise_for_status(response, 200)
+        return True
+
+    async def move(self, source: Path, destination: Path) -> None:
+        # Cópia no servidor pela JSON API; o conteúdo não passa pelo cliente
+        response = await self._request(
+            "POST",
+            f"/storage/v1/b/{self.bucket}/o/{quote(str(source), safe='')}"
+            f"/copyTo/b/{self.bucket}/o/{quote(str(destination), safe='')}",
+        )
+        self._raise_for_status(response, 200)
+        await self.delete(source)
+
+    async def close(self) -> None:
+        """Fecha o pool do loop atual; os dos outros loops fecham com eles"""
+        entry = self._clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            _, closer = entry
+            await closer.aclose()
+
+    async def _start_resumable_upload(self, name: str, content_type: str) -> str:
+        response = await self._request(
+            "POST",
+            f"/upload/storage/v1/b/{self.bucket}/o"
+            f"?uploadType=resumable&name={quote(name, safe='')}",
+            {"X-Upload-Content-Type": content_type},
+        )
+        self._raise_for_status(response, 200, 201)
+        # URL absoluta da sessão; as requests seguem pelo mesmo pool
+        return response.headers["location"]
+
+    async def _upload_chunk(
+        self, session: str, data: bytes, offset: int, total: int | None
+    ) -> int:
+        size = "*" if total is None else str(total)
+        content_range = (
+            f"bytes {offset}-{offset + len(data) - 1}/{size}"
+            if data
+            else f"bytes */{size}"
+        )
+        for attempt in range(self.MAX_UPLOAD_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(self.RETRY_BACKOFF * 2 ** (attempt - 1))
+            response = await self._request(
+                "PUT", session, {"Content-Range": content_range}, data
+            )
+
+            if response.status_code in (200, 201):
+                return offset + len(data)
+            self._raise_for_status(response, 308)
+
+            # 308: o servidor informa até onde persistiu; o restante é
+            # reenviado. Sem progresso, o mesmo bloco é reenviado após espera
+            persisted = response.headers.get("range")
+            committed = int(persisted.rpartition("-")[2]) + 1 if persisted else 0
+            if committed > offset:
+                return committed
+
+        raise GCSRequestError(response)
+
+    async def _request(
+        self,
+        method: str,
+        target: str,
+        headers: dict[str, str] | None = None,
+        body: bytes = b"",
+    ) -> httpx.Response:
+        headers = dict(headers or {})
+        if self.token_provider is not None:
+            headers["Authorization"] = f"Bearer {await self.token_provider()}"
+        client = await self._http_client()
+        return await client.request(method, target, headers=headers, content=body)
+
+    async def _http_client(self) -> httpx.AsyncClient:
+        # O pool pertence ao event loop em que foi criado; o mesmo storage
+        # pode ser usado por loops diferentes (ex.: async_to_sync)
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(loop)
+        if entry is not None:
+            return entry[0]
+
+        client = httpx.AsyncClient(
+            base_url=self.endpoint,
+            limits=httpx.Limits(max_connections=self.max_connections),
+            timeout=self.timeout,
+            verify=self._verify,
+            follow_redirects=True,
+        )
+        # Async generator iniciado neste loop: shutdown_asyncgens (asyncio.run,
+        # async_to_sync) o finaliza e fecha o pool antes de o loop fechar
+        closer = _close_on_shutdown(client)
+        await anext(closer)
+        self._clients[loop] = (client, closer)
+        return client
+
+    def _object_target(self, name: str) -> str:
+        return f"/{self.bucket}/{quote(name)}"
+
+    def _public_url(self, name: str) -> str:
+        return f"{self.endpoint}{self._object_target(name)}"
+
+    @staticmethod
+    def _content_type(file_path: Path, content_type: str) -> str:
+        if not content_type:
+            content_type, _ = mimetypes.guess_type(str(file_path))
+        return content_type or "application/octet-stream"
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response, *expected: int) -> None:
+        if response.status_code not in expected:
+            raise GCSRequestError(response)
+
+
+async def _close_on_shutdown(client: httpx.AsyncClient) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+def default_token_provider() -> TokenProvider:
+    # Import tardio: google-auth só é necessário contra o GCS real
+    import google.auth
+    from google.auth.transport.requests import Request
+
+    credentials, _ = google.auth.default(
+        scopes=["https://www.googleapis.com/auth/devstorage.read_write"]
+    )
+
+    async def token() -> str:
+        # O refresh faz I/O síncrono: fora do event loop
+        if not credentials.valid:
+            await asyncio.to_thread(credentials.refresh, Request())
+        return credentials.token
+
+    return token
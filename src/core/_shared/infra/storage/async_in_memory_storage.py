@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from src.core._shared.infra.storage.abstract_async_storage import (
+    AbstractAsyncStorage,
+    AsyncStream,
+    aiter_chunks,
+)
+from src.core._shared.infra.storage.in_memory_storage import InMemoryStorage
+
+
+class AsyncInMemoryStorage(AbstractAsyncStorage):
+    """
+    Implementação async de storage em memória para testes.
+    Pode envolver um InMemoryStorage existente para que as rotas síncronas
+    e assíncronas enxerguem os mesmos arquivos.
+    """
+
+    def __init__(self, storage: InMemoryStorage | None = None):
+        self.storage = storage or InMemoryStorage()
+
+    async def store(
+        self, file_path: Path, content: bytes, content_type: str = ""
+    ) -> str:
+        """Armazena um arquivo em memória"""
+        return self.storage.store(file_path, content, content_type)
+
+    async def store_stream(
+        self, file_path: Path, stream: AsyncStream, content_type: str = ""
+    ) -> str:
+        """Armazena um arquivo em memória lendo-o em blocos"""
+        buffer = bytearray()
+        async for chunk in aiter_chunks(stream, self.CHUNK_SIZE):
+            buffer.extend(chunk)
+        return self.storage.store(file_path, bytes(buffer), content_type)
+
+    async def retrieve(self, file_path: Path) -> bytes:
+        """Recupera um arquivo da memória"""
+        return self.storage.retrieve(file_path)
+
+    async def delete(self, file_path: Path) -> None:
+        """Remove um arquivo da memória"""
+        self.storage.delete(file_path)
+
+    async def exists(self, file_path: Path) -> bool:
+        """Indica se o arquivo está em memória"""
+        return self.storage.exists(file_path)
+
+    async def move(self, source: Path, destination: Path) -> None:
+        """Renomeia um arquivo em memória"""
+        self.storage.move(source, destination)
+
+    def clear(self):
+        """Limpa todo o storage em memória"""
+        self.storage.clear()
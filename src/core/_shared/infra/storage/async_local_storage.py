@@ -0,0 +1,55 @@
+import asyncio
+from pathlib import Path
+
+from src.core._shared.infra.storage.abstract_async_storage import (
+    AbstractAsyncStorage,
+    AsyncStream,
+    aiter_chunks,
+)
+from src.core._shared.infra.storage.local_storage import LocalStorage
+
+
+class AsyncLocalStorage(AbstractAsyncStorage):
+    TMP_BUCKET = LocalStorage.TMP_BUCKET
+
+    def __init__(self, bucket: str = TMP_BUCKET):
+        self.bucket = Path(bucket)
+
+        if not self.bucket.exists():
+            self.bucket.mkdir(parents=True)
+
+    async def store(
+        self, file_path: Path, content: bytes, content_type: str = ""
+    ) -> str:
+        return await self.store_stream(file_path, [content], content_type)
+
+    async def store_stream(
+        self, file_path: Path, stream: AsyncStream, content_type: str = ""
+    ) -> str:
+        full_path = self.bucket.joinpath(file_path)
+        await asyncio.to_thread(full_path.parent.mkdir, parents=True, exist_ok=True)
+
+        # Cada escrita de bloco vai para uma thread: o loop só espera o disco
+        # bloco a bloco, nunca o arquivo inteiro
+        file = await asyncio.to_thread(open, full_path, "wb")
+        try:
+            async for chunk in aiter_chunks(stream, self.CHUNK_SIZE):
+                await asyncio.to_thread(file.write, chunk)
+        finally:
+            await asyncio.to_thread(file.close)
+
+        return full_path.as_uri()
+
+    async def retrieve(self, file_path: Path) -> bytes:
+        return await asyncio.to_thread(self.bucket.joinpath(file_path).read_bytes)
+
+    async def exists(self, file_path: Path) -> bool:
+        return await asyncio.to_thread(self.bucket.joinpath(file_path).exists)
+
+    async def move(self, source: Path, destination: Path) -> None:
+        full_path = self.bucket.joinpath(destination)
+        await asyncio.to_thread(full_path.parent.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread(self.bucket.joinpath(source).replace, full_path)
+
+    async def delete(self, file_path: Path) -> None:
+        await asyncio.to_thread(self.bucket.joinpath(file_path).unlink, missing_ok=True)
@@ -0,0 +1,100 @@
+import io
+from dataclasses import dataclass
+from typing import BinaryIO
+
+
+class RangeNotSatisfiable(Exception):
+    def __init__(self, size: int) -> None:
+        super().__init__(f"Range not satisfiable for a file of {size} bytes")
+        self.size = size
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    """Intervalo inclusivo [start, end] de bytes, como no header HTTP Range."""
+
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    @classmethod
+    def parse(cls, header: str | None, size: int) -> "ByteRange | None":
+        """
+        Interpreta um header Range (RFC 9110) para um arquivo de `size` bytes:
+        "bytes=0-99", "bytes=100-" ou "bytes=-100" (últimos 100 bytes).
+
+        Retorna None quando o header está ausente, é inválido ou pede vários
+        intervalos: nesses casos o arquivo é servido inteiro, como a RFC
+        permite. Intervalos fora do arquivo levantam RangeNotSatisfiable.
+        """
+        unit, _, spec = (header or "").partition("=")
+        if unit.strip() != "bytes" or "," in spec:
+            return None
+
+        first, _, last = spec.strip().partition("-")
+        if not (first + last).isdigit() or (first and last and int(first) > int(last)):
+            return None
+
+        if not first:
+            suffix = int(last)
+            if suffix == 0 or size == 0:
+                raise RangeNotSatisfiable(size)
+            return cls(start=max(size - suffix, 0), end=size - 1)
+
+        start = int(first)
+        if start >= size:
+            raise RangeNotSatisfiable(size)
+        end = min(int(last), size - 1) if last else size - 1
+        return cls(start=start, end=end)
+
+
+class RangeReader(io.RawIOBase):
+    """
+    Lê no máximo `length` bytes a partir da posição atual de `file`.
+
+    Expõe o fileno do arquivo: com wsgi.file_wrapper (ex.: gunicorn) o
+    FileResponse é enviado por os.sendfile a partir dessa posição, limitado
+    pelo Content-Length, sem passar pelo espaço de usuário.
+    """
+
+    def __init__(self, file: BinaryIO, length: int) -> None:
+        self._file = file
+        self._remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._remaining)
+        if size == 0:
+            return 0
+
+        read = self._file.readinto(memoryview(buffer)[:size])
+        self._remaining -= read
+        return read
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+class MemoryReader(io.RawIOBase):
+    """Leitura de um memoryview em blocos, sem copiar o conteúdo inteiro."""
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), len(self._view))
+        buffer[:size] = self._view[:size]
+        self._view = self._view[size:]
+        return size
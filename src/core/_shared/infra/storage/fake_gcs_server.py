@@ -0,0 +1,400 @@
+import asyncio
+import base64
+import json
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+from urllib.parse import parse_qs, unquote, urlsplit
+from uuid import uuid4
+
+from src.core._shared.infra.storage.byte_range import ByteRange, RangeNotSatisfiable
+
+try:
+    # Dependência do google-cloud-storage, que valida o crc32c dos uploads
+    import google_crc32c
+except ImportError:  # pragma: no cover
+    google_crc32c = None
+
+UPLOAD_GRANULARITY = 256 * 1024
+
+
+@dataclass
+class _ResumableUpload:
+    bucket: str
+    name: str
+    content_type: str = ""
+    data: bytearray = field(default_factory=bytearray)
+
+
+class FakeGCSServer:
+    """
+    Stand-in local do GCS para testes e benchmarks: uploads (media,
+    multipart e resumível), metadados, compose, cópia, download com Range e
+    remoção pela JSON API (o que o google-cloud-storage usa), além de
+    download, HEAD e remoção pela XML API (AsyncGCSStorage).
+    Objetos ficam em memória em `objects[(bucket, nome)]`.
+
+    latency: atraso por request, simulando a rede.
+    max_commit: limita os bytes persistidos por request do upload resumível,
+    como o GCS faz ao aceitar só parte de um bloco.
+    stalled_chunks: quantos blocos do upload resumível recebem 308 sem
+    persistir nada, pedindo o reenvio do mesmo bloco.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        max_commit: int | None = None,
+        stalled_chunks: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.max_commit = max_commit
+        self.stalled_chunks = stalled_chunks
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.content_types: dict[tuple[str, str], str] = {}
+        # Quantidade de objetos de origem de cada compose recebido
+        self.compose_requests: list[int] = []
+        self.requests: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._uploads: dict[str, _ResumableUpload] = {}
+        self._server: asyncio.Server | None = None
+        self._connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self.url = ""
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        self._server.close()
+        # Encerra as conexões keep-alive e aguarda seus handlers
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+
+    async def __aenter__(self) -> "FakeGCSServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    @contextmanager
+    def running_in_thread(self) -> Iterator["FakeGCSServer"]:
+        """
+        Sobe o servidor em um event loop próprio, em outro thread: para
+        clientes síncronos (GCSStorage) e para não disputar o loop medido.
+        """
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(), loop).result()
+        try:
+            yield self
+        finally:
+            asyncio.run_coroutine_threadsafe(self.stop(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while (head := await read_head(reader)) is not None:
+                request_line, headers = head
+                body = await read_body(reader, headers)
+                method, target, _ = request_line.split(" ", 2)
+
+                self.requests.append((method, target))
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                try:
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+                    status, response_headers, response_body = self._handle(
+                        method, target, headers, body
+                    )
+                finally:
+                    self.in_flight -= 1
+
+                write_message(
+                    writer,
+                    f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}",
+                    {**response_headers, "Content-Length": str(len(response_body))},
+                    b"" if method == "HEAD" else response_body,
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+
+    def _handle(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        url = urlsplit(target)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        segments = [unquote(segment) for segment in url.path.split("/")]
+
+        # JSON API: /upload/storage/v1/b/<bucket>/o
+        if url.path.startswith("/upload/storage/v1/b/"):
+            return self._handle_upload(method, segments[5], query, headers, body)
+
+        # JSON API: /storage/v1/b/<bucket>/o/<nome>[/compose|/copyTo/...]
+        if url.path.startswith("/storage/v1/b/") and len(segments) >= 7:
+            return self._handle_object(method, segments, body)
+
+        # JSON API: /download/storage/v1/b/<bucket>/o/<nome>?alt=media
+        if url.path.startswith("/download/storage/v1/b/") and len(segments) == 8:
+            return self._download(
+                method, (segments[5], segments[7]), headers.get("range")
+            )
+
+        # XML API: /<bucket>/<nome>
+        bucket, _, name = url.path.lstrip("/").partition("/")
+        key = (bucket, unquote(name))
+        if method == "DELETE":
+            return self._delete(key)
+        return self._download(method, key, headers.get("range"))
+
+    def _handle_upload(
+        self,
+        method: str,
+        bucket: str,
+        query: dict[str, str],
+        headers: dict[str, str],
+        body: bytes,
+    ) -> tuple[int, dict[str, str], bytes]:
+        upload_type = query.get("uploadType")
+        if method == "POST" and upload_type == "media":
+            return self._finish(
+                bucket, query["name"], body, headers.get("content-type", "")
+            )
+
+        if method == "POST" and upload_type == "multipart":
+            metadata, content_type, content = _parse_multipart(
+                headers["content-type"], body
+            )
+            return self._finish(
+                bucket,
+                metadata["name"],
+                content,
+                metadata.get("contentType", content_type),
+            )
+
+        if method == "POST" and upload_type == "resumable":
+            # Nome na query (uploads simples) ou nos metadados JSON do corpo
+            metadata = json.loads(body) if body else {}
+            upload_id = uuid4().hex
+            self._uploads[upload_id] = _ResumableUpload(
+                bucket,
+                query.get("name") or metadata["name"],
+                content_type=metadata.get("contentType")
+                or headers.get("x-upload-content-type", ""),
+            )
+            location = (
+                f"{self.url}/upload/storage/v1/b/{bucket}/o"
+                f"?uploadType=resumable&upload_id={upload_id}"
+            )
+            return 200, {"Location": location}, b""
+
+        if method == "PUT" and query.get("upload_id") in self._uploads:
+            return self._upload_chunk(
+                query["upload_id"], headers.get("content-range", ""), body
+            )
+        return 404, {}, b""
+
+    def _handle_object(
+        self, method: str, segments: list[str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        key = (segments[4], segments[6])
+
+        if len(segments) == 8 and segments[7] == "compose" and method == "POST":
+            request = json.loads(body)
+            sources = [(key[0], source["name"]) for source in request["sourceObjects"]]
+            if any(source not in self.objects for source in sources):
+                return 404, {}, b""
+            self.compose_requests.append(len(sources))
+            return self._finish(
+                *key,
+                b"".join(self.objects[source] for source in sources),
+                request.get("destination", {}).get("contentType", ""),
+            )
+
+        if len(segments) == 12 and segments[7] in ("copyTo", "rewriteTo"):
+            destination = (segments[9], segments[11])
+            if method != "POST" or key not in self.objects:
+                return 404, {}, b""
+            status, headers, resource = self._finish(
+                *destination, self.objects[key], self.content_types[key]
+            )
+            if segments[7] == "rewriteTo":
+                resource = json.dumps(
+                    {"done": True, "resource": json.loads(resource)}
+                ).encode()
+            return status, headers, resource
+
+        if len(segments) == 7 and method == "GET" and key in self.objects:
+            return 200, _JSON, json.dumps(self._resource(key)).encode()
+        if len(segments) == 7 and method == "DELETE":
+            return self._delete(key)
+        return 404, {}, b""
+
+    def _download(
+        self, method: str, key: tuple[str, str], range_header: str | None
+    ) -> tuple[int, dict[str, str], bytes]:
+        if method not in ("GET", "HEAD") or key not in self.objects:
+            return 404, {}, b""
+
+        data = self.objects[key]
+        headers = {
+            "Content-Type": self.content_types[key] or "application/octet-stream"
+        }
+        try:
+            byte_range = ByteRange.parse(range_header, len(data))
+        except RangeNotSatisfiable:
+            return 416, {"Content-Range": f"bytes */{len(data)}"}, b""
+        if byte_range is None:
+            return 200, headers, data
+
+        headers["Content-Range"] = (
+            f"bytes {byte_range.start}-{byte_range.end}/{len(data)}"
+        )
+        return 206, headers, data[byte_range.start : byte_range.end + 1]
+
+    def _delete(self, key: tuple[str, str]) -> tuple[int, dict[str, str], bytes]:
+        if key not in self.objects:
+            return 404, {}, b""
+        del self.objects[key]
+        del self.content_types[key]
+        return 204, {}, b""
+
+    def _upload_chunk(
+        self, upload_id: str, content_range: str, body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        upload = self._uploads[upload_id]
+        # "bytes <início>-<fim>/<total|*>" ou "bytes */<total>"
+        span, _, total = content_range.removeprefix("bytes ").partition("/")
+        total = None if total == "*" else int(total)
+
+        if span != "*" and self.stalled_chunks:
+            self.stalled_chunks -= 1
+            span = "*"
+        elif span != "*":
+            start = int(span.partition("-")[0])
+            if start > len(upload.data):
+                return 400, {}, b""
+            # Bytes já persistidos de um reenvio são ignorados
+            body = body[len(upload.data) - start :]
+            is_last = total is not None and len(upload.data) + len(body) == total
+            if not is_last and len(body) % UPLOAD_GRANULARITY:
+                return 400, {}, b""
+            if self.max_commit is not None and len(body) > self.max_commit:
+                body = body[: self.max_commit - self.max_commit % UPLOAD_GRANULARITY]
+            upload.data += body
+
+        if total is not None and len(upload.data) == total:
+            del self._uploads[upload_id]
+            return self._finish(
+                upload.bucket, upload.name, bytes(upload.data), upload.content_type
+            )
+
+        headers = {"Range": f"bytes=0-{len(upload.data) - 1}"} if upload.data else {}
+        return 308, headers, b""
+
+    def _finish(
+        self, bucket: str, name: str, data: bytes, content_type: str = ""
+    ) -> tuple[int, dict[str, str], bytes]:
+        self.objects[(bucket, name)] = data
+        self.content_types[(bucket, name)] = content_type
+        return 200, _JSON, json.dumps(self._resource((bucket, name))).encode()
+
+    def _resource(self, key: tuple[str, str]) -> dict:
+        bucket, name = key
+        resource = {
+            "kind": "storage#object",
+            "id": f"{bucket}/{name}/1",
+            "bucket": bucket,
+            "name": name,
+            "generation": "1",
+            "metageneration": "1",
+            "size": str(len(self.objects[key])),
+            "contentType": self.content_types[key],
+        }
+        if google_crc32c is not None:
+            checksum = google_crc32c.value(self.objects[key]).to_bytes(4, "big")
+            resource["crc32c"] = base64.b64encode(checksum).decode()
+        return resource
+
+
+def _parse_multipart(content_type: str, body: bytes) -> tuple[dict, str, bytes]:
+    # multipart/related: metadados JSON seguidos do conteúdo
+    boundary = content_type.partition("boundary=")[2].strip('"').encode()
+    metadata_part, media_part = body.split(b"--" + boundary)[1:3]
+    metadata = json.loads(metadata_part.partition(b"\r\n\r\n")[2])
+    media_headers, _, media = media_part.partition(b"\r\n\r\n")
+    media_type = media_headers.decode("latin-1").partition(":")[2].strip()
+    return metadata, media_type, media.removesuffix(b"\r\n")
+
+
+_JSON = {"Content-Type": "application/json"}
+
+
+_REASONS = {
+    200: "OK",
+    204: "No Content",
+    206: "Partial Content",
+    308: "Resume Incomplete",
+    400: "Bad Request",
+    404: "Not Found",
+    416: "Range Not Satisfiable",
+}
+
+
+def write_message(
+    writer: asyncio.StreamWriter,
+    start_line: str,
+    headers: dict[str, str],
+    body: bytes = b"",
+) -> None:
+    head = [start_line, *(f"{name}: {value}" for name, value in headers.items())]
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+    if body:
+        writer.write(body)
+
+
+async def read_head(
+    reader: asyncio.StreamReader,
+) -> tuple[str, dict[str, str]] | None:
+    line = await reader.readline()
+    if not line:
+        return None
+
+    start_line = line.decode("latin-1").rstrip("\r\n")
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return start_line, headers
+
+
+async def read_body(reader: asyncio.StreamReader, headers: dict[str, str]) -> bytes:
+    # Só o que os clientes dos testes enviam: Content-Length ou chunked
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        body = bytearray()
+        while size := int((await reader.readline()).split(b";")[0], 16):
+            body += await reader.readexactly(size)
+            await reader.readexactly(2)
+        await reader.readline()
+        return bytes(body)
+
+    return await reader.readexactly(int(headers.get("content-length", 0)))
@@ -1,18 +1,56 @@
+import io
 import mimetypes
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import chain
+from uuid import uuid4
 from django.conf import settings
 
+from google.api_core.exceptions import GoogleAPIError, NotFound
 from google.cloud import storage
 from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
 
-from src.core._shared.infra.storage.abstract_storage import AbstractStorage
+from src.core._shared.infra.storage.abstract_storage import (
+    AbstractStorage,
+    Stream,
+    iter_chunks,
+)
+from src.core._shared.infra.storage.byte_range import ByteRange
 
 
 class GCSStorage(AbstractStorage):
-    def __init__(self) -> None:
+    """
+    Arquivos maiores que part_size são enviados em partes paralelas
+    (max_workers threads) e unidos no servidor com compose; os menores
+    seguem em uma única request. Memória por upload limitada a
+    max_buffered_bytes.
+    """
+
+    PART_SIZE = 8 * 1024 * 1024
+    MAX_WORKERS = 4
+    # Limite de objetos de origem por chamada de compose no GCS
+    MAX_COMPOSE_SOURCES = 32
+
+    def __init__(
+        self,
+        client: storage.Client | None = None,
+        bucket_name: str | None = None,
+        part_size: int = PART_SIZE,
+        max_workers: int = MAX_WORKERS,
+    ) -> None:
         # Client vai procurar por env var GOOGLE_APPLICATION_CREDENTIALS
         # https://cloud.google.com/docs/authentication/provide-credentials-adc#how-to
-        self.client = storage.Client()
-        self.bucket = self.client.bucket(settings.CLOUD_STORAGE_BUCKET_NAME)
+        self.client = client or storage.Client()
+        self.bucket = self.client.bucket(
+            bucket_name or settings.CLOUD_STORAGE_BUCKET_NAME
+        )
+        self.part_size = part_size
+        self.max_workers = max_workers
+
+    @property
+    def max_buffered_bytes(self) -> int:
+        # Partes em envio, mais a parte lida enquanto aguarda uma thread livre
+        return (self.max_workers + 1) * self.part_size
 
     def store(self, file_path: Path, content: bytes, content_type: str = "") -> str:
         blob = self.bucket.blob(str(file_path))
@@ -20,9 +58,185 @@ class GCSStorage(AbstractStorage):
         if not content_type:
             content_type, _ = mimetypes.guess_type(str(file_path))
 
+        if len(content) > self.part_size:
+            parts = (
+                content[start : start + self.part_size]
+                for start in range(0, len(content), self.part_size)
+            )
+            return self._composite_upload(blob, parts, content_type)
+
         blob.upload_from_string(content, content_type=content_type)
         return blob.public_url
 
+    def store_stream(
+        self, file_path: Path, stream: Stream, content_type: str = ""
+    ) -> str:
+        if not content_type:
+            content_type, _ = mimetypes.guess_type(str(file_path))
+
+        # Sonda no máximo part_size + 1 bloco para escolher o caminho
+        chunks = iter_chunks(stream, self.CHUNK_SIZE)
+        probed, probed_size = [], 0
+        for chunk in chunks:
+            probed.append(chunk)
+            probed_size += len(chunk)
+            if probed_size > self.part_size:
+                break
+        chunks = chain(probed, chunks)
+
+        if probed_size > self.part_size:
+            return self._composite_upload(
+                self.bucket.blob(str(file_path)),
+                iter_parts(chunks, self.part_size),
+                content_type,
+            )
+
+        # Com chunk_size definido o client faz upload resumível, bloco a bloco
+        blob = self.bucket.blob(str(file_path), chunk_size=self.CHUNK_SIZE)
+        blob.upload_from_file(ChunkedReader(chunks), content_type=content_type)
+        return blob.public_url
+
+    def _composite_upload(
+        self, blob: storage.Blob, parts: Iterable[bytes], content_type: str | None
+    ) -> str:
+        prefix = f"{blob.name}.parts-{uuid4().hex}"
+        futures: list[Future] = []
+        composed: list[storage.Blob] = []
+
+        def upload_part(index: int, content: bytes) -> storage.Blob:
+            part = self.bucket.blob(f"{prefix}/part-{index:05d}")
+            part.upload_from_string(content, content_type=content_type)
+            return part
+
+        def compose_group(item: tuple[int, list[storage.Blob]]) -> storage.Blob:
+            index, group = item
+            target = self.bucket.blob(f"{prefix}/compose-{level}-{index:05d}")
+            return self._compose(target, group, content_type)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                # No máximo max_workers partes em memória por vez: a leitura
+                # do stream só avança quando um envio termina
+                pending: set[Future] = set()
+                for index, content in enumerate(parts):
+                    if len(pending) >= self.max_workers:
+                        _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    futures.append(executor.submit(upload_part, index, content))
+                    pending.add(futures[-1])
+                sources = [future.result() for future in futures]
+
+                # Compose aceita até 32 origens: agrupa em níveis até caber
+                level = 0
+                while len(sources) > self.MAX_COMPOSE_SOURCES:
+                    groups = [
+                        sources[start : start + self.MAX_COMPOSE_SOURCES]
+                        for start in range(0, len(sources), self.MAX_COMPOSE_SOURCES)
+                    ]
+                    sources = list(executor.map(compose_group, enumerate(groups)))
+                    composed.extend(sources)
+                    level += 1
+
+                self._compose(blob, sources, content_type)
+                return blob.public_url
+            finally:
+                # Remove os temporários, inclusive os enviados antes de uma falha
+                wait(futures)
+                uploaded = [
+                    future.result() for future in futures if not future.exception()
+                ]
+                list(executor.map(_delete_quietly, uploaded + composed))
+
+    @staticmethod
+    def _compose(
+        blob: storage.Blob, sources: list[storage.Blob], content_type: str | None
+    ) -> storage.Blob:
+        blob.content_type = content_type
+        blob.compose(sources)
+        return blob
+
     def retrieve(self, file_path: Path) -> bytes:
         blob = self.bucket.blob(str(file_path))
         return blob.download_as_bytes()
+
+    def delete(self, file_path: Path) -> None:
+        try:
+            self.bucket.blob(str(file_path)).delete()
+        except NotFound:
+            pass
+
+    def exists(self, file_path: Path) -> bool:
+        return self.bucket.blob(str(file_path)).exists()
+
+    def move(self, source: Path, destination: Path) -> None:
+        # Cópia no servidor (rewrite) seguida da remoção da origem
+        self.bucket.rename_blob(self.bucket.blob(str(source)), str(destination))
+
+    def size(self, file_path: Path) -> int:
+        blob = self.bucket.get_blob(str(file_path))
+        if blob is None:
+            raise FileNotFoundError(f"File {file_path} not found in bucket")
+        return blob.size
+
+    def open_range(self, file_path: Path, byte_range: ByteRange) -> BinaryIO:
+        blob = self.bucket.blob(str(file_path))
+        # Um GET com Range por bloco, feito só quando o leitor chega nele
+        return ChunkedReader(
+            blob.download_as_bytes(
+                start=start, end=min(start + self.CHUNK_SIZE, byte_range.end + 1) - 1
+            )
+            for start in range(byte_range.start, byte_range.end + 1, self.CHUNK_SIZE)
+        )
+
+
+def iter_parts(stream: Stream, part_size: int) -> Iterator[bytes]:
+    """Reagrupa o stream em partes de part_size bytes (a última pode ser menor)"""
+    buffer = bytearray()
+    for chunk in iter_chunks(stream, AbstractStorage.CHUNK_SIZE):
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _delete_quietly(blob: storage.Blob) -> None:
+    try:
+        blob.delete()
+    except GoogleAPIError:
+        pass
+
+
+class ChunkedReader(io.RawIOBase):
+    """Adapta um iterável de blocos de bytes para a interface de arquivo."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._pending = b""
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        # O upload resumível do client usa a posição como offset de cada bloco
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        # Preenche o buffer inteiro, se houver dados: o upload resumível
+        # trata uma leitura curta como o fim do arquivo
+        size = 0
+        while size < len(buffer):
+            if not self._pending:
+                # memoryview: consumir o bloco aos poucos não copia o restante
+                self._pending = memoryview(next(self._chunks, b""))
+                if not self._pending:
+                    break
+
+            count = min(len(buffer) - size, len(self._pending))
+            buffer[size : size + count] = self._pending[:count]
+            self._pending = self._pending[count:]
+            size += count
+
+        self._position += size
+        return size
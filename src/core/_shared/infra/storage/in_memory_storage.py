@@ -1,7 +1,12 @@
 from pathlib import Path
-from typing import Dict
+from typing import BinaryIO, Dict
 
-from src.core._shared.infra.storage.abstract_storage import AbstractStorage
+from src.core._shared.infra.storage.abstract_storage import (
+    AbstractStorage,
+    Stream,
+    iter_chunks,
+)
+from src.core._shared.infra.storage.byte_range import ByteRange, MemoryReader
 
 
 class InMemoryStorage(AbstractStorage):
@@ -18,6 +23,15 @@ class InMemoryStorage(AbstractStorage):
         key = str(file_path)
         self._storage[key] = content
         return f"memory://{key}"
+
+    def store_stream(
+        self, file_path: Path, stream: Stream, content_type: str = ""
+    ) -> str:
+        """Armazena um arquivo em memória lendo-o em blocos"""
+        buffer = bytearray()
+        for chunk in iter_chunks(stream, self.CHUNK_SIZE):
+            buffer.extend(chunk)
+        return self.store(file_path, bytes(buffer), content_type)
     
     def retrieve(self, file_path: Path) -> bytes:
         """Recupera um arquivo da memória"""
@@ -26,6 +40,27 @@ class InMemoryStorage(AbstractStorage):
             raise FileNotFoundError(f"File {file_path} not found in memory storage")
         return self._storage[key]
     
+    def delete(self, file_path: Path) -> None:
+        """Remove um arquivo da memória"""
+        self._storage.pop(str(file_path), None)
+    
+    def size(self, file_path: Path) -> int:
+        """Tamanho de um arquivo em memória"""
+        return len(self.retrieve(file_path))
+
+    def exists(self, file_path: Path) -> bool:
+        """Indica se o arquivo está em memória"""
+        return str(file_path) in self._storage
+
+    def move(self, source: Path, destination: Path) -> None:
+        """Renomeia um arquivo em memória"""
+        self._storage[str(destination)] = self._storage.pop(str(source))
+
+    def open_range(self, file_path: Path, byte_range: ByteRange) -> BinaryIO:
+        """Lê um intervalo do arquivo por fatias de memoryview, sem cópias"""
+        view = memoryview(self.retrieve(file_path))
+        return MemoryReader(view[byte_range.start : byte_range.end + 1])
+    
     def clear(self):
         """Limpa todo o storage em memória"""
         self._storage.clear()
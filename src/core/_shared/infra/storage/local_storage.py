@@ -1,6 +1,12 @@
 from pathlib import Path
+from typing import BinaryIO
 
-from src.core._shared.infra.storage.abstract_storage import AbstractStorage
+from src.core._shared.infra.storage.abstract_storage import (
+    AbstractStorage,
+    Stream,
+    iter_chunks,
+)
+from src.core._shared.infra.storage.byte_range import ByteRange, RangeReader
 
 
 class LocalStorage(AbstractStorage):
@@ -23,6 +29,43 @@ class LocalStorage(AbstractStorage):
 
         return full_path.as_uri()
 
+    def store_stream(
+        self, file_path: Path, stream: Stream, content_type: str = ""
+    ) -> str:
+        full_path = self.bucket.joinpath(file_path)
+
+        if not full_path.parent.exists():
+            full_path.parent.mkdir(parents=True)
+
+        # Escreve em blocos de CHUNK_SIZE: memória limitada ao tamanho do bloco
+        with open(full_path, "wb") as file:
+            for chunk in iter_chunks(stream, self.CHUNK_SIZE):
+                file.write(chunk)
+
+        return full_path.as_uri()
+
     def retrieve(self, file_path: Path) -> bytes:
         with open(self.bucket.joinpath(file_path), "rb") as file:
             return file.read()
+
+    def delete(self, file_path: Path) -> None:
+        self.bucket.joinpath(file_path).unlink(missing_ok=True)
+
+    def size(self, file_path: Path) -> int:
+        return self.bucket.joinpath(file_path).stat().st_size
+
+    def exists(self, file_path: Path) -> bool:
+        return self.bucket.joinpath(file_path).exists()
+
+    def move(self, source: Path, destination: Path) -> None:
+        full_path = self.bucket.joinpath(destination)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        # Atômico no mesmo sistema de arquivos
+        self.bucket.joinpath(source).replace(full_path)
+
+    def open_range(self, file_path: Path, byte_range: ByteRange) -> BinaryIO:
+        # Sem buffer: a posição do descritor é exatamente o início do intervalo,
+        # que é de onde o os.sendfile do servidor WSGI parte
+        file = open(self.bucket.joinpath(file_path), "rb", buffering=0)
+        file.seek(byte_range.start)
+        return RangeReader(file, byte_range.length)
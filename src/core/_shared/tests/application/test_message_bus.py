@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from unittest.mock import create_autospec
 
+import pytest
+
 from src.core._shared.application.handlers import Handler
 from src.core._shared.events.event import Event
 from src.core._shared.events.message_bus import MessageBus
@@ -21,3 +23,14 @@ class TestMessageBus:
         message_bus.handle([event])
 
         dummy_handler.handle.assert_called_once_with(event)
+
+    def test_propagates_handler_errors_when_raise_errors_is_set(self) -> None:
+        failing_handler = create_autospec(Handler)
+        failing_handler.handle.side_effect = ConnectionError("broker down")
+        message_bus = MessageBus(raise_errors=True)
+        event = DummyEvent()
+
+        message_bus.handlers[type(event)] = [failing_handler]
+
+        with pytest.raises(ConnectionError):
+            message_bus.handle([event])
@@ -0,0 +1,70 @@
+from src.core._shared.application.use_cases.list_use_case import ListOutputMeta
+from src.core._shared.application.use_cases.search_use_case import SearchRequest
+from src.core._shared.domain.search import SearchDocument
+from src.core._shared.infra.search.in_memory_search_engine import (
+    InMemorySearchEngine,
+)
+from src.core.category.application.use_cases.list_category import CategoryOutput
+from src.core.category.application.use_cases.search_category import SearchCategory
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import (
+    InMemoryCategoryRepository,
+)
+
+
+def index(engine: InMemorySearchEngine, *categories: Category) -> None:
+    engine.index(
+        SearchDocument(
+            entity_type="category",
+            entity_id=category.id,
+            title=category.name,
+            body=category.description,
+        )
+        for category in categories
+    )
+
+
+class TestSearchUseCase:
+    def test_returns_outputs_in_relevance_order(self):
+        in_description = Category(name="Séries", description="Ação e aventura")
+        in_name = Category(name="Ação", description="Filmes")
+        unrelated = Category(name="Drama", description="")
+        repository = InMemoryCategoryRepository([in_description, in_name, unrelated])
+        engine = InMemorySearchEngine()
+        index(engine, in_description, in_name, unrelated)
+
+        response = SearchCategory(repository, engine).execute(
+            SearchRequest(text="acao")
+        )
+
+        assert [output.id for output in response.data] == [
+            in_name.id,
+            in_description.id,
+        ]
+        assert response.data[0] == CategoryOutput(
+            id=in_name.id, name="Ação", description="Filmes", is_active=True
+        )
+        assert response.meta == ListOutputMeta(current_page=1, per_page=2, total=2)
+
+    def test_paginates_by_page_number(self):
+        categories = [Category(name=f"Documentário {index}") for index in range(5)]
+        engine = InMemorySearchEngine()
+        index(engine, *categories)
+
+        response = SearchCategory(
+            InMemoryCategoryRepository(categories), engine
+        ).execute(SearchRequest(text="docu", current_page=3, per_page=2))
+
+        assert len(response.data) == 1
+        assert response.meta == ListOutputMeta(current_page=3, per_page=2, total=5)
+
+    def test_skips_ids_no_longer_in_repository(self):
+        category = Category(name="Anime")
+        engine = InMemorySearchEngine()
+        index(engine, category)
+
+        response = SearchCategory(InMemoryCategoryRepository(), engine).execute(
+            SearchRequest(text="anime")
+        )
+
+        assert response.data == []
@@ -0,0 +1,242 @@
+import asyncio
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+
+from src.core._shared.infra.storage.abstract_async_storage import aiter_chunks
+from src.core._shared.infra.storage.abstract_storage import blob_path
+from src.core._shared.infra.storage.async_gcs_storage import (
+    AsyncGCSStorage,
+    GCSRequestError,
+)
+from src.core._shared.infra.storage.async_in_memory_storage import (
+    AsyncInMemoryStorage,
+)
+from src.core._shared.infra.storage.async_local_storage import AsyncLocalStorage
+from src.core._shared.infra.storage.fake_gcs_server import FakeGCSServer
+from src.core._shared.infra.storage.in_memory_storage import InMemoryStorage
+
+KIB = 1024
+
+
+async def collect(chunks) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+async def agenerate(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestAiterChunks:
+    def test_reads_file_like_objects_in_fixed_size_chunks(self):
+        stream = io.BytesIO(b"abcdefghij")
+
+        chunks = asyncio.run(collect(aiter_chunks(stream, chunk_size=4)))
+
+        assert chunks == [b"abcd", b"efgh", b"ij"]
+
+    def test_passes_through_sync_and_async_iterables_skipping_empty_chunks(self):
+        assert asyncio.run(collect(aiter_chunks(iter([b"ab", b"", b"cd"])))) == [
+            b"ab",
+            b"cd",
+        ]
+        assert asyncio.run(collect(aiter_chunks(agenerate(b"ab", b"", b"cd")))) == [
+            b"ab",
+            b"cd",
+        ]
+
+
+class TestAsyncLocalStorage:
+    def test_store_stream_retrieve_and_delete(self, tmp_path, monkeypatch):
+        storage = AsyncLocalStorage(bucket=str(tmp_path))
+        monkeypatch.setattr(storage, "CHUNK_SIZE", 3)
+        path = Path("videos/1/video.mp4")
+
+        async def scenario():
+            uri = await storage.store_stream(path, io.BytesIO(b"video content"))
+            content = await storage.retrieve(path)
+            await storage.delete(path)
+            await storage.delete(path)
+            return uri, content
+
+        uri, content = asyncio.run(scenario())
+
+        assert uri == tmp_path.joinpath("videos/1/video.mp4").as_uri()
+        assert content == b"video content"
+        assert not tmp_path.joinpath("videos/1/video.mp4").exists()
+
+
+class TestAsyncInMemoryStorage:
+    def test_shares_files_with_wrapped_sync_storage(self):
+        sync_storage = InMemoryStorage()
+        storage = AsyncInMemoryStorage(sync_storage)
+
+        asyncio.run(
+            storage.store_stream(Path("videos/1/video.mp4"), agenerate(b"a", b"b"))
+        )
+
+        assert sync_storage.retrieve(Path("videos/1/video.mp4")) == b"ab"
+
+
+class TestAsyncGCSStorage:
+    def run_against_fake_gcs(self, scenario, **server_options):
+        async def main():
+            async with FakeGCSServer(**server_options) as server:
+                storage = AsyncGCSStorage(bucket="codeflix", endpoint=server.url)
+                try:
+                    return server, await scenario(storage)
+                finally:
+                    await storage.close()
+
+        return asyncio.run(main())
+
+    def test_store_uses_simple_upload_and_retrieve_uses_xml_api(self):
+        path = Path("videos/1/my video.mp4")
+
+        async def scenario(storage):
+            url = await storage.store(path, b"video content")
+            return url, await storage.retrieve(path)
+
+        server, (url, content) = self.run_against_fake_gcs(scenario)
+
+        assert url == f"{server.url}/codeflix/videos/1/my%20video.mp4"
+        assert content == b"video content"
+        assert server.requests[-1] == ("GET", "/codeflix/videos/1/my%20video.mp4")
+
+    def test_store_stream_uploads_resumable_chunks(self, monkeypatch):
+        monkeypatch.setattr(AsyncGCSStorage, "CHUNK_SIZE", 256 * KIB)
+        content = bytes(range(256)) * 3 * KIB + b"tail"  # 768 KiB + 4 bytes
+
+        async def scenario(storage):
+            await storage.store_stream(
+                Path("videos/1/video.mp4"), io.BytesIO(content), "video/mp4"
+            )
+
+        server, _ = self.run_against_fake_gcs(scenario)
+
+        assert server.objects[("codeflix", "videos/1/video.mp4")] == content
+        assert [method for method, _ in server.requests] == ["POST"] + ["PUT"] * 4
+
+    def test_store_stream_resends_bytes_not_persisted_by_server(self, monkeypatch):
+        monkeypatch.setattr(AsyncGCSStorage, "CHUNK_SIZE", 512 * KIB)
+        content = b"x" * (1024 * KIB + 10)
+
+        async def scenario(storage):
+            await storage.store_stream(
+                Path("video.mp4"), agenerate(content[:100], content[100:])
+            )
+
+        server, _ = self.run_against_fake_gcs(scenario, max_commit=256 * KIB)
+
+        assert server.objects[("codeflix", "video.mp4")] == content
+
+    def test_store_stream_resends_chunk_when_server_reports_no_progress(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr(AsyncGCSStorage, "CHUNK_SIZE", 256 * KIB)
+        monkeypatch.setattr(AsyncGCSStorage, "RETRY_BACKOFF", 0)
+        content = b"x" * (512 * KIB + 10)
+
+        async def scenario(storage):
+            await storage.store_stream(Path("video.mp4"), [content])
+
+        server, _ = self.run_against_fake_gcs(scenario, stalled_chunks=2)
+
+        assert server.objects[("codeflix", "video.mp4")] == content
+        assert [method for method, _ in server.requests] == ["POST"] + ["PUT"] * 5
+
+    def test_store_stream_gives_up_after_max_retries_without_progress(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr(AsyncGCSStorage, "CHUNK_SIZE", 256 * KIB)
+        monkeypatch.setattr(AsyncGCSStorage, "RETRY_BACKOFF", 0)
+
+        async def scenario(storage):
+            with pytest.raises(GCSRequestError):
+                await storage.store_stream(Path("video.mp4"), [b"x" * 512 * KIB])
+
+        server, _ = self.run_against_fake_gcs(scenario, stalled_chunks=100)
+
+        assert ("codeflix", "video.mp4") not in server.objects
+
+    def test_same_storage_can_be_used_from_different_event_loops(self):
+        with FakeGCSServer().running_in_thread() as server:
+            storage = AsyncGCSStorage(bucket="codeflix", endpoint=server.url)
+
+            async def store(name: str):
+                await storage.store(Path(name), name.encode())
+                return await storage._http_client()
+
+            # Como em async_to_sync: cada chamada roda em um loop novo
+            first = asyncio.run(store("a.mp4"))
+            second = asyncio.run(store("b.mp4"))
+
+        assert server.objects[("codeflix", "b.mp4")] == b"b.mp4"
+        # Cada pool é fechado junto com o seu loop
+        assert first is not second
+        assert first.is_closed and second.is_closed
+
+    def test_close_closes_the_pool_of_the_running_loop(self):
+        async def scenario(storage):
+            await storage.exists(Path("video.mp4"))
+            client = await storage._http_client()
+            await storage.close()
+            return client
+
+        _, client = self.run_against_fake_gcs(scenario)
+
+        assert client.is_closed
+
+    def test_store_stream_with_empty_content(self):
+        async def scenario(storage):
+            await storage.store_stream(Path("empty.mp4"), iter([]))
+
+        server, _ = self.run_against_fake_gcs(scenario)
+
+        assert server.objects[("codeflix", "empty.mp4")] == b""
+
+    def test_retrieve_missing_file_raises_and_delete_is_idempotent(self):
+        async def scenario(storage):
+            await storage.store(Path("video.mp4"), b"content")
+            await storage.delete(Path("video.mp4"))
+            await storage.delete(Path("video.mp4"))
+            with pytest.raises(FileNotFoundError):
+                await storage.retrieve(Path("video.mp4"))
+
+        server, _ = self.run_against_fake_gcs(scenario)
+
+        assert server.objects == {}
+
+    def test_store_blob_moves_content_server_side_and_skips_duplicates(self):
+        checksum = hashlib.sha256(b"video content").hexdigest()
+
+        async def scenario(storage):
+            first = await storage.store_blob(agenerate(b"video ", b"content"))
+            second = await storage.store_blob([b"video content"])
+            return first, second
+
+        server, (first, second) = self.run_against_fake_gcs(scenario)
+
+        assert first.path == second.path == blob_path(checksum)
+        assert (first.created, second.created) == (True, False)
+        assert server.objects == {
+            ("codeflix", str(blob_path(checksum))): b"video content"
+        }
+
+    def test_concurrent_uploads_share_the_event_loop(self):
+        async def scenario(storage):
+            await asyncio.gather(
+                *(
+                    storage.store_stream(Path(f"video-{i}.mp4"), [b"content"])
+                    for i in range(10)
+                )
+            )
+
+        server, _ = self.run_against_fake_gcs(scenario, latency=0.02)
+
+        assert len(server.objects) == 10
+        # Com I/O bloqueante as requests chegariam uma de cada vez
+        assert server.max_in_flight > 1
@@ -0,0 +1,135 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.core._shared.infra.cache.backends import MISSING, LocalLRUCache, TieredCache
+from src.core._shared.infra.cache.cached_repository import (
+    CachedRepository,
+    RepositoryCache,
+)
+from src.core.category.application.category_repository import CategoryRepository
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import (
+    InMemoryCategoryRepository,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLocalLRUCache:
+    def test_evicts_least_recently_used_entry(self):
+        cache = LocalLRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is MISSING
+        assert cache.get("c") == 3
+
+    def test_expires_entries_after_ttl(self):
+        clock = FakeClock()
+        cache = LocalLRUCache(ttl=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10
+        assert cache.get("a") is MISSING
+        assert len(cache) == 0
+
+    def test_returns_copies_of_cached_values(self):
+        cache = LocalLRUCache()
+        value = {"name": "Movie"}
+        cache.set("a", value)
+
+        value["name"] = "Changed"
+        cache.get("a")["name"] = "Changed again"
+
+        assert cache.get("a") == {"name": "Movie"}
+
+
+class TestTieredCache:
+    def test_shared_hit_populates_local_cache(self):
+        local, shared = LocalLRUCache(), LocalLRUCache()
+        cache = TieredCache(local=local, shared=shared)
+        shared.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert local.get("a") == 1
+
+    def test_delete_removes_from_both_tiers(self):
+        local, shared = LocalLRUCache(), LocalLRUCache()
+        cache = TieredCache(local=local, shared=shared)
+        cache.set("a", 1)
+
+        cache.delete("a")
+
+        assert local.get("a") is MISSING
+        assert shared.get("a") is MISSING
+
+
+@pytest.fixture
+def category() -> Category:
+    return Category(name="Movie", description="Movie description")
+
+
+@pytest.fixture
+def cache() -> RepositoryCache:
+    return RepositoryCache("category", LocalLRUCache())
+
+
+class TestCachedRepository:
+    def test_reads_through_and_counts_hits_and_misses(self, category, cache):
+        repository = create_autospec(CategoryRepository)
+        repository.get_by_id.return_value = category
+        cached = CachedRepository(repository, cache)
+
+        assert cached.get_by_id(category.id) == category
+        assert cached.get_by_id(category.id) == category
+
+        repository.get_by_id.assert_called_once_with(category.id)
+        metrics = cache.metrics
+        assert (metrics.hits, metrics.misses) == (1, 1)
+        assert metrics.hit_ratio == 0.5
+
+    def test_does_not_cache_missing_entities(self, category, cache):
+        repository = InMemoryCategoryRepository()
+        cached = CachedRepository(repository, cache)
+
+        assert cached.get_by_id(category.id) is None
+        repository.save(category)
+
+        assert cached.get_by_id(category.id) == category
+
+    def test_update_invalidates_cached_entity(self, category, cache):
+        cached = CachedRepository(InMemoryCategoryRepository([category]), cache)
+        cached_category = cached.get_by_id(category.id)
+
+        cached_category.update_category(name="Series", description="Series")
+        cached.update(cached_category)
+
+        assert cached.get_by_id(category.id).name == "Series"
+        assert cache.metrics.invalidations == 1
+
+    def test_delete_invalidates_cached_entity(self, category, cache):
+        cached = CachedRepository(InMemoryCategoryRepository([category]), cache)
+        cached.get_by_id(category.id)
+
+        cached.delete(category.id)
+
+        assert cached.get_by_id(category.id) is None
+
+    def test_delegates_other_methods(self, category, cache):
+        cached = CachedRepository(InMemoryCategoryRepository([category]), cache)
+
+        assert cached.list() == [category]
+        assert cached.find_missing_ids({category.id}) == set()
@@ -0,0 +1,146 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("google.cloud.storage")
+
+from google.api_core.client_options import ClientOptions  # noqa: E402
+from google.api_core.exceptions import NotFound  # noqa: E402
+from google.auth.credentials import AnonymousCredentials  # noqa: E402
+from google.cloud import storage  # noqa: E402
+
+from src.core._shared.infra.storage.byte_range import ByteRange  # noqa: E402
+from src.core._shared.infra.storage.fake_gcs_server import (  # noqa: E402
+    FakeGCSServer,
+)
+from src.core._shared.infra.storage.gcs_storage import GCSStorage  # noqa: E402
+
+BUCKET = "codeflix"
+KIB = 1024
+
+
+@pytest.fixture
+def server():
+    with FakeGCSServer().running_in_thread() as server:
+        yield server
+
+
+def make_storage(server: FakeGCSServer, **kwargs) -> GCSStorage:
+    client = storage.Client(
+        project="test",
+        credentials=AnonymousCredentials(),
+        client_options=ClientOptions(api_endpoint=server.url),
+    )
+    return GCSStorage(client=client, bucket_name=BUCKET, **kwargs)
+
+
+def uploads(server: FakeGCSServer) -> list[tuple[str, str]]:
+    return [
+        (method, target)
+        for method, target in server.requests
+        if target.startswith("/upload/")
+    ]
+
+
+class TestStore:
+    def test_small_payload_is_uploaded_in_a_single_request(self, server):
+        gcs = make_storage(server, part_size=4 * KIB)
+
+        gcs.store(Path("videos/1/video.mp4"), b"x" * 4 * KIB)
+
+        assert server.objects == {(BUCKET, "videos/1/video.mp4"): b"x" * 4 * KIB}
+        assert server.content_types[(BUCKET, "videos/1/video.mp4")] == "video/mp4"
+        assert len(uploads(server)) == 1
+        assert server.compose_requests == []
+
+    def test_large_payload_is_uploaded_in_parallel_parts_and_composed(self, server):
+        gcs = make_storage(server, part_size=4 * KIB, max_workers=3)
+        content = bytes(range(256)) * 40  # 10 KiB: 3 partes
+
+        gcs.store(Path("videos/1/video.mp4"), content, "video/mp4")
+
+        assert len(uploads(server)) == 3
+        assert server.compose_requests == [3]
+        # Partes temporárias removidas: só o objeto final permanece
+        assert server.objects == {(BUCKET, "videos/1/video.mp4"): content}
+        assert server.content_types[(BUCKET, "videos/1/video.mp4")] == "video/mp4"
+        assert server.max_in_flight <= 3
+
+    def test_more_parts_than_compose_limit_are_composed_in_levels(self, server):
+        gcs = make_storage(server, part_size=KIB)
+        content = bytes(range(256)) * 4 * 70  # 70 partes: 3 grupos, depois o final
+
+        gcs.store(Path("videos/1/video.mp4"), content)
+
+        # Os compose do primeiro nível são paralelos; o final vem por último
+        assert sorted(server.compose_requests[:3]) == [6, 32, 32]
+        assert server.compose_requests[3] == 3
+        assert server.objects == {(BUCKET, "videos/1/video.mp4"): content}
+
+    def test_when_compose_fails_then_uploaded_parts_are_removed(
+        self, server, monkeypatch
+    ):
+        gcs = make_storage(server, part_size=KIB)
+
+        def fail(blob, sources, content_type):
+            raise NotFound("compose")
+
+        monkeypatch.setattr(GCSStorage, "_compose", staticmethod(fail))
+
+        with pytest.raises(NotFound):
+            gcs.store(Path("videos/1/video.mp4"), b"x" * 3 * KIB)
+
+        assert len(uploads(server)) == 3
+        assert server.objects == {}
+
+
+class TestStoreStream:
+    def test_stream_larger_than_part_size_uses_composite_upload(self, server):
+        gcs = make_storage(server, part_size=4 * KIB)
+        chunks = [bytes([i]) * 3 * KIB for i in range(3)]
+
+        gcs.store_stream(Path("videos/1/video.mp4"), iter(chunks))
+
+        assert len(uploads(server)) == 3
+        assert server.compose_requests == [3]
+        assert server.objects == {(BUCKET, "videos/1/video.mp4"): b"".join(chunks)}
+
+    def test_stream_within_part_size_keeps_chunked_resumable_upload(self, server):
+        gcs = make_storage(server, part_size=1024 * KIB)
+        gcs.CHUNK_SIZE = 256 * KIB
+        # Blocos menores que CHUNK_SIZE, como os de UploadedFile.chunks()
+        chunks = [bytes([i]) * 64 * KIB for i in range(10)]
+
+        gcs.store_stream(Path("videos/1/video.mp4"), iter(chunks))
+
+        assert server.objects == {(BUCKET, "videos/1/video.mp4"): b"".join(chunks)}
+        assert server.compose_requests == []
+        assert [method for method, _ in uploads(server)] == ["POST"] + ["PUT"] * 3
+        assert "uploadType=resumable" in uploads(server)[0][1]
+
+    def test_memory_bound_follows_part_size_and_workers(self, server):
+        gcs = make_storage(server, part_size=4 * KIB, max_workers=2)
+
+        assert gcs.max_buffered_bytes == 12 * KIB
+
+
+class TestRead:
+    def test_retrieve_size_and_open_range(self, server):
+        gcs = make_storage(server, part_size=KIB)
+        content = bytes(range(256)) * 12
+        path = Path("videos/1/video.mp4")
+        gcs.store(path, content)
+
+        assert gcs.retrieve(path) == content
+        assert gcs.size(path) == len(content)
+        assert gcs.open_range(path, ByteRange(10, 1999)).read() == content[10:2000]
+
+    def test_delete_is_idempotent(self, server):
+        gcs = make_storage(server)
+        path = Path("videos/1/video.mp4")
+        gcs.store(path, b"content")
+
+        gcs.delete(path)
+        gcs.delete(path)
+
+        assert server.objects == {}
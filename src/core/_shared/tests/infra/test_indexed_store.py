@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from src.core._shared.domain.pagination import (
+    PageQuery,
+    SortDirection,
+    paginate_in_memory,
+)
+from src.core._shared.infra.in_memory.indexed_store import IndexedStore
+from src.core.category.domain.category import Category
+
+
+@pytest.fixture
+def categories() -> list[Category]:
+    # Nomes repetidos: o desempate é pelo id, como no ORM
+    names = ["Drama", "Ação", "Comédia", "Drama", "Terror", "Ação", "Anime"]
+    return [Category(name=name) for name in names]
+
+
+class TestIndexedStore:
+    def test_update_keeps_insertion_position(self, categories):
+        store = IndexedStore(categories, indexes=("name",))
+        first = categories[0]
+
+        first.name = "Zumbi"
+        store.add(first)
+
+        assert store[0] is first
+        assert len(store) == len(categories)
+        assert store.paginate(PageQuery(limit=100)).items[-1] is first
+
+    def test_remove_drops_entity_from_indexes(self, categories):
+        store = IndexedStore(categories, indexes=("name",))
+
+        removed = store.remove(categories[1].id)
+
+        assert removed is categories[1]
+        assert store.get(categories[1].id) is None
+        assert categories[1] not in store.paginate(PageQuery(limit=100)).items
+        assert store.remove(categories[1].id) is None
+
+    def test_missing_ids(self, categories):
+        store = IndexedStore(categories[:2])
+
+        assert store.missing_ids({categories[0].id, categories[2].id}) == {
+            categories[2].id
+        }
+
+    @pytest.mark.parametrize("direction", list(SortDirection))
+    @pytest.mark.parametrize("offset, limit", [(0, 2), (1, 3), (5, 5), (10, 1)])
+    def test_indexed_pages_match_unindexed_pagination(
+        self, categories, direction, offset, limit
+    ):
+        store = IndexedStore(indexes=("name",))
+        for category in random.sample(categories, len(categories)):
+            store.add(category)
+
+        query = PageQuery(direction=direction, offset=offset, limit=limit)
+
+        assert store.paginate(query) == paginate_in_memory(categories, query)
+
+    @pytest.mark.parametrize("direction", list(SortDirection))
+    def test_keyset_pages_match_unindexed_pagination(self, categories, direction):
+        store = IndexedStore(categories, indexes=("name",))
+        ordered = paginate_in_memory(
+            categories, PageQuery(direction=direction, limit=100)
+        ).items
+
+        for position, last in enumerate(ordered):
+            query = PageQuery(direction=direction, limit=2, after=(last.name, last.id))
+            assert store.paginate(query) == paginate_in_memory(categories, query)
+            assert store.paginate(query).items == ordered[position + 1 : position + 3]
+
+    def test_unindexed_field_falls_back_to_full_scan(self, categories):
+        store = IndexedStore(categories, indexes=("name",))
+        query = PageQuery(order_by="description", limit=3)
+
+        assert store.paginate(query) == paginate_in_memory(categories, query)
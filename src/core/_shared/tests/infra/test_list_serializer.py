@@ -0,0 +1,113 @@
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from rest_framework import serializers
+
+from src.core._shared.application.use_cases.list_use_case import (
+    ListOutputMeta,
+    ListResponse,
+)
+from src.core._shared.infra.django.serializers import build_representation
+from src.core.cast_member.application.use_cases.list_cast_member import (
+    CastMemberOutput,
+)
+from src.core.category.application.use_cases.list_category import CategoryOutput
+from src.core.genre.application.use_cases.list_genre import GenreOutput
+from src.django_project.cast_member_app.serializers import (
+    CastMemberOutputSerializer,
+    ListCastMemberOutputSerializer,
+)
+from src.django_project.category_app.serializers import (
+    CategoryResponseSerializer,
+    ListCategoryResponseSerializer,
+)
+from src.django_project.genre_app.serializers import (
+    GenreOutputSerializer,
+    ListGenreOutputSerializer,
+)
+
+
+def drf_representation(item_serializer, response):
+    return [item_serializer.to_representation(item) for item in response.data]
+
+
+@pytest.mark.parametrize(
+    "list_serializer, item_serializer, items",
+    [
+        (
+            ListCategoryResponseSerializer,
+            CategoryResponseSerializer,
+            [
+                CategoryOutput(
+                    id=uuid4(), name="Movie", description="", is_active=True
+                ),
+                CategoryOutput(
+                    id=uuid4(), name="Series", description="Tv", is_active=False
+                ),
+            ],
+        ),
+        (
+            ListGenreOutputSerializer,
+            GenreOutputSerializer,
+            [
+                GenreOutput(
+                    id=uuid4(),
+                    name="Drama",
+                    categories={uuid4(), uuid4()},
+                    is_active=True,
+                ),
+                GenreOutput(
+                    id=uuid4(), name="Action", categories=set(), is_active=False
+                ),
+            ],
+        ),
+        (
+            ListCastMemberOutputSerializer,
+            CastMemberOutputSerializer,
+            [CastMemberOutput(id=uuid4(), name="John", type="ACTOR")],
+        ),
+    ],
+)
+def test_fast_path_matches_drf_representation(list_serializer, item_serializer, items):
+    response = ListResponse(data=items, meta=ListOutputMeta(total=len(items)))
+
+    data = list_serializer(response).data
+
+    assert data["data"] == drf_representation(item_serializer(), response)
+    assert data["meta"] == {
+        "current_page": 1,
+        "per_page": response.meta.per_page,
+        "total": len(items),
+        "next_cursor": None,
+    }
+
+
+class CustomFieldSerializer(serializers.Serializer):
+    id = serializers.UUIDField(format="hex")
+    amount = serializers.DecimalField(max_digits=5, decimal_places=2)
+    label = serializers.CharField(source="name", allow_null=True)
+    secret = serializers.CharField(write_only=True)
+
+
+class TestBuildRepresentation:
+    def test_is_built_once_per_serializer_class(self):
+        assert build_representation(CustomFieldSerializer) is build_representation(
+            CustomFieldSerializer
+        )
+
+    def test_falls_back_to_drf_for_other_fields(self):
+        item = SimpleNamespace(id=uuid4(), amount=Decimal("1.5"), name=None)
+
+        representation = build_representation(CustomFieldSerializer)(item)
+
+        assert representation == {"id": item.id.hex, "amount": "1.50", "label": None}
+
+    def test_uses_drf_getter_for_nested_sources(self):
+        class NestedSerializer(serializers.Serializer):
+            owner = serializers.CharField(source="owner.name")
+
+        item = SimpleNamespace(owner=SimpleNamespace(name="John"))
+
+        assert build_representation(NestedSerializer)(item) == {"owner": "John"}
@@ -0,0 +1,47 @@
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core._shared.application.use_cases.exceptions import InvalidCursor
+from src.core._shared.domain.pagination import PageQuery
+from src.core._shared.infra.django.pagination import (
+    apaginate_queryset,
+    paginate_queryset,
+)
+from src.django_project.category_app.models import Category
+from src.django_project.video_app.models import Video
+
+
+@pytest.mark.django_db
+class TestKeysetCursorValue:
+    @pytest.mark.parametrize(
+        "model, order_by, value",
+        [
+            (Category, "version", "abc"),
+            (Category, "updated_at", "zzz"),
+            (Category, "is_active", "abc"),
+            (Video, "launch_year", "abc"),
+        ],
+    )
+    def test_value_not_accepted_by_field_raises_invalid_cursor(
+        self, model, order_by, value
+    ):
+        query = PageQuery(order_by=order_by, after=(value, uuid4()))
+
+        with pytest.raises(InvalidCursor):
+            paginate_queryset(model.objects.all(), query)
+        with pytest.raises(InvalidCursor):
+            # Antes de qualquer consulta: a conversão não depende do loop
+            apaginate_queryset(model.objects.all(), query).send(None)
+
+    def test_value_is_converted_to_field_type(self):
+        Category.objects.create(name="Movie")
+        updated = Category.objects.create(name="Series")
+        updated.save()
+
+        page = paginate_queryset(
+            Category.objects.all(),
+            PageQuery(order_by="version", after=("1", UUID(int=2**128 - 1))),
+        )
+
+        assert [category.id for category in page.items] == [updated.id]
@@ -0,0 +1,148 @@
+import threading
+from types import SimpleNamespace
+
+from src.core._shared.infra.events import rabbitmq_consumer
+from src.core._shared.infra.events.rabbitmq_consumer import ConcurrentRabbitMQConsumer
+
+
+class FakeChannel:
+    def __init__(self, deliveries):
+        self.deliveries = deliveries
+        self.qos = None
+        self.acks = []
+        self.nacks = []
+        self.stopped = False
+
+    def queue_declare(self, queue):
+        pass
+
+    def basic_qos(self, prefetch_count):
+        self.qos = prefetch_count
+
+    def basic_consume(self, queue, on_message_callback):
+        self.on_message_callback = on_message_callback
+
+    def start_consuming(self):
+        # Entrega tudo e retorna, como após um stop_consuming
+        for tag, (body, redelivered) in enumerate(self.deliveries, start=1):
+            method = SimpleNamespace(delivery_tag=tag, redelivered=redelivered)
+            self.on_message_callback(self, method, None, body)
+
+    def stop_consuming(self):
+        self.stopped = True
+
+    def basic_ack(self, delivery_tag):
+        self.acks.append(delivery_tag)
+
+    def basic_nack(self, delivery_tag, requeue):
+        self.nacks.append((delivery_tag, requeue))
+
+
+class FakeConnection:
+    def __init__(self, channel):
+        self._channel = channel
+        self.is_open = True
+        self.pending_callbacks = []
+        self.lock = threading.Lock()
+
+    def channel(self):
+        return self._channel
+
+    def add_callback_threadsafe(self, callback):
+        with self.lock:
+            self.pending_callbacks.append(callback)
+
+    def process_data_events(self, time_limit=None):
+        with self.lock:
+            callbacks, self.pending_callbacks = self.pending_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def close(self):
+        self.is_open = False
+
+
+class RecordingConsumer(ConcurrentRabbitMQConsumer):
+    permanent_errors = (ValueError,)
+
+    def __init__(self, deliveries, **kwargs):
+        self.fake_channel = FakeChannel(deliveries)
+        self.fake_connection = FakeConnection(self.fake_channel)
+        super().__init__(
+            queue="test", connection_factory=lambda: self.fake_connection, **kwargs
+        )
+        self.handled = []
+        self.threads = set()
+
+    def on_message(self, message):
+        self.threads.add(threading.current_thread().name)
+        if message == b"invalid":
+            raise ValueError("invalid payload")
+        if message == b"transient":
+            raise ConnectionError("database unavailable")
+        self.handled.append(message)
+
+
+class TestConcurrentRabbitMQConsumer:
+    def test_sets_prefetch_and_acks_processed_messages(self):
+        consumer = RecordingConsumer(
+            [(f"message-{i}".encode(), False) for i in range(20)],
+            prefetch_count=5,
+            workers=3,
+        )
+
+        consumer.start()
+
+        assert consumer.fake_channel.qos == 5
+        assert sorted(consumer.fake_channel.acks) == list(range(1, 21))
+        assert len(consumer.handled) == 20
+        assert all(name.startswith("consumer-test") for name in consumer.threads)
+        assert consumer.fake_connection.is_open is False
+
+    def test_nacks_failures_requeueing_only_transient_first_deliveries(self):
+        consumer = RecordingConsumer(
+            [
+                (b"invalid", False),
+                (b"transient", False),
+                (b"transient", True),
+                (b"ok", False),
+            ]
+        )
+
+        consumer.start()
+
+        assert consumer.fake_channel.acks == [4]
+        assert sorted(consumer.fake_channel.nacks) == [
+            (1, False),
+            (2, True),
+            (3, False),
+        ]
+
+    def test_closes_old_connections_around_each_message(self, monkeypatch):
+        events = []
+        monkeypatch.setattr(
+            rabbitmq_consumer, "close_old_connections", lambda: events.append("close")
+        )
+        consumer = RecordingConsumer([(b"ok", False), (b"invalid", False)], workers=1)
+        handle = consumer.on_message
+
+        def on_message(message):
+            events.append(message)
+            handle(message)
+
+        consumer.on_message = on_message
+
+        consumer.start()
+
+        assert events == ["close", b"ok", "close", "close", b"invalid", "close"]
+
+    def test_stop_schedules_stop_consuming_on_connection_thread(self):
+        consumer = RecordingConsumer([])
+        consumer.connection = consumer.fake_connection
+        consumer.channel = consumer.fake_channel
+
+        consumer.stop()
+
+        assert consumer.fake_channel.stopped is False
+        consumer.fake_connection.process_data_events()
+        assert consumer.fake_channel.stopped is True
@@ -0,0 +1,192 @@
+import json
+import threading
+from uuid import uuid4
+
+import pytest
+from pika.exceptions import AMQPConnectionError, StreamLostError
+
+from src.core._shared.infra.events.rabbitmq_dispatcher import RabbitMQDispatcher
+from src.core._shared.infra.events.rabbitmq_publisher import RabbitMQPublisherPool
+from src.core.video.application.events.integration_events import (
+    AudioVideoMediaUpdatedIntegrationEvent,
+)
+
+
+class FakeChannel:
+    def __init__(self, broker):
+        self.broker = broker
+        self.is_open = True
+        self.confirms = False
+
+    def confirm_delivery(self):
+        self.confirms = True
+
+    def queue_declare(self, queue):
+        self.broker.declared.append(queue)
+
+    def basic_publish(self, exchange, routing_key, body, properties=None):
+        if self.broker.fail_next:
+            self.broker.fail_next -= 1
+            self.is_open = False
+            raise StreamLostError("connection lost")
+        self.broker.published.append((routing_key, body, self.confirms))
+        self.broker.message_ids.append(properties and properties.message_id)
+
+
+class FakeConnection:
+    def __init__(self, broker):
+        self.broker = broker
+        self.is_open = True
+
+    def channel(self):
+        return FakeChannel(self.broker)
+
+    def close(self):
+        self.is_open = False
+        self.broker.closed += 1
+
+
+class FakeBroker:
+    def __init__(self):
+        self.connections = 0
+        self.closed = 0
+        self.declared = []
+        self.published = []
+        self.message_ids = []
+        self.fail_next = 0
+        self.down = False
+
+    def connect(self):
+        if self.down:
+            raise AMQPConnectionError("broker down")
+        self.connections += 1
+        return FakeConnection(self)
+
+
+@pytest.fixture
+def broker() -> FakeBroker:
+    return FakeBroker()
+
+
+@pytest.fixture
+def pool(broker: FakeBroker) -> RabbitMQPublisherPool:
+    return RabbitMQPublisherPool(connection_factory=broker.connect)
+
+
+class TestRabbitMQPublisherPool:
+    def test_reuses_connection_and_declares_queue_once(self, pool, broker):
+        for i in range(3):
+            pool.publish("videos.new", f"message-{i}")
+
+        assert broker.connections == 1
+        assert broker.declared == ["videos.new"]
+        assert [body for _, body, _ in broker.published] == [
+            "message-0",
+            "message-1",
+            "message-2",
+        ]
+
+    def test_enables_publisher_confirms(self, broker):
+        pool = RabbitMQPublisherPool(
+            confirm_delivery=True, connection_factory=broker.connect
+        )
+
+        pool.publish("videos.new", "message")
+
+        assert broker.published == [("videos.new", "message", True)]
+
+    def test_reconnects_after_lost_connection(self, pool, broker):
+        pool.publish("videos.new", "first")
+        broker.fail_next = 1
+
+        pool.publish("videos.new", "second")
+
+        assert broker.connections == 2
+        assert broker.closed == 1
+        assert [body for _, body, _ in broker.published] == ["first", "second"]
+
+    def test_raises_when_retries_are_exhausted(self, pool, broker):
+        broker.fail_next = 2
+
+        with pytest.raises(StreamLostError):
+            pool.publish("videos.new", "message")
+
+        broker.fail_next = 0
+        pool.publish("videos.new", "message")
+        assert len(broker.published) == 1
+
+    def test_releases_slot_when_broker_is_unreachable(self, broker):
+        pool = RabbitMQPublisherPool(max_size=1, connection_factory=broker.connect)
+        broker.down = True
+
+        with pytest.raises(AMQPConnectionError):
+            pool.publish("videos.new", "message")
+
+        broker.down = False
+        pool.publish("videos.new", "message")
+        assert len(broker.published) == 1
+
+    def test_concurrent_publishers_are_bounded_by_pool_size(self, broker):
+        pool = RabbitMQPublisherPool(max_size=2, connection_factory=broker.connect)
+        threads = [
+            threading.Thread(
+                target=lambda i=i: [
+                    pool.publish("videos.new", f"{i}-{n}") for n in range(20)
+                ]
+            )
+            for i in range(8)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(broker.published) == 160
+        assert broker.connections <= 2
+
+    def test_close_drops_idle_connections(self, pool, broker):
+        pool.publish("videos.new", "message")
+
+        pool.close()
+        pool.publish("videos.new", "message")
+
+        assert broker.closed == 1
+        assert broker.connections == 2
+
+    def test_for_host_returns_shared_pool(self):
+        assert RabbitMQPublisherPool.for_host("rabbit") is (
+            RabbitMQPublisherPool.for_host("rabbit")
+        )
+        assert RabbitMQPublisherPool.for_host("rabbit") is not (
+            RabbitMQPublisherPool.for_host("rabbit", confirm_delivery=True)
+        )
+
+
+class TestRabbitMQDispatcher:
+    def test_dispatchers_share_the_pool_connection(self, pool, broker):
+        event = AudioVideoMediaUpdatedIntegrationEvent(
+            resource_id=f"{uuid4()}.VIDEO",
+            file_path="videos/1/video.mp4",
+        )
+
+        for _ in range(2):
+            RabbitMQDispatcher(queue="videos.new", pool=pool).dispatch(event)
+
+        assert broker.connections == 1
+        assert [json.loads(body) for _, body, _ in broker.published] == [
+            event.payload,
+            event.payload,
+        ]
+
+    def test_publishes_message_id_outside_the_payload(self, pool, broker):
+        event = AudioVideoMediaUpdatedIntegrationEvent(
+            resource_id=f"{uuid4()}.VIDEO",
+            file_path="videos/1/video.mp4",
+            message_id="outbox-1",
+        )
+
+        RabbitMQDispatcher(queue="videos.new", pool=pool).dispatch(event)
+
+        assert broker.message_ids == ["outbox-1"]
+        assert "message_id" not in json.loads(broker.published[0][1])
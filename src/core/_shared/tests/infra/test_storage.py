@@ -0,0 +1,120 @@
+import hashlib
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+from src.core._shared.infra.storage.abstract_storage import blob_path, iter_chunks
+from src.core._shared.infra.storage.byte_range import ByteRange, RangeNotSatisfiable
+from src.core._shared.infra.storage.in_memory_storage import InMemoryStorage
+from src.core._shared.infra.storage.local_storage import LocalStorage
+
+
+class TestIterChunks:
+    def test_reads_file_like_objects_in_fixed_size_chunks(self):
+        stream = io.BytesIO(b"abcdefghij")
+
+        assert list(iter_chunks(stream, chunk_size=4)) == [b"abcd", b"efgh", b"ij"]
+
+    def test_passes_through_iterables_skipping_empty_chunks(self):
+        assert list(iter_chunks([b"ab", b"", b"cd"])) == [b"ab", b"cd"]
+
+
+class TestLocalStorageStoreStream:
+    def test_writes_stream_in_chunks(self, tmp_path, monkeypatch):
+        storage = LocalStorage(bucket=str(tmp_path))
+        monkeypatch.setattr(storage, "CHUNK_SIZE", 3)
+        stream = io.BytesIO(b"video content")
+        reads = []
+        original_read = stream.read
+        stream.read = lambda size=-1: reads.append(size) or original_read(size)
+
+        uri = storage.store_stream(Path("videos/1/video.mp4"), stream, "video/mp4")
+
+        assert uri == tmp_path.joinpath("videos/1/video.mp4").as_uri()
+        assert storage.retrieve(Path("videos/1/video.mp4")) == b"video content"
+        assert set(reads) == {3}
+
+
+class TestInMemoryStorageStoreStream:
+    def test_stores_content_from_chunks(self):
+        storage = InMemoryStorage()
+
+        storage.store_stream(Path("videos/1/video.mp4"), iter([b"video ", b"content"]))
+
+        assert storage.retrieve(Path("videos/1/video.mp4")) == b"video content"
+
+
+class TestByteRangeParse:
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("bytes=0-3", ByteRange(0, 3)),
+            ("bytes=4-", ByteRange(4, 9)),
+            ("bytes=-3", ByteRange(7, 9)),
+            ("bytes=-20", ByteRange(0, 9)),
+            ("bytes=8-100", ByteRange(8, 9)),
+        ],
+    )
+    def test_resolves_range_against_file_size(self, header, expected):
+        assert ByteRange.parse(header, size=10) == expected
+
+    @pytest.mark.parametrize(
+        "header", [None, "", "items=0-3", "bytes=0-1,4-5", "bytes=5-2", "bytes=a-b"]
+    )
+    def test_absent_invalid_or_multiple_ranges_serve_whole_file(self, header):
+        assert ByteRange.parse(header, size=10) is None
+
+    @pytest.mark.parametrize("header", ["bytes=10-", "bytes=-0"])
+    def test_range_outside_file_is_not_satisfiable(self, header):
+        with pytest.raises(RangeNotSatisfiable) as error:
+            ByteRange.parse(header, size=10)
+
+        assert error.value.size == 10
+
+
+class TestOpenRange:
+    def test_local_storage_reads_only_the_range(self, tmp_path):
+        storage = LocalStorage(bucket=str(tmp_path))
+        storage.store(Path("video.mp4"), b"video content")
+
+        with storage.open_range(Path("video.mp4"), ByteRange(2, 6)) as content:
+            # Descritor posicionado no início do intervalo, pronto para sendfile
+            assert os.lseek(content.fileno(), 0, os.SEEK_CUR) == 2
+            assert content.read(3) == b"deo"
+            assert content.read() == b" c"
+            assert content.read() == b""
+
+        assert storage.size(Path("video.mp4")) == 13
+
+    def test_in_memory_storage_reads_range_in_blocks(self):
+        storage = InMemoryStorage()
+        storage.store(Path("video.mp4"), b"video content")
+
+        content = storage.open_range(Path("video.mp4"), ByteRange(6, 12))
+
+        assert list(iter_chunks(content, chunk_size=4)) == [b"cont", b"ent"]
+        assert storage.size(Path("video.mp4")) == 13
+
+    def test_size_of_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            LocalStorage(bucket=str(tmp_path)).size(Path("missing.mp4"))
+        with pytest.raises(FileNotFoundError):
+            InMemoryStorage().size(Path("missing.mp4"))
+
+
+class TestStoreBlob:
+    def test_stores_content_under_its_checksum_once(self, tmp_path):
+        storage = LocalStorage(bucket=str(tmp_path))
+        checksum = hashlib.sha256(b"video content").hexdigest()
+
+        first = storage.store_blob(iter([b"video ", b"content"]), "video/mp4")
+        second = storage.store_blob(io.BytesIO(b"video content"))
+
+        assert first.checksum == second.checksum == checksum
+        assert first.path == second.path == blob_path(checksum)
+        assert (first.created, second.created) == (True, False)
+        assert storage.retrieve(first.path) == b"video content"
+        # A cópia duplicada enviada para staging foi descartada
+        assert not any(tmp_path.joinpath("blobs/staging").iterdir())
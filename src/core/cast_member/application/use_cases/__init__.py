@@ -1,4 +1,5 @@
 from .list_cast_member import ListCastMember
+from .search_cast_member import SearchCastMember
 from .create_cast_member import CreateCastMember
 from .update_cast_member import UpdateCastMember
 from .delete_cast_member import DeleteCastMember
@@ -6,6 +7,7 @@ from .exceptions import CastMemberNotFound, InvalidCastMember
 
 __all__ = [
     "ListCastMember",
+    "SearchCastMember",
     "CreateCastMember", 
     "UpdateCastMember",
     "DeleteCastMember",
@@ -20,13 +20,21 @@ class CreateCastMember:
         id: UUID
 
     def execute(self, input: Input) -> Output:
+        cast_member = self._build(input)
+        self.repository.save(cast_member)
+        return self.Output(id=cast_member.id)
+
+    async def aexecute(self, input: Input) -> Output:
+        cast_member = self._build(input)
+        await self.repository.asave(cast_member)
+        return self.Output(id=cast_member.id)
+
+    @staticmethod
+    def _build(input: Input) -> CastMember:
         try:
-            cast_member = CastMember(
+            return CastMember(
                 name=input.name,
                 type=input.type,
             )
         except ValueError as err:
             raise InvalidCastMember(str(err))
-
-        self.repository.save(cast_member)
-        return self.Output(id=cast_member.id) 
\ No newline at end of file
@@ -0,0 +1,10 @@
+from src.core._shared.application.use_cases.search_use_case import SearchUseCase
+from src.core.cast_member.application.use_cases.list_cast_member import (
+    CastMemberOutput,
+    ListCastMember,
+)
+from src.core.cast_member.domain.cast_member import CastMember
+
+
+class SearchCastMember(SearchUseCase[CastMember, CastMemberOutput], ListCastMember):
+    entity_type = "cast_member"
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set
 from uuid import UUID
 
+from src.core._shared.domain.pagination import Page, PageQuery
+
 from src.core.cast_member.domain.cast_member import CastMember
 
 
@@ -14,14 +16,44 @@ class CastMemberRepository(ABC):
     def get_by_id(self, id: UUID) -> Optional[CastMember]:
         pass
 
+    @abstractmethod
+    def get_by_ids(self, ids: Set[UUID]) -> List[CastMember]:
+        pass
+
     @abstractmethod
     def list(self) -> List[CastMember]:
         pass
 
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[CastMember]:
+        """Percorre todos os registros sem carregá-los de uma vez"""
+        pass
+
+    @abstractmethod
+    def paginate(self, query: PageQuery) -> Page[CastMember]:
+        pass
+
+    @abstractmethod
+    def find_missing_ids(self, ids: Set[UUID]) -> Set[UUID]:
+        pass
+
     @abstractmethod
     def update(self, cast_member: CastMember) -> None:
         pass
 
     @abstractmethod
     def delete(self, id: UUID) -> None:
-        pass 
\ No newline at end of file
+        pass 
+
+    # Variantes async para as views ASGI: mesma semântica dos métodos acima
+    @abstractmethod
+    async def apaginate(self, query: PageQuery) -> Page[CastMember]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def afind_missing_ids(self, ids: Set[UUID]) -> Set[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def asave(self, cast_member: CastMember) -> None:
+        raise NotImplementedError
@@ -1,36 +1,54 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set
 from uuid import UUID
 
+from src.core._shared.domain.pagination import Page, PageQuery
+from src.core._shared.infra.in_memory.indexed_store import IndexedStore
 from src.core.cast_member.domain.cast_member import CastMember
 from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
 
 
 class InMemoryCastMemberRepository(CastMemberRepository):
     def __init__(self):
-        self.cast_members: List[CastMember] = []
+        self.cast_members: IndexedStore[CastMember] = IndexedStore(
+            indexes=("name",)
+        )
 
     def save(self, cast_member: CastMember) -> None:
-        self.cast_members.append(cast_member)
+        self.cast_members.add(cast_member)
 
     def get_by_id(self, id: UUID) -> Optional[CastMember]:
-        for cast_member in self.cast_members:
-            if cast_member.id == id:
-                return cast_member
-        return None
+        return self.cast_members.get(id)
+
+    def get_by_ids(self, ids: Set[UUID]) -> List[CastMember]:
+        return self.cast_members.get_many(ids)
 
     def list(self) -> List[CastMember]:
-        return self.cast_members.copy()
+        return list(self.cast_members)
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[CastMember]:
+        return iter(list(self.cast_members))
+
+    def paginate(self, query: PageQuery) -> Page[CastMember]:
+        return self.cast_members.paginate(query)
+
+    def find_missing_ids(self, ids: Set[UUID]) -> Set[UUID]:
+        return self.cast_members.missing_ids(ids)
 
     def update(self, cast_member: CastMember) -> None:
-        for i, existing_cast_member in enumerate(self.cast_members):
-            if existing_cast_member.id == cast_member.id:
-                self.cast_members[i] = cast_member
-                return
-        raise ValueError(f"CastMember with id {cast_member.id} not found")
+        if self.cast_members.get(cast_member.id) is None:
+            raise ValueError(f"CastMember with id {cast_member.id} not found")
+        self.cast_members.add(cast_member)
 
     def delete(self, id: UUID) -> None:
-        for i, cast_member in enumerate(self.cast_members):
-            if cast_member.id == id:
-                del self.cast_members[i]
-                return
-        raise ValueError(f"CastMember with id {id} not found") 
\ No newline at end of file
+        if self.cast_members.remove(id) is None:
+            raise ValueError(f"CastMember with id {id} not found")
+
+    # Sem I/O: as variantes async apenas delegam aos métodos síncronos
+    async def apaginate(self, query: PageQuery) -> Page[CastMember]:
+        return self.paginate(query)
+
+    async def afind_missing_ids(self, ids: Set[UUID]) -> Set[UUID]:
+        return self.find_missing_ids(ids)
+
+    async def asave(self, cast_member: CastMember) -> None:
+        self.save(cast_member)
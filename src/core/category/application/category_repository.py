@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 from uuid import UUID
 
+from src.core._shared.domain.pagination import Page, PageQuery
+
 from src.core.category.domain.category import Category
 
 
@@ -13,6 +16,10 @@ class CategoryRepository(ABC):
     def get_by_id(self, id: UUID) -> Category | None:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_by_ids(self, ids: set[UUID]) -> list[Category]:
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, id: UUID) -> None:
         raise NotImplementedError
@@ -21,6 +28,36 @@ class CategoryRepository(ABC):
     def list(self) -> list[Category]:
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Category]:
+        """Percorre todos os registros sem carregá-los de uma vez"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def paginate(self, query: PageQuery) -> Page[Category]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
     @abstractmethod
     def update(self, category: Category) -> None:
         raise NotImplementedError
+
+    # Variantes async para as views ASGI: mesma semântica dos métodos acima
+    @abstractmethod
+    async def aget_by_id(self, id: UUID) -> Category | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def apaginate(self, query: PageQuery) -> Page[Category]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def afind_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def asave(self, category: Category) -> None:
+        raise NotImplementedError
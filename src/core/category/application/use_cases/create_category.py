@@ -23,14 +23,22 @@ class CreateCategory:
         self.repository = repository
 
     def execute(self, request: CreateCategoryRequest) -> CreateCategoryResponse:
+        category = self._build(request)
+        self.repository.save(category)
+        return CreateCategoryResponse(id=category.id)
+
+    async def aexecute(self, request: CreateCategoryRequest) -> CreateCategoryResponse:
+        category = self._build(request)
+        await self.repository.asave(category)
+        return CreateCategoryResponse(id=category.id)
+
+    @staticmethod
+    def _build(request: CreateCategoryRequest) -> Category:
         try:
-            category = Category(
+            return Category(
                 name=request.name,
                 description=request.description,
                 is_active=request.is_active,
             )
         except ValueError as err:
             raise InvalidCategory(err)
-
-        self.repository.save(category)
-        return CreateCategoryResponse(id=category.id)
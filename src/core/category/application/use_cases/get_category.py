@@ -24,8 +24,16 @@ class GetCategory:
         self.repository = repository
 
     def execute(self, request: GetCategoryRequest) -> GetCategoryResponse:
-        category = self.repository.get_by_id(request.id)
+        return self._to_response(request, self.repository.get_by_id(request.id))
 
+    async def aexecute(self, request: GetCategoryRequest) -> GetCategoryResponse:
+        category = await self.repository.aget_by_id(request.id)
+        return self._to_response(request, category)
+
+    @staticmethod
+    def _to_response(
+        request: GetCategoryRequest, category: Category | None
+    ) -> GetCategoryResponse:
         if category is None:
             raise CategoryNotFound(f"Category with {request.id} not found")
 
@@ -0,0 +1,10 @@
+from src.core._shared.application.use_cases.search_use_case import SearchUseCase
+from src.core.category.application.use_cases.list_category import (
+    CategoryOutput,
+    ListCategory,
+)
+from src.core.category.domain.category import Category
+
+
+class SearchCategory(SearchUseCase[Category, CategoryOutput], ListCategory):
+    entity_type = "category"
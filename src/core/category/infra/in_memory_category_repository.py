@@ -1,30 +1,55 @@
+from typing import Iterator
 from uuid import UUID
+
+from src.core._shared.domain.pagination import Page, PageQuery
+from src.core._shared.infra.in_memory.indexed_store import IndexedStore
 from src.core.category.application.category_repository import CategoryRepository
 from src.core.category.domain.category import Category
 
 
 class InMemoryCategoryRepository(CategoryRepository):
     def __init__(self, categories: list[Category] = []):
-        self.categories: list[Category] = categories or []
+        self.categories: IndexedStore[Category] = IndexedStore(
+            categories or [], indexes=("name",)
+        )
 
     def save(self, category: Category) -> None:
-        self.categories.append(category)
+        self.categories.add(category)
 
     def get_by_id(self, id: UUID) -> Category | None:
-        return next(
-            (category for category in self.categories if category.id == id), None
-        )
+        return self.categories.get(id)
+
+    def get_by_ids(self, ids: set[UUID]) -> list[Category]:
+        return self.categories.get_many(ids)
 
     def delete(self, id: UUID) -> None:
-        category = self.get_by_id(id)
-        if category:
-            self.categories.remove(category)
+        self.categories.remove(id)
 
     def list(self) -> list[Category]:
         return [category for category in self.categories]
 
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Category]:
+        return iter(list(self.categories))
+
+    def paginate(self, query: PageQuery) -> Page[Category]:
+        return self.categories.paginate(query)
+
+    def find_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        return self.categories.missing_ids(ids)
+
     def update(self, category: Category) -> None:
-        old_category = self.get_by_id(category.id)
-        if old_category:
-            self.categories.remove(old_category)
-            self.categories.append(category)
+        if self.categories.get(category.id):
+            self.categories.add(category)
+
+    # Sem I/O: as variantes async apenas delegam aos métodos síncronos
+    async def aget_by_id(self, id: UUID) -> Category | None:
+        return self.get_by_id(id)
+
+    async def apaginate(self, query: PageQuery) -> Page[Category]:
+        return self.paginate(query)
+
+    async def afind_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        return self.find_missing_ids(ids)
+
+    async def asave(self, category: Category) -> None:
+        self.save(category)
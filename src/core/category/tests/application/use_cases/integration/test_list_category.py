@@ -9,6 +9,7 @@ from src.core.category.application.use_cases.list_category import (
     ListCategoryResponse,
 )
 from src.core._shared.application.use_cases.list_use_case import ListOutputMeta
+from src.core._shared.domain.pagination import Page
 from src.core.category.domain.category import Category
 from src.core.category.infra.in_memory_category_repository import (
     InMemoryCategoryRepository,
@@ -70,3 +71,30 @@ class TestListCategory:
                 total=2,
             ),
         )
+
+    def test_uses_requested_per_page(self) -> None:
+        repository = InMemoryCategoryRepository(
+            [Category(name=f"Category {i}", description="") for i in range(5)]
+        )
+
+        response = ListCategory(repository=repository).execute(
+            request=ListCategoryRequest(per_page=3, current_page=2)
+        )
+
+        assert [output.name for output in response.data] == [
+            "Category 3",
+            "Category 4",
+        ]
+        assert response.meta == ListOutputMeta(current_page=2, per_page=3, total=5)
+
+    @pytest.mark.parametrize("per_page, expected", [(0, 1), (-5, 1), (10_000, 1000)])
+    def test_per_page_is_clamped_to_allowed_range(self, per_page, expected) -> None:
+        repository = create_autospec(CategoryRepository)
+        repository.paginate.return_value = Page(items=[], total=0)
+
+        response = ListCategory(repository=repository).execute(
+            request=ListCategoryRequest(per_page=per_page)
+        )
+
+        assert repository.paginate.call_args.args[0].limit == expected
+        assert response.meta.per_page == expected
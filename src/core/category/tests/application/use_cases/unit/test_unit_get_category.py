@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock, create_autospec
 from uuid import UUID
 import uuid
@@ -49,3 +50,29 @@ class TestGetCategory:
 
         with pytest.raises(CategoryNotFound):
             use_case.execute(request)
+
+    def test_aexecute_reads_from_async_repository(self):
+        category = Category(name="Filme", description="Categoria para filmes")
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.aget_by_id.return_value = category
+
+        response = asyncio.run(
+            GetCategory(repository=mock_repository).aexecute(
+                GetCategoryRequest(id=category.id)
+            )
+        )
+
+        assert response.id == category.id
+        mock_repository.aget_by_id.assert_awaited_once_with(category.id)
+        mock_repository.get_by_id.assert_not_called()
+
+    def test_aexecute_when_category_not_found_then_raise_exception(self):
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.aget_by_id.return_value = None
+
+        with pytest.raises(CategoryNotFound):
+            asyncio.run(
+                GetCategory(repository=mock_repository).aexecute(
+                    GetCategoryRequest(id=uuid.uuid4())
+                )
+            )
@@ -9,6 +9,7 @@ from src.core.category.application.use_cases.list_category import (
     ListCategoryResponse,
 )
 from src.core._shared.application.use_cases.list_use_case import ListOutputMeta
+from src.core._shared.domain.pagination import Page, PageQuery, SortDirection
 from src.core.category.domain.category import Category
 
 
@@ -30,7 +31,7 @@ class TestListCategory:
     @pytest.fixture
     def mock_empty_repository(self) -> CategoryRepository:
         repository = create_autospec(CategoryRepository)
-        repository.list.return_value = []
+        repository.paginate.return_value = Page(items=[], total=0)
         return repository
 
     @pytest.fixture
@@ -40,10 +41,13 @@ class TestListCategory:
         category_series: Category,
     ) -> CategoryRepository:
         repository = create_autospec(CategoryRepository)
-        repository.list.return_value = [
-            category_movie,
-            category_series,
-        ]
+        repository.paginate.return_value = Page(
+            items=[
+                category_movie,
+                category_series,
+            ],
+            total=2,
+        )
         return repository
 
     def test_when_no_categories_then_return_empty_list(
@@ -85,3 +89,17 @@ class TestListCategory:
                 total=2,
             ),
         )
+        mock_populated_repository.paginate.assert_called_once_with(
+            PageQuery(order_by="name", offset=0, limit=2)
+        )
+
+    def test_when_order_by_has_minus_prefix_then_request_descending_page(
+        self,
+        mock_empty_repository: CategoryRepository,
+    ) -> None:
+        use_case = ListCategory(repository=mock_empty_repository)
+        use_case.execute(request=ListCategoryRequest(order_by="-name", current_page=3))
+
+        mock_empty_repository.paginate.assert_called_once_with(
+            PageQuery(order_by="name", direction=SortDirection.DESC, offset=4, limit=2)
+        )
@@ -1,4 +1,6 @@
 import uuid
+
+from src.core._shared.domain.pagination import Page, PageQuery, SortDirection
 from src.core.category.domain.category import Category
 from src.core.category.infra.in_memory_category_repository import (
     InMemoryCategoryRepository,
@@ -115,3 +117,37 @@ class TestUpdate:
         repository.update(category)
 
         assert len(repository.categories) == 0
+
+
+class TestPaginate:
+    def test_returns_requested_page_ordered_and_total(self):
+        category_filme = Category(name="Filme")
+        category_serie = Category(name="Série")
+        category_documentario = Category(name="Documentário")
+        repository = InMemoryCategoryRepository(
+            categories=[
+                category_filme,
+                category_serie,
+                category_documentario,
+            ]
+        )
+
+        page = repository.paginate(PageQuery(order_by="name", offset=1, limit=2))
+
+        assert page == Page(items=[category_filme, category_serie], total=3)
+
+    def test_descending_order(self):
+        category_filme = Category(name="Filme")
+        category_serie = Category(name="Série")
+        repository = InMemoryCategoryRepository(
+            categories=[
+                category_filme,
+                category_serie,
+            ]
+        )
+
+        page = repository.paginate(
+            PageQuery(order_by="name", direction=SortDirection.DESC, limit=1)
+        )
+
+        assert page == Page(items=[category_serie], total=2, has_next=True)
@@ -1,4 +1,5 @@
 from .list_genre import ListGenre
+from .search_genre import SearchGenre
 from .create_genre import CreateGenre
 from .delete_genre import DeleteGenre
 from .update_genre import UpdateGenre
@@ -6,6 +7,7 @@ from .exceptions import GenreNotFound, InvalidGenre, RelatedCategoriesNotFound
 
 __all__ = [
     "ListGenre",
+    "SearchGenre",
     "CreateGenre", 
     "DeleteGenre",
     "UpdateGenre",
@@ -29,20 +29,33 @@ class CreateGenre:
 
     def execute(self, input: Input) -> Output:
         # Application Business Rule: Categories devem existir para criar um Genre
-        category_ids = {category.id for category in self.category_repository.list()}
-        if not input.categories.issubset(category_ids):
+        missing_categories = self.category_repository.find_missing_ids(input.categories)
+        genre = self._build(input, missing_categories)
+
+        self.repository.save(genre)
+        return self.Output(id=genre.id)
+
+    async def aexecute(self, input: Input) -> Output:
+        missing_categories = await self.category_repository.afind_missing_ids(
+            input.categories
+        )
+        genre = self._build(input, missing_categories)
+
+        await self.repository.asave(genre)
+        return self.Output(id=genre.id)
+
+    @staticmethod
+    def _build(input: Input, missing_categories: set[UUID]) -> Genre:
+        if missing_categories:
             raise RelatedCategoriesNotFound(
-                f"Categories with provided IDs not found: {input.categories - category_ids}"
+                f"Categories with provided IDs not found: {missing_categories}"
             )
 
         try:
-            genre = Genre(
+            return Genre(
                 name=input.name,
                 is_active=input.is_active,
-                categories=category_ids,
+                categories=input.categories,
             )
         except ValueError as err:
             raise InvalidGenre(err)
-
-        self.repository.save(genre)
-        return self.Output(id=genre.id)
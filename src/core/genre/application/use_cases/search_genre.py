@@ -0,0 +1,7 @@
+from src.core._shared.application.use_cases.search_use_case import SearchUseCase
+from src.core.genre.application.use_cases.list_genre import GenreOutput, ListGenre
+from src.core.genre.domain.genre import Genre
+
+
+class SearchGenre(SearchUseCase[Genre, GenreOutput], ListGenre):
+    entity_type = "genre"
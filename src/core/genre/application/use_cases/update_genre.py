@@ -39,10 +39,10 @@ class UpdateGenre:
             raise GenreNotFound(f"Genre with id {input.id} not found")
 
         # Verificar se as categorias existem
-        category_ids = {category.id for category in self.category_repository.list()}
-        if not input.categories.issubset(category_ids):
+        missing_categories = self.category_repository.find_missing_ids(input.categories)
+        if missing_categories:
             raise RelatedCategoriesNotFound(
-                f"Categories with provided IDs not found: {input.categories - category_ids}"
+                f"Categories with provided IDs not found: {missing_categories}"
             )
 
         try:
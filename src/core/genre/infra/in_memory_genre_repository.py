@@ -1,28 +1,52 @@
+from typing import Iterator
 from uuid import UUID
+
+from src.core._shared.domain.pagination import Page, PageQuery
+from src.core._shared.infra.in_memory.indexed_store import IndexedStore
 from src.core.genre.domain.genre_repository import GenreRepository
 from src.core.genre.domain.genre import Genre
 
 
 class InMemoryGenreRepository(GenreRepository):
     def __init__(self, genres: list[Genre] = None):
-        self.genres: list[Genre] = genres or []
+        self.genres: IndexedStore[Genre] = IndexedStore(
+            genres or [], indexes=("name",)
+        )
 
     def save(self, genre: Genre) -> None:
-        self.genres.append(genre)
+        self.genres.add(genre)
 
     def get_by_id(self, id: UUID) -> Genre | None:
-        return next((genre for genre in self.genres if genre.id == id), None)
+        return self.genres.get(id)
+
+    def get_by_ids(self, ids: set[UUID]) -> list[Genre]:
+        return self.genres.get_many(ids)
 
     def delete(self, id: UUID) -> None:
-        genre = self.get_by_id(id)
-        if genre:
-            self.genres.remove(genre)
+        self.genres.remove(id)
 
     def list(self) -> list[Genre]:
         return [genre for genre in self.genres]
 
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Genre]:
+        return iter(list(self.genres))
+
+    def paginate(self, query: PageQuery) -> Page[Genre]:
+        return self.genres.paginate(query)
+
+    def find_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        return self.genres.missing_ids(ids)
+
     def update(self, genre: Genre) -> None:
-        old_genre = self.get_by_id(genre.id)
-        if old_genre:
-            self.genres.remove(old_genre)
-            self.genres.append(genre)
+        if self.genres.get(genre.id):
+            self.genres.add(genre)
+
+    # Sem I/O: as variantes async apenas delegam aos métodos síncronos
+    async def apaginate(self, query: PageQuery) -> Page[Genre]:
+        return self.paginate(query)
+
+    async def afind_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        return self.find_missing_ids(ids)
+
+    async def asave(self, genre: Genre) -> None:
+        self.save(genre)
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from unittest.mock import create_autospec
 
@@ -34,14 +35,19 @@ def mock_category_repository_with_categories(
     movie_category, documentary_category
 ) -> CategoryRepository:
     repository = create_autospec(CategoryRepository)
-    repository.list.return_value = [movie_category, documentary_category]
+    repository.find_missing_ids.side_effect = lambda ids: ids - {
+        movie_category.id,
+        documentary_category.id,
+    }
+    repository.afind_missing_ids.side_effect = repository.find_missing_ids.side_effect
     return repository
 
 
 @pytest.fixture
 def mock_empty_category_repository() -> CategoryRepository:
     repository = create_autospec(CategoryRepository)
-    repository.list.return_value = []
+    repository.find_missing_ids.side_effect = lambda ids: set(ids)
+    repository.afind_missing_ids.side_effect = lambda ids: set(ids)
     return repository
 
 
@@ -144,3 +150,49 @@ class TestCreateGenre:
                 categories=set(),
             )
         )
+
+    def test_aexecute_saves_genre_through_async_repository(
+        self,
+        movie_category,
+        mock_category_repository_with_categories,
+        mock_genre_repository,
+    ):
+        use_case = CreateGenre(
+            repository=mock_genre_repository,
+            category_repository=mock_category_repository_with_categories,
+        )
+
+        output = asyncio.run(
+            use_case.aexecute(
+                CreateGenre.Input(name="Romance", categories={movie_category.id})
+            )
+        )
+
+        mock_genre_repository.asave.assert_awaited_once_with(
+            Genre(
+                id=output.id,
+                name="Romance",
+                is_active=True,
+                categories={movie_category.id},
+            )
+        )
+        mock_genre_repository.save.assert_not_called()
+
+    def test_aexecute_when_categories_do_not_exist_then_raise(
+        self,
+        mock_empty_category_repository,
+        mock_genre_repository,
+    ):
+        use_case = CreateGenre(
+            repository=mock_genre_repository,
+            category_repository=mock_empty_category_repository,
+        )
+
+        with pytest.raises(RelatedCategoriesNotFound):
+            asyncio.run(
+                use_case.aexecute(
+                    CreateGenre.Input(name="Romance", categories={uuid.uuid4()})
+                )
+            )
+
+        mock_genre_repository.asave.assert_not_awaited()
@@ -8,6 +8,7 @@ from src.core.genre.application.use_cases.list_genre import (
     ListGenreResponse,
 )
 from src.core._shared.application.use_cases.list_use_case import ListOutputMeta
+from src.core._shared.domain.pagination import Page
 from src.core.genre.domain.genre import Genre
 from src.core.genre.domain.genre_repository import GenreRepository
 
@@ -25,7 +26,9 @@ class TestListGenre:
         )
         genre_romance = Genre(name="Romance")
 
-        genre_repository.list.return_value = [genre_drama, genre_romance]
+        genre_repository.paginate.return_value = Page(
+            items=[genre_drama, genre_romance], total=2
+        )
 
         use_case = ListGenre(repository=genre_repository)
         output = use_case.execute(ListGenreRequest())
@@ -54,7 +57,7 @@ class TestListGenre:
 
     def test_when_no_genres_exist_then_return_empty_data(self):
         genre_repository = create_autospec(GenreRepository)
-        genre_repository.list.return_value = []
+        genre_repository.paginate.return_value = Page(items=[], total=0)
 
         use_case = ListGenre(repository=genre_repository)
         output = use_case.execute(ListGenreRequest())
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core._shared.infra.storage.abstract_storage import AbstractStorage
+from src.core.video.application.use_cases.exceptions import UploadSessionNotFound
+from src.core.video.domain.upload_session_repository import UploadSessionRepository
+
+
+class AbortUploadSession:
+    @dataclass
+    class Input:
+        video_id: UUID
+        session_id: UUID
+
+    def __init__(
+        self,
+        upload_session_repository: UploadSessionRepository,
+        storage_service: AbstractStorage,
+    ) -> None:
+        self.upload_session_repository = upload_session_repository
+        self.storage_service = storage_service
+
+    def execute(self, input: Input) -> None:
+        upload_session = self.upload_session_repository.get_by_id(input.session_id)
+        if upload_session is None or upload_session.video_id != input.video_id:
+            raise UploadSessionNotFound(input.session_id)
+
+        for part_number in upload_session.parts:
+            self.storage_service.delete(upload_session.part_path(part_number))
+        self.upload_session_repository.delete(upload_session.id)
@@ -0,0 +1,93 @@
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.core._shared.domain.notification import Notification
+from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.domain.genre_repository import GenreRepository
+from src.core.video.application.use_cases.create_video_without_media import (
+    CreateVideoWithoutMedia,
+)
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import VideoRepository
+
+
+class BulkCreateVideoWithoutMedia:
+    @dataclass
+    class Input:
+        videos: list[CreateVideoWithoutMedia.Input] = field(default_factory=list)
+
+    @dataclass
+    class ItemResult:
+        id: UUID | None = None
+        # Mensagens de validação do item; None quando o vídeo foi criado
+        error: list[str] | None = None
+
+    @dataclass
+    class Output:
+        results: list["BulkCreateVideoWithoutMedia.ItemResult"] = field(
+            default_factory=list
+        )
+
+    def __init__(
+        self,
+        video_repository: VideoRepository,
+        category_repository: CategoryRepository,
+        genre_repository: GenreRepository,
+        cast_member_repository: CastMemberRepository,
+    ):
+        self._video_repository = video_repository
+        self._category_repository = category_repository
+        self._genre_repository = genre_repository
+        self._cast_member_repository = cast_member_repository
+
+    def execute(self, request: Input) -> Output:
+        # Uma única consulta por repositório para validar o lote inteiro
+        missing_categories = self._category_repository.find_missing_ids(
+            {id for item in request.videos for id in item.categories}
+        )
+        missing_genres = self._genre_repository.find_missing_ids(
+            {id for item in request.videos for id in item.genres}
+        )
+        missing_cast_members = self._cast_member_repository.find_missing_ids(
+            {id for item in request.videos for id in item.cast_members}
+        )
+
+        results = []
+        videos = []
+        for item in request.videos:
+            notification = Notification()
+            if item.categories & missing_categories:
+                notification.add_error("Invalid categories")
+            if item.genres & missing_genres:
+                notification.add_error("Invalid genres")
+            if item.cast_members & missing_cast_members:
+                notification.add_error("Invalid cast members")
+
+            if notification.has_errors:
+                results.append(self.ItemResult(error=notification.errors))
+                continue
+
+            try:
+                video = Video(
+                    title=item.title,
+                    description=item.description,
+                    launch_year=item.launch_year,
+                    opened=item.opened,
+                    duration=item.duration,
+                    rating=item.rating,
+                    categories=item.categories,
+                    genres=item.genres,
+                    cast_members=item.cast_members,
+                )
+            except ValueError as err:
+                results.append(self.ItemResult(error=[str(err)]))
+                continue
+
+            videos.append(video)
+            results.append(self.ItemResult(id=video.id))
+
+        if videos:
+            self._video_repository.bulk_save(videos)
+
+        return self.Output(results=results)
@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from typing import Iterator
+from uuid import UUID
+
+from src.core._shared.infra.storage.abstract_storage import (
+    AbstractStorage,
+    iter_chunks,
+)
+from src.core._shared.infra.storage.byte_range import ByteRange
+from src.core.video.application.use_cases.exceptions import (
+    IncompleteUpload,
+    UploadSessionNotFound,
+)
+from src.core.video.application.use_cases.upload_video import UploadVideo
+from src.core.video.domain.upload_session import UploadSession
+from src.core.video.domain.upload_session_repository import UploadSessionRepository
+
+
+class CompleteUploadSession:
+    @dataclass
+    class Input:
+        video_id: UUID
+        session_id: UUID
+
+    def __init__(
+        self,
+        upload_session_repository: UploadSessionRepository,
+        storage_service: AbstractStorage,
+        upload_video: UploadVideo,
+    ) -> None:
+        self.upload_session_repository = upload_session_repository
+        self.storage_service = storage_service
+        self.upload_video = upload_video
+
+    def execute(self, input: Input) -> None:
+        upload_session = self.upload_session_repository.get_by_id(input.session_id)
+        if upload_session is None or upload_session.video_id != input.video_id:
+            raise UploadSessionNotFound(input.session_id)
+
+        if not upload_session.is_complete:
+            raise IncompleteUpload(
+                f"Upload session {upload_session.id} is missing parts"
+            )
+
+        # Monta o arquivo final parte a parte; o evento só é emitido após o upload
+        self.upload_video.execute(
+            UploadVideo.Input(
+                video_id=upload_session.video_id,
+                file_name=upload_session.file_name,
+                content=self._read_parts(upload_session),
+                content_type=upload_session.content_type,
+            )
+        )
+
+        for part_number in upload_session.parts:
+            self.storage_service.delete(upload_session.part_path(part_number))
+        self.upload_session_repository.delete(upload_session.id)
+
+    def _read_parts(self, upload_session: UploadSession) -> Iterator[bytes]:
+        # Bloco a bloco: nenhuma parte é carregada inteira em memória
+        for part_number in sorted(upload_session.parts):
+            part_path = upload_session.part_path(part_number)
+            size = self.storage_service.size(part_path)
+            if not size:
+                continue
+
+            with self.storage_service.open_range(
+                part_path, ByteRange(0, size - 1)
+            ) as reader:
+                yield from iter_chunks(reader, self.storage_service.CHUNK_SIZE)
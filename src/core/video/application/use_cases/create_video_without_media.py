@@ -46,28 +46,60 @@ class CreateVideoWithoutMedia:
         self._cast_member_repository = cast_member_repository
 
     def execute(self, request: Input) -> Output:
+        # WHERE id IN (...) em vez de carregar a tabela inteira
+        video = self._build(
+            request,
+            missing_categories=self._category_repository.find_missing_ids(
+                request.categories
+            ),
+            missing_genres=self._genre_repository.find_missing_ids(request.genres),
+            missing_cast_members=self._cast_member_repository.find_missing_ids(
+                request.cast_members
+            ),
+        )
+
+        self._video_repository.save(video)
+
+        return self.Output(id=video.id)
+
+    async def aexecute(self, request: Input) -> Output:
+        video = self._build(
+            request,
+            missing_categories=await self._category_repository.afind_missing_ids(
+                request.categories
+            ),
+            missing_genres=await self._genre_repository.afind_missing_ids(
+                request.genres
+            ),
+            missing_cast_members=await self._cast_member_repository.afind_missing_ids(
+                request.cast_members
+            ),
+        )
+
+        await self._video_repository.asave(video)
+
+        return self.Output(id=video.id)
+
+    @staticmethod
+    def _build(
+        request: Input,
+        missing_categories: Set[UUID],
+        missing_genres: Set[UUID],
+        missing_cast_members: Set[UUID],
+    ) -> Video:
         notification = Notification()
-        
-        # Validate categories
-        category_errors = self.validate_categories(request.categories)
-        if category_errors:
-            notification.add_error(category_errors[0])
-        
-        # Validate genres
-        genre_errors = self.validate_genres(request.genres)
-        if genre_errors:
-            notification.add_error(genre_errors[0])
-        
-        # Validate cast members
-        cast_member_errors = self.validate_cast_members(request.cast_members)
-        if cast_member_errors:
-            notification.add_error(cast_member_errors[0])
+        if missing_categories:
+            notification.add_error("Invalid categories")
+        if missing_genres:
+            notification.add_error("Invalid genres")
+        if missing_cast_members:
+            notification.add_error("Invalid cast members")
 
         if notification.has_errors:
             raise RelatedEntitiesNotFound(notification.messages)
 
         try:
-            video = Video(
+            return Video(
                 title=request.title,
                 description=request.description,
                 launch_year=request.launch_year,
@@ -80,26 +112,3 @@ class CreateVideoWithoutMedia:
             )
         except ValueError as err:
             raise InvalidVideo(err)
-
-        self._video_repository.save(video)
-
-        return self.Output(id=video.id)
-
-    def validate_categories(self, category_ids: Set[UUID]) -> list[str]:
-        existing_category_ids = {
-            category.id for category in self._category_repository.list()
-        }
-        if not category_ids.issubset(existing_category_ids):
-            return ["Invalid categories"]
-
-    def validate_genres(self, genre_ids: Set[UUID]) -> list[str]:
-        existing_genre_ids = {genre.id for genre in self._genre_repository.list()}
-        if not genre_ids.issubset(existing_genre_ids):
-            return ["Invalid genres"]
-
-    def validate_cast_members(self, cast_member_ids: Set[UUID]) -> list[str]:
-        existing_cast_member_ids = {
-            cast_member.id for cast_member in self._cast_member_repository.list()
-        }
-        if not cast_member_ids.issubset(existing_cast_member_ids):
-            return ["Invalid cast members"]
@@ -11,4 +11,20 @@ class VideoNotFound(Exception):
 
 
 class MediaNotFound(Exception):
-    pass
\ No newline at end of file
+    pass
+
+
+class UploadSessionNotFound(Exception):
+    pass
+
+
+class IncompleteUpload(Exception):
+    pass
+
+
+class InvalidUploadPart(Exception):
+    pass
+
+
+class MediaBlobReleased(Exception):
+    pass
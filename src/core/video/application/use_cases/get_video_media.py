@@ -0,0 +1,87 @@
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO
+from uuid import UUID
+
+from src.core._shared.infra.storage.abstract_storage import AbstractStorage
+from src.core._shared.infra.storage.byte_range import ByteRange
+from src.core.video.application.use_cases.exceptions import (
+    MediaNotFound,
+    VideoNotFound,
+)
+from src.core.video.domain.value_objects import AudioVideoMedia
+from src.core.video.domain.video_repository import VideoRepository
+
+
+class GetVideoMedia:
+    @dataclass
+    class Input:
+        video_id: UUID
+        # Valor do header Range (ex.: "bytes=0-1023"); None: arquivo inteiro
+        range: str | None = None
+        # Valor do header If-Range: o Range só vale se ainda for o mesmo arquivo
+        if_range: str | None = None
+
+    @dataclass
+    class Output:
+        content: BinaryIO
+        name: str
+        size: int
+        # Intervalo servido; None quando o arquivo vai inteiro
+        byte_range: ByteRange | None
+        etag: str
+
+    def __init__(
+        self, repository: VideoRepository, storage_service: AbstractStorage
+    ) -> None:
+        self.repository = repository
+        self.storage_service = storage_service
+
+    def execute(self, input: Input) -> Output:
+        video = self.repository.get_by_id(input.video_id)
+        if video is None:
+            raise VideoNotFound(input.video_id)
+        if video.video is None:
+            raise MediaNotFound(f"Video {input.video_id} has no video media")
+
+        # Sempre o arquivo enviado: encoded_location é a pasta de saída do
+        # encoder (segmentos), não um arquivo para download
+        media = video.video
+        file_path = self._file_path(media.raw_location)
+        try:
+            size = self.storage_service.size(file_path)
+        except FileNotFoundError:
+            raise MediaNotFound(f"Media file {media.raw_location} not found")
+
+        etag = self._etag(media, size)
+        # If-Range diferente (ETag ou data): o arquivo pode ter mudado desde
+        # o início do download, então vai inteiro em vez de misturar versões
+        range_header = input.range if input.if_range in (None, etag) else None
+        byte_range = ByteRange.parse(range_header, size)
+        content = self.storage_service.open_range(
+            file_path, byte_range or ByteRange(start=0, end=size - 1)
+        )
+        return self.Output(
+            content=content,
+            name=media.name,
+            size=size,
+            byte_range=byte_range,
+            etag=etag,
+        )
+
+    @staticmethod
+    def _file_path(location: str) -> Path:
+        # Relativo ao bucket: caminhos absolutos ou com ".." sairiam dele
+        path = PurePosixPath(location)
+        if not location or path.is_absolute() or ".." in path.parts:
+            raise MediaNotFound(f"Invalid media location {location!r}")
+        return Path(path)
+
+    @staticmethod
+    def _etag(media: AudioVideoMedia, size: int) -> str:
+        # Blob endereçado por conteúdo: o checksum identifica a versão
+        if media.checksum:
+            return f'"{media.checksum}"'
+        digest = hashlib.sha256(f"{media.raw_location}:{size}".encode()).hexdigest()
+        return f'"{digest}"'
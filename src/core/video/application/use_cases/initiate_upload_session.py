@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.video.application.use_cases.exceptions import VideoNotFound
+from src.core.video.domain.upload_session import UploadSession
+from src.core.video.domain.upload_session_repository import UploadSessionRepository
+from src.core.video.domain.video_repository import VideoRepository
+
+
+class InitiateUploadSession:
+    @dataclass
+    class Input:
+        video_id: UUID
+        file_name: str
+        content_type: str = ""
+
+    @dataclass
+    class Output:
+        id: UUID
+
+    def __init__(
+        self,
+        video_repository: VideoRepository,
+        upload_session_repository: UploadSessionRepository,
+    ) -> None:
+        self.video_repository = video_repository
+        self.upload_session_repository = upload_session_repository
+
+    def execute(self, input: Input) -> Output:
+        if self.video_repository.get_by_id(input.video_id) is None:
+            raise VideoNotFound(input.video_id)
+
+        upload_session = UploadSession(
+            video_id=input.video_id,
+            file_name=input.file_name,
+            content_type=input.content_type,
+        )
+        self.upload_session_repository.save(upload_session)
+
+        return self.Output(id=upload_session.id)
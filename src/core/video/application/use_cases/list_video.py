@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from uuid import UUID
+
+from src.core._shared.application.use_cases.list_use_case import (
+    ListRequest,
+    ListResponse,
+    ListUseCase,
+)
+from src.core._shared.domain.pagination import Page, PageQuery
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_filter import VideoFilter
+
+
+@dataclass
+class VideoOutput:
+    id: UUID
+    title: str
+    description: str
+    launch_year: int
+    duration: Decimal
+    rating: str
+    opened: bool
+    published: bool
+
+
+@dataclass
+class ListVideoRequest(ListRequest):
+    order_by: str = "title"
+    filter: VideoFilter = field(default_factory=VideoFilter)
+
+
+class ListVideo(ListUseCase[Video, VideoOutput]):
+    def _paginate(self, request: ListVideoRequest, query: PageQuery) -> Page[Video]:
+        # Filtro aplicado pelo repositório, antes de ORDER BY/LIMIT
+        return self.repository.paginate(query, video_filter=request.filter)
+
+    async def _apaginate(
+        self, request: ListVideoRequest, query: PageQuery
+    ) -> Page[Video]:
+        return await self.repository.apaginate(query, video_filter=request.filter)
+
+    def _to_output(self, entity: Video) -> VideoOutput:
+        return VideoOutput(
+            id=entity.id,
+            title=entity.title,
+            description=entity.description,
+            launch_year=entity.launch_year,
+            duration=entity.duration,
+            rating=entity.rating.value,
+            opened=entity.opened,
+            published=entity.published,
+        )
+
+
+ListVideoResponse = ListResponse[VideoOutput]
@@ -0,0 +1,7 @@
+from src.core._shared.application.use_cases.search_use_case import SearchUseCase
+from src.core.video.application.use_cases.list_video import ListVideo, VideoOutput
+from src.core.video.domain.video import Video
+
+
+class SearchVideo(SearchUseCase[Video, VideoOutput], ListVideo):
+    entity_type = "video"
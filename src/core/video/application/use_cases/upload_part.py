@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+from typing import Iterator
+from uuid import UUID
+
+from src.core._shared.infra.storage.abstract_storage import (
+    AbstractStorage,
+    Stream,
+    iter_chunks,
+)
+from src.core.video.application.use_cases.exceptions import (
+    InvalidUploadPart,
+    UploadSessionNotFound,
+)
+from src.core.video.domain.upload_session import MAX_PART_NUMBER
+from src.core.video.domain.upload_session_repository import UploadSessionRepository
+
+
+class UploadPart:
+    # Limite por parte: cada request de upload tem tamanho e duração limitados
+    MAX_PART_SIZE = 64 * 1024 * 1024
+
+    @dataclass
+    class Input:
+        video_id: UUID
+        session_id: UUID
+        part_number: int
+        content: Stream
+
+    def __init__(
+        self,
+        upload_session_repository: UploadSessionRepository,
+        storage_service: AbstractStorage,
+        max_part_size: int = MAX_PART_SIZE,
+    ) -> None:
+        self.upload_session_repository = upload_session_repository
+        self.storage_service = storage_service
+        self.max_part_size = max_part_size
+
+    def execute(self, input: Input) -> None:
+        upload_session = self.upload_session_repository.get_by_id(input.session_id)
+        if upload_session is None or upload_session.video_id != input.video_id:
+            raise UploadSessionNotFound(input.session_id)
+
+        if not 1 <= input.part_number <= MAX_PART_NUMBER:
+            raise InvalidUploadPart(
+                f"Part numbers must be between 1 and {MAX_PART_NUMBER}"
+            )
+
+        # Cada parte é independente: clientes podem enviá-las em paralelo
+        part_path = upload_session.part_path(input.part_number)
+        try:
+            self.storage_service.store_stream(
+                part_path, self._limit_size(input.content)
+            )
+        except InvalidUploadPart:
+            self.storage_service.delete(part_path)
+            raise
+        self.upload_session_repository.add_part(upload_session.id, input.part_number)
+
+    def _limit_size(self, content: Stream) -> Iterator[bytes]:
+        # Interrompe o envio assim que o limite é ultrapassado
+        size = 0
+        for chunk in iter_chunks(content, self.storage_service.CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.max_part_size:
+                raise InvalidUploadPart(
+                    f"Parts must be at most {self.max_part_size} bytes"
+                )
+            yield chunk
@@ -1,34 +1,67 @@
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Any, Awaitable, Callable
 from uuid import UUID
 
-from src.core._shared.events.message_bus import MessageBus
-from src.core._shared.infra.storage.abstract_storage import AbstractStorage
+from src.core._shared.events.abstract_message_bus import AbstractMessageBus
+from src.core._shared.infra.storage.abstract_async_storage import (
+    AbstractAsyncStorage,
+    AsyncStream,
+)
+from src.core._shared.infra.storage.abstract_storage import (
+    AbstractStorage,
+    StoredBlob,
+    Stream,
+)
 from src.core.video.application.events.integration_events import (
     AudioVideoMediaUpdatedIntegrationEvent,
 )
-from src.core.video.application.use_cases.exceptions import VideoNotFound
+from src.core.video.application.use_cases.exceptions import (
+    MediaBlobReleased,
+    VideoNotFound,
+)
+from src.core.video.domain.media_blob_repository import MediaBlobRepository
 from src.core.video.domain.value_objects import AudioVideoMedia, MediaStatus, MediaType
+from src.core.video.domain.video import Video
 from src.core.video.domain.video_repository import VideoRepository
 
+SyncRunner = Callable[[Callable[[], Any]], Awaitable[Any]]
+
+
+async def run_inline(function: Callable[[], Any]) -> Any:
+    return function()
+
 
 class UploadVideo:
     @dataclass
     class Input:
         video_id: UUID
         file_name: str
-        content: bytes
+        content: Stream | AsyncStream
         content_type: str
 
     def __init__(
         self,
         repository: VideoRepository,
-        storage_service: AbstractStorage,
-        message_bus: MessageBus,
+        storage_service: AbstractStorage | AbstractAsyncStorage,
+        message_bus: AbstractMessageBus,
+        blob_repository: MediaBlobRepository,
+        unit_of_work: Callable[[], AbstractContextManager] = nullcontext,
+        run_sync: SyncRunner = run_inline,
     ) -> None:
+        """
+        execute usa um AbstractStorage; aexecute, um AbstractAsyncStorage.
+        run_sync executa a etapa transacional (síncrona) a partir do
+        aexecute, ex.: em uma thread via sync_to_async sob ASGI.
+        """
         self.repository = repository
         self.storage_service = storage_service
         self.message_bus = message_bus
+        self.blob_repository = blob_repository
+        self.unit_of_work = unit_of_work
+        self.run_sync = run_sync
 
     def execute(self, input: Input) -> None:
         # TODO: trailer vs video
@@ -36,25 +69,73 @@ class UploadVideo:
         if video is None:
             raise VideoNotFound(input.video_id)
 
-        file_path = Path("videos") / str(video.id) / input.file_name
-        self.storage_service.store(file_path, input.content, input.content_type)
-        video_media = AudioVideoMedia(
-            name=input.file_name,
-            raw_location=str(file_path),
-            encoded_location="",
-            status=MediaStatus.PENDING,
-            media_type=MediaType.VIDEO,
+        blob = self.storage_service.store_blob(input.content, input.content_type)
+        orphan = self._attach_media(video, input.file_name, blob)
+        if orphan is not None:
+            self.storage_service.delete(Path(orphan))
+
+    async def aexecute(self, input: Input) -> None:
+        video = await self.repository.aget_by_id(input.video_id)
+        if video is None:
+            raise VideoNotFound(input.video_id)
+
+        # O loop atende outras requests enquanto os blocos são transferidos
+        blob = await self.storage_service.store_blob(
+            input.content, input.content_type
         )
-        video.update_video_media(video_media)
-        self.repository.update(video)
-
-        # Dispatch integration event: ao fim de toda transaction (commit)
-        # Pesquisar por Unit of Work
-        self.message_bus.handle(
-            [
-                AudioVideoMediaUpdatedIntegrationEvent(
-                    resource_id=f"{str(video.id)}.{MediaType.VIDEO}",
-                    file_path=str(file_path),
-                ),
-            ]
+        orphan = await self.run_sync(
+            partial(self._attach_media, video, input.file_name, blob)
         )
+        if orphan is not None:
+            await self.storage_service.delete(Path(orphan))
+
+    def _attach_media(
+        self, video: Video, file_name: str, blob: StoredBlob
+    ) -> str | None:
+        previous_media = video.video
+        video.update_video_media(
+            AudioVideoMedia(
+                name=file_name,
+                raw_location=str(blob.path),
+                encoded_location="",
+                status=MediaStatus.PENDING,
+                media_type=MediaType.VIDEO,
+                checksum=blob.checksum,
+            )
+        )
+        # Conteúdo já codificado (reenvio do mesmo master): só metadados,
+        # sem evento para o encoder
+        encoded_media = self.repository.find_encoded_media(blob.checksum)
+        if encoded_media is not None:
+            video.process(MediaStatus.COMPLETED, encoded_media.encoded_location)
+
+        # Unit of Work: o vídeo, as referências ao blob e o evento de integração
+        # são gravados juntos (ex.: outbox na mesma transação); o upload fica
+        # fora da transação
+        with self.unit_of_work():
+            if not self.blob_repository.acquire(
+                blob.checksum, str(blob.path), blob.created
+            ):
+                # O arquivo reaproveitado está sendo apagado: o cliente reenvia
+                # e o blob é gravado de novo
+                raise MediaBlobReleased(
+                    f"Media blob {blob.checksum} is being removed, retry the upload"
+                )
+            self.repository.update(video)
+            orphan = (
+                self.blob_repository.release(previous_media.checksum)
+                if previous_media is not None and previous_media.checksum
+                else None
+            )
+            if encoded_media is None:
+                self.message_bus.handle(
+                    [
+                        AudioVideoMediaUpdatedIntegrationEvent(
+                            resource_id=f"{str(video.id)}.{MediaType.VIDEO}",
+                            file_path=str(blob.path),
+                        ),
+                    ]
+                )
+
+        # Blob sem referências: removido só depois do commit
+        return orphan
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+
+class MediaBlobRepository(ABC):
+    """
+    Contagem de referências das mídias aos blobs endereçados por conteúdo
+    (checksum SHA-256): o blob só pode ser apagado quando nenhuma mídia
+    aponta para ele.
+
+    Ao perder a última referência o blob vira tombstone (zero referências)
+    e é apagado do storage depois do commit: um upload que reaproveitou o
+    arquivo nesse intervalo não pode reativá-lo.
+    """
+
+    @abstractmethod
+    def acquire(self, checksum: str, location: str, stored: bool) -> bool:
+        """
+        Registra mais uma mídia apontando para o blob. stored indica que o
+        upload gravou o arquivo; se não gravou e o blob é um tombstone, a
+        referência não é registrada e retorna False.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self, checksum: str) -> str | None:
+        """Remove uma referência; retorna a location se era a última"""
+        raise NotImplementedError
@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from uuid import UUID
+
+from src.core._shared.domain.entity import Entity
+
+# Mesmo limite de partes do upload multipart do S3/GCS
+MAX_PART_NUMBER = 10_000
+
+
+@dataclass(eq=False, kw_only=True)
+class UploadSession(Entity):
+    video_id: UUID
+    file_name: str
+    content_type: str = ""
+    parts: set[int] = field(default_factory=set)
+
+    def __post_init__(self):
+        self.validate()
+
+    def validate(self):
+        if not self.file_name:
+            self.notification.add_error("file_name is required")
+
+        if any(not 1 <= part_number <= MAX_PART_NUMBER for part_number in self.parts):
+            self.notification.add_error(
+                f"part numbers must be between 1 and {MAX_PART_NUMBER}"
+            )
+
+        if self.notification.has_errors:
+            raise ValueError(self.notification.messages)
+
+    def part_path(self, part_number: int) -> Path:
+        return Path("uploads") / str(self.id) / f"part-{part_number:05d}"
+
+    @property
+    def is_complete(self) -> bool:
+        # Números distintos e >= 1: N partes com máximo N são exatamente 1..N
+        return bool(self.parts) and len(self.parts) == max(self.parts)
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.core.video.domain.upload_session import UploadSession
+
+
+class UploadSessionRepository(ABC):
+    @abstractmethod
+    def save(self, upload_session: UploadSession) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_by_id(self, id: UUID) -> UploadSession | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_part(self, id: UUID, part_number: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, id: UUID) -> None:
+        raise NotImplementedError
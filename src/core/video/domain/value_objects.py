@@ -52,6 +52,8 @@ class AudioVideoMedia:
     encoded_location: str
     status: MediaStatus
     media_type: MediaType
+    # SHA-256 do conteúdo enviado; vazio em mídias anteriores à deduplicação
+    checksum: str = ""
 
     def complete(self, encoded_location: str):
         return AudioVideoMedia(
@@ -60,6 +62,7 @@ class AudioVideoMedia:
             encoded_location=encoded_location,
             status=MediaStatus.COMPLETED,
             media_type=self.media_type,
+            checksum=self.checksum,
         )
 
     def fail(self):
@@ -69,4 +72,5 @@ class AudioVideoMedia:
             encoded_location=self.encoded_location,
             status=MediaStatus.ERROR,
             media_type=self.media_type,
+            checksum=self.checksum,
         )
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.video.domain.value_objects import MediaStatus, Rating
+from src.core.video.domain.video import Video
+
+
+@dataclass(frozen=True)
+class VideoFilter:
+    """
+    Critérios de listagem de vídeos: todos os informados precisam ser
+    atendidos (AND); dentro de um mesmo critério basta um dos valores (OR),
+    ex.: genres={a, b} retorna vídeos do gênero a ou b.
+    """
+
+    categories: frozenset[UUID] = frozenset()
+    genres: frozenset[UUID] = frozenset()
+    cast_members: frozenset[UUID] = frozenset()
+    ratings: frozenset[Rating] = frozenset()
+    published: bool | None = None
+    launch_year_min: int | None = None
+    launch_year_max: int | None = None
+    media_status: MediaStatus | None = None
+
+    def matches(self, video: Video) -> bool:
+        if self.categories and not self.categories & video.categories:
+            return False
+        if self.genres and not self.genres & video.genres:
+            return False
+        if self.cast_members and not self.cast_members & video.cast_members:
+            return False
+        if self.ratings and video.rating not in self.ratings:
+            return False
+        if self.published is not None and video.published != self.published:
+            return False
+        if (
+            self.launch_year_min is not None
+            and video.launch_year < self.launch_year_min
+        ):
+            return False
+        if (
+            self.launch_year_max is not None
+            and video.launch_year > self.launch_year_max
+        ):
+            return False
+        if self.media_status is not None and (
+            video.video is None or video.video.status != self.media_status
+        ):
+            return False
+        return True
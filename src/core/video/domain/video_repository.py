@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 from uuid import UUID
 
+from src.core._shared.domain.pagination import Page, PageQuery
+from src.core.video.domain.value_objects import AudioVideoMedia
 from src.core.video.domain.video import Video
+from src.core.video.domain.video_filter import VideoFilter
 
 
 class VideoRepository(ABC):
@@ -9,10 +13,18 @@ class VideoRepository(ABC):
     def save(self, video: Video):
         raise NotImplementedError
 
+    @abstractmethod
+    def bulk_save(self, videos: list[Video]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def get_by_id(self, id: UUID) -> Video | None:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_by_ids(self, ids: set[UUID]) -> list[Video]:
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, id: UUID) -> None:
         raise NotImplementedError
@@ -21,6 +33,37 @@ class VideoRepository(ABC):
     def list(self) -> list[Video]:
         raise NotImplementedError
 
+    @abstractmethod
+    def paginate(
+        self, query: PageQuery, video_filter: VideoFilter | None = None
+    ) -> Page[Video]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Video]:
+        """Percorre todos os registros sem carregá-los de uma vez"""
+        raise NotImplementedError
+
     @abstractmethod
     def update(self, video: Video) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    def find_encoded_media(self, checksum: str) -> AudioVideoMedia | None:
+        """Mídia já codificada com o mesmo conteúdo, se houver"""
+        raise NotImplementedError
+
+    # Variantes async para as views ASGI: mesma semântica dos métodos acima
+    @abstractmethod
+    async def aget_by_id(self, id: UUID) -> Video | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def apaginate(
+        self, query: PageQuery, video_filter: VideoFilter | None = None
+    ) -> Page[Video]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def asave(self, video: Video) -> None:
+        raise NotImplementedError
@@ -0,0 +1,25 @@
+from src.core.video.domain.media_blob_repository import MediaBlobRepository
+
+
+class InMemoryMediaBlobRepository(MediaBlobRepository):
+    def __init__(self):
+        self.locations: dict[str, str] = {}
+        self.ref_counts: dict[str, int] = {}
+
+    def acquire(self, checksum: str, location: str, stored: bool) -> bool:
+        if self.ref_counts.get(checksum) == 0 and not stored:
+            return False
+
+        self.locations[checksum] = location
+        self.ref_counts[checksum] = self.ref_counts.get(checksum, 0) + 1
+        return True
+
+    def release(self, checksum: str) -> str | None:
+        if not self.ref_counts.get(checksum):
+            return None
+
+        self.ref_counts[checksum] -= 1
+        if self.ref_counts[checksum] > 0:
+            return None
+
+        return self.locations[checksum]
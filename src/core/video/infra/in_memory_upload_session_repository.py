@@ -0,0 +1,26 @@
+from uuid import UUID
+
+from src.core.video.domain.upload_session import UploadSession
+from src.core.video.domain.upload_session_repository import UploadSessionRepository
+
+
+class InMemoryUploadSessionRepository(UploadSessionRepository):
+    def __init__(self, upload_sessions: list[UploadSession] = None):
+        self.upload_sessions: dict[UUID, UploadSession] = {
+            upload_session.id: upload_session
+            for upload_session in upload_sessions or []
+        }
+
+    def save(self, upload_session: UploadSession) -> None:
+        self.upload_sessions[upload_session.id] = upload_session
+
+    def get_by_id(self, id: UUID) -> UploadSession | None:
+        return self.upload_sessions.get(id)
+
+    def add_part(self, id: UUID, part_number: int) -> None:
+        upload_session = self.upload_sessions.get(id)
+        if upload_session:
+            upload_session.parts.add(part_number)
+
+    def delete(self, id: UUID) -> None:
+        self.upload_sessions.pop(id, None)
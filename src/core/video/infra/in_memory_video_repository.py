@@ -1,28 +1,76 @@
+from typing import Iterator
 from uuid import UUID
+
+from src.core._shared.domain.pagination import Page, PageQuery, paginate_in_memory
+from src.core._shared.infra.in_memory.indexed_store import IndexedStore
+from src.core.video.domain.value_objects import AudioVideoMedia, MediaStatus
 from src.core.video.domain.video_repository import VideoRepository
 from src.core.video.domain.video import Video
+from src.core.video.domain.video_filter import VideoFilter
 
 
 class InMemoryVideoRepository(VideoRepository):
     def __init__(self, videos: list[Video] = None):
-        self.videos: list[Video] = videos or []
+        self.videos: IndexedStore[Video] = IndexedStore(
+            videos or [], indexes=("title",)
+        )
 
     def save(self, video: Video) -> None:
-        self.videos.append(video)
+        self.videos.add(video)
+
+    def bulk_save(self, videos: list[Video]) -> None:
+        for video in videos:
+            self.videos.add(video)
 
     def get_by_id(self, id: UUID) -> Video | None:
-        return next((video for video in self.videos if video.id == id), None)
+        return self.videos.get(id)
+
+    def get_by_ids(self, ids: set[UUID]) -> list[Video]:
+        return self.videos.get_many(ids)
 
     def delete(self, id: UUID) -> None:
-        video = self.get_by_id(id)
-        if video:
-            self.videos.remove(video)
+        self.videos.remove(id)
 
     def list(self) -> list[Video]:
         return [video for video in self.videos]
 
+    def paginate(
+        self, query: PageQuery, video_filter: VideoFilter | None = None
+    ) -> Page[Video]:
+        if video_filter is None:
+            return self.videos.paginate(query)
+
+        return paginate_in_memory(
+            (video for video in self.videos if video_filter.matches(video)), query
+        )
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Video]:
+        return iter(list(self.videos))
+
     def update(self, video: Video) -> None:
-        old_video = self.get_by_id(video.id)
-        if old_video:
-            self.videos.remove(old_video)
-            self.videos.append(video)
+        if self.videos.get(video.id):
+            self.videos.add(video)
+
+    def find_encoded_media(self, checksum: str) -> AudioVideoMedia | None:
+        return next(
+            (
+                video.video
+                for video in self.videos
+                if video.video is not None
+                and video.video.checksum == checksum
+                and video.video.status == MediaStatus.COMPLETED
+            ),
+            None,
+        )
+
+    # Sem I/O: as variantes async apenas delegam aos métodos síncronos
+    async def aget_by_id(self, id: UUID) -> Video | None:
+        return self.get_by_id(id)
+
+    async def apaginate(
+        self, query: PageQuery, video_filter: VideoFilter | None = None
+    ) -> Page[Video]:
+        return self.paginate(query, video_filter)
+
+    async def asave(self, video: Video) -> None:
+        self.save(video)
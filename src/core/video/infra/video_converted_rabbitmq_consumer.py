@@ -2,9 +2,13 @@ import json
 import logging
 from uuid import UUID
 
-import pika
+from django.db import transaction
 
-from src.core._shared.events.abstract_consumer import AbstractConsumer
+from src.core._shared.infra.events.rabbitmq_consumer import ConcurrentRabbitMQConsumer
+from src.core.video.application.use_cases.exceptions import (
+    MediaNotFound,
+    VideoNotFound,
+)
 from src.core.video.application.use_cases.process_audio_video_media import (
     ProcessAudioVideoMedia,
 )
@@ -14,68 +18,54 @@ from src.django_project.video_app.repository import DjangoORMVideoRepository
 logger = logging.getLogger(__name__)
 
 
-class VideoConvertedRabbitMQConsumer(AbstractConsumer):
-    def __init__(self, host="localhost", queue="videos.converted"):
-        self.host = host
-        self.queue = queue
-        self.connection = None
-        self.channel = None
+class VideoConvertedRabbitMQConsumer(ConcurrentRabbitMQConsumer):
+    # Payload inválido ou vídeo inexistente: reprocessar não resolve
+    permanent_errors = (ValueError, KeyError, VideoNotFound, MediaNotFound)
+
+    def __init__(
+        self,
+        host="localhost",
+        queue="videos.converted",
+        prefetch_count=10,
+        workers=4,
+        connection_factory=None,
+    ):
+        super().__init__(
+            host=host,
+            queue=queue,
+            prefetch_count=prefetch_count,
+            workers=workers,
+            connection_factory=connection_factory,
+        )
 
     def on_message(self, message):
         print(f"Received message: {message}")
-        try:
-            # Body payload
-            message = json.loads(message)
-
-            # Tratamento de erro
-            error_message = message["error"]
-            if error_message:
-                aggregate_id_raw, _ = message["message"]["resource_id"].split(".")
-                logger.error(
-                    f"Error processing video {aggregate_id_raw}: {error_message}"
-                )
-                return
-
-            # Serialização do evento
-            aggregate_id_raw, media_type_raw = message["video"]["resource_id"].split(
-                "."
-            )
-            aggregate_id = UUID(aggregate_id_raw)
-            media_type = MediaType(media_type_raw)
-            encoded_location = message["video"]["encoded_video_folder"]
-            status = MediaStatus(message["status"])
+        # Body payload
+        message = json.loads(message)
 
-            # Execução do caso de uso
-            process_audio_video_media_input = ProcessAudioVideoMedia.Input(
-                video_id=aggregate_id,
-                encoded_location=encoded_location,
-                media_type=media_type,
-                status=status,
-            )
-            print("Calling use case with input", process_audio_video_media_input)
-            use_case = ProcessAudioVideoMedia(
-                video_repository=DjangoORMVideoRepository()
-            )
-            use_case.execute(request=process_audio_video_media_input)
-        except Exception as e:
-            logger.error(f"Error processing payload {message}", exc_info=True)
+        # Tratamento de erro
+        error_message = message["error"]
+        if error_message:
+            aggregate_id_raw, _ = message["message"]["resource_id"].split(".")
+            logger.error(f"Error processing video {aggregate_id_raw}: {error_message}")
             return
 
-    def start(self):
-        self.connection = pika.BlockingConnection(pika.ConnectionParameters(self.host))
-        self.channel = self.connection.channel()
-
-        # Cria a fila se não existir
-        self.channel.queue_declare(queue=self.queue)
+        # Serialização do evento
+        aggregate_id_raw, media_type_raw = message["video"]["resource_id"].split(".")
+        aggregate_id = UUID(aggregate_id_raw)
+        media_type = MediaType(media_type_raw)
+        encoded_location = message["video"]["encoded_video_folder"]
+        status = MediaStatus(message["status"])
 
-        self.channel.basic_consume(
-            queue=self.queue, on_message_callback=self.on_message_callback
+        # Execução do caso de uso
+        process_audio_video_media_input = ProcessAudioVideoMedia.Input(
+            video_id=aggregate_id,
+            encoded_location=encoded_location,
+            media_type=media_type,
+            status=status,
         )
-        print("Consumer started. Waiting for messages. To exit press CTRL+C")
-        self.channel.start_consuming()
-
-    def on_message_callback(self, ch, method, properties, body):
-        self.on_message(body)
-
-    def stop(self):
-        self.connection.close()
+        print("Calling use case with input", process_audio_video_media_input)
+        use_case = ProcessAudioVideoMedia(video_repository=DjangoORMVideoRepository())
+        # O ack só é enviado depois que esta transação for commitada
+        with transaction.atomic():
+            use_case.execute(request=process_audio_video_media_input)
@@ -0,0 +1,93 @@
+from decimal import Decimal
+from unittest.mock import create_autospec
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.domain.genre_repository import GenreRepository
+from src.core.video.application.use_cases.bulk_create_video_without_media import (
+    BulkCreateVideoWithoutMedia,
+)
+from src.core.video.application.use_cases.create_video_without_media import (
+    CreateVideoWithoutMedia,
+)
+from src.core.video.domain.value_objects import Rating
+from src.core.video.infra.in_memory_video_repository import InMemoryVideoRepository
+
+
+class TestBulkCreateVideoWithoutMedia:
+    @pytest.fixture
+    def category_id(self) -> UUID:
+        return uuid4()
+
+    @pytest.fixture
+    def mock_category_repository(self, category_id: UUID) -> CategoryRepository:
+        repository = create_autospec(CategoryRepository)
+        repository.find_missing_ids.side_effect = lambda ids: ids - {category_id}
+        return repository
+
+    @pytest.fixture
+    def mock_genre_repository(self) -> GenreRepository:
+        repository = create_autospec(GenreRepository)
+        repository.find_missing_ids.return_value = set()
+        return repository
+
+    @pytest.fixture
+    def mock_cast_member_repository(self) -> CastMemberRepository:
+        repository = create_autospec(CastMemberRepository)
+        repository.find_missing_ids.return_value = set()
+        return repository
+
+    def make_input(self, title: str, categories: set[UUID]):
+        return CreateVideoWithoutMedia.Input(
+            title=title,
+            description="A test video",
+            launch_year=2022,
+            opened=False,
+            duration=Decimal("120.5"),
+            rating=Rating.AGE_12,
+            categories=categories,
+            genres=set(),
+            cast_members=set(),
+        )
+
+    def test_validates_batch_once_and_returns_result_per_item(
+        self,
+        mock_category_repository: CategoryRepository,
+        mock_genre_repository: GenreRepository,
+        mock_cast_member_repository: CastMemberRepository,
+        category_id: UUID,
+    ) -> None:
+        video_repository = InMemoryVideoRepository()
+        use_case = BulkCreateVideoWithoutMedia(
+            video_repository=video_repository,
+            category_repository=mock_category_repository,
+            genre_repository=mock_genre_repository,
+            cast_member_repository=mock_cast_member_repository,
+        )
+        missing_category_id = uuid4()
+
+        output = use_case.execute(
+            BulkCreateVideoWithoutMedia.Input(
+                videos=[
+                    self.make_input("Video 1", {category_id}),
+                    self.make_input("Video 2", {missing_category_id}),
+                    self.make_input("", {category_id}),
+                ]
+            )
+        )
+
+        mock_category_repository.find_missing_ids.assert_called_once_with(
+            {category_id, missing_category_id}
+        )
+        assert output.results[0].id == video_repository.videos[0].id
+        assert output.results[0].error is None
+        assert output.results[1] == BulkCreateVideoWithoutMedia.ItemResult(
+            error=["Invalid categories"]
+        )
+        assert output.results[2] == BulkCreateVideoWithoutMedia.ItemResult(
+            error=["Title is required"]
+        )
+        assert len(video_repository.videos) == 1
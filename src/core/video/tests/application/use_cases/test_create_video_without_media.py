@@ -1,3 +1,4 @@
+import asyncio
 from decimal import Decimal
 from unittest.mock import create_autospec
 from uuid import UUID, uuid4
@@ -38,19 +39,22 @@ class TestCreateVideoWithoutMedia:
     @pytest.fixture
     def mock_category_repository(self, category_id: UUID) -> CategoryRepository:
         repository = create_autospec(CategoryRepository)
-        repository.list.return_value = [create_autospec("Category", id=category_id)]
+        repository.find_missing_ids.side_effect = lambda ids: ids - {category_id}
+        repository.afind_missing_ids.side_effect = lambda ids: ids - {category_id}
         return repository
 
     @pytest.fixture
     def mock_genre_repository(self, genre_id: UUID) -> GenreRepository:
         repository = create_autospec(GenreRepository)
-        repository.list.return_value = [create_autospec("Genre", id=genre_id)]
+        repository.find_missing_ids.side_effect = lambda ids: ids - {genre_id}
+        repository.afind_missing_ids.side_effect = lambda ids: ids - {genre_id}
         return repository
 
     @pytest.fixture
     def mock_cast_member_repository(self, cast_member_id: UUID) -> CastMemberRepository:
         repository = create_autospec(CastMemberRepository)
-        repository.list.return_value = [create_autospec("CastMember", id=cast_member_id)]
+        repository.find_missing_ids.side_effect = lambda ids: ids - {cast_member_id}
+        repository.afind_missing_ids.side_effect = lambda ids: ids - {cast_member_id}
         return repository
 
     def test_create_video_without_media_success(
@@ -267,3 +271,76 @@ class TestCreateVideoWithoutMedia:
         assert "Invalid cast members" in str(exc_info.value)
 
         mock_video_repository.save.assert_not_called()
+
+    def test_aexecute_saves_video_through_async_repository(
+        self,
+        mock_video_repository: VideoRepository,
+        mock_category_repository: CategoryRepository,
+        mock_genre_repository: GenreRepository,
+        mock_cast_member_repository: CastMemberRepository,
+        category_id: UUID,
+        genre_id: UUID,
+        cast_member_id: UUID,
+    ) -> None:
+        use_case = CreateVideoWithoutMedia(
+            video_repository=mock_video_repository,
+            category_repository=mock_category_repository,
+            genre_repository=mock_genre_repository,
+            cast_member_repository=mock_cast_member_repository,
+        )
+
+        output = asyncio.run(
+            use_case.aexecute(
+                CreateVideoWithoutMedia.Input(
+                    title="Sample Video",
+                    description="A test video",
+                    launch_year=2022,
+                    opened=False,
+                    duration=Decimal("120.5"),
+                    rating=Rating.AGE_12,
+                    categories={category_id},
+                    genres={genre_id},
+                    cast_members={cast_member_id},
+                )
+            )
+        )
+
+        mock_video_repository.asave.assert_awaited_once()
+        assert mock_video_repository.asave.await_args.args[0].id == output.id
+        mock_video_repository.save.assert_not_called()
+
+    def test_aexecute_reports_every_missing_relationship(
+        self,
+        mock_video_repository: VideoRepository,
+        mock_category_repository: CategoryRepository,
+        mock_genre_repository: GenreRepository,
+        mock_cast_member_repository: CastMemberRepository,
+    ) -> None:
+        use_case = CreateVideoWithoutMedia(
+            video_repository=mock_video_repository,
+            category_repository=mock_category_repository,
+            genre_repository=mock_genre_repository,
+            cast_member_repository=mock_cast_member_repository,
+        )
+
+        with pytest.raises(RelatedEntitiesNotFound) as exc:
+            asyncio.run(
+                use_case.aexecute(
+                    CreateVideoWithoutMedia.Input(
+                        title="Sample Video",
+                        description="A test video",
+                        launch_year=2022,
+                        opened=False,
+                        duration=Decimal("120.5"),
+                        rating=Rating.AGE_12,
+                        categories={uuid4()},
+                        genres={uuid4()},
+                        cast_members={uuid4()},
+                    )
+                )
+            )
+
+        assert "Invalid categories" in str(exc.value)
+        assert "Invalid genres" in str(exc.value)
+        assert "Invalid cast members" in str(exc.value)
+        mock_video_repository.asave.assert_not_awaited()
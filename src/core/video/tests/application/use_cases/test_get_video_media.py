@@ -0,0 +1,129 @@
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from src.core._shared.infra.storage.byte_range import ByteRange, RangeNotSatisfiable
+from src.core._shared.infra.storage.in_memory_storage import InMemoryStorage
+from src.core.video.application.use_cases.exceptions import MediaNotFound
+from src.core.video.application.use_cases.get_video_media import GetVideoMedia
+from src.core.video.domain.value_objects import (
+    AudioVideoMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.core.video.domain.video import Video
+from src.core.video.infra.in_memory_video_repository import InMemoryVideoRepository
+
+
+@pytest.fixture
+def video() -> Video:
+    return Video(
+        title="Video 1",
+        description="Video 1 description",
+        launch_year=2021,
+        duration=Decimal(120),
+        rating=Rating.AGE_14,
+        opened=True,
+        cast_members=set(),
+        categories=set(),
+        genres=set(),
+    )
+
+
+@pytest.fixture
+def storage() -> InMemoryStorage:
+    storage = InMemoryStorage()
+    storage.store(Path("videos/raw.mp4"), b"raw content")
+    return storage
+
+
+def media(
+    status: MediaStatus, raw_location: str = "videos/raw.mp4", checksum: str = ""
+) -> AudioVideoMedia:
+    return AudioVideoMedia(
+        name="video.mp4",
+        raw_location=raw_location,
+        # Pasta de saída do encoder, como enviada pelo consumer
+        encoded_location="/path/to/encoded/video",
+        status=status,
+        media_type=MediaType.VIDEO,
+        checksum=checksum,
+    )
+
+
+class TestGetVideoMedia:
+    def test_returns_requested_range_of_uploaded_media_once_encoded(
+        self, video, storage
+    ):
+        video.update_video_media(media(MediaStatus.COMPLETED))
+        use_case = GetVideoMedia(InMemoryVideoRepository([video]), storage)
+
+        output = use_case.execute(
+            GetVideoMedia.Input(video_id=video.id, range="bytes=0-2")
+        )
+
+        assert output.content.read() == b"raw"
+        assert output.byte_range == ByteRange(0, 2)
+        assert output.size == 11
+        assert output.name == "video.mp4"
+
+    def test_serves_raw_media_while_processing_and_whole_file_without_range(
+        self, video, storage
+    ):
+        video.update_video_media(media(MediaStatus.PENDING))
+        use_case = GetVideoMedia(InMemoryVideoRepository([video]), storage)
+
+        output = use_case.execute(GetVideoMedia.Input(video_id=video.id))
+
+        assert output.content.read() == b"raw content"
+        assert output.byte_range is None
+
+    def test_range_outside_file_raises(self, video, storage):
+        video.update_video_media(media(MediaStatus.PENDING))
+        use_case = GetVideoMedia(InMemoryVideoRepository([video]), storage)
+
+        with pytest.raises(RangeNotSatisfiable):
+            use_case.execute(GetVideoMedia.Input(video_id=video.id, range="bytes=50-"))
+
+    def test_video_without_media_raises(self, video, storage):
+        use_case = GetVideoMedia(InMemoryVideoRepository([video]), storage)
+
+        with pytest.raises(MediaNotFound):
+            use_case.execute(GetVideoMedia.Input(video_id=video.id))
+
+    @pytest.mark.parametrize(
+        "raw_location", ["/etc/passwd", "videos/../../etc/passwd", ""]
+    )
+    def test_location_outside_bucket_raises(self, video, storage, raw_location):
+        video.update_video_media(media(MediaStatus.PENDING, raw_location))
+        use_case = GetVideoMedia(InMemoryVideoRepository([video]), storage)
+
+        with pytest.raises(MediaNotFound):
+            use_case.execute(GetVideoMedia.Input(video_id=video.id))
+
+    def test_if_range_matching_etag_keeps_range(self, video, storage):
+        video.update_video_media(media(MediaStatus.PENDING, checksum="abc"))
+        use_case = GetVideoMedia(InMemoryVideoRepository([video]), storage)
+
+        output = use_case.execute(
+            GetVideoMedia.Input(video_id=video.id, range="bytes=4-", if_range='"abc"')
+        )
+
+        assert output.etag == '"abc"'
+        assert output.content.read() == b"content"
+
+    @pytest.mark.parametrize(
+        "if_range", ['"old"', 'W/"abc"', "Wed, 21 Oct 2015 07:28:00 GMT"]
+    )
+    def test_if_range_not_matching_serves_whole_file(self, video, storage, if_range):
+        video.update_video_media(media(MediaStatus.PENDING, checksum="abc"))
+        use_case = GetVideoMedia(InMemoryVideoRepository([video]), storage)
+
+        output = use_case.execute(
+            GetVideoMedia.Input(video_id=video.id, range="bytes=4-", if_range=if_range)
+        )
+
+        assert output.byte_range is None
+        assert output.content.read() == b"raw content"
@@ -0,0 +1,139 @@
+import asyncio
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.core.video.application.use_cases.list_video import (
+    ListVideo,
+    ListVideoRequest,
+)
+from src.core.video.domain.value_objects import (
+    AudioVideoMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_filter import VideoFilter
+from src.core.video.infra.in_memory_video_repository import InMemoryVideoRepository
+
+
+def make_video(title: str, **kwargs) -> Video:
+    fields = dict(
+        title=title,
+        description="",
+        launch_year=2022,
+        duration=Decimal("90"),
+        rating=Rating.AGE_12,
+        opened=False,
+        published=True,
+        categories=set(),
+        genres=set(),
+        cast_members=set(),
+    )
+    fields.update(kwargs)
+    return Video(**fields)
+
+
+class TestListVideo:
+    @pytest.fixture
+    def genre_id(self):
+        return uuid4()
+
+    @pytest.fixture
+    def repository(self, genre_id) -> InMemoryVideoRepository:
+        return InMemoryVideoRepository(
+            [
+                make_video("Alpha", genres={genre_id}),
+                make_video("Bravo", genres={genre_id}, rating=Rating.AGE_18),
+                make_video("Charlie", genres={genre_id}, published=False),
+                make_video("Delta"),
+                make_video("Echo", genres={genre_id, uuid4()}, launch_year=1999),
+            ]
+        )
+
+    def test_without_filter_lists_all_videos_ordered_by_title(self, repository):
+        response = ListVideo(repository=repository).execute(
+            ListVideoRequest(per_page=10)
+        )
+
+        assert [output.title for output in response.data] == [
+            "Alpha",
+            "Bravo",
+            "Charlie",
+            "Delta",
+            "Echo",
+        ]
+        assert response.meta.total == 5
+
+    def test_published_videos_of_rating_in_genre(self, repository, genre_id):
+        response = ListVideo(repository=repository).execute(
+            ListVideoRequest(
+                per_page=10,
+                filter=VideoFilter(
+                    genres=frozenset({genre_id}),
+                    ratings=frozenset({Rating.AGE_12}),
+                    published=True,
+                ),
+            )
+        )
+
+        assert [output.title for output in response.data] == ["Alpha", "Echo"]
+        assert response.meta.total == 2
+        assert response.data[0].rating == "AGE_12"
+
+    def test_launch_year_range_and_pagination(self, repository):
+        response = ListVideo(repository=repository).execute(
+            ListVideoRequest(
+                order_by="-title",
+                per_page=2,
+                filter=VideoFilter(launch_year_min=2000, launch_year_max=2022),
+            )
+        )
+
+        assert [output.title for output in response.data] == ["Delta", "Charlie"]
+        assert response.meta.total == 4
+        assert response.meta.next_cursor is not None
+
+    def test_aexecute_applies_filter(self, repository, genre_id):
+        response = asyncio.run(
+            ListVideo(repository=repository).aexecute(
+                ListVideoRequest(
+                    per_page=10,
+                    filter=VideoFilter(genres=frozenset({genre_id}), published=True),
+                )
+            )
+        )
+
+        assert [output.title for output in response.data] == [
+            "Alpha",
+            "Bravo",
+            "Echo",
+        ]
+
+
+class TestVideoFilter:
+    def test_media_status_requires_video_media(self):
+        video = make_video("Alpha")
+        video_filter = VideoFilter(media_status=MediaStatus.COMPLETED)
+
+        assert not video_filter.matches(video)
+
+        video.update_video_media(
+            AudioVideoMedia(
+                name="video.mp4",
+                raw_location="videos/video.mp4",
+                encoded_location="videos/video.m3u8",
+                status=MediaStatus.COMPLETED,
+                media_type=MediaType.VIDEO,
+            )
+        )
+        assert video_filter.matches(video)
+
+    def test_any_related_id_matches(self):
+        category_id = uuid4()
+        video = make_video("Alpha", categories={category_id})
+
+        assert VideoFilter(categories=frozenset({uuid4(), category_id})).matches(video)
+        assert not VideoFilter(categories=frozenset({uuid4()})).matches(video)
@@ -0,0 +1,233 @@
+import hashlib
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.core._shared.events.message_bus import MessageBus
+from src.core._shared.infra.storage.abstract_storage import blob_path
+from src.core._shared.infra.storage.in_memory_storage import InMemoryStorage
+from src.core.video.application.events.integration_events import (
+    AudioVideoMediaUpdatedIntegrationEvent,
+)
+from src.core.video.application.use_cases.abort_upload_session import (
+    AbortUploadSession,
+)
+from src.core.video.application.use_cases.complete_upload_session import (
+    CompleteUploadSession,
+)
+from src.core.video.application.use_cases.exceptions import (
+    IncompleteUpload,
+    InvalidUploadPart,
+    UploadSessionNotFound,
+)
+from src.core.video.application.use_cases.initiate_upload_session import (
+    InitiateUploadSession,
+)
+from src.core.video.application.use_cases.upload_part import UploadPart
+from src.core.video.application.use_cases.upload_video import UploadVideo
+from src.core.video.domain.value_objects import MediaType, Rating
+from src.core.video.domain.video import Video
+from src.core.video.infra.in_memory_media_blob_repository import (
+    InMemoryMediaBlobRepository,
+)
+from src.core.video.infra.in_memory_upload_session_repository import (
+    InMemoryUploadSessionRepository,
+)
+from src.core.video.infra.in_memory_video_repository import InMemoryVideoRepository
+
+
+@pytest.fixture
+def video() -> Video:
+    return Video(
+        title="Video 1",
+        description="Video 1 description",
+        launch_year=2021,
+        duration=Decimal(120),
+        rating=Rating.AGE_14,
+        opened=True,
+        cast_members=set(),
+        categories=set(),
+        genres=set(),
+    )
+
+
+@pytest.fixture
+def video_repository(video: Video) -> InMemoryVideoRepository:
+    return InMemoryVideoRepository(videos=[video])
+
+
+@pytest.fixture
+def upload_session_repository() -> InMemoryUploadSessionRepository:
+    return InMemoryUploadSessionRepository()
+
+
+@pytest.fixture
+def storage() -> InMemoryStorage:
+    return InMemoryStorage()
+
+
+@pytest.fixture
+def mock_message_bus() -> MessageBus:
+    return create_autospec(MessageBus)
+
+
+@pytest.fixture
+def complete_use_case(
+    video_repository, upload_session_repository, storage, mock_message_bus
+) -> CompleteUploadSession:
+    return CompleteUploadSession(
+        upload_session_repository=upload_session_repository,
+        storage_service=storage,
+        upload_video=UploadVideo(
+            repository=video_repository,
+            storage_service=storage,
+            message_bus=mock_message_bus,
+            blob_repository=InMemoryMediaBlobRepository(),
+        ),
+    )
+
+
+def initiate(video, video_repository, upload_session_repository):
+    return InitiateUploadSession(
+        video_repository=video_repository,
+        upload_session_repository=upload_session_repository,
+    ).execute(
+        InitiateUploadSession.Input(
+            video_id=video.id, file_name="video.mp4", content_type="video/mp4"
+        )
+    )
+
+
+def upload(video, session_id, part_number, content, upload_session_repository, storage):
+    UploadPart(
+        upload_session_repository=upload_session_repository,
+        storage_service=storage,
+    ).execute(
+        UploadPart.Input(
+            video_id=video.id,
+            session_id=session_id,
+            part_number=part_number,
+            content=[content],
+        )
+    )
+
+
+class TestCompleteUploadSession:
+    def test_assembles_parts_in_order_then_uploads_video_and_dispatches_event(
+        self,
+        video,
+        video_repository,
+        upload_session_repository,
+        storage,
+        mock_message_bus,
+        complete_use_case,
+    ):
+        session = initiate(video, video_repository, upload_session_repository)
+        upload(video, session.id, 2, b"content", upload_session_repository, storage)
+        upload(video, session.id, 1, b"video ", upload_session_repository, storage)
+
+        complete_use_case.execute(
+            CompleteUploadSession.Input(video_id=video.id, session_id=session.id)
+        )
+
+        file_path = blob_path(hashlib.sha256(b"video content").hexdigest())
+        assert storage.retrieve(file_path) == b"video content"
+        assert video.video.raw_location == str(file_path)
+        mock_message_bus.handle.assert_called_once_with(
+            [
+                AudioVideoMediaUpdatedIntegrationEvent(
+                    resource_id=f"{video.id}.{MediaType.VIDEO}",
+                    file_path=str(file_path),
+                )
+            ]
+        )
+        assert upload_session_repository.get_by_id(session.id) is None
+        with pytest.raises(FileNotFoundError):
+            storage.retrieve(Path("uploads") / str(session.id) / "part-00001")
+
+    def test_when_parts_are_missing_then_raise_without_dispatching(
+        self,
+        video,
+        video_repository,
+        upload_session_repository,
+        storage,
+        mock_message_bus,
+        complete_use_case,
+    ):
+        session = initiate(video, video_repository, upload_session_repository)
+        upload(video, session.id, 2, b"content", upload_session_repository, storage)
+
+        with pytest.raises(IncompleteUpload):
+            complete_use_case.execute(
+                CompleteUploadSession.Input(video_id=video.id, session_id=session.id)
+            )
+
+        mock_message_bus.handle.assert_not_called()
+        assert video.video is None
+
+
+class TestUploadPart:
+    @pytest.mark.parametrize("part_number", [0, 10_001, 2_000_000_000])
+    def test_when_part_number_is_out_of_range_then_raise(
+        self, video, video_repository, upload_session_repository, storage, part_number
+    ):
+        session = initiate(video, video_repository, upload_session_repository)
+
+        with pytest.raises(InvalidUploadPart):
+            upload(
+                video,
+                session.id,
+                part_number,
+                b"video",
+                upload_session_repository,
+                storage,
+            )
+
+        assert upload_session_repository.get_by_id(session.id).parts == set()
+
+    def test_when_part_exceeds_max_size_then_raise_and_discard_it(
+        self, video, video_repository, upload_session_repository, storage
+    ):
+        session = initiate(video, video_repository, upload_session_repository)
+        use_case = UploadPart(
+            upload_session_repository=upload_session_repository,
+            storage_service=storage,
+            max_part_size=8,
+        )
+
+        with pytest.raises(InvalidUploadPart):
+            use_case.execute(
+                UploadPart.Input(
+                    video_id=video.id,
+                    session_id=session.id,
+                    part_number=1,
+                    content=[b"video", b" content"],
+                )
+            )
+
+        assert upload_session_repository.get_by_id(session.id).parts == set()
+        assert not storage.exists(Path("uploads") / str(session.id) / "part-00001")
+
+
+class TestAbortUploadSession:
+    def test_removes_parts_and_session(
+        self, video, video_repository, upload_session_repository, storage
+    ):
+        session = initiate(video, video_repository, upload_session_repository)
+        upload(video, session.id, 1, b"video", upload_session_repository, storage)
+        use_case = AbortUploadSession(
+            upload_session_repository=upload_session_repository,
+            storage_service=storage,
+        )
+
+        use_case.execute(
+            AbortUploadSession.Input(video_id=video.id, session_id=session.id)
+        )
+
+        assert upload_session_repository.get_by_id(session.id) is None
+        with pytest.raises(UploadSessionNotFound):
+            use_case.execute(
+                AbortUploadSession.Input(video_id=video.id, session_id=session.id)
+            )
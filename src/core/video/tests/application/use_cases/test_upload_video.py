@@ -1,14 +1,47 @@
+import asyncio
+import hashlib
+import io
 from decimal import Decimal
-from pathlib import Path
 from unittest.mock import create_autospec
 
-from src.core._shared.infra.storage.abstract_storage import AbstractStorage
+import pytest
+
+from src.core._shared.infra.storage.abstract_storage import (
+    AbstractStorage,
+    StoredBlob,
+    blob_path,
+)
+from src.core._shared.infra.storage.async_in_memory_storage import (
+    AsyncInMemoryStorage,
+)
+from src.core._shared.infra.storage.in_memory_storage import InMemoryStorage
 from src.core._shared.events.message_bus import MessageBus
+from src.core.video.application.use_cases.exceptions import MediaBlobReleased
 from src.core.video.application.use_cases.upload_video import UploadVideo
 from src.core.video.domain.value_objects import Rating, AudioVideoMedia, MediaStatus, MediaType
 from src.core.video.domain.video import Video
+from src.core.video.infra.in_memory_media_blob_repository import (
+    InMemoryMediaBlobRepository,
+)
 from src.core.video.infra.in_memory_video_repository import InMemoryVideoRepository
 
+CHECKSUM = hashlib.sha256(b"video content").hexdigest()
+BLOB_PATH = blob_path(CHECKSUM)
+
+
+def make_video() -> Video:
+    return Video(
+        title="Video 1",
+        description="Video 1 description",
+        launch_year=2021,
+        duration=Decimal(120),
+        rating=Rating.AGE_14,
+        opened=True,
+        cast_members=set(),
+        categories=set(),
+        genres=set(),
+    )
+
 
 class TestUploadVideo:
     def test_upload_video_media_to_video(self) -> None:
@@ -26,32 +59,213 @@ class TestUploadVideo:
 
         video_repository = InMemoryVideoRepository(videos=[video])
         mock_storage = create_autospec(AbstractStorage)
+        mock_storage.store_blob.return_value = StoredBlob(
+            checksum=CHECKSUM, path=BLOB_PATH, created=True
+        )
         mock_message_bus = create_autospec(MessageBus)
         use_case = UploadVideo(
             repository=video_repository,
             storage_service=mock_storage,
             message_bus=mock_message_bus,
+            blob_repository=InMemoryMediaBlobRepository(),
         )
 
+        content = io.BytesIO(b"video content")
         use_case.execute(
             UploadVideo.Input(
                 video_id=video.id,
                 file_name="video.mp4",
-                content=b"video content",
+                content=content,
                 content_type="video/mp4",
             )
         )
 
-        mock_storage.store.assert_called_once_with(
-            Path(f"videos/{video.id}/video.mp4"),
-            b"video content",
-            "video/mp4",
-        )
+        mock_storage.store_blob.assert_called_once_with(content, "video/mp4")
         assert video.video == AudioVideoMedia(
             name="video.mp4",
-            raw_location=f"videos/{video.id}/video.mp4",
+            raw_location=str(BLOB_PATH),
             encoded_location="",
             status=MediaStatus.PENDING,
             media_type=MediaType.VIDEO,
+            checksum=CHECKSUM,
         )
         assert video_repository.videos[0] == video
+
+    def test_updates_video_and_emits_event_inside_unit_of_work(self) -> None:
+        video = Video(
+            title="Video 1",
+            description="Video 1 description",
+            launch_year=2021,
+            duration=Decimal(120),
+            rating=Rating.AGE_14,
+            opened=True,
+            cast_members=set(),
+            categories=set(),
+            genres=set(),
+        )
+        calls = []
+
+        class RecordingUnitOfWork:
+            def __enter__(self):
+                calls.append("begin")
+
+            def __exit__(self, *exc_info):
+                calls.append("commit")
+
+        mock_storage = create_autospec(AbstractStorage)
+        mock_storage.store_blob.side_effect = lambda *args: calls.append(
+            "store"
+        ) or StoredBlob(checksum=CHECKSUM, path=BLOB_PATH, created=True)
+        mock_message_bus = create_autospec(MessageBus)
+        mock_message_bus.handle.side_effect = lambda events: calls.append("handle")
+        use_case = UploadVideo(
+            repository=InMemoryVideoRepository(videos=[video]),
+            storage_service=mock_storage,
+            message_bus=mock_message_bus,
+            blob_repository=InMemoryMediaBlobRepository(),
+            unit_of_work=RecordingUnitOfWork,
+        )
+
+        use_case.execute(
+            UploadVideo.Input(
+                video_id=video.id,
+                file_name="video.mp4",
+                content=io.BytesIO(b"video content"),
+                content_type="video/mp4",
+            )
+        )
+
+        assert calls == ["store", "begin", "handle", "commit"]
+
+    def test_aexecute_awaits_storage_and_runs_unit_of_work_through_run_sync(
+        self,
+    ) -> None:
+        video = Video(
+            title="Video 1",
+            description="Video 1 description",
+            launch_year=2021,
+            duration=Decimal(120),
+            rating=Rating.AGE_14,
+            opened=True,
+            cast_members=set(),
+            categories=set(),
+            genres=set(),
+        )
+        storage = AsyncInMemoryStorage()
+        mock_message_bus = create_autospec(MessageBus)
+        sync_calls = []
+
+        async def run_sync(function):
+            sync_calls.append(function)
+            return function()
+
+        use_case = UploadVideo(
+            repository=InMemoryVideoRepository(videos=[video]),
+            storage_service=storage,
+            message_bus=mock_message_bus,
+            blob_repository=InMemoryMediaBlobRepository(),
+            run_sync=run_sync,
+        )
+
+        asyncio.run(
+            use_case.aexecute(
+                UploadVideo.Input(
+                    video_id=video.id,
+                    file_name="video.mp4",
+                    content=io.BytesIO(b"video content"),
+                    content_type="video/mp4",
+                )
+            )
+        )
+
+        assert asyncio.run(storage.retrieve(BLOB_PATH)) == b"video content"
+        assert video.video.raw_location == str(BLOB_PATH)
+        assert len(sync_calls) == 1
+        mock_message_bus.handle.assert_called_once()
+
+
+class TestUploadVideoDeduplication:
+    def upload(self, use_case: UploadVideo, video: Video, content: bytes) -> None:
+        use_case.execute(
+            UploadVideo.Input(
+                video_id=video.id,
+                file_name="video.mp4",
+                content=io.BytesIO(content),
+                content_type="video/mp4",
+            )
+        )
+
+    def test_duplicate_of_encoded_media_is_a_metadata_write(self) -> None:
+        first, second = make_video(), make_video()
+        storage = InMemoryStorage()
+        blob_repository = InMemoryMediaBlobRepository()
+        mock_message_bus = create_autospec(MessageBus)
+        use_case = UploadVideo(
+            repository=InMemoryVideoRepository(videos=[first, second]),
+            storage_service=storage,
+            message_bus=mock_message_bus,
+            blob_repository=blob_repository,
+        )
+        self.upload(use_case, first, b"video content")
+        first.process(MediaStatus.COMPLETED, "encoded/video.mp4")
+        mock_message_bus.reset_mock()
+
+        self.upload(use_case, second, b"video content")
+
+        assert second.video.raw_location == str(BLOB_PATH)
+        assert second.video.encoded_location == "encoded/video.mp4"
+        assert second.video.status == MediaStatus.COMPLETED
+        assert second.published is True
+        mock_message_bus.handle.assert_not_called()
+        assert blob_repository.ref_counts == {CHECKSUM: 2}
+        # Uma única cópia do conteúdo, sem sobras da área de staging
+        assert list(storage._storage) == [str(BLOB_PATH)]
+
+    def test_replacing_media_deletes_blob_without_references(self) -> None:
+        video = make_video()
+        storage = InMemoryStorage()
+        blob_repository = InMemoryMediaBlobRepository()
+        use_case = UploadVideo(
+            repository=InMemoryVideoRepository(videos=[video]),
+            storage_service=storage,
+            message_bus=create_autospec(MessageBus),
+            blob_repository=blob_repository,
+        )
+        self.upload(use_case, video, b"video content")
+
+        self.upload(use_case, video, b"new content")
+
+        new_checksum = hashlib.sha256(b"new content").hexdigest()
+        assert video.video.checksum == new_checksum
+        assert blob_repository.ref_counts == {CHECKSUM: 0, new_checksum: 1}
+        assert not storage.exists(BLOB_PATH)
+        assert storage.exists(blob_path(new_checksum))
+
+    def test_reusing_blob_pending_removal_raises(self) -> None:
+        video, retry = make_video(), make_video()
+        storage = InMemoryStorage()
+        storage.store(BLOB_PATH, b"video content")
+        blob_repository = InMemoryMediaBlobRepository()
+        blob_repository.acquire(CHECKSUM, str(BLOB_PATH), stored=True)
+        # Última referência liberada; o arquivo ainda não foi apagado
+        assert blob_repository.release(CHECKSUM) == str(BLOB_PATH)
+        mock_message_bus = create_autospec(MessageBus)
+        use_case = UploadVideo(
+            repository=InMemoryVideoRepository(videos=[video, retry]),
+            storage_service=storage,
+            message_bus=mock_message_bus,
+            blob_repository=blob_repository,
+        )
+
+        with pytest.raises(MediaBlobReleased):
+            self.upload(use_case, video, b"video content")
+
+        mock_message_bus.handle.assert_not_called()
+        assert blob_repository.ref_counts == {CHECKSUM: 0}
+
+        # Arquivo já apagado: o reenvio grava o blob de novo
+        storage.delete(BLOB_PATH)
+        self.upload(use_case, retry, b"video content")
+
+        assert blob_repository.ref_counts == {CHECKSUM: 1}
+        mock_message_bus.handle.assert_called_once()
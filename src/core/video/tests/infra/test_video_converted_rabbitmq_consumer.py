@@ -0,0 +1,89 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+from src.core.video.application.use_cases.exceptions import VideoNotFound
+from src.core.video.domain.value_objects import (
+    AudioVideoMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.core.video.domain.video import Video
+from src.core.video.infra.video_converted_rabbitmq_consumer import (
+    VideoConvertedRabbitMQConsumer,
+)
+from src.django_project.video_app.repository import DjangoORMVideoRepository
+
+
+@pytest.fixture
+def video() -> Video:
+    video = Video(
+        title="Video",
+        description="Video description",
+        launch_year=2022,
+        duration=Decimal("120.50"),
+        rating=Rating.AGE_12,
+        opened=True,
+        categories=set(),
+        genres=set(),
+        cast_members=set(),
+    )
+    video.update_video_media(
+        AudioVideoMedia(
+            name="video.mp4",
+            raw_location=f"videos/{video.id}/video.mp4",
+            encoded_location="",
+            status=MediaStatus.PENDING,
+            media_type=MediaType.VIDEO,
+        )
+    )
+    return video
+
+
+def converted_message(video_id, status="COMPLETED") -> bytes:
+    return json.dumps(
+        {
+            "error": "",
+            "video": {
+                "resource_id": f"{video_id}.VIDEO",
+                "encoded_video_folder": "/path/to/encoded/video",
+            },
+            "status": status,
+        }
+    ).encode()
+
+
+@pytest.mark.django_db
+class TestOnMessage:
+    def test_processes_converted_video(self, video: Video):
+        repository = DjangoORMVideoRepository()
+        repository.save(video)
+        repository.update(video)
+
+        VideoConvertedRabbitMQConsumer().on_message(converted_message(video.id))
+
+        processed = repository.get_by_id(video.id)
+        assert processed.video.status == MediaStatus.COMPLETED
+        assert processed.video.encoded_location == "/path/to/encoded/video"
+
+    def test_raises_permanent_error_for_unknown_video(self, video: Video):
+        consumer = VideoConvertedRabbitMQConsumer()
+
+        with pytest.raises(VideoNotFound) as exc_info:
+            consumer.on_message(converted_message(video.id))
+
+        assert isinstance(exc_info.value, consumer.permanent_errors)
+
+
+class TestPermanentErrors:
+    @pytest.mark.parametrize(
+        "message",
+        [b"not json", b'{"status": "COMPLETED"}', converted_message("not-a-uuid")],
+    )
+    def test_malformed_payloads_are_not_requeued(self, message):
+        consumer = VideoConvertedRabbitMQConsumer()
+
+        with pytest.raises(consumer.permanent_errors):
+            consumer.on_message(message)
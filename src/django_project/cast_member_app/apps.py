@@ -3,4 +3,14 @@ from django.apps import AppConfig
 
 class CastMemberAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "src.django_project.cast_member_app" 
\ No newline at end of file
+    name = "src.django_project.cast_member_app" 
+
+    def ready(self):
+        from src.core._shared.infra.django.cache import (
+            invalidate_on_change,
+        )
+        from src.django_project.cast_member_app.models import CastMember
+        from src.django_project.cast_member_app.repository import cast_member_cache
+
+        # Escritas fora do CachedRepository também invalidam o cache
+        invalidate_on_change(cast_member_cache, CastMember)
@@ -0,0 +1,38 @@
+from src.core._shared.infra.django.async_views import AsyncCollectionView
+from src.core.cast_member.application.use_cases import (
+    CreateCastMember,
+    InvalidCastMember,
+    ListCastMember,
+)
+from src.core.cast_member.domain.cast_member import CastMemberType
+from src.django_project.cast_member_app.repository import (
+    cached_cast_member_repository,
+)
+from src.django_project.cast_member_app.serializers import (
+    CreateCastMemberInputSerializer,
+    CreateCastMemberOutputSerializer,
+    ListCastMemberOutputSerializer,
+    ListCastMemberRequestSerializer,
+)
+
+
+class CastMemberAsyncCollectionView(AsyncCollectionView):
+    list_request_serializer = ListCastMemberRequestSerializer
+    create_request_serializer = CreateCastMemberInputSerializer
+    create_response_serializer = CreateCastMemberOutputSerializer
+    # ValueError: type fora de CastMemberType
+    create_errors = (InvalidCastMember, ValueError)
+
+    def _get_list_use_case(self) -> ListCastMember:
+        return ListCastMember(repository=cached_cast_member_repository())
+
+    def _get_list_response_serializer(self, output):
+        return ListCastMemberOutputSerializer(output)
+
+    def _get_create_use_case(self) -> CreateCastMember:
+        return CreateCastMember(repository=cached_cast_member_repository())
+
+    def _to_create_input(self, data: dict) -> CreateCastMember.Input:
+        return CreateCastMember.Input(
+            name=data["name"], type=CastMemberType(data["type"])
+        )
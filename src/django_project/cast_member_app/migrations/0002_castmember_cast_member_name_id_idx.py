@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cast_member_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="castmember",
+            index=models.Index(fields=["name", "id"], name="cast_member_name_id_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cast_member_app", "0002_castmember_cast_member_name_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="castmember",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
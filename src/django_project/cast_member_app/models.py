@@ -2,8 +2,10 @@ import uuid
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from src.core._shared.infra.django.models import VersionedModel
 
-class CastMember(models.Model):
+
+class CastMember(VersionedModel):
     class CastMemberType(models.TextChoices):
         ACTOR = "ACTOR", _("Actor")
         DIRECTOR = "DIRECTOR", _("Director")
@@ -16,6 +18,7 @@ class CastMember(models.Model):
 
     class Meta:
         db_table = "cast_members"
+        indexes = [models.Index(fields=["name", "id"], name="cast_member_name_id_idx")]
         verbose_name = _("Cast Member")
         verbose_name_plural = _("Cast Members")
 
@@ -1,11 +1,24 @@
 from uuid import UUID
-from typing import List
+from typing import Iterator, List, Set
 
+from asgiref.sync import sync_to_async
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 
+from src.core._shared.domain.pagination import Page, PageQuery
+from src.core._shared.infra.django.pagination import (
+    apaginate_queryset,
+    paginate_queryset,
+)
+from src.core._shared.infra.cache.cached_repository import CachedRepository
+from src.core._shared.domain.search import SearchDocument
+from src.core._shared.infra.django.search import search_engine
+from src.core._shared.infra.django.cache import repository_cache
 from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
 from src.core.cast_member.domain.cast_member_repository import CastMemberRepository
 from src.django_project.cast_member_app.models import CastMember as CastMemberModel
+from src.django_project.change_feed_app.models import ChangeOperation, EntityType
+from src.django_project.change_feed_app.recorder import record_change
 
 
 class DjangoORMCastMemberRepository(CastMemberRepository):
@@ -15,7 +28,22 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
             name=cast_member.name,
             type=cast_member.type.value,
         )
-        cast_member_model.save()
+        with transaction.atomic():
+            cast_member_model.save()
+            record_change(
+                EntityType.CAST_MEMBER, cast_member.id, ChangeOperation.CREATED
+            )
+            search_engine().index([cast_member_search_document(cast_member)])
+
+    def get_by_ids(self, ids: Set[UUID]) -> List[CastMember]:
+        return [
+            CastMember(
+                id=cast_member_model.id,
+                name=cast_member_model.name,
+                type=CastMemberType(cast_member_model.type),
+            )
+            for cast_member_model in CastMemberModel.objects.filter(id__in=ids)
+        ]
 
     def get_by_id(self, id: UUID) -> CastMember | None:
         try:
@@ -39,18 +67,104 @@ class DjangoORMCastMemberRepository(CastMemberRepository):
             for cast_member_model in cast_member_models
         ]
 
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[CastMember]:
+        cast_member_models = CastMemberModel.objects.order_by("pk")
+        for cast_member_model in cast_member_models.iterator(chunk_size):
+            yield CastMember(
+                id=cast_member_model.id,
+                name=cast_member_model.name,
+                type=CastMemberType(cast_member_model.type),
+            )
+
+    def paginate(self, query: PageQuery) -> Page[CastMember]:
+        page = paginate_queryset(CastMemberModel.objects.all(), query)
+        return Page(
+            items=[
+                CastMember(
+                    id=cast_member_model.id,
+                    name=cast_member_model.name,
+                    type=CastMemberType(cast_member_model.type),
+                )
+                for cast_member_model in page.items
+            ],
+            total=page.total,
+            has_next=page.has_next,
+        )
+
+    def find_missing_ids(self, ids: Set[UUID]) -> Set[UUID]:
+        if not ids:
+            return set()
+
+        existing_ids = CastMemberModel.objects.filter(id__in=ids).values_list(
+            "id", flat=True
+        )
+        return set(ids) - set(existing_ids)
+
     def update(self, cast_member: CastMember) -> None:
         try:
             cast_member_model = CastMemberModel.objects.get(id=cast_member.id)
             cast_member_model.name = cast_member.name
             cast_member_model.type = cast_member.type.value
-            cast_member_model.save()
+            with transaction.atomic():
+                cast_member_model.save()
+                record_change(
+                    EntityType.CAST_MEMBER, cast_member.id, ChangeOperation.UPDATED
+                )
+                search_engine().index([cast_member_search_document(cast_member)])
         except ObjectDoesNotExist:
             raise ValueError(f"CastMember with id {cast_member.id} not found")
 
     def delete(self, id: UUID) -> None:
         try:
             cast_member_model = CastMemberModel.objects.get(id=id)
-            cast_member_model.delete()
+            with transaction.atomic():
+                cast_member_model.delete()
+                # Tombstone: o feed de alterações propaga a remoção
+                record_change(EntityType.CAST_MEMBER, id, ChangeOperation.DELETED)
+                search_engine().remove(EntityType.CAST_MEMBER, [id])
         except ObjectDoesNotExist:
-            raise ValueError(f"CastMember with id {id} not found") 
\ No newline at end of file
+            raise ValueError(f"CastMember with id {id} not found")
+
+    async def apaginate(self, query: PageQuery) -> Page[CastMember]:
+        page = await apaginate_queryset(CastMemberModel.objects.all(), query)
+        return Page(
+            items=[
+                CastMember(
+                    id=cast_member_model.id,
+                    name=cast_member_model.name,
+                    type=CastMemberType(cast_member_model.type),
+                )
+                for cast_member_model in page.items
+            ],
+            total=page.total,
+            has_next=page.has_next,
+        )
+
+    async def afind_missing_ids(self, ids: Set[UUID]) -> Set[UUID]:
+        if not ids:
+            return set()
+
+        existing_ids = CastMemberModel.objects.filter(id__in=ids).values_list(
+            "id", flat=True
+        )
+        return set(ids) - {id async for id in existing_ids}
+
+    async def asave(self, cast_member: CastMember) -> None:
+        # Escrita transacional (feed e índice de busca juntos) em uma thread
+        await sync_to_async(self.save)(cast_member)
+
+
+def cast_member_search_document(cast_member: CastMember) -> SearchDocument:
+    return SearchDocument(
+        entity_type=EntityType.CAST_MEMBER,
+        entity_id=cast_member.id,
+        title=cast_member.name,
+    )
+
+
+# Cache read-through de get_by_id compartilhado pelo processo
+cast_member_cache = repository_cache("cast_member")
+
+
+def cached_cast_member_repository() -> CastMemberRepository:
+    return CachedRepository(DjangoORMCastMemberRepository(), cast_member_cache)
@@ -1,8 +1,10 @@
 from rest_framework import serializers
 
 from src.core._shared.infra.django.serializers import (
+    ListRequestSerializer,
     ListResponseSerializer,
     ListOutputMetaSerializer,
+    order_by_field,
 )
 
 
@@ -17,6 +19,16 @@ class ListCastMemberOutputSerializer(ListResponseSerializer):
         return CastMemberOutputSerializer()
 
 
+class ListCastMemberRequestSerializer(ListRequestSerializer):
+    ORDER_BY_FIELDS = ("name", "type")
+
+    order_by = order_by_field(ORDER_BY_FIELDS, default="name")
+
+
+class ExportCastMemberSerializer(CastMemberOutputSerializer):
+    type = serializers.CharField(source="type.value")
+
+
 class CreateCastMemberInputSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=255)
     type = serializers.CharField(max_length=255)
@@ -0,0 +1,37 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+
+from src.django_project.cast_member_app.models import CastMember
+
+pytestmark = pytest.mark.django_db
+
+
+def post(data: dict):
+    return async_to_sync(AsyncClient().post)(
+        reverse("async-cast-member-list"), data, content_type="application/json"
+    )
+
+
+class TestCastMemberAsyncViews:
+    def test_create_and_list_cast_member(self):
+        response = post({"name": "John Doe", "type": "ACTOR"})
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = async_to_sync(AsyncClient().get)(reverse("async-cast-member-list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"] == [
+            {
+                "id": str(CastMember.objects.get().id),
+                "name": "John Doe",
+                "type": "ACTOR",
+            }
+        ]
+
+    def test_when_type_is_unknown_then_return_400(self):
+        response = post({"name": "John Doe", "type": "PRODUCER"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not CastMember.objects.exists()
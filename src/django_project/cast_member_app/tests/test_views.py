@@ -1,4 +1,7 @@
+import json
 import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
 from rest_framework import status
 from rest_framework.test import APIClient
 from uuid import uuid4
@@ -56,6 +59,35 @@ class TestListAPI:
         assert str(cast_member_actor.id) in cast_member_ids
         assert str(cast_member_director.id) in cast_member_ids
 
+    @pytest.mark.parametrize("order_by", ["foo", "updated_at"])
+    def test_when_order_by_is_not_allowed_then_return_400(self, order_by) -> None:
+        response = APIClient().get("/api/cast-members/", {"order_by": order_by})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "order_by" in response.data
+
+    def test_paginates_by_type_with_cursor(
+        self, cast_member_repository: DjangoORMCastMemberRepository
+    ) -> None:
+        for name, type in [("A", "DIRECTOR"), ("B", "ACTOR"), ("C", "ACTOR")]:
+            cast_member_repository.save(
+                CastMember(name=name, type=CastMemberType(type))
+            )
+        client = APIClient()
+
+        first = client.get("/api/cast-members/", {"order_by": "type"})
+        cursor = first.data["meta"]["next_cursor"]
+        second = client.get(
+            "/api/cast-members/", {"order_by": "type", "cursor": cursor}
+        )
+
+        assert second.status_code == status.HTTP_200_OK
+        assert [item["type"] for item in first.data["data"] + second.data["data"]] == [
+            "ACTOR",
+            "ACTOR",
+            "DIRECTOR",
+        ]
+
 
 @pytest.mark.django_db
 class TestCreateAPI:
@@ -86,4 +118,49 @@ class TestCreateAPI:
         }
         response = APIClient().post(url, data=data, content_type="application/json")
 
-        assert response.status_code == status.HTTP_400_BAD_REQUEST 
\ No newline at end of file
+        assert response.status_code == status.HTTP_400_BAD_REQUEST 
+
+@pytest.mark.django_db
+class TestExportAPI:
+    def test_streams_cast_members_with_type_value(
+        self,
+        cast_member_actor: CastMember,
+        cast_member_director: CastMember,
+        cast_member_repository: DjangoORMCastMemberRepository,
+    ) -> None:
+        cast_member_repository.save(cast_member_actor)
+        cast_member_repository.save(cast_member_director)
+
+        response = APIClient().get("/api/cast-members/export/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert sorted(map(json.loads, lines), key=lambda item: item["name"]) == [
+            {
+                "id": str(cast_member_director.id),
+                "name": "Jane Smith",
+                "type": "DIRECTOR",
+            },
+            {
+                "id": str(cast_member_actor.id),
+                "name": "John Doe",
+                "type": "ACTOR",
+            },
+        ]
+
+    def test_streams_asynchronously_under_asgi(
+        self,
+        cast_member_actor: CastMember,
+        cast_member_repository: DjangoORMCastMemberRepository,
+    ) -> None:
+        cast_member_repository.save(cast_member_actor)
+
+        async def export():
+            response = await AsyncClient().get("/api/cast-members/export/")
+            return response, [chunk async for chunk in response.streaming_content]
+
+        response, chunks = async_to_sync(export)()
+
+        assert response.is_async
+        assert json.loads(b"".join(chunks))["name"] == "John Doe"
@@ -1,6 +1,8 @@
 from uuid import UUID
 
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
@@ -14,6 +16,7 @@ from rest_framework.status import (
 from src.core.cast_member.application.use_cases import (
     CreateCastMember,
     DeleteCastMember,
+    SearchCastMember,
     UpdateCastMember,
 )
 from src.core.cast_member.domain.cast_member import CastMemberType
@@ -26,10 +29,15 @@ from src.core.cast_member.application.use_cases.list_cast_member import (
     ListCastMemberRequest,
     ListCastMemberResponse,
 )
-from src.core._shared.infra.django.views import ListViewSet
-from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
+from src.core._shared.infra.django.export import EXPORT_CHUNK_SIZE, ndjson_response
+from src.core._shared.infra.django.search import search_engine
+from src.core._shared.infra.django.views import ListViewSet, SearchViewMixin
+from src.django_project.cast_member_app.models import CastMember
+from src.django_project.cast_member_app.repository import cached_cast_member_repository
 from src.django_project.cast_member_app.serializers import (
+    ExportCastMemberSerializer,
     ListCastMemberOutputSerializer,
+    ListCastMemberRequestSerializer,
     CreateCastMemberInputSerializer,
     DeleteCastMemberInputSerializer,
     CreateCastMemberOutputSerializer,
@@ -37,13 +45,32 @@ from src.django_project.cast_member_app.serializers import (
 )
 
 
-class CastMemberViewSet(ListViewSet, viewsets.ViewSet):
+class CastMemberViewSet(SearchViewMixin, ListViewSet, viewsets.ViewSet):
+    list_request_serializer = ListCastMemberRequestSerializer
     def _get_use_case(self) -> ListCastMember:
-        return ListCastMember(repository=DjangoORMCastMemberRepository())
+        return ListCastMember(repository=cached_cast_member_repository())
+
+    def _get_search_use_case(self) -> SearchCastMember:
+        return SearchCastMember(
+            repository=cached_cast_member_repository(),
+            search_engine=search_engine(),
+        )
 
     def _get_response_serializer(self, output: ListCastMemberResponse):
         return ListCastMemberOutputSerializer(output)
 
+    def _get_queryset(self):
+        return CastMember.objects.all()
+
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        return ndjson_response(
+            request,
+            cached_cast_member_repository().iter_all(chunk_size=EXPORT_CHUNK_SIZE),
+            ExportCastMemberSerializer,
+            filename="cast-members.ndjson",
+        )
+
     def create(self, request: Request) -> Response:
         serializer = CreateCastMemberInputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -52,7 +79,7 @@ class CastMemberViewSet(ListViewSet, viewsets.ViewSet):
         validated_data = serializer.validated_data.copy()
         validated_data["type"] = CastMemberType(validated_data["type"])
 
-        use_case = CreateCastMember(repository=DjangoORMCastMemberRepository())
+        use_case = CreateCastMember(repository=cached_cast_member_repository())
         try:
             output = use_case.execute(CreateCastMember.Input(**validated_data))
         except InvalidCastMember as error:
@@ -71,7 +98,7 @@ class CastMemberViewSet(ListViewSet, viewsets.ViewSet):
         request_data.is_valid(raise_exception=True)
         input = DeleteCastMember.Input(**request_data.validated_data)
 
-        use_case = DeleteCastMember(repository=DjangoORMCastMemberRepository())
+        use_case = DeleteCastMember(repository=cached_cast_member_repository())
         try:
             use_case.execute(input)
         except CastMemberNotFound:
@@ -97,7 +124,7 @@ class CastMemberViewSet(ListViewSet, viewsets.ViewSet):
         
         input = UpdateCastMember.Input(**validated_data)
 
-        use_case = UpdateCastMember(repository=DjangoORMCastMemberRepository())
+        use_case = UpdateCastMember(repository=cached_cast_member_repository())
         try:
             use_case.execute(input)
         except CastMemberNotFound:
@@ -3,4 +3,14 @@ from django.apps import AppConfig
 
 class CategoryAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'src.django_project.category_app'
\ No newline at end of file
+    name = 'src.django_project.category_app'
+
+    def ready(self):
+        from src.core._shared.infra.django.cache import (
+            invalidate_on_change,
+        )
+        from src.django_project.category_app.models import Category
+        from src.django_project.category_app.repository import category_cache
+
+        # Escritas fora do CachedRepository também invalidam o cache
+        invalidate_on_change(category_cache, Category)
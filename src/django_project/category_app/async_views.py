@@ -0,0 +1,61 @@
+from uuid import UUID
+
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+from rest_framework.status import HTTP_404_NOT_FOUND
+
+from src.core._shared.infra.django.async_views import AsyncCollectionView
+from src.core.category.application.use_cases.create_category import (
+    CreateCategory,
+    CreateCategoryRequest,
+)
+from src.core.category.application.use_cases.exceptions import (
+    CategoryNotFound,
+    InvalidCategory,
+)
+from src.core.category.application.use_cases.get_category import (
+    GetCategory,
+    GetCategoryRequest,
+)
+from src.core.category.application.use_cases.list_category import (
+    ListCategory,
+    ListCategoryResponse,
+)
+from src.django_project.category_app.repository import cached_category_repository
+from src.django_project.category_app.serializers import (
+    CreateCategoryRequestSerializer,
+    CreateCategoryResponseSerializer,
+    ListCategoryRequestSerializer,
+    ListCategoryResponseSerializer,
+    RetrieveCategoryResponseSerializer,
+)
+
+
+class CategoryAsyncCollectionView(AsyncCollectionView):
+    list_request_serializer = ListCategoryRequestSerializer
+    create_request_serializer = CreateCategoryRequestSerializer
+    create_response_serializer = CreateCategoryResponseSerializer
+    create_errors = (InvalidCategory,)
+
+    def _get_list_use_case(self) -> ListCategory:
+        return ListCategory(repository=cached_category_repository())
+
+    def _get_list_response_serializer(self, output: ListCategoryResponse):
+        return ListCategoryResponseSerializer(output)
+
+    def _get_create_use_case(self) -> CreateCategory:
+        return CreateCategory(repository=cached_category_repository())
+
+    def _to_create_input(self, data: dict) -> CreateCategoryRequest:
+        return CreateCategoryRequest(**data)
+
+
+class CategoryAsyncDetailView(View):
+    async def get(self, request: HttpRequest, pk: UUID) -> JsonResponse:
+        use_case = GetCategory(repository=cached_category_repository())
+        try:
+            output = await use_case.aexecute(GetCategoryRequest(id=pk))
+        except CategoryNotFound as error:
+            return JsonResponse({"error": str(error)}, status=HTTP_404_NOT_FOUND)
+
+        return JsonResponse(RetrieveCategoryResponseSerializer(output).data)
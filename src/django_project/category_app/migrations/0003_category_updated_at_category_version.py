@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:01
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("category_app", "0002_category_category_name_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="updated_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
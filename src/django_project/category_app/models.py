@@ -1,8 +1,10 @@
 from uuid import uuid4
 from django.db import models
 
+from src.core._shared.infra.django.models import VersionedModel
 
-class Category(models.Model):
+
+class Category(VersionedModel):
 
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     name = models.CharField(max_length=255)
@@ -11,6 +13,7 @@ class Category(models.Model):
 
     class Meta:
         db_table = "category"
+        indexes = [models.Index(fields=["name", "id"], name="category_name_id_idx")]
 
     def __str__(self):
         return self.name
@@ -1,7 +1,24 @@
+from typing import Iterator
 from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+
+from src.core._shared.domain.pagination import Page, PageQuery
+from src.core._shared.infra.django.pagination import (
+    apaginate_queryset,
+    paginate_queryset,
+)
+from src.core._shared.infra.cache.cached_repository import CachedRepository
+from src.core._shared.infra.django.cache import repository_cache
+from src.core._shared.infra.django.models import bump_version
+from src.core._shared.domain.search import SearchDocument
+from src.core._shared.infra.django.search import search_engine
 from src.core.category.domain.category_repository import CategoryRepository
 from src.core.category.domain.category import Category
 from src.django_project.category_app.models import Category as CategoryORM
+from src.django_project.change_feed_app.models import ChangeOperation, EntityType
+from src.django_project.change_feed_app.recorder import record_change
 
 
 class DjangoORMCategoryRepository(CategoryRepository):
@@ -10,7 +27,16 @@ class DjangoORMCategoryRepository(CategoryRepository):
 
     def save(self, category: Category) -> None:
         category_model = CategoryModelMapper.to_model(category)
-        category_model.save()
+        with transaction.atomic():
+            category_model.save()
+            record_change(EntityType.CATEGORY, category.id, ChangeOperation.CREATED)
+            search_engine().index([category_search_document(category)])
+
+    def get_by_ids(self, ids: set[UUID]) -> list[Category]:
+        return [
+            CategoryModelMapper.to_entity(category)
+            for category in self.model.objects.filter(id__in=ids)
+        ]
 
     def get_by_id(self, id: UUID) -> Category | None:
         try:
@@ -20,7 +46,12 @@ class DjangoORMCategoryRepository(CategoryRepository):
             return None
 
     def delete(self, id: UUID) -> None:
-        self.model.objects.filter(id=id).delete()
+        with transaction.atomic():
+            deleted, _ = self.model.objects.filter(id=id).delete()
+            if deleted:
+                # Tombstone: o feed de alterações propaga a remoção
+                record_change(EntityType.CATEGORY, id, ChangeOperation.DELETED)
+                search_engine().remove(EntityType.CATEGORY, [id])
 
     def list(self) -> list[Category]:
         return [
@@ -28,13 +59,66 @@ class DjangoORMCategoryRepository(CategoryRepository):
             for category in self.model.objects.all()
         ]
 
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Category]:
+        for category in self.model.objects.order_by("pk").iterator(chunk_size):
+            yield CategoryModelMapper.to_entity(category)
+
+    def paginate(self, query: PageQuery) -> Page[Category]:
+        page = paginate_queryset(self.model.objects.all(), query)
+        return Page(
+            items=[CategoryModelMapper.to_entity(category) for category in page.items],
+            total=page.total,
+            has_next=page.has_next,
+        )
+
+    def find_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+
+        existing_ids = self.model.objects.filter(id__in=ids).values_list("id", flat=True)
+        return set(ids) - set(existing_ids)
+
     def update(self, category: Category) -> None:
-        self.model.objects.filter(pk=category.id).update(
-            name=category.name,
-            description=category.description,
-            is_active=category.is_active,
+        with transaction.atomic():
+            updated = self.model.objects.filter(pk=category.id).update(
+                name=category.name,
+                description=category.description,
+                is_active=category.is_active,
+                **bump_version(),
+            )
+            if updated:
+                record_change(
+                    EntityType.CATEGORY, category.id, ChangeOperation.UPDATED
+                )
+                search_engine().index([category_search_document(category)])
+
+    async def aget_by_id(self, id: UUID) -> Category | None:
+        try:
+            category_model = await self.model.objects.aget(id=id)
+        except self.model.DoesNotExist:
+            return None
+        return CategoryModelMapper.to_entity(category_model)
+
+    async def apaginate(self, query: PageQuery) -> Page[Category]:
+        page = await apaginate_queryset(self.model.objects.all(), query)
+        return Page(
+            items=[CategoryModelMapper.to_entity(category) for category in page.items],
+            total=page.total,
+            has_next=page.has_next,
         )
 
+    async def afind_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+
+        existing_ids = self.model.objects.filter(id__in=ids).values_list("id", flat=True)
+        return set(ids) - {id async for id in existing_ids}
+
+    async def asave(self, category: Category) -> None:
+        # transaction.atomic não funciona em código async: a escrita (linha,
+        # feed de alterações e índice de busca) roda inteira em uma thread
+        await sync_to_async(self.save)(category)
+
 
 class CategoryModelMapper:
     @staticmethod
@@ -54,3 +138,20 @@ class CategoryModelMapper:
             description=entity.description,
             is_active=entity.is_active,
         )
+
+
+def category_search_document(category: Category) -> SearchDocument:
+    return SearchDocument(
+        entity_type=EntityType.CATEGORY,
+        entity_id=category.id,
+        title=category.name,
+        body=category.description,
+    )
+
+
+# Cache read-through de get_by_id compartilhado pelo processo
+category_cache = repository_cache("category")
+
+
+def cached_category_repository() -> CategoryRepository:
+    return CachedRepository(DjangoORMCategoryRepository(), category_cache)
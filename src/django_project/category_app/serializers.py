@@ -1,8 +1,10 @@
 from rest_framework import serializers
 
 from src.core._shared.infra.django.serializers import (
+    ListRequestSerializer,
     ListResponseSerializer,
     ListOutputMetaSerializer,
+    order_by_field,
 )
 
 
@@ -18,6 +20,12 @@ class ListCategoryResponseSerializer(ListResponseSerializer):
         return CategoryResponseSerializer()
 
 
+class ListCategoryRequestSerializer(ListRequestSerializer):
+    ORDER_BY_FIELDS = ("name", "description", "is_active")
+
+    order_by = order_by_field(ORDER_BY_FIELDS, default="name")
+
+
 class RetrieveCategoryRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
 
@@ -0,0 +1,116 @@
+import asyncio
+import uuid
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+
+from src.core._shared.application.use_cases.list_use_case import encode_cursor
+from src.core._shared.domain.pagination import SortDirection
+from src.django_project.category_app.models import Category
+
+pytestmark = pytest.mark.django_db
+
+
+def get(url: str, params: dict | None = None):
+    return async_to_sync(AsyncClient().get)(url, params or {})
+
+
+def post(url: str, data: dict):
+    return async_to_sync(AsyncClient().post)(url, data, content_type="application/json")
+
+
+class TestListAPI:
+    def test_lists_categories_ordered_by_name(self):
+        Category.objects.create(name="Series")
+        Category.objects.create(name="Movie")
+
+        response = get(reverse("async-category-list"), {"per_page": 10})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["name"] for item in response.json()["data"]] == [
+            "Movie",
+            "Series",
+        ]
+        assert response.json()["meta"]["total"] == 2
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"per_page": "abc"},
+            {"per_page": 0},
+            {"current_page": "x"},
+            {"cursor": "invalid"},
+            {"order_by": "unknown"},
+            {"order_by": "updated_at"},
+            {
+                "order_by": "is_active",
+                "cursor": encode_cursor(
+                    "is_active", SortDirection.ASC, "abc", uuid.uuid4()
+                ),
+            },
+        ],
+    )
+    def test_invalid_params_return_400(self, params):
+        response = get(reverse("async-category-list"), params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_serves_concurrent_requests_on_one_event_loop(self):
+        Category.objects.create(name="Movie")
+
+        async def fetch_all():
+            client = AsyncClient()
+            return await asyncio.gather(
+                *(client.get(reverse("async-category-list")) for _ in range(50))
+            )
+
+        responses = async_to_sync(fetch_all)()
+
+        assert {response.status_code for response in responses} == {status.HTTP_200_OK}
+
+
+class TestRetrieveAPI:
+    def test_returns_category(self):
+        category = Category.objects.create(name="Movie", description="Movies")
+
+        response = get(reverse("async-category-detail", args=[category.id]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "data": {
+                "id": str(category.id),
+                "name": "Movie",
+                "description": "Movies",
+                "is_active": True,
+            }
+        }
+
+    def test_when_category_does_not_exist_then_return_404(self):
+        response = get(reverse("async-category-detail", args=[uuid.uuid4()]))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestCreateAPI:
+    def test_creates_category(self):
+        response = post(reverse("async-category-list"), {"name": "Movie"})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        category = Category.objects.get(id=response.json()["id"])
+        assert category.name == "Movie"
+
+    def test_when_payload_is_invalid_then_return_400(self):
+        response = post(reverse("async-category-list"), {"name": ""})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "name" in response.json()
+
+    def test_when_body_is_not_json_then_return_400(self):
+        response = async_to_sync(AsyncClient().post)(
+            reverse("async-category-list"), "name=Movie", content_type="text/plain"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
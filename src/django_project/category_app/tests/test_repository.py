@@ -1,4 +1,7 @@
+import uuid
+
 import pytest
+from src.core._shared.domain.pagination import PageQuery, SortDirection
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.category_app.models import Category as CategoryORM
 from core.category.domain.category import Category
@@ -22,3 +25,108 @@ class TestSave:
         assert saved_category.name == category.name
         assert saved_category.description == category.description
         assert saved_category.is_active == category.is_active
+
+
+@pytest.mark.django_db
+class TestPaginate:
+    def test_returns_only_requested_page_and_total(self, django_assert_num_queries):
+        repository = DjangoORMCategoryRepository()
+        category_movie = Category(name="Movie")
+        category_documentary = Category(name="Documentary")
+        category_series = Category(name="Series")
+        repository.save(category_movie)
+        repository.save(category_documentary)
+        repository.save(category_series)
+
+        with django_assert_num_queries(2):
+            page = repository.paginate(PageQuery(order_by="name", offset=1, limit=2))
+
+        assert page.total == 3
+        assert [category.id for category in page.items] == [
+            category_movie.id,
+            category_series.id,
+        ]
+
+    def test_descending_order(self):
+        repository = DjangoORMCategoryRepository()
+        category_movie = Category(name="Movie")
+        category_documentary = Category(name="Documentary")
+        repository.save(category_movie)
+        repository.save(category_documentary)
+
+        page = repository.paginate(
+            PageQuery(order_by="name", direction=SortDirection.DESC)
+        )
+
+        assert [category.id for category in page.items] == [
+            category_movie.id,
+            category_documentary.id,
+        ]
+
+    def test_after_keyset_returns_rows_following_cursor(self):
+        repository = DjangoORMCategoryRepository()
+        category_movie = Category(name="Movie")
+        category_documentary = Category(name="Documentary")
+        category_series = Category(name="Series")
+        repository.save(category_movie)
+        repository.save(category_documentary)
+        repository.save(category_series)
+
+        page = repository.paginate(
+            PageQuery(
+                order_by="name",
+                limit=1,
+                after=(category_documentary.name, category_documentary.id),
+            )
+        )
+
+        assert [category.id for category in page.items] == [category_movie.id]
+        assert page.has_next is True
+
+
+@pytest.mark.django_db
+class TestFindMissingIds:
+    def test_returns_ids_not_in_database_with_a_single_query(
+        self, django_assert_num_queries
+    ):
+        repository = DjangoORMCategoryRepository()
+        category_movie = Category(name="Movie")
+        repository.save(category_movie)
+        missing_id = uuid.uuid4()
+
+        with django_assert_num_queries(1):
+            missing_ids = repository.find_missing_ids({category_movie.id, missing_id})
+
+        assert missing_ids == {missing_id}
+
+    def test_when_no_ids_are_given_then_skip_query(self, django_assert_num_queries):
+        repository = DjangoORMCategoryRepository()
+
+        with django_assert_num_queries(0):
+            assert repository.find_missing_ids(set()) == set()
+
+
+@pytest.mark.django_db
+class TestVersioning:
+    def test_update_bumps_version_and_updated_at(self):
+        category = Category(name="Movie", description="Movie description")
+        repository = DjangoORMCategoryRepository()
+        repository.save(category)
+        created = CategoryORM.objects.get(id=category.id)
+
+        category.update_category(name="Film", description="Film description")
+        repository.update(category)
+
+        updated = CategoryORM.objects.get(id=category.id)
+        assert (created.version, updated.version) == (1, 2)
+        assert updated.updated_at > created.updated_at
+
+    def test_model_save_bumps_version(self):
+        model = CategoryORM.objects.create(name="Movie", description="Movie")
+
+        model.name = "Film"
+        model.save(update_fields=["name"])
+
+        assert model.version == 2
+        model.save()
+        assert model.version == 3
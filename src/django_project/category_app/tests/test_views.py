@@ -1,6 +1,10 @@
+import base64
+import json
+import time
 from uuid import UUID, uuid4
 from django.test import override_settings
 from django.urls import reverse
+from django.utils.http import http_date
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -64,6 +68,7 @@ class TestListAPI:
                 "current_page": 1,
                 "per_page": DEFAULT_PAGINATION_SIZE,
                 "total": 2,
+                "next_cursor": None,
             },
         }
 
@@ -71,6 +76,109 @@ class TestListAPI:
         assert response.data == expected_data
 
 
+    def test_list_categories_with_cursor(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        names = ["Action", "Comedy", "Documentary", "Drama", "Movie"]
+        for name in names:
+            category_repository.save(Category(name=name))
+
+        url = "/api/categories/"
+        response = APIClient().get(url)
+        listed = [category["name"] for category in response.data["data"]]
+
+        while response.data["meta"]["next_cursor"]:
+            response = APIClient().get(
+                url, {"cursor": response.data["meta"]["next_cursor"]}
+            )
+            assert response.status_code == status.HTTP_200_OK
+            listed += [category["name"] for category in response.data["data"]]
+
+        assert listed == names
+
+    def test_when_cursor_is_invalid_then_return_400(self) -> None:
+        url = "/api/categories/"
+        response = APIClient().get(url, {"cursor": "invalid"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"id": 123},
+            {"value": None},
+            ["name", "asc", "Action", 123],
+            ["name", "asc", None, str(uuid4())],
+            ["name", "asc", ["Action"], str(uuid4())],
+        ],
+    )
+    def test_when_cursor_is_tampered_then_return_400(self, payload) -> None:
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        response = APIClient().get("/api/categories/", {"cursor": cursor})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_categories_with_per_page(
+        self,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        names = ["Action", "Comedy", "Documentary", "Drama", "Movie"]
+        for name in names:
+            category_repository.save(Category(name=name))
+
+        response = APIClient().get("/api/categories/", {"per_page": 4})
+
+        assert [category["name"] for category in response.data["data"]] == names[:4]
+        assert response.data["meta"]["per_page"] == 4
+        assert response.data["meta"]["total"] == 5
+        assert response.data["meta"]["next_cursor"] is not None
+
+    def test_per_page_above_maximum_is_capped(self, monkeypatch) -> None:
+        monkeypatch.setattr("src.config.MAX_PAGINATION_SIZE", 3)
+
+        response = APIClient().get("/api/categories/", {"per_page": 500})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["meta"]["per_page"] == 3
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"per_page": "all"},
+            {"per_page": 0},
+            {"per_page": -5},
+            {"current_page": "x"},
+            {"current_page": 0},
+        ],
+    )
+    def test_when_page_params_are_invalid_then_return_400(self, params) -> None:
+        response = APIClient().get("/api/categories/", params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert set(response.data) == set(params)
+
+    # foo: campo inexistente; updated_at: coluna do model fora da entidade
+    @pytest.mark.parametrize("order_by", ["foo", "updated_at", "-version"])
+    def test_when_order_by_is_not_allowed_then_return_400(self, order_by) -> None:
+        response = APIClient().get("/api/categories/", {"order_by": order_by})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "order_by" in response.data
+
+    def test_list_categories_ordered_by_is_active(
+        self, category_repository: DjangoORMCategoryRepository
+    ) -> None:
+        category_repository.save(Category(name="Movie", is_active=True))
+        category_repository.save(Category(name="Series", is_active=False))
+
+        response = APIClient().get("/api/categories/", {"order_by": "-is_active"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["name"] for item in response.data["data"]] == ["Movie", "Series"]
+
+
 @pytest.mark.django_db
 class TestRetrieveAPI:
     def test_when_category_with_id_exists_then_return_category(
@@ -109,6 +217,112 @@ class TestRetrieveAPI:
         assert response.data == {"id": ["Must be a valid UUID."]}
 
 
+@pytest.mark.django_db
+class TestConditionalGetAPI:
+    def test_list_returns_304_when_etag_matches(
+        self,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+        django_assert_num_queries,
+    ) -> None:
+        category_repository.save(category_movie)
+        client = APIClient()
+        response = client.get("/api/categories/")
+        etag = response["ETag"]
+        assert response.status_code == status.HTTP_200_OK
+        assert "Last-Modified" not in response
+
+        # Apenas (pk, versão) da página + COUNT(*)
+        with django_assert_num_queries(2):
+            response = client.get("/api/categories/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert not response.content
+
+    def test_list_etag_changes_when_a_category_on_the_page_is_updated(
+        self,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        client = APIClient()
+        etag = client.get("/api/categories/")["ETag"]
+
+        category_movie.update_category(name="Film", description="Film description")
+        category_repository.update(category_movie)
+        response = client.get("/api/categories/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+        assert response.data["data"][0]["name"] == "Film"
+
+    def test_list_ignores_if_modified_since_after_a_delete(
+        self,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+        client = APIClient()
+
+        # A exclusão não altera o updated_at de nenhuma categoria restante
+        category_repository.delete(category_documentary.id)
+        response = client.get(
+            "/api/categories/", HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60)
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["data"]) == 1
+
+    def test_list_etag_depends_on_the_page(
+        self,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+        client = APIClient()
+
+        etag = client.get("/api/categories/?order_by=name")["ETag"]
+        response = client.get("/api/categories/?order_by=-name", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_retrieve_returns_304_without_loading_the_category(
+        self,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+        django_assert_num_queries,
+    ) -> None:
+        category_repository.save(category_movie)
+        client = APIClient()
+        url = f"/api/categories/{category_movie.id}/"
+        response = client.get(url)
+        assert response["ETag"] == f'"{category_movie.id}-1"'
+
+        with django_assert_num_queries(1):
+            response = client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_retrieve_honors_if_modified_since(
+        self,
+        category_movie: Category,
+        category_repository: DjangoORMCategoryRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        client = APIClient()
+        url = f"/api/categories/{category_movie.id}/"
+        last_modified = client.get(url)["Last-Modified"]
+
+        response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
 @pytest.mark.django_db
 class TestCreateAPI:
     def test_when_request_data_is_valid_then_create_category(
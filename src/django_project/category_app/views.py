@@ -1,6 +1,8 @@
 from uuid import UUID
 
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
@@ -30,16 +32,27 @@ from src.core.category.application.use_cases.list_category import (
     ListCategoryRequest,
     ListCategoryResponse,
 )
-from src.core._shared.infra.django.views import ListViewSet
+from src.core._shared.infra.django.conditional import (
+    entity_validators,
+    not_modified,
+    with_validators,
+)
+from src.core._shared.infra.django.export import EXPORT_CHUNK_SIZE, ndjson_response
+from src.core._shared.infra.django.search import search_engine
+from src.core._shared.infra.django.views import ListViewSet, SearchViewMixin
+from src.core.category.application.use_cases.search_category import SearchCategory
 from src.core.category.application.use_cases.update_category import (
     UpdateCategory,
     UpdateCategoryRequest,
 )
-from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.category_app.models import Category
+from src.django_project.category_app.repository import cached_category_repository
 from src.django_project.category_app.serializers import (
+    CategoryResponseSerializer,
     CreateCategoryRequestSerializer,
     CreateCategoryResponseSerializer,
     DeleteCategoryRequestSerializer,
+    ListCategoryRequestSerializer,
     ListCategoryResponseSerializer,
     RetrieveCategoryRequestSerializer,
     RetrieveCategoryResponseSerializer,
@@ -47,19 +60,44 @@ from src.django_project.category_app.serializers import (
 )
 
 
-class CategoryViewSet(ListViewSet, viewsets.ViewSet):
+class CategoryViewSet(SearchViewMixin, ListViewSet, viewsets.ViewSet):
+    list_request_serializer = ListCategoryRequestSerializer
+
     def _get_use_case(self) -> ListCategory:
-        return ListCategory(repository=DjangoORMCategoryRepository())
+        return ListCategory(repository=cached_category_repository())
+
+    def _get_search_use_case(self) -> SearchCategory:
+        return SearchCategory(
+            repository=cached_category_repository(), search_engine=search_engine()
+        )
 
     def _get_response_serializer(self, output: ListCategoryResponse):
         return ListCategoryResponseSerializer(output)
 
+    def _get_queryset(self):
+        return Category.objects.all()
+
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        return ndjson_response(
+            request,
+            cached_category_repository().iter_all(chunk_size=EXPORT_CHUNK_SIZE),
+            CategoryResponseSerializer,
+            filename="categories.ndjson",
+        )
+
     def retrieve(self, request: Request, pk: UUID = None) -> Response:
         serializer = RetrieveCategoryRequestSerializer(data={"id": pk})
         serializer.is_valid(raise_exception=True)
 
         input = GetCategoryRequest(**serializer.validated_data)
-        use_case = GetCategory(repository=DjangoORMCategoryRepository())
+        validators = entity_validators(Category.objects.all(), input.id)
+        if validators is not None:
+            response = not_modified(request, validators)
+            if response is not None:
+                return response
+
+        use_case = GetCategory(repository=cached_category_repository())
 
         try:
             output = use_case.execute(request=input)
@@ -67,17 +105,18 @@ class CategoryViewSet(ListViewSet, viewsets.ViewSet):
             return Response(status=HTTP_404_NOT_FOUND)
 
         response_serializer = RetrieveCategoryResponseSerializer(output)
-        return Response(
+        response = Response(
             status=HTTP_200_OK,
             data=response_serializer.data,
         )
+        return with_validators(response, validators) if validators else response
 
     def create(self, request: Request) -> Response:
         serializer = CreateCategoryRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         input = CreateCategoryRequest(**serializer.validated_data)
-        use_case = CreateCategory(repository=DjangoORMCategoryRepository())
+        use_case = CreateCategory(repository=cached_category_repository())
         output = use_case.execute(request=input)
 
         return Response(
@@ -95,7 +134,7 @@ class CategoryViewSet(ListViewSet, viewsets.ViewSet):
         serializer.is_valid(raise_exception=True)
 
         input = UpdateCategoryRequest(**serializer.validated_data)
-        use_case = UpdateCategory(repository=DjangoORMCategoryRepository())
+        use_case = UpdateCategory(repository=cached_category_repository())
         try:
             use_case.execute(request=input)
         except CategoryNotFound:
@@ -114,7 +153,7 @@ class CategoryViewSet(ListViewSet, viewsets.ViewSet):
         serializer.is_valid(raise_exception=True)
 
         input = UpdateCategoryRequest(**serializer.validated_data)
-        use_case = UpdateCategory(repository=DjangoORMCategoryRepository())
+        use_case = UpdateCategory(repository=cached_category_repository())
         try:
             use_case.execute(request=input)
         except CategoryNotFound:
@@ -127,7 +166,7 @@ class CategoryViewSet(ListViewSet, viewsets.ViewSet):
         request_data.is_valid(raise_exception=True)
 
         input = DeleteCategoryRequest(**request_data.validated_data)
-        use_case = DeleteCategory(repository=DjangoORMCategoryRepository())
+        use_case = DeleteCategory(repository=cached_category_repository())
         try:
             use_case.execute(input)
         except CategoryNotFound:
@@ -0,0 +1,9 @@
+from django.contrib import admin
+from src.django_project.change_feed_app.models import Change
+
+
+class ChangeAdmin(admin.ModelAdmin):
+    list_display = ("seq", "entity_type", "entity_id", "operation", "changed_at")
+
+
+admin.site.register(Change, ChangeAdmin)
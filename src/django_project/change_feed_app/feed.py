@@ -0,0 +1,101 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from rest_framework import serializers
+
+from src.core._shared.infra.django.serializers import build_representation
+from src.django_project.change_feed_app.models import (
+    Change,
+    ChangeOperation,
+    EntityType,
+)
+from src.django_project.change_feed_app.recorder import sequence_changes
+
+
+@dataclass(frozen=True)
+class FeedSource:
+    # Fábrica do repositório Django (precisa de get_by_ids) e serializer da entidade
+    repository: Callable[[], Any]
+    serializer_class: type[serializers.Serializer]
+
+
+@dataclass
+class ChangeFeedPage:
+    changes: list[dict]
+    next_since: int
+
+
+class ChangeFeed:
+    """
+    Lê as alterações com seq > since em ordem de seq.
+
+    Várias alterações da mesma entidade na página viram uma só, na posição da
+    mais recente, com o estado atual da entidade; remoções saem como tombstone
+    (data=None). A seq segue a ordem de commit, então avançar o cursor não
+    pula transações que ainda estavam abertas.
+    """
+
+    def __init__(self, sources: dict[EntityType, FeedSource]):
+        self.sources = sources
+
+    def read(self, since: int, limit: int) -> ChangeFeedPage:
+        # Alterações commitadas cujo sequenciador não rodou (ex.: o processo
+        # caiu depois do commit) recebem seq aqui
+        if Change.objects.filter(seq__isnull=True).exists():
+            sequence_changes()
+
+        queryset = Change.objects.filter(seq__gt=since).order_by("seq")
+        rows = list(
+            queryset.values_list("seq", "entity_type", "entity_id", "operation")[:limit]
+        )
+        if not rows:
+            return ChangeFeedPage(changes=[], next_since=since)
+
+        latest: dict[tuple[str, Any], tuple[int, str]] = {}
+        for seq, entity_type, entity_id, operation in rows:
+            # Reinsere para o dict ficar na ordem da alteração mais recente
+            latest.pop((entity_type, entity_id), None)
+            latest[(entity_type, entity_id)] = (seq, operation)
+
+        entities = self._load_entities(
+            key
+            for key, (_, operation) in latest.items()
+            if operation != ChangeOperation.DELETED
+        )
+
+        changes = []
+        for (entity_type, entity_id), (seq, operation) in latest.items():
+            data = None
+            if operation != ChangeOperation.DELETED:
+                data = entities.get((entity_type, entity_id))
+                if data is None:
+                    # Removida depois: o tombstone aparece em uma seq posterior
+                    continue
+
+            changes.append(
+                {
+                    "seq": seq,
+                    "type": entity_type,
+                    "id": entity_id,
+                    "operation": operation,
+                    "data": data,
+                }
+            )
+
+        return ChangeFeedPage(changes=changes, next_since=rows[-1][0])
+
+    def _load_entities(self, keys) -> dict[tuple[str, Any], dict]:
+        ids_by_type = defaultdict(set)
+        for entity_type, entity_id in keys:
+            ids_by_type[entity_type].add(entity_id)
+
+        # Uma busca em lote por tipo de entidade
+        entities = {}
+        for entity_type, ids in ids_by_type.items():
+            source = self.sources[EntityType(entity_type)]
+            represent = build_representation(source.serializer_class)
+            for entity in source.repository().get_by_ids(ids):
+                entities[(entity_type, entity.id)] = represent(entity)
+
+        return entities
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Change",
+            fields=[
+                ("seq", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "entity_type",
+                    models.CharField(
+                        choices=[
+                            ("category", "Category"),
+                            ("genre", "Genre"),
+                            ("cast_member", "Cast Member"),
+                            ("video", "Video"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                ("entity_id", models.UUIDField()),
+                (
+                    "operation",
+                    models.CharField(
+                        choices=[
+                            ("CREATED", "Created"),
+                            ("UPDATED", "Updated"),
+                            ("DELETED", "Deleted"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("changed_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "catalog_change",
+            },
+        ),
+    ]
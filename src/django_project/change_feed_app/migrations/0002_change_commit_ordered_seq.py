@@ -0,0 +1,47 @@
+from django.db import migrations, models
+from django.db.models import F, Max
+
+
+def sequence_existing_changes(apps, schema_editor):
+    Change = apps.get_model("change_feed_app", "Change")
+    ChangeSequence = apps.get_model("change_feed_app", "ChangeSequence")
+
+    # Alterações já existentes mantêm a posição que tinham no feed
+    Change.objects.update(seq=F("id"))
+    last_seq = Change.objects.aggregate(last=Max("id"))["last"] or 0
+    ChangeSequence.objects.create(pk=1, last_seq=last_seq)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("change_feed_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RenameField(model_name="change", old_name="seq", new_name="id"),
+        migrations.AddField(
+            model_name="change",
+            name="seq",
+            field=models.BigIntegerField(null=True, unique=True),
+        ),
+        migrations.CreateModel(
+            name="ChangeSequence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("last_seq", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "db_table": "catalog_change_sequence",
+            },
+        ),
+        migrations.RunPython(sequence_existing_changes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+from django.db import models
+
+
+class EntityType(models.TextChoices):
+    CATEGORY = "category"
+    GENRE = "genre"
+    CAST_MEMBER = "cast_member"
+    VIDEO = "video"
+
+
+class ChangeOperation(models.TextChoices):
+    CREATED = "CREATED"
+    UPDATED = "UPDATED"
+    DELETED = "DELETED"
+
+
+class Change(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    # Cursor (since) do feed: atribuído depois do commit da escrita, em ordem
+    # de commit (recorder.sequence_changes); nulo enquanto pendente
+    seq = models.BigIntegerField(null=True, unique=True)
+    entity_type = models.CharField(max_length=50, choices=EntityType.choices)
+    entity_id = models.UUIDField()
+    operation = models.CharField(max_length=10, choices=ChangeOperation.choices)
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "catalog_change"
+
+    def __str__(self):
+        return f"{self.seq} {self.operation} {self.entity_type} ({self.entity_id})"
+
+
+class ChangeSequence(models.Model):
+    """Linha única com o último seq atribuído; serializa os sequenciadores"""
+
+    last_seq = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "catalog_change_sequence"
@@ -0,0 +1,75 @@
+from typing import Iterable
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.fields.related_descriptors import ManyToManyDescriptor
+
+from src.core._shared.infra.django.models import on_m2m_change
+
+from src.django_project.change_feed_app.models import (
+    Change,
+    ChangeOperation,
+    ChangeSequence,
+    EntityType,
+)
+
+
+def record_change(
+    entity_type: EntityType, entity_id: UUID, operation: ChangeOperation
+) -> None:
+    """Deve ser chamado na mesma transação da escrita que registra"""
+    Change.objects.create(
+        entity_type=entity_type, entity_id=entity_id, operation=operation
+    )
+    transaction.on_commit(sequence_changes)
+
+
+def record_changes(
+    entity_type: EntityType, entity_ids: Iterable[UUID], operation: ChangeOperation
+) -> None:
+    Change.objects.bulk_create(
+        [
+            Change(entity_type=entity_type, entity_id=entity_id, operation=operation)
+            for entity_id in entity_ids
+        ]
+    )
+    transaction.on_commit(sequence_changes)
+
+
+def record_m2m_changes(entity_type: EntityType, relation: ManyToManyDescriptor) -> None:
+    """
+    Registra UPDATED para os agregados (ex.: gêneros) cuja relação M2M muda
+    pelo outro lado ou por cascade, como ao apagar uma categoria. Alterações
+    pelo próprio agregado já são registradas pelo repositório.
+    """
+
+    def record(aggregate_ids):
+        record_changes(entity_type, aggregate_ids, ChangeOperation.UPDATED)
+
+    on_m2m_change(relation, record, forward=False)
+
+
+def sequence_changes() -> None:
+    """
+    Atribui seq às alterações pendentes já visíveis, isto é, commitadas.
+
+    Um seq só existe depois do commit da escrita e os sequenciadores rodam
+    um de cada vez, cada um com seqs maiores que os anteriores: um leitor
+    nunca vê aparecer um seq menor que o cursor que já passou, por mais que
+    uma transação demore para fazer commit.
+    """
+    with transaction.atomic():
+        # UPDATE sem efeito: bloqueia a linha do contador até o commit
+        ChangeSequence.objects.get_or_create(pk=1)
+        ChangeSequence.objects.filter(pk=1).update(last_seq=F("last_seq"))
+        last_seq = ChangeSequence.objects.values_list("last_seq", flat=True).get(pk=1)
+
+        pending = list(Change.objects.filter(seq__isnull=True).order_by("id"))
+        if not pending:
+            return
+
+        for position, change in enumerate(pending, start=last_seq + 1):
+            change.seq = position
+        Change.objects.bulk_update(pending, ["seq"], batch_size=1000)
+        ChangeSequence.objects.filter(pk=1).update(last_seq=pending[-1].seq)
@@ -0,0 +1,7 @@
+from rest_framework import serializers
+
+
+class ChangeFeedRequestSerializer(serializers.Serializer):
+    since = serializers.IntegerField(default=0, min_value=0)
+    # Acima do máximo é limitado pela view, como per_page nas listagens
+    limit = serializers.IntegerField(required=False, min_value=1)
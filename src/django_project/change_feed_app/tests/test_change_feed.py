@@ -0,0 +1,173 @@
+import pytest
+
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.change_feed_app.feed import ChangeFeed
+from src.django_project.change_feed_app.models import Change, ChangeOperation
+from src.django_project.change_feed_app.views import FEED_SOURCES
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def feed() -> ChangeFeed:
+    return ChangeFeed(FEED_SOURCES)
+
+
+class TestRecording:
+    def test_repository_writes_record_changes_in_order(self):
+        repository = DjangoORMCategoryRepository()
+        category = Category(name="Movie")
+
+        repository.save(category)
+        category.update_category(name="Film", description="")
+        repository.update(category)
+        repository.delete(category.id)
+
+        assert list(
+            Change.objects.order_by("id").values_list("entity_id", "operation")
+        ) == [
+            (category.id, ChangeOperation.CREATED),
+            (category.id, ChangeOperation.UPDATED),
+            (category.id, ChangeOperation.DELETED),
+        ]
+
+    def test_changes_are_sequenced_after_commit(
+        self, django_capture_on_commit_callbacks
+    ):
+        repository = DjangoORMCategoryRepository()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            repository.save(Category(name="Movie"))
+            repository.save(Category(name="Series"))
+            # Antes do commit a alteração ainda não tem posição no feed
+            assert list(Change.objects.values_list("seq", flat=True)) == [None, None]
+
+        assert list(Change.objects.order_by("id").values_list("seq", flat=True)) == [
+            1,
+            2,
+        ]
+
+    def test_genre_save_records_only_its_own_change(self):
+        category = Category(name="Movie")
+        DjangoORMCategoryRepository().save(category)
+        genre = Genre(name="Drama", categories={category.id})
+
+        DjangoORMGenreRepository().save(genre)
+
+        assert list(
+            Change.objects.filter(entity_id=genre.id).values_list(
+                "operation", flat=True
+            )
+        ) == [ChangeOperation.CREATED]
+
+    def test_deleting_category_records_update_of_genres_using_it(
+        self, feed: ChangeFeed
+    ):
+        category_repository = DjangoORMCategoryRepository()
+        category = Category(name="Movie")
+        category_repository.save(category)
+        genre = Genre(name="Drama", categories={category.id})
+        DjangoORMGenreRepository().save(genre)
+        since = feed.read(since=0, limit=10).next_since
+
+        category_repository.delete(category.id)
+        page = feed.read(since=since, limit=10)
+
+        assert [(change["type"], change["id"]) for change in page.changes] == [
+            ("genre", genre.id),
+            ("category", category.id),
+        ]
+        assert page.changes[0]["data"]["categories"] == []
+
+    def test_deleting_missing_entity_records_nothing(self):
+        DjangoORMCategoryRepository().delete(Category(name="Movie").id)
+
+        assert not Change.objects.exists()
+
+
+class TestRead:
+    def test_returns_current_state_of_changed_entities(self, feed: ChangeFeed):
+        category_repository = DjangoORMCategoryRepository()
+        category = Category(name="Movie")
+        category_repository.save(category)
+        genre = Genre(name="Drama", categories={category.id})
+        DjangoORMGenreRepository().save(genre)
+
+        page = feed.read(since=0, limit=10)
+
+        assert [(change["type"], change["id"]) for change in page.changes] == [
+            ("category", category.id),
+            ("genre", genre.id),
+        ]
+        assert page.changes[1]["data"]["categories"] == [str(category.id)]
+        assert page.next_since == page.changes[1]["seq"]
+
+    def test_collapses_repeated_changes_into_latest_position(self, feed: ChangeFeed):
+        repository = DjangoORMCategoryRepository()
+        movie = Category(name="Movie")
+        series = Category(name="Series")
+        repository.save(movie)
+        repository.save(series)
+        movie.update_category(name="Film", description="")
+        repository.update(movie)
+
+        page = feed.read(since=0, limit=10)
+
+        assert [change["id"] for change in page.changes] == [series.id, movie.id]
+        assert page.changes[1]["operation"] == ChangeOperation.UPDATED
+        assert page.changes[1]["data"]["name"] == "Film"
+
+    def test_deleted_entities_are_returned_as_tombstones(self, feed: ChangeFeed):
+        repository = DjangoORMCategoryRepository()
+        category = Category(name="Movie")
+        repository.save(category)
+        since = feed.read(since=0, limit=10).next_since
+
+        repository.delete(category.id)
+        page = feed.read(since=since, limit=10)
+
+        assert len(page.changes) == 1
+        assert page.changes[0]["operation"] == ChangeOperation.DELETED
+        assert page.changes[0]["data"] is None
+
+    def test_pages_with_since_cursor(self, feed: ChangeFeed):
+        repository = DjangoORMCategoryRepository()
+        categories = [Category(name=f"Category {index}") for index in range(3)]
+        for category in categories:
+            repository.save(category)
+
+        first = feed.read(since=0, limit=2)
+        second = feed.read(since=first.next_since, limit=2)
+        last = feed.read(since=second.next_since, limit=2)
+
+        assert [change["id"] for change in first.changes + second.changes] == [
+            category.id for category in categories
+        ]
+        assert last.changes == []
+        assert last.next_since == second.next_since
+
+    def test_transaction_committed_late_is_not_skipped(self, feed: ChangeFeed):
+        repository = DjangoORMCategoryRepository()
+        early = Category(name="Early")
+        late = Category(name="Late")
+        repository.save(early)
+        repository.save(late)
+        early_change = Change.objects.get(entity_id=early.id)
+        # A transação de "early" inseriu primeiro, mas ainda não fez commit
+        early_change.delete()
+        since = feed.read(since=0, limit=10).next_since
+
+        # Commit tardio: a alteração fica visível depois que o leitor avançou
+        Change.objects.create(
+            id=early_change.id,
+            entity_type=early_change.entity_type,
+            entity_id=early.id,
+            operation=early_change.operation,
+        )
+        page = feed.read(since=since, limit=10)
+
+        assert [change["id"] for change in page.changes] == [early.id]
+        assert page.changes[0]["seq"] > since
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
+from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
+
+pytestmark = pytest.mark.django_db
+
+
+def read_lines(response) -> list[dict]:
+    return [
+        json.loads(line)
+        for line in b"".join(response.streaming_content).decode().splitlines()
+    ]
+
+
+class TestChangeFeedAPI:
+    def test_streams_changes_since_cursor(self):
+        repository = DjangoORMCastMemberRepository()
+        actor = CastMember(name="John Doe", type=CastMemberType.ACTOR)
+        director = CastMember(name="Jane Smith", type=CastMemberType.DIRECTOR)
+        repository.save(actor)
+
+        response = APIClient().get("/api/changes/")
+        since = response["X-Next-Since"]
+        assert [change["id"] for change in read_lines(response)] == [str(actor.id)]
+
+        repository.save(director)
+        repository.delete(actor.id)
+        response = APIClient().get(f"/api/changes/?since={since}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        changes = read_lines(response)
+        assert [(change["id"], change["operation"]) for change in changes] == [
+            (str(director.id), "CREATED"),
+            (str(actor.id), "DELETED"),
+        ]
+        assert changes[0]["type"] == "cast_member"
+        assert changes[0]["data"]["type"] == "DIRECTOR"
+        assert changes[1]["data"] is None
+
+    def test_when_nothing_changed_then_keep_cursor(self):
+        response = APIClient().get("/api/changes/?since=42")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["X-Next-Since"] == "42"
+        assert read_lines(response) == []
+
+    @pytest.mark.parametrize(
+        "query", ["since=abc", "since=-1", "limit=abc", "limit=0", "limit=-5"]
+    )
+    def test_when_cursor_is_invalid_then_return_400(self, query):
+        response = APIClient().get(f"/api/changes/?{query}")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,44 @@
+from django.http import StreamingHttpResponse
+from rest_framework import viewsets
+from rest_framework.request import Request
+
+from src import config
+from src.core._shared.infra.django.export import stream_ndjson
+from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
+from src.django_project.cast_member_app.serializers import ExportCastMemberSerializer
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.category_app.serializers import CategoryResponseSerializer
+from src.django_project.change_feed_app.feed import ChangeFeed, FeedSource
+from src.django_project.change_feed_app.models import EntityType
+from src.django_project.change_feed_app.serializers import ChangeFeedRequestSerializer
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.genre_app.serializers import GenreOutputSerializer
+from src.django_project.video_app.repository import DjangoORMVideoRepository
+from src.django_project.video_app.serializers import ExportVideoSerializer
+
+FEED_SOURCES = {
+    EntityType.CATEGORY: FeedSource(
+        DjangoORMCategoryRepository, CategoryResponseSerializer
+    ),
+    EntityType.GENRE: FeedSource(DjangoORMGenreRepository, GenreOutputSerializer),
+    EntityType.CAST_MEMBER: FeedSource(
+        DjangoORMCastMemberRepository, ExportCastMemberSerializer
+    ),
+    EntityType.VIDEO: FeedSource(DjangoORMVideoRepository, ExportVideoSerializer),
+}
+
+
+class ChangeFeedViewSet(viewsets.ViewSet):
+    def list(self, request: Request) -> StreamingHttpResponse:
+        serializer = ChangeFeedRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        since = serializer.validated_data["since"]
+        limit = serializer.validated_data.get("limit", config.MAX_PAGINATION_SIZE)
+
+        feed = ChangeFeed(FEED_SOURCES)
+        page = feed.read(since, limit=min(limit, config.MAX_PAGINATION_SIZE))
+
+        response = stream_ndjson(request, page.changes)
+        # Cursor para a próxima chamada (?since=), mesmo quando a página vem vazia
+        response["X-Next-Since"] = str(page.next_since)
+        return response
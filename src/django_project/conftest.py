@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def media_storage(settings):
+    # Testes usam storage em memória, isolado por client (middleware)
+    settings.MEDIA_STORAGE = {
+        "BACKEND": "src.core._shared.infra.storage.in_memory_storage.InMemoryStorage",
+        "ASYNC_BACKEND": (
+            "src.core._shared.infra.storage.async_in_memory_storage."
+            "AsyncInMemoryStorage"
+        ),
+    }
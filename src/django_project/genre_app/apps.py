@@ -4,3 +4,22 @@ from django.apps import AppConfig
 class GenreAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "src.django_project.genre_app"
+
+    def ready(self):
+        from src.core._shared.infra.django.cache import (
+            invalidate_on_change,
+            invalidate_on_m2m_change,
+        )
+        from src.core._shared.infra.django.models import bump_version_on_m2m_change
+        from src.django_project.change_feed_app.models import EntityType
+        from src.django_project.change_feed_app.recorder import record_m2m_changes
+        from src.django_project.genre_app.models import Genre
+        from src.django_project.genre_app.repository import genre_cache
+
+        # Escritas fora do CachedRepository também invalidam o cache
+        invalidate_on_change(genre_cache, Genre)
+        invalidate_on_m2m_change(genre_cache, Genre.categories)
+        # Alterações e cascades nas relações M2M mudam o ETag
+        bump_version_on_m2m_change(Genre.categories)
+        # ...e chegam ao feed de alterações
+        record_m2m_changes(EntityType.GENRE, Genre.categories)
@@ -0,0 +1,37 @@
+from src.core._shared.infra.django.async_views import AsyncCollectionView
+from src.core.genre.application.use_cases import (
+    CreateGenre,
+    InvalidGenre,
+    ListGenre,
+    RelatedCategoriesNotFound,
+)
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.repository import cached_genre_repository
+from src.django_project.genre_app.serializers import (
+    CreateGenreInputSerializer,
+    CreateGenreOutputSerializer,
+    ListGenreOutputSerializer,
+    ListGenreRequestSerializer,
+)
+
+
+class GenreAsyncCollectionView(AsyncCollectionView):
+    list_request_serializer = ListGenreRequestSerializer
+    create_request_serializer = CreateGenreInputSerializer
+    create_response_serializer = CreateGenreOutputSerializer
+    create_errors = (InvalidGenre, RelatedCategoriesNotFound)
+
+    def _get_list_use_case(self) -> ListGenre:
+        return ListGenre(repository=cached_genre_repository())
+
+    def _get_list_response_serializer(self, output):
+        return ListGenreOutputSerializer(output)
+
+    def _get_create_use_case(self) -> CreateGenre:
+        return CreateGenre(
+            repository=cached_genre_repository(),
+            category_repository=DjangoORMCategoryRepository(),
+        )
+
+    def _to_create_input(self, data: dict) -> CreateGenre.Input:
+        return CreateGenre.Input(**data)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("category_app", "0002_category_category_name_id_idx"),
+        ("genre_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="genre",
+            index=models.Index(fields=["name", "id"], name="genre_name_id_idx"),
+        ),
+    ]
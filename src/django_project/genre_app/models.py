@@ -2,8 +2,10 @@ from uuid import uuid4
 
 from django.db import models
 
+from src.core._shared.infra.django.models import VersionedModel
 
-class Genre(models.Model):
+
+class Genre(VersionedModel):
     app_label = "genre_app"
 
     id = models.UUIDField(primary_key=True, editable=False, default=uuid4)
@@ -13,3 +15,4 @@ class Genre(models.Model):
 
     class Meta:
         db_table = "genres"
+        indexes = [models.Index(fields=["name", "id"], name="genre_name_id_idx")]
@@ -1,10 +1,26 @@
+from collections import defaultdict
+from typing import Iterator, List
 from uuid import UUID
 
+from asgiref.sync import sync_to_async
 from django.db import transaction
 
+from src.core._shared.domain.pagination import Page, PageQuery
+from src.core._shared.infra.django.pagination import (
+    apaginate_queryset,
+    iter_batches,
+    paginate_queryset,
+)
+from src.core._shared.infra.cache.cached_repository import CachedRepository
+from src.core._shared.infra.django.cache import repository_cache
+from src.core._shared.infra.django.models import bump_version
+from src.core._shared.domain.search import SearchDocument
+from src.core._shared.infra.django.search import search_engine
 from src.core.genre.domain.genre import Genre
 from src.core.genre.domain.genre_repository import GenreRepository
 from src.django_project.genre_app.models import Genre as GenreORM
+from src.django_project.change_feed_app.models import ChangeOperation, EntityType
+from src.django_project.change_feed_app.recorder import record_change
 
 
 class DjangoORMGenreRepository(GenreRepository):
@@ -16,35 +32,94 @@ class DjangoORMGenreRepository(GenreRepository):
                 is_active=genre.is_active,
             )
             genre_model.categories.set(genre.categories)
+            record_change(EntityType.GENRE, genre.id, ChangeOperation.CREATED)
+            search_engine().index([genre_search_document(genre)])
+
+    def get_by_ids(self, ids: set[UUID]) -> list[Genre]:
+        return self._to_entities(list(GenreORM.objects.filter(id__in=ids)))
 
     def get_by_id(self, id: UUID) -> Genre | None:
         try:
-            # TODO: N+1
             genre_model = GenreORM.objects.get(id=id)
-            return Genre(
-                id=genre_model.id,
-                name=genre_model.name,
-                is_active=genre_model.is_active,
-                categories=set(genre_model.categories.values_list("id", flat=True)),
-            )
         except GenreORM.DoesNotExist:
             return None
 
+        categories = self._load_category_ids([genre_model.id])
+        return self._to_entity(genre_model, categories[genre_model.id])
+
     def delete(self, id: UUID) -> None:
-        GenreORM.objects.filter(id=id).delete()
+        with transaction.atomic():
+            deleted, _ = GenreORM.objects.filter(id=id).delete()
+            if deleted:
+                # Tombstone: o feed de alterações propaga a remoção
+                record_change(EntityType.GENRE, id, ChangeOperation.DELETED)
+                search_engine().remove(EntityType.GENRE, [id])
 
     def list(self) -> list[Genre]:
-        # TODO: N+1
+        return self._to_entities(list(GenreORM.objects.all()))
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Genre]:
+        # Categorias carregadas por lote: 1 consulta extra a cada chunk_size gêneros
+        for batch in iter_batches(GenreORM.objects.order_by("pk"), chunk_size):
+            yield from self._to_entities(batch)
+
+    def paginate(self, query: PageQuery) -> Page[Genre]:
+        page = paginate_queryset(GenreORM.objects.all(), query)
+        return Page(
+            items=self._to_entities(page.items),
+            total=page.total,
+            has_next=page.has_next,
+        )
+
+    def find_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+
+        existing_ids = GenreORM.objects.filter(id__in=ids).values_list("id", flat=True)
+        return set(ids) - set(existing_ids)
+
+    def _to_entities(self, genre_models: List[GenreORM]) -> List[Genre]:
+        # Uma única consulta na tabela intermediária para todo o lote (evita N+1)
+        categories = self._load_category_ids([model.id for model in genre_models])
         return [
-            Genre(
-                id=genre_model.id,
-                name=genre_model.name,
-                is_active=genre_model.is_active,
-                categories=set(genre_model.categories.values_list("id", flat=True)),
-            )
-            for genre_model in GenreORM.objects.all()
+            self._to_entity(genre_model, categories[genre_model.id])
+            for genre_model in genre_models
         ]
 
+    async def _ato_entities(self, genre_models: List[GenreORM]) -> List[Genre]:
+        rows = self._category_ids_rows([model.id for model in genre_models])
+        categories = self._group_category_ids([row async for row in rows])
+        return [
+            self._to_entity(genre_model, categories[genre_model.id])
+            for genre_model in genre_models
+        ]
+
+    def _load_category_ids(self, genre_ids: List[UUID]) -> dict[UUID, set[UUID]]:
+        return self._group_category_ids(self._category_ids_rows(genre_ids))
+
+    @staticmethod
+    def _category_ids_rows(genre_ids: List[UUID]):
+        # Lista vazia: o ORM resolve IN () sem ir ao banco
+        through = GenreORM.categories.through.objects.filter(genre_id__in=genre_ids)
+        return through.values_list("genre_id", "category_id")
+
+    @staticmethod
+    def _group_category_ids(rows) -> dict[UUID, set[UUID]]:
+        categories: dict[UUID, set[UUID]] = defaultdict(set)
+        for genre_id, category_id in rows:
+            categories[genre_id].add(category_id)
+
+        return categories
+
+    @staticmethod
+    def _to_entity(genre_model: GenreORM, categories: set[UUID]) -> Genre:
+        return Genre(
+            id=genre_model.id,
+            name=genre_model.name,
+            is_active=genre_model.is_active,
+            categories=categories,
+        )
+
     def update(self, genre: Genre) -> None:
         try:
             genre_model = GenreORM.objects.get(pk=genre.id)
@@ -55,5 +130,42 @@ class DjangoORMGenreRepository(GenreRepository):
                 GenreORM.objects.filter(pk=genre.id).update(
                     name=genre.name,
                     is_active=genre.is_active,
+                    **bump_version(),
                 )
                 genre_model.categories.set(genre.categories)
+                record_change(EntityType.GENRE, genre.id, ChangeOperation.UPDATED)
+                search_engine().index([genre_search_document(genre)])
+
+    async def apaginate(self, query: PageQuery) -> Page[Genre]:
+        page = await apaginate_queryset(GenreORM.objects.all(), query)
+        return Page(
+            items=await self._ato_entities(page.items),
+            total=page.total,
+            has_next=page.has_next,
+        )
+
+    async def afind_missing_ids(self, ids: set[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+
+        existing_ids = GenreORM.objects.filter(id__in=ids).values_list("id", flat=True)
+        return set(ids) - {id async for id in existing_ids}
+
+    async def asave(self, genre: Genre) -> None:
+        # Gênero, categorias (M2M), feed e índice de busca em uma única
+        # transação: transaction.atomic só existe no modo síncrono
+        await sync_to_async(self.save)(genre)
+
+
+def genre_search_document(genre: Genre) -> SearchDocument:
+    return SearchDocument(
+        entity_type=EntityType.GENRE, entity_id=genre.id, title=genre.name
+    )
+
+
+# Cache read-through de get_by_id compartilhado pelo processo
+genre_cache = repository_cache("genre")
+
+
+def cached_genre_repository() -> GenreRepository:
+    return CachedRepository(DjangoORMGenreRepository(), genre_cache)
@@ -1,8 +1,10 @@
 from rest_framework import serializers
 
 from src.core._shared.infra.django.serializers import (
+    ListRequestSerializer,
     ListResponseSerializer,
     ListOutputMetaSerializer,
+    order_by_field,
 )
 
 
@@ -18,6 +20,12 @@ class ListGenreOutputSerializer(ListResponseSerializer):
         return GenreOutputSerializer()
 
 
+class ListGenreRequestSerializer(ListRequestSerializer):
+    ORDER_BY_FIELDS = ("name", "is_active")
+
+    order_by = order_by_field(ORDER_BY_FIELDS, default="name")
+
+
 class SetField(serializers.ListField):
     # Outras alternativas:
     # Na view, converter para Set manualmente
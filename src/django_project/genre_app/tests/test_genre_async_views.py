@@ -0,0 +1,43 @@
+import uuid
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+
+from src.django_project.category_app.models import Category
+from src.django_project.genre_app.models import Genre
+
+pytestmark = pytest.mark.django_db
+
+
+def post(data: dict):
+    return async_to_sync(AsyncClient().post)(
+        reverse("async-genre-list"), data, content_type="application/json"
+    )
+
+
+class TestGenreAsyncViews:
+    def test_create_and_list_genre_with_categories(self):
+        category = Category.objects.create(name="Movie")
+
+        response = post({"name": "Romance", "categories": [str(category.id)]})
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = async_to_sync(AsyncClient().get)(reverse("async-genre-list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"] == [
+            {
+                "id": str(Genre.objects.get().id),
+                "name": "Romance",
+                "is_active": True,
+                "categories": [str(category.id)],
+            }
+        ]
+
+    def test_when_categories_do_not_exist_then_return_400(self):
+        response = post({"name": "Romance", "categories": [str(uuid.uuid4())]})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Genre.objects.exists()
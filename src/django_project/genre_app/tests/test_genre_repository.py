@@ -1,5 +1,7 @@
 import pytest
 
+from src.core._shared.domain.pagination import PageQuery
+
 from src.django_project.category_app.models import Category
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.genre_app.repository import DjangoORMGenreRepository
@@ -41,3 +43,116 @@ class TestSave:
 
         related_category = saved_genre.categories.get()
         assert related_category.id == category.id
+
+
+@pytest.mark.django_db
+class TestList:
+    def test_query_count_does_not_grow_with_number_of_genres(
+        self, django_assert_num_queries
+    ):
+        category_repository = DjangoORMCategoryRepository()
+        category = Category(name="Action")
+        category_repository.save(category)
+
+        repository = DjangoORMGenreRepository()
+        for index in range(10):
+            genre = Genre(name=f"Genre {index}")
+            genre.add_category(category.id)
+            repository.save(genre)
+
+        with django_assert_num_queries(2):
+            genres = repository.list()
+
+        assert len(genres) == 10
+        assert all(genre.categories == {category.id} for genre in genres)
+
+    def test_paginate_loads_categories_in_a_single_query(
+        self, django_assert_num_queries
+    ):
+        category_repository = DjangoORMCategoryRepository()
+        category = Category(name="Action")
+        category_repository.save(category)
+
+        repository = DjangoORMGenreRepository()
+        drama = Genre(name="Drama", categories={category.id})
+        romance = Genre(name="Romance")
+        repository.save(drama)
+        repository.save(romance)
+
+        with django_assert_num_queries(3):
+            page = repository.paginate(PageQuery(order_by="name"))
+
+        assert [genre.categories for genre in page.items] == [{category.id}, set()]
+
+
+@pytest.mark.django_db
+class TestGetById:
+    def test_returns_genre_with_categories(self, django_assert_num_queries):
+        category_repository = DjangoORMCategoryRepository()
+        category = Category(name="Action")
+        category_repository.save(category)
+
+        repository = DjangoORMGenreRepository()
+        genre = Genre(name="Drama", categories={category.id})
+        repository.save(genre)
+
+        with django_assert_num_queries(2):
+            saved_genre = repository.get_by_id(genre.id)
+
+        assert saved_genre.name == "Drama"
+        assert saved_genre.categories == {category.id}
+
+
+@pytest.mark.django_db
+class TestIterAll:
+    def test_loads_categories_once_per_chunk(self, django_assert_num_queries):
+        category_repository = DjangoORMCategoryRepository()
+        category = Category(name="Action")
+        category_repository.save(category)
+
+        repository = DjangoORMGenreRepository()
+        for index in range(5):
+            repository.save(Genre(name=f"Genre {index}", categories={category.id}))
+
+        # 1 consulta de gêneros + 1 de categorias para cada lote de 2
+        with django_assert_num_queries(4):
+            genres = list(repository.iter_all(chunk_size=2))
+
+        assert len(genres) == 5
+        assert all(genre.categories == {category.id} for genre in genres)
+
+
+@pytest.mark.django_db
+class TestVersioning:
+    @pytest.fixture
+    def category(self) -> Category:
+        category = Category(name="Action")
+        DjangoORMCategoryRepository().save(category)
+        return category
+
+    @pytest.fixture
+    def genre(self, category: Category) -> Genre:
+        genre = Genre(name="Drama", categories={category.id})
+        DjangoORMGenreRepository().save(genre)
+        return genre
+
+    def version(self, genre: Genre) -> int:
+        return GenreORM.objects.get(id=genre.id).version
+
+    def test_changes_from_the_category_side_bump_version(self, category, genre):
+        before = self.version(genre)
+        category_model = Category.objects.get(id=category.id)
+
+        category_model.genres.clear()
+        cleared = self.version(genre)
+        category_model.genres.add(genre.id)
+
+        assert before < cleared < self.version(genre)
+
+    def test_deleting_a_related_category_bumps_version(self, category, genre):
+        before = self.version(genre)
+
+        DjangoORMCategoryRepository().delete(category.id)
+
+        assert GenreORM.objects.get(id=genre.id).categories.count() == 0
+        assert self.version(genre) > before
@@ -1,3 +1,4 @@
+import json
 from uuid import UUID, uuid4
 from django.test import override_settings
 from django.urls import reverse
@@ -123,6 +124,13 @@ class TestListAPI:
                 assert genre_data["is_active"] is True
                 assert genre_data["categories"] == []
 
+    @pytest.mark.parametrize("order_by", ["foo", "updated_at", "categories"])
+    def test_when_order_by_is_not_allowed_then_return_400(self, order_by) -> None:
+        response = APIClient().get("/api/genres/", {"order_by": order_by})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "order_by" in response.data
+
 
 @pytest.mark.django_db
 class TestCreateAPI:
@@ -286,3 +294,41 @@ class TestDeleteAPI:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert genre_repository.get_by_id(genre_romance.id) is None
+
+
+@pytest.mark.django_db
+class TestExportAPI:
+    def test_streams_one_json_line_per_genre(
+        self,
+        category_movie: Category,
+        category_documentary: Category,
+        category_repository: DjangoORMCategoryRepository,
+        genre_romance: Genre,
+        genre_drama: Genre,
+        genre_repository: DjangoORMGenreRepository,
+    ) -> None:
+        category_repository.save(category_movie)
+        category_repository.save(category_documentary)
+        genre_repository.save(genre_romance)
+        genre_repository.save(genre_drama)
+
+        response = APIClient().get("/api/genres/export/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert 'filename="genres.ndjson"' in response["Content-Disposition"]
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        exported = {item["id"]: item for item in map(json.loads, lines)}
+        assert exported.keys() == {str(genre_romance.id), str(genre_drama.id)}
+        assert set(exported[str(genre_romance.id)]["categories"]) == {
+            str(category_movie.id),
+            str(category_documentary.id),
+        }
+        assert exported[str(genre_drama.id)]["categories"] == []
+
+    def test_when_there_are_no_genres_then_return_empty_body(self) -> None:
+        response = APIClient().get("/api/genres/export/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content) == b""
@@ -1,6 +1,8 @@
 from uuid import UUID
 
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
@@ -14,6 +16,7 @@ from rest_framework.status import (
 from src.core.genre.application.use_cases import (
     CreateGenre,
     DeleteGenre,
+    SearchGenre,
     UpdateGenre,
 )
 from src.core.genre.application.use_cases.list_genre import (
@@ -21,16 +24,21 @@ from src.core.genre.application.use_cases.list_genre import (
     ListGenreRequest,
     ListGenreResponse,
 )
-from src.core._shared.infra.django.views import ListViewSet
+from src.core._shared.infra.django.export import EXPORT_CHUNK_SIZE, ndjson_response
+from src.core._shared.infra.django.search import search_engine
+from src.core._shared.infra.django.views import ListViewSet, SearchViewMixin
 from src.core.genre.application.use_cases.exceptions import (
     GenreNotFound,
     InvalidGenre,
     RelatedCategoriesNotFound,
 )
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
-from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.genre_app.models import Genre
+from src.django_project.genre_app.repository import cached_genre_repository
 from src.django_project.genre_app.serializers import (
+    GenreOutputSerializer,
     ListGenreOutputSerializer,
+    ListGenreRequestSerializer,
     CreateGenreInputSerializer,
     DeleteGenreInputSerializer,
     CreateGenreOutputSerializer,
@@ -38,19 +46,38 @@ from src.django_project.genre_app.serializers import (
 )
 
 
-class GenreViewSet(ListViewSet, viewsets.ViewSet):
+class GenreViewSet(SearchViewMixin, ListViewSet, viewsets.ViewSet):
+    list_request_serializer = ListGenreRequestSerializer
+
     def _get_use_case(self) -> ListGenre:
-        return ListGenre(repository=DjangoORMGenreRepository())
+        return ListGenre(repository=cached_genre_repository())
+
+    def _get_search_use_case(self) -> SearchGenre:
+        return SearchGenre(
+            repository=cached_genre_repository(), search_engine=search_engine()
+        )
 
     def _get_response_serializer(self, output: ListGenreResponse):
         return ListGenreOutputSerializer(output)
 
+    def _get_queryset(self):
+        return Genre.objects.all()
+
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        return ndjson_response(
+            request,
+            cached_genre_repository().iter_all(chunk_size=EXPORT_CHUNK_SIZE),
+            GenreOutputSerializer,
+            filename="genres.ndjson",
+        )
+
     def create(self, request: Request) -> Response:
         serializer = CreateGenreInputSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         use_case = CreateGenre(
-            repository=DjangoORMGenreRepository(),
+            repository=cached_genre_repository(),
             category_repository=DjangoORMCategoryRepository(),
         )
         try:
@@ -71,7 +98,7 @@ class GenreViewSet(ListViewSet, viewsets.ViewSet):
         request_data.is_valid(raise_exception=True)
         input = DeleteGenre.Input(**request_data.validated_data)
 
-        use_case = DeleteGenre(repository=DjangoORMGenreRepository())
+        use_case = DeleteGenre(repository=cached_genre_repository())
         try:
             use_case.execute(input)
         except GenreNotFound:
@@ -93,7 +120,7 @@ class GenreViewSet(ListViewSet, viewsets.ViewSet):
         input = UpdateGenre.Input(**serializer.validated_data)
 
         use_case = UpdateGenre(
-            repository=DjangoORMGenreRepository(),
+            repository=cached_genre_repository(),
             category_repository=DjangoORMCategoryRepository(),
         )
         try:
@@ -0,0 +1,9 @@
+from django.contrib import admin
+from src.django_project.outbox_app.models import OutboxMessage
+
+
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ("event_type", "created_at", "published_at", "attempts")
+
+
+admin.site.register(OutboxMessage, OutboxMessageAdmin)
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class OutboxAppConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "src.django_project.outbox_app"
@@ -0,0 +1,36 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from src.django_project.outbox_app.relay import OutboxRelay
+
+
+class Command(BaseCommand):
+    help = "Publishes pending outbox messages to the message broker"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when the outbox is drained",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Relay a single batch and exit",
+        )
+
+    def handle(self, *args, **options):
+        relay = OutboxRelay(batch_size=options["batch_size"])
+        if options["once"]:
+            relayed = relay.relay_batch()
+            self.stdout.write(f"Relayed {relayed} messages")
+            return
+
+        signal.signal(signal.SIGTERM, lambda *_: relay.stop())
+        try:
+            relay.run(poll_interval=options["poll_interval"])
+        except KeyboardInterrupt:
+            pass
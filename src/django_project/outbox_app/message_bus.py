@@ -0,0 +1,20 @@
+from src.core._shared.events.abstract_message_bus import AbstractMessageBus
+from src.core._shared.events.event import Event
+from src.django_project.outbox_app.models import OutboxMessage
+
+
+class OutboxMessageBus(AbstractMessageBus):
+    """
+    Grava os eventos na tabela de outbox em vez de publicá-los.
+
+    Deve ser usado dentro da mesma transaction.atomic() que persiste o
+    agregado; o OutboxRelay publica as mensagens depois, fora do request.
+    """
+
+    def handle(self, events: list[Event]) -> None:
+        OutboxMessage.objects.bulk_create(
+            [
+                OutboxMessage(event_type=event.type, payload=event.payload)
+                for event in events
+            ]
+        )
@@ -0,0 +1,94 @@
+import logging
+import threading
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from src.core._shared.events.event import Event
+from src.core._shared.events.message_bus import MessageBus
+from src.django_project.outbox_app.models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Drena o outbox para o MessageBus (RabbitMQ) em lotes.
+
+    Entrega at-least-once: cada lote é travado com SELECT ... FOR UPDATE SKIP
+    LOCKED, então relays concorrentes não publicam a mesma linha. Cada linha
+    é publicada com o seu id como message_id: reentregas da mesma linha são
+    descartadas pelos consumidores, eventos iguais de linhas distintas não.
+    Falhas são reagendadas com backoff exponencial até max_attempts.
+    """
+
+    def __init__(
+        self,
+        message_bus: MessageBus | None = None,
+        batch_size: int = 100,
+        max_attempts: int = 10,
+        base_backoff: timedelta = timedelta(seconds=1),
+        max_backoff: timedelta = timedelta(minutes=5),
+    ):
+        self.message_bus = message_bus or MessageBus(raise_errors=True)
+        self.event_types = {cls.__name__: cls for cls in self.message_bus.handlers}
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._stop = threading.Event()
+
+    def relay_batch(self) -> int:
+        now = timezone.now()
+        with transaction.atomic():
+            messages = list(
+                OutboxMessage.objects.select_for_update(skip_locked=True)
+                .filter(
+                    published_at__isnull=True,
+                    next_attempt_at__lte=now,
+                    attempts__lt=self.max_attempts,
+                )
+                .order_by("created_at")[: self.batch_size]
+            )
+
+            for message in messages:
+                error = self._publish(message)
+                if error is None:
+                    message.published_at = now
+                else:
+                    message.attempts += 1
+                    message.last_error = error
+                    message.next_attempt_at = now + self._backoff(message.attempts)
+
+            OutboxMessage.objects.bulk_update(
+                messages,
+                ["published_at", "attempts", "last_error", "next_attempt_at"],
+            )
+
+        return sum(1 for message in messages if message.published_at is not None)
+
+    def run(self, poll_interval: float = 1.0) -> None:
+        while not self._stop.is_set():
+            # Lote cheio: continua drenando sem esperar
+            if self.relay_batch() < self.batch_size:
+                self._stop.wait(poll_interval)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _publish(self, message: OutboxMessage) -> str | None:
+        try:
+            self.message_bus.handle([self._to_event(message)])
+        except Exception as e:
+            logger.warning(f"Error relaying outbox message {message.id}", exc_info=True)
+            return repr(e)
+        return None
+
+    def _to_event(self, message: OutboxMessage) -> Event:
+        return self.event_types[message.event_type](
+            **message.payload, message_id=str(message.id)
+        )
+
+    def _backoff(self, attempts: int) -> timedelta:
+        return min(self.base_backoff * 2 ** (attempts - 1), self.max_backoff)
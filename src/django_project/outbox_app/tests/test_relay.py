@@ -0,0 +1,127 @@
+from datetime import timedelta
+from unittest.mock import create_autospec
+
+import pytest
+from django.db import transaction
+from django.utils import timezone
+
+from src.core._shared.application.handlers import Handler
+from src.core._shared.events.message_bus import MessageBus
+from src.core.video.application.events.integration_events import (
+    AudioVideoMediaUpdatedIntegrationEvent,
+)
+from src.django_project.outbox_app.message_bus import OutboxMessageBus
+from src.django_project.outbox_app.models import OutboxMessage
+from src.django_project.outbox_app.relay import OutboxRelay
+
+pytestmark = pytest.mark.django_db
+
+
+def make_event(index: int = 1) -> AudioVideoMediaUpdatedIntegrationEvent:
+    return AudioVideoMediaUpdatedIntegrationEvent(
+        resource_id=f"video-{index}.VIDEO",
+        file_path=f"videos/{index}/video.mp4",
+    )
+
+
+@pytest.fixture
+def handler() -> Handler:
+    return create_autospec(Handler)
+
+
+@pytest.fixture
+def relay(handler: Handler) -> OutboxRelay:
+    message_bus = MessageBus(raise_errors=True)
+    message_bus.handlers[AudioVideoMediaUpdatedIntegrationEvent] = [handler]
+    return OutboxRelay(message_bus=message_bus, batch_size=10)
+
+
+class TestOutboxMessageBus:
+    def test_stores_events_instead_of_publishing(self):
+        OutboxMessageBus().handle([make_event(1), make_event(2)])
+
+        assert list(
+            OutboxMessage.objects.order_by("created_at").values_list(
+                "event_type", "payload"
+            )
+        ) == [
+            (
+                "AudioVideoMediaUpdatedIntegrationEvent",
+                {"resource_id": "video-1.VIDEO", "file_path": "videos/1/video.mp4"},
+            ),
+            (
+                "AudioVideoMediaUpdatedIntegrationEvent",
+                {"resource_id": "video-2.VIDEO", "file_path": "videos/2/video.mp4"},
+            ),
+        ]
+
+    def test_rolls_back_with_the_surrounding_transaction(self):
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                OutboxMessageBus().handle([make_event()])
+                raise RuntimeError("update failed")
+
+        assert not OutboxMessage.objects.exists()
+
+
+class TestOutboxRelay:
+    def test_publishes_pending_messages_and_marks_them_published(
+        self, relay: OutboxRelay, handler: Handler
+    ):
+        OutboxMessageBus().handle([make_event(1), make_event(2)])
+
+        assert relay.relay_batch() == 2
+
+        assert [call.args[0] for call in handler.handle.call_args_list] == [
+            make_event(1),
+            make_event(2),
+        ]
+        assert not OutboxMessage.objects.filter(published_at__isnull=True).exists()
+        assert relay.relay_batch() == 0
+        assert handler.handle.call_count == 2
+
+    def test_publishes_identical_events_with_their_own_message_id(
+        self, relay: OutboxRelay, handler: Handler
+    ):
+        OutboxMessageBus().handle([make_event(), make_event()])
+
+        assert relay.relay_batch() == 2
+
+        # Mesmo payload, linhas distintas: ambas são entregues
+        events = [call.args[0] for call in handler.handle.call_args_list]
+        assert events == [make_event(), make_event()]
+        assert sorted(event.message_id for event in events) == sorted(
+            str(pk) for pk in OutboxMessage.objects.values_list("id", flat=True)
+        )
+
+    def test_reschedules_failed_messages_with_backoff(
+        self, relay: OutboxRelay, handler: Handler
+    ):
+        handler.handle.side_effect = ConnectionError("broker down")
+        OutboxMessageBus().handle([make_event()])
+
+        assert relay.relay_batch() == 0
+
+        message = OutboxMessage.objects.get()
+        assert message.published_at is None
+        assert message.attempts == 1
+        assert "broker down" in message.last_error
+        assert message.next_attempt_at > timezone.now()
+
+        handler.handle.side_effect = None
+        assert relay.relay_batch() == 0
+
+        OutboxMessage.objects.update(next_attempt_at=timezone.now())
+        assert relay.relay_batch() == 1
+
+    def test_gives_up_after_max_attempts(self, relay: OutboxRelay, handler: Handler):
+        OutboxMessageBus().handle([make_event()])
+        OutboxMessage.objects.update(attempts=relay.max_attempts)
+
+        assert relay.relay_batch() == 0
+        handler.handle.assert_not_called()
+
+    def test_backoff_is_capped(self, relay: OutboxRelay):
+        assert relay._backoff(1) == timedelta(seconds=1)
+        assert relay._backoff(3) == timedelta(seconds=4)
+        assert relay._backoff(20) == timedelta(minutes=5)
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class SearchAppConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "src.django_project.search_app"
@@ -0,0 +1,58 @@
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from src.core._shared.infra.django.search import search_engine
+from src.django_project.cast_member_app.repository import (
+    DjangoORMCastMemberRepository,
+    cast_member_search_document,
+)
+from src.django_project.category_app.repository import (
+    DjangoORMCategoryRepository,
+    category_search_document,
+)
+from src.django_project.genre_app.repository import (
+    DjangoORMGenreRepository,
+    genre_search_document,
+)
+from src.django_project.video_app.repository import (
+    DjangoORMVideoRepository,
+    video_search_document,
+)
+
+SOURCES = {
+    "category": (DjangoORMCategoryRepository, category_search_document),
+    "genre": (DjangoORMGenreRepository, genre_search_document),
+    "cast_member": (DjangoORMCastMemberRepository, cast_member_search_document),
+    "video": (DjangoORMVideoRepository, video_search_document),
+}
+
+
+class Command(BaseCommand):
+    help = "Indexes existing catalog entities for full-text search"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--type",
+            choices=sorted(SOURCES),
+            action="append",
+            help="Entity type to index (default: all)",
+        )
+
+    def handle(self, *args, **options):
+        engine = search_engine()
+        batch_size = options["batch_size"]
+        for entity_type in options["type"] or SOURCES:
+            repository_class, to_document = SOURCES[entity_type]
+            entities = repository_class().iter_all(chunk_size=batch_size)
+
+            indexed = 0
+            # Um commit por lote: reindexar não segura uma transação longa
+            while batch := list(islice(entities, batch_size)):
+                with transaction.atomic():
+                    engine.index(to_document(entity) for entity in batch)
+                indexed += len(batch)
+
+            self.stdout.write(f"Indexed {indexed} {entity_type} documents")
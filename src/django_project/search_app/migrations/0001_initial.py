@@ -0,0 +1,63 @@
+from django.db import migrations
+
+# O índice não é um model: o SQL depende do banco (FTS5 ou tsvector + GIN)
+SQLITE_SCHEMA = [
+    """
+    CREATE TABLE search_entry (
+        id INTEGER PRIMARY KEY,
+        entity_type varchar(50) NOT NULL,
+        entity_id char(32) NOT NULL,
+        UNIQUE (entity_type, entity_id)
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE search_entry_fts USING fts5(
+        title,
+        body,
+        entity_type UNINDEXED,
+        entity_id UNINDEXED,
+        prefix = '3',
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+]
+SQLITE_DROP = ["DROP TABLE search_entry_fts", "DROP TABLE search_entry"]
+
+POSTGRES_SCHEMA = [
+    """
+    CREATE TABLE search_entry (
+        entity_type varchar(50) NOT NULL,
+        entity_id uuid NOT NULL,
+        document tsvector NOT NULL,
+        PRIMARY KEY (entity_type, entity_id)
+    )
+    """,
+    "CREATE INDEX search_entry_document_idx ON search_entry USING GIN (document)",
+]
+POSTGRES_DROP = ["DROP TABLE search_entry"]
+
+
+def _run(schema_editor, statements_by_vendor):
+    # Demais bancos: sem índice, search_engine() usa o NullSearchEngine
+    vendor = schema_editor.connection.vendor
+    for statement in statements_by_vendor.get(vendor, []):
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    _run(schema_editor, {"sqlite": SQLITE_SCHEMA, "postgresql": POSTGRES_SCHEMA})
+
+
+def drop_search_index(apps, schema_editor):
+    _run(schema_editor, {"sqlite": SQLITE_DROP, "postgresql": POSTGRES_DROP})
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,150 @@
+from importlib import import_module
+from io import StringIO
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from django.core.management import call_command
+
+from src.core._shared.domain.search import SearchDocument
+from src.core._shared.infra.django import search
+from src.core._shared.infra.django.search import SQLiteSearchEngine, search_engine
+from src.core._shared.infra.search.null_search_engine import NullSearchEngine
+from src.core.category.domain.category import Category
+from src.django_project.category_app.models import Category as CategoryORM
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def engine() -> SQLiteSearchEngine:
+    return SQLiteSearchEngine()
+
+
+def document(title: str, body: str = "", entity_type: str = "video"):
+    return SearchDocument(
+        entity_type=entity_type, entity_id=uuid4(), title=title, body=body
+    )
+
+
+class TestSQLiteSearchEngine:
+    def test_matches_all_terms_ignoring_case_and_accents(self, engine):
+        match = document("O Poderoso Chefão")
+        partial = document("O Poderoso")
+        engine.index([match, partial])
+
+        page = engine.search("video", "poderoso CHEFAO")
+
+        assert page.items == [match.entity_id]
+        assert page.total == 1
+
+    def test_last_term_matches_as_prefix(self, engine):
+        match = document("Interestelar")
+        engine.index([match])
+
+        assert engine.search("video", "inter").items == [match.entity_id]
+        # Prefixos curtos demais não expandem
+        assert engine.search("video", "in").items == []
+
+    def test_ranks_title_matches_above_body_matches(self, engine):
+        in_body = document("Viagem", body="Uma história no espaço")
+        in_title = document("Espaço", body="Uma viagem")
+        engine.index([in_body, in_title])
+
+        page = engine.search("video", "espaco")
+
+        assert page.items == [in_title.entity_id, in_body.entity_id]
+
+    def test_filters_by_entity_type(self, engine):
+        video = document("Drama")
+        genre = document("Drama", entity_type="genre")
+        engine.index([video, genre])
+
+        assert engine.search("genre", "drama").items == [genre.entity_id]
+
+    def test_reindexing_replaces_document(self, engine):
+        original = document("Título antigo")
+        engine.index([original])
+
+        engine.index([SearchDocument("video", original.entity_id, title="Título novo")])
+
+        assert engine.search("video", "antigo").items == []
+        assert engine.search("video", "novo").items == [original.entity_id]
+
+    def test_remove(self, engine):
+        removed = document("Duna")
+        kept = document("Duna parte dois")
+        engine.index([removed, kept])
+
+        engine.remove("video", [removed.entity_id])
+
+        assert engine.search("video", "duna").items == [kept.entity_id]
+
+    def test_paginates_results(self, engine):
+        documents = [document(f"Episódio {index}") for index in range(5)]
+        engine.index(documents)
+
+        first = engine.search("video", "episodio", offset=0, limit=2)
+        last = engine.search("video", "episodio", offset=4, limit=2)
+
+        assert (len(first.items), first.total, first.has_next) == (2, 5, True)
+        assert (len(last.items), last.total, last.has_next) == (1, 5, False)
+
+    def test_query_operators_are_treated_as_text(self, engine):
+        engine.index([document("Tom & Jerry")])
+
+        assert engine.search("video", 'tom" OR NEAR(*').total == 0
+        assert engine.search("video", "").items == []
+
+
+class TestRepositorySync:
+    def test_repository_writes_keep_index_in_sync(self, engine):
+        repository = DjangoORMCategoryRepository()
+        category = Category(name="Filme", description="Longa-metragem")
+
+        repository.save(category)
+        assert engine.search("category", "longa").items == [category.id]
+
+        category.update_category(name="Série", description="")
+        repository.update(category)
+        assert engine.search("category", "filme").items == []
+        assert engine.search("category", "serie").items == [category.id]
+
+        repository.delete(category.id)
+        assert engine.search("category", "serie").items == []
+
+    def test_rebuild_command_indexes_existing_rows(self, engine):
+        # Linha gravada sem passar pelo repositório (ex.: dados anteriores)
+        category = CategoryORM.objects.create(name="Documentário")
+
+        call_command("rebuildsearchindex", "--type", "category", stdout=StringIO())
+
+        assert engine.search("category", "documentario").items == [category.id]
+
+
+class TestUnsupportedDatabase:
+    @pytest.fixture
+    def mysql(self, monkeypatch):
+        connection = SimpleNamespace(vendor="mysql")
+        monkeypatch.setattr(search, "connections", {"default": connection})
+        return connection
+
+    def test_falls_back_to_engine_without_results(self, mysql):
+        engine = search_engine()
+        engine.index([document("Interestelar")])
+
+        assert isinstance(engine, NullSearchEngine)
+        assert engine.search("video", "interestelar").total == 0
+
+    def test_migration_creates_nothing(self, mysql):
+        migration = import_module(
+            "src.django_project.search_app.migrations.0001_initial"
+        )
+        executed = []
+        schema_editor = SimpleNamespace(connection=mysql, execute=executed.append)
+
+        migration.create_search_index(None, schema_editor)
+        migration.drop_search_index(None, schema_editor)
+
+        assert executed == []
@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
+from src.core.category.domain.category import Category
+from src.core.video.domain.value_objects import Rating
+from src.core.video.domain.video import Video
+from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.video_app.repository import DjangoORMVideoRepository
+
+pytestmark = pytest.mark.django_db
+
+
+class TestSearchAPI:
+    def test_returns_ranked_page_of_categories(self):
+        repository = DjangoORMCategoryRepository()
+        in_description = Category(name="Séries", description="Ação sem parar")
+        in_name = Category(name="Ação", description="Filmes")
+        repository.save(in_description)
+        repository.save(in_name)
+        repository.save(Category(name="Drama"))
+
+        response = APIClient().get("/api/categories/search/?q=acao&per_page=10")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["data"]] == [
+            str(in_name.id),
+            str(in_description.id),
+        ]
+        assert response.data["meta"] == {
+            "current_page": 1,
+            "per_page": 10,
+            "total": 2,
+            "next_cursor": None,
+        }
+
+    def test_searches_cast_members_by_name(self):
+        repository = DjangoORMCastMemberRepository()
+        actor = CastMember(name="Fernanda Montenegro", type=CastMemberType.ACTOR)
+        repository.save(actor)
+        repository.save(CastMember(name="Wagner Moura", type=CastMemberType.ACTOR))
+
+        response = APIClient().get("/api/cast-members/search/?q=fernanda")
+
+        assert response.data["data"] == [
+            {"id": str(actor.id), "name": "Fernanda Montenegro", "type": "ACTOR"}
+        ]
+
+    def test_searches_videos_by_title_and_description(self):
+        video = Video(
+            title="Cidade de Deus",
+            description="Crescer no Rio de Janeiro",
+            launch_year=2002,
+            duration=Decimal("130"),
+            rating=Rating.AGE_16,
+            opened=True,
+            categories=set(),
+            genres=set(),
+            cast_members=set(),
+        )
+        DjangoORMVideoRepository().save(video)
+
+        response = APIClient().get("/api/videos/search/?q=janeiro")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["data"]] == [str(video.id)]
+        assert response.data["data"][0]["rating"] == "AGE_16"
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "",
+            "?q=",
+            "?q=%20",
+            "?q=acao&per_page=x",
+            "?q=acao&per_page=0",
+            "?q=acao&current_page=x",
+            "?q=acao&current_page=0",
+        ],
+    )
+    def test_when_query_is_invalid_then_return_400(self, query):
+        response = APIClient().get(f"/api/genres/search/{query}")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
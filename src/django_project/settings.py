@@ -43,6 +43,9 @@ INSTALLED_APPS = [
     "src.django_project.genre_app",
     "src.django_project.cast_member_app",
     "src.django_project.video_app",
+    "src.django_project.change_feed_app",
+    "src.django_project.search_app",
+    "src.django_project.outbox_app",
 ]
 
 MIDDLEWARE = [
@@ -74,6 +77,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "src.django_project.wsgi.application"
+ASGI_APPLICATION = "src.django_project.asgi.application"
 
 
 # Database
@@ -87,6 +91,29 @@ DATABASES = {
 }
 
 
+# Cache read-through dos repositórios (get_by_id): LRU local + cache do Django.
+# Sem CACHES configurado o cache do Django é LocMem (por processo) e o
+# SHARED_TTL fica limitado ao LOCAL_TTL; com Redis/Memcached vale o SHARED_TTL
+REPOSITORY_CACHE = {
+    "CACHE_ALIAS": "default",
+    "LOCAL_MAX_SIZE": 1024,
+    "LOCAL_TTL": 5,
+    "SHARED_TTL": 300,
+}
+
+# Storage das mídias, compartilhado entre workers e reinícios: sessões de
+# upload recebem as partes em requests distintos. ASYNC_BACKEND atende as
+# views async com os mesmos arquivos (ASYNC_OPTIONS, se omitido, = OPTIONS).
+# GCS: "src.core._shared.infra.storage.gcs_storage.GCSStorage" e
+# "src.core._shared.infra.storage.async_gcs_storage.AsyncGCSStorage"
+MEDIA_STORAGE = {
+    "BACKEND": "src.core._shared.infra.storage.local_storage.LocalStorage",
+    "ASYNC_BACKEND": (
+        "src.core._shared.infra.storage.async_local_storage.AsyncLocalStorage"
+    ),
+    "OPTIONS": {"bucket": str(BASE_DIR / "storage")},
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -19,17 +19,65 @@ from django.contrib import admin
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
+from src.django_project.cast_member_app.async_views import (
+    CastMemberAsyncCollectionView,
+)
+from src.django_project.category_app.async_views import (
+    CategoryAsyncCollectionView,
+    CategoryAsyncDetailView,
+)
+from src.django_project.genre_app.async_views import GenreAsyncCollectionView
+from src.django_project.video_app.async_views import (
+    VideoAsyncCollectionView,
+    VideoAsyncUploadMediaView,
+)
 from src.django_project.category_app.views import CategoryViewSet
 from src.django_project.genre_app.views import GenreViewSet
 from src.django_project.cast_member_app.views import CastMemberViewSet
 from src.django_project.video_app.views import VideoViewSet
+from src.django_project.change_feed_app.views import ChangeFeedViewSet
 
 router = DefaultRouter()
 router.register(r"api/categories", CategoryViewSet, basename="category")
 router.register(r"api/genres", GenreViewSet, basename="genre")
 router.register(r"api/cast-members", CastMemberViewSet, basename="cast-member")
 router.register(r"api/videos", VideoViewSet, basename="video")
+router.register(r"api/changes", ChangeFeedViewSet, basename="change")
+
+# Views async (ASGI): mesmos use cases das rotas DRF, sem thread por request
+async_urlpatterns = [
+    path(
+        "api/async/categories/",
+        CategoryAsyncCollectionView.as_view(),
+        name="async-category-list",
+    ),
+    path(
+        "api/async/categories/<uuid:pk>/",
+        CategoryAsyncDetailView.as_view(),
+        name="async-category-detail",
+    ),
+    path(
+        "api/async/genres/",
+        GenreAsyncCollectionView.as_view(),
+        name="async-genre-list",
+    ),
+    path(
+        "api/async/cast-members/",
+        CastMemberAsyncCollectionView.as_view(),
+        name="async-cast-member-list",
+    ),
+    path(
+        "api/async/videos/",
+        VideoAsyncCollectionView.as_view(),
+        name="async-video-list",
+    ),
+    path(
+        "api/async/videos/<uuid:pk>/upload-media/",
+        VideoAsyncUploadMediaView.as_view(),
+        name="async-video-upload-media",
+    ),
+]
 
 urlpatterns = [
     path("admin/", admin.site.urls),
-] + router.urls
+] + router.urls + async_urlpatterns
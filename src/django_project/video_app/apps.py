@@ -3,4 +3,29 @@ from django.apps import AppConfig
 
 class VideoAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'src.django_project.video_app'
\ No newline at end of file
+    name = 'src.django_project.video_app'
+
+    def ready(self):
+        from src.core._shared.infra.django.cache import (
+            invalidate_on_change,
+            invalidate_on_m2m_change,
+        )
+        from src.core._shared.infra.django.models import bump_version_on_m2m_change
+        from src.django_project.change_feed_app.models import EntityType
+        from src.django_project.change_feed_app.recorder import record_m2m_changes
+        from src.django_project.video_app.models import Video
+        from src.django_project.video_app.repository import video_cache
+
+        # Escritas fora do CachedRepository também invalidam o cache
+        invalidate_on_change(video_cache, Video)
+        invalidate_on_m2m_change(video_cache, Video.categories)
+        invalidate_on_m2m_change(video_cache, Video.genres)
+        invalidate_on_m2m_change(video_cache, Video.cast_members)
+        # Alterações e cascades nas relações M2M mudam o ETag
+        bump_version_on_m2m_change(Video.categories)
+        bump_version_on_m2m_change(Video.genres)
+        bump_version_on_m2m_change(Video.cast_members)
+        # ...e chegam ao feed de alterações
+        record_m2m_changes(EntityType.VIDEO, Video.categories)
+        record_m2m_changes(EntityType.VIDEO, Video.genres)
+        record_m2m_changes(EntityType.VIDEO, Video.cast_members)
@@ -0,0 +1,106 @@
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.http import HttpRequest, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.status import HTTP_200_OK, HTTP_404_NOT_FOUND, HTTP_409_CONFLICT
+
+from src.core._shared.infra.django.async_views import (
+    AsyncCollectionView,
+    error_response,
+    run_sync,
+)
+from src.core.video.application.use_cases.create_video_without_media import (
+    CreateVideoWithoutMedia,
+)
+from src.core.video.application.use_cases.exceptions import (
+    InvalidVideo,
+    MediaBlobReleased,
+    RelatedEntitiesNotFound,
+    VideoNotFound,
+)
+from src.core.video.application.use_cases.list_video import (
+    ListVideo,
+    ListVideoRequest,
+)
+from src.core.video.application.use_cases.upload_video import UploadVideo
+from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.video_app.repository import (
+    DjangoORMMediaBlobRepository,
+    cached_video_repository,
+)
+from src.django_project.video_app.serializers import (
+    CreateVideoRequestSerializer,
+    CreateVideoResponseSerializer,
+    ListVideoOutputSerializer,
+    ListVideoRequestSerializer,
+)
+from src.django_project.video_app.views import to_create_input, to_list_request
+
+
+class VideoAsyncCollectionView(AsyncCollectionView):
+    list_request_serializer = ListVideoRequestSerializer
+    create_request_serializer = CreateVideoRequestSerializer
+    create_response_serializer = CreateVideoResponseSerializer
+    create_errors = (InvalidVideo, RelatedEntitiesNotFound)
+
+    def _get_list_use_case(self) -> ListVideo:
+        return ListVideo(repository=cached_video_repository())
+
+    def _get_list_response_serializer(self, output):
+        return ListVideoOutputSerializer(output)
+
+    def _to_list_request(self, data: dict) -> ListVideoRequest:
+        return to_list_request(data)
+
+    def _get_create_use_case(self) -> CreateVideoWithoutMedia:
+        return CreateVideoWithoutMedia(
+            video_repository=cached_video_repository(),
+            category_repository=DjangoORMCategoryRepository(),
+            genre_repository=DjangoORMGenreRepository(),
+            cast_member_repository=DjangoORMCastMemberRepository(),
+        )
+
+    def _to_create_input(self, data: dict) -> CreateVideoWithoutMedia.Input:
+        return to_create_input(data)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class VideoAsyncUploadMediaView(View):
+    async def post(self, request: HttpRequest, pk: UUID) -> JsonResponse:
+        # O parse do multipart lê o corpo do disco: fora do event loop
+        files = await sync_to_async(lambda: request.FILES)()
+        if "file" not in files:
+            return error_response("No file provided")
+
+        file = files["file"]
+        use_case = UploadVideo(
+            repository=cached_video_repository(),
+            storage_service=request.async_storage_service,
+            message_bus=request.message_bus,
+            blob_repository=DjangoORMMediaBlobRepository(),
+            unit_of_work=transaction.atomic,
+            run_sync=run_sync,
+        )
+        try:
+            await use_case.aexecute(
+                UploadVideo.Input(
+                    video_id=pk,
+                    file_name=file.name,
+                    content=file,
+                    content_type=file.content_type,
+                )
+            )
+        except VideoNotFound as error:
+            return JsonResponse({"error": str(error)}, status=HTTP_404_NOT_FOUND)
+        except MediaBlobReleased as error:
+            return JsonResponse({"error": str(error)}, status=HTTP_409_CONFLICT)
+
+        return JsonResponse(
+            {"message": "Media uploaded successfully"}, status=HTTP_200_OK
+        )
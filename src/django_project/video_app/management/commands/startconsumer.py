@@ -1,3 +1,5 @@
+import signal
+
 from django.core.management.base import BaseCommand
 
 from src.core.video.infra.video_converted_rabbitmq_consumer import VideoConvertedRabbitMQConsumer
@@ -6,6 +8,32 @@ from src.core.video.infra.video_converted_rabbitmq_consumer import VideoConverte
 class Command(BaseCommand):
     help = 'Starts the VideoConverted Consumer'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='localhost')
+        parser.add_argument('--queue', default='videos.converted')
+        parser.add_argument(
+            '--prefetch-count',
+            type=int,
+            default=10,
+            help='Maximum unacknowledged messages delivered to this consumer',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Number of threads processing messages concurrently',
+        )
+
     def handle(self, *args, **options):
-        consumer = VideoConvertedRabbitMQConsumer()
-        consumer.start()
\ No newline at end of file
+        consumer = VideoConvertedRabbitMQConsumer(
+            host=options['host'],
+            queue=options['queue'],
+            prefetch_count=options['prefetch_count'],
+            workers=options['workers'],
+        )
+        # Encerramento gracioso: termina as mensagens em andamento e envia os acks
+        signal.signal(signal.SIGTERM, lambda *_: consumer.stop())
+        try:
+            consumer.start()
+        except KeyboardInterrupt:
+            pass
@@ -1,14 +1,61 @@
-from django.utils.deprecation import MiddlewareMixin
-from src.core._shared.infra.storage.in_memory_storage import InMemoryStorage
-from src.core._shared.events.message_bus import MessageBus
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.module_loading import import_string
 
+from src.core._shared.infra.storage.abstract_async_storage import (
+    AbstractAsyncStorage,
+)
+from src.core._shared.infra.storage.abstract_storage import AbstractStorage
+from src.core._shared.infra.storage.async_in_memory_storage import (
+    AsyncInMemoryStorage,
+)
+from src.django_project.outbox_app.message_bus import OutboxMessageBus
+
+
+def build_storage_services() -> tuple[AbstractStorage, AbstractAsyncStorage]:
+    """Instancia os storages síncrono e async configurados em MEDIA_STORAGE"""
+    config = settings.MEDIA_STORAGE
+    options = config.get("OPTIONS", {})
+    storage_service = import_string(config["BACKEND"])(**options)
+
+    async_backend = import_string(config["ASYNC_BACKEND"])
+    if issubclass(async_backend, AsyncInMemoryStorage):
+        # Em memória: o async envolve o próprio storage para ver os mesmos arquivos
+        return storage_service, async_backend(storage_service)
+    return storage_service, async_backend(**config.get("ASYNC_OPTIONS", options))
+
+
+class ServiceInjectionMiddleware:
+    # Síncrono e assíncrono: sob ASGI não força a request para uma thread
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # Storage persistente (settings.MEDIA_STORAGE): sessões de upload
+        # recebem as partes em requests distintos, talvez em outros workers
+        (
+            self.storage_service,
+            self.async_storage_service,
+        ) = build_storage_services()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        self.process_request(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        self.process_request(request)
+        return await self.get_response(request)
 
-class ServiceInjectionMiddleware(MiddlewareMixin):
     def process_request(self, request):
         # Inject storage service
-        request.storage_service = InMemoryStorage()
-        
-        # Inject message bus
-        request.message_bus = MessageBus()
-        
-        return None
+        request.storage_service = self.storage_service
+        request.async_storage_service = self.async_storage_service
+
+        # Inject message bus: eventos vão para o outbox, o relay publica no broker
+        request.message_bus = OutboxMessageBus()
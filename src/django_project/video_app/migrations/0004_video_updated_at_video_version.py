@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:01
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_app", "0003_uploadsession_uploadsessionpart"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="video",
+            name="updated_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="video",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:38
+
+from django.db import migrations, models
+
+# Tabelas intermediárias criadas pelo ManyToManyField não aceitam Meta.indexes.
+# O unique (video_id, <relacionado>_id) cobre a hidratação por vídeo; o índice
+# invertido cobre o filtro "vídeos do gênero X" sem ler a tabela.
+THROUGH_INDEXES = (
+    ("video_categories", "category_id"),
+    ("video_genres", "genre_id"),
+    ("video_cast_members", "castmember_id"),
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cast_member_app", "0003_castmember_version"),
+        ("category_app", "0003_category_updated_at_category_version"),
+        ("genre_app", "0003_genre_updated_at_genre_version"),
+        ("video_app", "0004_video_updated_at_video_version"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                fields=["published", "rating", "title"],
+                name="video_published_rating_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(fields=["launch_year"], name="video_launch_year_idx"),
+        ),
+    ] + [
+        migrations.RunSQL(
+            sql=f"CREATE INDEX {table}_{column}_video_idx ON {table} ({column}, video_id)",
+            reverse_sql=f"DROP INDEX {table}_{column}_video_idx",
+        )
+        for table, column in THROUGH_INDEXES
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-18 12:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("video_app", "0005_video_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MediaBlob",
+            fields=[
+                (
+                    "checksum",
+                    models.CharField(max_length=64, primary_key=True, serialize=False),
+                ),
+                ("location", models.CharField(max_length=255)),
+                ("ref_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "db_table": "media_blob",
+            },
+        ),
+        migrations.AddField(
+            model_name="audiovideomedia",
+            name="checksum",
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+    ]
@@ -5,10 +5,11 @@ from uuid import uuid4
 
 from django.db import models
 
+from src.core._shared.infra.django.models import VersionedModel
 from src.core.video.domain.value_objects import MediaStatus, Rating
 
 
-class Video(models.Model):
+class Video(VersionedModel):
     app_label = "video_app"
 
     RATING_CHOICES = [(rating.name, rating.value) for rating in Rating]
@@ -62,6 +63,14 @@ class Video(models.Model):
 
     class Meta:
         db_table = "video"
+        indexes = [
+            # Vitrine: vídeos publicados de uma classificação, ordenados por título
+            models.Index(
+                fields=["published", "rating", "title"],
+                name="video_published_rating_idx",
+            ),
+            models.Index(fields=["launch_year"], name="video_launch_year_idx"),
+        ]
 
 
 class ImageMedia(models.Model):
@@ -82,3 +91,41 @@ class AudioVideoMedia(models.Model):
     status = models.CharField(
         max_length=255, choices=STATUS_CHOICES, default=MediaStatus.PENDING.value
     )
+    # Indexado: uploads repetidos reaproveitam a codificação pelo checksum
+    checksum = models.CharField(max_length=64, blank=True, db_index=True)
+
+
+class MediaBlob(models.Model):
+    """Blob endereçado por conteúdo e quantas mídias o referenciam."""
+
+    checksum = models.CharField(max_length=64, primary_key=True)
+    location = models.CharField(max_length=255)
+    ref_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "media_blob"
+
+
+class UploadSession(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+
+    video = models.ForeignKey(
+        "Video", related_name="upload_sessions", on_delete=models.CASCADE
+    )
+    file_name = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+
+class UploadSessionPart(models.Model):
+    session = models.ForeignKey(
+        "UploadSession", related_name="parts", on_delete=models.CASCADE
+    )
+    part_number = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["session", "part_number"], name="upload_session_part_unique"
+            )
+        ]
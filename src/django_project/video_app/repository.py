@@ -1,13 +1,67 @@
+from collections import defaultdict
+from functools import partial
+from pathlib import Path
+from typing import Iterator, List
 from uuid import UUID
 
+from asgiref.sync import sync_to_async
 from django.db import transaction
+from django.db.models import Q, QuerySet
 
+from src.core._shared.domain.pagination import Page, PageQuery
+from src.core._shared.domain.search import SearchDocument
+from src.core._shared.infra.cache.cached_repository import CachedRepository
+from src.core._shared.infra.django.cache import repository_cache
+from src.core._shared.infra.django.pagination import (
+    apaginate_queryset,
+    iter_batches,
+    paginate_queryset,
+)
+from src.core._shared.infra.django.search import search_engine
+from src.core._shared.infra.storage.abstract_storage import AbstractStorage
+from src.core.video.domain.value_objects import (
+    AudioVideoMedia as AudioVideoMediaEntity,
+    ImageMedia as ImageMediaEntity,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.core.video.domain.media_blob_repository import MediaBlobRepository
+from src.core.video.domain.upload_session import UploadSession
+from src.core.video.domain.upload_session_repository import UploadSessionRepository
 from src.core.video.domain.video import Video
+from src.core.video.domain.video_filter import VideoFilter
 from src.core.video.domain.video_repository import VideoRepository
 from src.django_project.video_app.models import Video as VideoORM, AudioVideoMedia, ImageMedia
+from src.django_project.video_app.models import (
+    MediaBlob as MediaBlobORM,
+    UploadSession as UploadSessionORM,
+    UploadSessionPart as UploadSessionPartORM,
+)
+from src.django_project.change_feed_app.models import ChangeOperation, EntityType
+from src.django_project.change_feed_app.recorder import record_change, record_changes
+from src.django_project.video_app.middleware import build_storage_services
+
+BULK_BATCH_SIZE = 1000
+
+# (campo M2M, coluna do relacionado na tabela intermediária)
+RELATED_FIELDS = (
+    ("categories", "category_id"),
+    ("genres", "genre_id"),
+    ("cast_members", "castmember_id"),
+)
 
 
 class DjangoORMVideoRepository(VideoRepository):
+    def __init__(
+        self,
+        storage_service: AbstractStorage | None = None,
+        blob_repository: MediaBlobRepository | None = None,
+    ) -> None:
+        # Usados no delete, para liberar os blobs das mídias do vídeo
+        self.storage_service = storage_service
+        self.blob_repository = blob_repository or DjangoORMMediaBlobRepository()
+
     # TODO: use model/entity mapper
     def save(self, video: Video) -> None:
         with transaction.atomic():
@@ -26,58 +80,134 @@ class DjangoORMVideoRepository(VideoRepository):
             
             # Atribuir o ID do modelo ORM de volta à entidade
             video.id = video_model.id
+            record_change(EntityType.VIDEO, video.id, ChangeOperation.CREATED)
+            search_engine().index([video_search_document(video)])
 
-    def get_by_id(self, id: UUID) -> Video | None:
-        try:
-            video_model = VideoORM.objects.get(pk=id)
-            
-            # Criar a entidade Video
-            video = Video(
-                id=video_model.id,
-                title=video_model.title,
-                description=video_model.description,
-                launch_year=video_model.launch_year,
-                opened=video_model.opened,
-                duration=video_model.duration,
-                rating=video_model.rating,
-                categories=set(video_model.categories.values_list("id", flat=True)),
-                genres=set(video_model.genres.values_list("id", flat=True)),
-                cast_members=set(video_model.cast_members.values_list("id", flat=True)),
+    def bulk_save(self, videos: List[Video]) -> None:
+        # INSERTs em lote: vídeos e linhas das tabelas intermediárias (M2M)
+        with transaction.atomic():
+            VideoORM.objects.bulk_create(
+                [
+                    VideoORM(
+                        id=video.id,
+                        title=video.title,
+                        description=video.description,
+                        launch_year=video.launch_year,
+                        opened=video.opened,
+                        duration=video.duration,
+                        rating=video.rating,
+                        published=video.published,
+                    )
+                    for video in videos
+                ],
+                batch_size=BULK_BATCH_SIZE,
             )
-            
-            # Adicionar mídia se existir
-            if video_model.video:
-                from src.core.video.domain.value_objects import AudioVideoMedia, MediaStatus, MediaType
-                video.video = AudioVideoMedia(
-                    name=video_model.video.name,
-                    raw_location=video_model.video.raw_location,
-                    encoded_location=video_model.video.encoded_location,
-                    status=MediaStatus(video_model.video.status),
-                    media_type=MediaType.VIDEO,  # Assumindo que é sempre VIDEO para este campo
+            for field, related_field in RELATED_FIELDS:
+                through = getattr(VideoORM, field).through
+                through.objects.bulk_create(
+                    [
+                        through(video_id=video.id, **{related_field: related_id})
+                        for video in videos
+                        for related_id in getattr(video, field)
+                    ],
+                    batch_size=BULK_BATCH_SIZE,
                 )
-            
-            return video
-        except VideoORM.DoesNotExist:
+            record_changes(
+                EntityType.VIDEO, [video.id for video in videos], ChangeOperation.CREATED
+            )
+            search_engine().index(video_search_document(video) for video in videos)
+
+    def get_by_ids(self, ids: set[UUID]) -> List[Video]:
+        return self._to_entities(self._queryset().filter(pk__in=ids))
+
+    def get_by_id(self, id: UUID) -> Video | None:
+        video_model = self._queryset().filter(pk=id).first()
+        if video_model is None:
             return None
 
+        return self._to_entities([video_model])[0]
+
     def delete(self, id: UUID) -> None:
-        VideoORM.objects.filter(id=id).delete()
+        with transaction.atomic():
+            medias = dict(
+                AudioVideoMedia.objects.filter(
+                    Q(video_media__id=id) | Q(video_trailer__id=id)
+                ).values_list("id", "checksum")
+            )
+            deleted, _ = VideoORM.objects.filter(id=id).delete()
+            if not deleted:
+                return
+
+            # Mídias saem junto: find_encoded_media não reaproveita o que
+            # aponta para blobs liberados
+            AudioVideoMedia.objects.filter(id__in=medias).delete()
+            orphans = [
+                location
+                for checksum in medias.values()
+                if checksum and (location := self.blob_repository.release(checksum))
+            ]
+            # Tombstone: o feed de alterações propaga a remoção
+            record_change(EntityType.VIDEO, id, ChangeOperation.DELETED)
+            search_engine().remove(EntityType.VIDEO, [id])
+
+            # Blobs sem referências: removidos do storage só após o commit
+            if orphans:
+                storage_service = self.storage_service or build_storage_services()[0]
+                for location in orphans:
+                    transaction.on_commit(
+                        partial(storage_service.delete, Path(location))
+                    )
 
     def list(self) -> list[Video]:
-        return [
-            Video(
-                id=video_model.id,
-                title=video_model.title,
-                description=video_model.description,
-                launch_year=video_model.launch_year,
-                opened=video_model.opened,
-                duration=video_model.duration,
-                rating=video_model.rating,
-                categories=set(video_model.categories.values_list("id", flat=True)),
-                genres=set(video_model.genres.values_list("id", flat=True)),
-                cast_members=set(video_model.cast_members.values_list("id", flat=True)),
-            ) for video_model in VideoORM.objects.all()
-        ]
+        return self._to_entities(self._queryset())
+
+    def paginate(
+        self, query: PageQuery, video_filter: VideoFilter | None = None
+    ) -> Page[Video]:
+        queryset = self._queryset()
+        if video_filter is not None:
+            queryset = filter_videos(queryset, video_filter)
+
+        page = paginate_queryset(queryset, query)
+        return Page(
+            items=self._to_entities(page.items),
+            total=page.total,
+            has_next=page.has_next,
+        )
+
+    def iter_all(self, chunk_size: int = BULK_BATCH_SIZE) -> Iterator[Video]:
+        # M2M carregados por lote: 3 consultas extras a cada chunk_size vídeos
+        for batch in iter_batches(self._queryset().order_by("pk"), chunk_size):
+            yield from self._to_entities(batch)
+
+    @staticmethod
+    def _queryset():
+        # Mídias OneToOne vêm no mesmo SELECT via JOIN
+        return VideoORM.objects.select_related(*VideoModelMapper.MEDIA_FIELDS)
+
+    @staticmethod
+    def _to_entities(video_models) -> List[Video]:
+        # Hidrata o lote inteiro: 1 consulta por relacionamento M2M (evita 3N+1)
+        video_models = list(video_models)
+        video_ids = [video_model.id for video_model in video_models]
+        related = {
+            field: _load_related_ids(
+                getattr(VideoORM, field).through, related_field, video_ids
+            )
+            for field, related_field in RELATED_FIELDS
+        }
+        return _map_entities(video_models, related)
+
+    @staticmethod
+    async def _ato_entities(video_models: List[VideoORM]) -> List[Video]:
+        video_ids = [video_model.id for video_model in video_models]
+        related = {
+            field: await _aload_related_ids(
+                getattr(VideoORM, field).through, related_field, video_ids
+            )
+            for field, related_field in RELATED_FIELDS
+        }
+        return _map_entities(video_models, related)
 
     def update(self, video: Video) -> None:
         try:
@@ -100,6 +230,7 @@ class DjangoORMVideoRepository(VideoRepository):
                     raw_location=video.video.raw_location,
                     encoded_location=video.video.encoded_location,
                     status=video.video.status,
+                    checksum=video.video.checksum,
                 ) if video.video else None
 
                 # Update video attributes
@@ -110,4 +241,252 @@ class DjangoORMVideoRepository(VideoRepository):
                 video_model.duration = video.duration
                 video_model.rating = video.rating
 
-                video_model.save()
\ No newline at end of file
+                video_model.save()
+                record_change(EntityType.VIDEO, video.id, ChangeOperation.UPDATED)
+                search_engine().index([video_search_document(video)])
+
+    def find_encoded_media(self, checksum: str) -> AudioVideoMediaEntity | None:
+        media_model = AudioVideoMedia.objects.filter(
+            checksum=checksum, status=MediaStatus.COMPLETED.value
+        ).first()
+        return VideoModelMapper.to_audio_video_media(media_model, MediaType.VIDEO)
+
+    async def aget_by_id(self, id: UUID) -> Video | None:
+        video_model = await self._queryset().filter(pk=id).afirst()
+        if video_model is None:
+            return None
+
+        return (await self._ato_entities([video_model]))[0]
+
+    async def apaginate(
+        self, query: PageQuery, video_filter: VideoFilter | None = None
+    ) -> Page[Video]:
+        queryset = self._queryset()
+        if video_filter is not None:
+            queryset = filter_videos(queryset, video_filter)
+
+        page = await apaginate_queryset(queryset, query)
+        return Page(
+            items=await self._ato_entities(page.items),
+            total=page.total,
+            has_next=page.has_next,
+        )
+
+    async def asave(self, video: Video) -> None:
+        # Vídeo, tabelas intermediárias, feed e índice de busca na mesma
+        # transação síncrona (transaction.atomic não tem versão async)
+        await sync_to_async(self.save)(video)
+
+
+class DjangoORMUploadSessionRepository(UploadSessionRepository):
+    def save(self, upload_session: UploadSession) -> None:
+        UploadSessionORM.objects.create(
+            id=upload_session.id,
+            video_id=upload_session.video_id,
+            file_name=upload_session.file_name,
+            content_type=upload_session.content_type,
+        )
+
+    def get_by_id(self, id: UUID) -> UploadSession | None:
+        try:
+            upload_session_model = UploadSessionORM.objects.get(id=id)
+        except UploadSessionORM.DoesNotExist:
+            return None
+
+        return UploadSession(
+            id=upload_session_model.id,
+            video_id=upload_session_model.video_id,
+            file_name=upload_session_model.file_name,
+            content_type=upload_session_model.content_type,
+            parts=set(
+                upload_session_model.parts.values_list("part_number", flat=True)
+            ),
+        )
+
+    def add_part(self, id: UUID, part_number: int) -> None:
+        # Partes chegam em paralelo: cada uma é uma linha, reenvio não conflita
+        UploadSessionPartORM.objects.bulk_create(
+            [UploadSessionPartORM(session_id=id, part_number=part_number)],
+            ignore_conflicts=True,
+        )
+
+    def delete(self, id: UUID) -> None:
+        UploadSessionORM.objects.filter(id=id).delete()
+
+
+class DjangoORMMediaBlobRepository(MediaBlobRepository):
+    def acquire(self, checksum: str, location: str, stored: bool) -> bool:
+        with transaction.atomic():
+            # Linha bloqueada até o commit: um release concorrente espera e vê
+            # a nova referência, ou já deixou o tombstone que é checado aqui
+            blob, created = MediaBlobORM.objects.select_for_update().get_or_create(
+                checksum=checksum, defaults={"location": location}
+            )
+            if not created and blob.ref_count == 0 and not stored:
+                # Remoção do arquivo pendente: reaproveitá-lo deixaria a mídia
+                # apontando para um blob apagado
+                return False
+
+            blob.ref_count += 1
+            blob.location = location
+            blob.save(update_fields=["ref_count", "location"])
+            return True
+
+    def release(self, checksum: str) -> str | None:
+        with transaction.atomic():
+            # Linha bloqueada: dois releases não decidem juntos pela remoção
+            blob = (
+                MediaBlobORM.objects.select_for_update()
+                .filter(pk=checksum, ref_count__gt=0)
+                .first()
+            )
+            if blob is None:
+                return None
+
+            blob.ref_count -= 1
+            blob.save(update_fields=["ref_count"])
+            # A linha fica como tombstone: o próximo acquire sabe que o
+            # arquivo pode já ter sido apagado
+            return blob.location if blob.ref_count == 0 else None
+
+
+def filter_videos(queryset: QuerySet, video_filter: VideoFilter) -> QuerySet:
+    for field, related_field in RELATED_FIELDS:
+        related_ids = getattr(video_filter, field)
+        if related_ids:
+            # Semi-join: id IN (SELECT video_id FROM <intermediária> WHERE ...),
+            # resolvido pelo índice (<relacionado>_id, video_id) sem DISTINCT
+            through = getattr(VideoORM, field).through
+            queryset = queryset.filter(
+                id__in=through.objects.filter(
+                    **{f"{related_field}__in": related_ids}
+                ).values("video_id")
+            )
+
+    if video_filter.ratings:
+        queryset = queryset.filter(
+            rating__in=[rating.value for rating in video_filter.ratings]
+        )
+    if video_filter.published is not None:
+        queryset = queryset.filter(published=video_filter.published)
+    if video_filter.launch_year_min is not None:
+        queryset = queryset.filter(launch_year__gte=video_filter.launch_year_min)
+    if video_filter.launch_year_max is not None:
+        queryset = queryset.filter(launch_year__lte=video_filter.launch_year_max)
+    if video_filter.media_status is not None:
+        # INNER JOIN pela chave primária da mídia (video.video_id)
+        queryset = queryset.filter(video__status=video_filter.media_status.value)
+
+    return queryset
+
+
+def _load_related_ids(through, related_field: str, video_ids: List[UUID]) -> dict:
+    related_ids: dict[UUID, set[UUID]] = defaultdict(set)
+    if not video_ids:
+        return related_ids
+
+    rows = through.objects.filter(video_id__in=video_ids).values_list(
+        "video_id", related_field
+    )
+    for video_id, related_id in rows:
+        related_ids[video_id].add(related_id)
+
+    return related_ids
+
+
+async def _aload_related_ids(through, related_field: str, video_ids: List[UUID]) -> dict:
+    related_ids: dict[UUID, set[UUID]] = defaultdict(set)
+    if not video_ids:
+        return related_ids
+
+    rows = through.objects.filter(video_id__in=video_ids).values_list(
+        "video_id", related_field
+    )
+    async for video_id, related_id in rows:
+        related_ids[video_id].add(related_id)
+
+    return related_ids
+
+
+def _map_entities(video_models: List[VideoORM], related: dict) -> List[Video]:
+    return [
+        VideoModelMapper.to_entity(
+            video_model,
+            categories=related["categories"][video_model.id],
+            genres=related["genres"][video_model.id],
+            cast_members=related["cast_members"][video_model.id],
+        )
+        for video_model in video_models
+    ]
+
+
+class VideoModelMapper:
+    MEDIA_FIELDS = ("banner", "thumbnail", "thumbnail_half", "trailer", "video")
+
+    @staticmethod
+    def to_entity(
+        model: VideoORM,
+        categories: set[UUID],
+        genres: set[UUID],
+        cast_members: set[UUID],
+    ) -> Video:
+        return Video(
+            id=model.id,
+            title=model.title,
+            description=model.description,
+            launch_year=model.launch_year,
+            opened=model.opened,
+            published=model.published,
+            duration=model.duration,
+            rating=Rating(model.rating),
+            categories=categories,
+            genres=genres,
+            cast_members=cast_members,
+            banner=VideoModelMapper.to_image_media(model.banner),
+            thumbnail=VideoModelMapper.to_image_media(model.thumbnail),
+            thumbnail_half=VideoModelMapper.to_image_media(model.thumbnail_half),
+            trailer=VideoModelMapper.to_audio_video_media(
+                model.trailer, MediaType.TRAILER
+            ),
+            video=VideoModelMapper.to_audio_video_media(model.video, MediaType.VIDEO),
+        )
+
+    @staticmethod
+    def to_image_media(model: ImageMedia | None) -> ImageMediaEntity | None:
+        if model is None:
+            return None
+
+        return ImageMediaEntity(name=model.name, raw_location=model.raw_location)
+
+    @staticmethod
+    def to_audio_video_media(
+        model: AudioVideoMedia | None, media_type: MediaType
+    ) -> AudioVideoMediaEntity | None:
+        if model is None:
+            return None
+
+        return AudioVideoMediaEntity(
+            name=model.name,
+            raw_location=model.raw_location,
+            encoded_location=model.encoded_location,
+            status=MediaStatus(model.status),
+            media_type=media_type,
+            checksum=model.checksum,
+        )
+
+
+def video_search_document(video: Video) -> SearchDocument:
+    return SearchDocument(
+        entity_type=EntityType.VIDEO,
+        entity_id=video.id,
+        title=video.title,
+        body=video.description,
+    )
+
+
+# Cache read-through de get_by_id compartilhado pelo processo
+video_cache = repository_cache("video")
+
+
+def cached_video_repository() -> VideoRepository:
+    return CachedRepository(DjangoORMVideoRepository(), video_cache)
@@ -1,6 +1,9 @@
 from rest_framework import serializers
 
+from src.core.video.domain.value_objects import MediaStatus, Rating
 from src.core._shared.infra.django.serializers import (
+    ListRequestSerializer,
+    order_by_field,
     ListResponseSerializer,
     ListOutputMetaSerializer,
 )
@@ -22,13 +25,41 @@ class ListVideoOutputSerializer(ListResponseSerializer):
         return VideoOutputSerializer()
 
 
+class ListVideoRequestSerializer(ListRequestSerializer):
+    ORDER_BY_FIELDS = ("title", "launch_year")
+
+    order_by = order_by_field(ORDER_BY_FIELDS, default="title")
+    # Parâmetros repetíveis: ?genres_id=<a>&genres_id=<b>
+    categories_id = serializers.ListField(child=serializers.UUIDField(), required=False)
+    genres_id = serializers.ListField(child=serializers.UUIDField(), required=False)
+    cast_members_id = serializers.ListField(
+        child=serializers.UUIDField(), required=False
+    )
+    rating = serializers.ListField(
+        child=serializers.ChoiceField(choices=[rating.name for rating in Rating]),
+        required=False,
+    )
+    published = serializers.BooleanField(default=None, allow_null=True)
+    year_launched_min = serializers.IntegerField(required=False)
+    year_launched_max = serializers.IntegerField(required=False)
+    media_status = serializers.ChoiceField(
+        choices=[status.name for status in MediaStatus], required=False
+    )
+
+
+class ExportVideoSerializer(VideoOutputSerializer):
+    categories = serializers.ListField(child=serializers.UUIDField())
+    genres = serializers.ListField(child=serializers.UUIDField())
+    cast_members = serializers.ListField(child=serializers.UUIDField())
+
+
 class CreateVideoRequestSerializer(serializers.Serializer):
     title = serializers.CharField(max_length=255)
     description = serializers.CharField()
     year_launched = serializers.IntegerField()
     opened = serializers.BooleanField(default=False)
     duration = serializers.DecimalField(max_digits=10, decimal_places=2)
-    rating = serializers.CharField(max_length=10)
+    rating = serializers.ChoiceField(choices=[rating.name for rating in Rating])
     categories_id = serializers.ListField(child=serializers.UUIDField())
     genres_id = serializers.ListField(child=serializers.UUIDField())
     cast_members_id = serializers.ListField(child=serializers.UUIDField())
@@ -38,6 +69,42 @@ class CreateVideoResponseSerializer(serializers.Serializer):
     id = serializers.UUIDField()
 
 
+class BulkCreateVideoRequestSerializer(serializers.Serializer):
+    # Comporta a importação de um catálogo inteiro; o repositório grava em lotes
+    # de BULK_BATCH_SIZE
+    MAX_VIDEOS = 10_000
+
+    # Cada item é validado individualmente para permitir resultado por item
+    videos = serializers.ListField(
+        child=serializers.DictField(), allow_empty=False, max_length=MAX_VIDEOS
+    )
+
+
+class BulkCreateVideoItemResponseSerializer(serializers.Serializer):
+    id = serializers.UUIDField(allow_null=True)
+    # Erros no formato do DRF: {campo: [mensagens]}, ou non_field_errors para
+    # erros que não pertencem a um campo
+    error = serializers.JSONField(allow_null=True)
+
+
+class BulkCreateVideoResponseSerializer(serializers.Serializer):
+    data = BulkCreateVideoItemResponseSerializer(many=True)
+
+
+class InitiateUploadSessionRequestSerializer(serializers.Serializer):
+    file_name = serializers.CharField(max_length=255)
+    content_type = serializers.CharField(max_length=255, required=False, default="")
+
+
+class InitiateUploadSessionResponseSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+
+
+class UploadSessionRequestSerializer(serializers.Serializer):
+    video_id = serializers.UUIDField()
+    session_id = serializers.UUIDField()
+
+
 class UpdateVideoRequestSerializer(serializers.Serializer):
     title = serializers.CharField(max_length=255, required=True)
     description = serializers.CharField(required=True)
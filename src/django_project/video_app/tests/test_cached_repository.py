@@ -0,0 +1,141 @@
+from decimal import Decimal
+
+import pytest
+
+from src.core.video.domain.value_objects import Rating
+from src.core.video.domain.video import Video
+from src.core._shared.infra.django.cache import repository_cache
+from src.django_project.category_app.models import Category as CategoryORM
+from src.django_project.category_app.repository import (
+    DjangoORMCategoryRepository,
+    cached_category_repository,
+    category_cache,
+)
+from src.django_project.genre_app.models import Genre as GenreORM
+from src.django_project.genre_app.repository import (
+    cached_genre_repository,
+    genre_cache,
+)
+from src.django_project.video_app.models import Video as VideoORM
+from src.django_project.video_app.repository import (
+    DjangoORMVideoRepository,
+    cached_video_repository,
+    video_cache,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    category_cache.clear()
+    genre_cache.clear()
+    video_cache.clear()
+
+
+@pytest.fixture
+def category() -> CategoryORM:
+    return CategoryORM.objects.create(name="Action", description="Action movies")
+
+
+@pytest.fixture
+def video(category: CategoryORM) -> Video:
+    video = Video(
+        title="Video",
+        description="Video description",
+        launch_year=2022,
+        duration=Decimal("120.50"),
+        rating=Rating.AGE_12,
+        opened=True,
+        categories={category.id},
+        genres=set(),
+        cast_members=set(),
+    )
+    DjangoORMVideoRepository().save(video)
+    return video
+
+
+class TestWarmReads:
+    def test_warm_video_read_runs_no_queries(
+        self, video: Video, django_assert_num_queries
+    ):
+        cached_video_repository().get_by_id(video.id)
+
+        with django_assert_num_queries(0):
+            cached = cached_video_repository().get_by_id(video.id)
+
+        assert cached.title == "Video"
+        assert cached.categories == video.categories
+        assert video_cache.metrics.hits == 1
+
+    def test_warm_genre_read_runs_no_queries(
+        self, category: CategoryORM, django_assert_num_queries
+    ):
+        genre = GenreORM.objects.create(name="Adventure")
+        genre.categories.set([category])
+        cached_genre_repository().get_by_id(genre.id)
+
+        with django_assert_num_queries(0):
+            cached = cached_genre_repository().get_by_id(genre.id)
+
+        assert cached.categories == {category.id}
+
+
+class TestInvalidation:
+    def test_update_through_repository_invalidates(self, category: CategoryORM):
+        repository = cached_category_repository()
+        entity = repository.get_by_id(category.id)
+        entity.update_category(name="Drama", description="Drama movies")
+
+        repository.update(entity)
+
+        assert cached_category_repository().get_by_id(category.id).name == "Drama"
+
+    def test_orm_writes_outside_repository_invalidate(self, category: CategoryORM):
+        cached_category_repository().get_by_id(category.id)
+
+        category.name = "Drama"
+        category.save()
+
+        assert cached_category_repository().get_by_id(category.id).name == "Drama"
+
+    def test_m2m_changes_invalidate_video(self, video: Video, category: CategoryORM):
+        other = CategoryORM.objects.create(name="Drama", description="Drama")
+        cached_video_repository().get_by_id(video.id)
+
+        VideoORM.objects.get(pk=video.id).categories.add(other)
+
+        assert cached_video_repository().get_by_id(video.id).categories == {
+            category.id,
+            other.id,
+        }
+
+    def test_delete_invalidates(self, category: CategoryORM):
+        cached_category_repository().get_by_id(category.id)
+
+        DjangoORMCategoryRepository().delete(category.id)
+
+        assert cached_category_repository().get_by_id(category.id) is None
+
+    def test_deleting_related_category_invalidates_genre_and_video(
+        self, video: Video, category: CategoryORM
+    ):
+        genre = GenreORM.objects.create(name="Adventure")
+        genre.categories.set([category])
+        cached_genre_repository().get_by_id(genre.id)
+        cached_video_repository().get_by_id(video.id)
+
+        # Cascade no through: não envia m2m_changed
+        category.delete()
+
+        assert cached_genre_repository().get_by_id(genre.id).categories == set()
+        assert cached_video_repository().get_by_id(video.id).categories == set()
+
+
+class TestRepositoryCache:
+    def test_process_local_shared_cache_does_not_outlive_local_ttl(self, settings):
+        settings.REPOSITORY_CACHE = {"LOCAL_TTL": 5, "SHARED_TTL": 300}
+
+        cache = repository_cache("test")
+
+        assert cache.backend.shared.ttl == 5
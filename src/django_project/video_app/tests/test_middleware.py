@@ -0,0 +1,30 @@
+from src.core._shared.infra.storage.async_in_memory_storage import (
+    AsyncInMemoryStorage,
+)
+from src.core._shared.infra.storage.async_local_storage import AsyncLocalStorage
+from src.core._shared.infra.storage.local_storage import LocalStorage
+from src.django_project.video_app.middleware import build_storage_services
+
+
+class TestBuildStorageServices:
+    def test_builds_configured_backends_with_shared_options(self, settings, tmp_path):
+        settings.MEDIA_STORAGE = {
+            "BACKEND": "src.core._shared.infra.storage.local_storage.LocalStorage",
+            "ASYNC_BACKEND": (
+                "src.core._shared.infra.storage.async_local_storage."
+                "AsyncLocalStorage"
+            ),
+            "OPTIONS": {"bucket": str(tmp_path)},
+        }
+
+        storage_service, async_storage_service = build_storage_services()
+
+        assert isinstance(storage_service, LocalStorage)
+        assert isinstance(async_storage_service, AsyncLocalStorage)
+        assert storage_service.bucket == async_storage_service.bucket == tmp_path
+
+    def test_async_in_memory_storage_wraps_the_sync_storage(self):
+        storage_service, async_storage_service = build_storage_services()
+
+        assert isinstance(async_storage_service, AsyncInMemoryStorage)
+        assert async_storage_service.storage is storage_service
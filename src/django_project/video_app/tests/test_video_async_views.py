@@ -0,0 +1,133 @@
+import hashlib
+import uuid
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import AsyncClient
+from django.urls import reverse
+from rest_framework import status
+
+from src.django_project.cast_member_app.models import CastMember
+from src.django_project.category_app.models import Category
+from src.django_project.change_feed_app.models import Change
+from src.django_project.genre_app.models import Genre
+from src.django_project.outbox_app.models import OutboxMessage
+from src.django_project.video_app.models import AudioVideoMedia, Video
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def related_ids() -> dict:
+    return {
+        "categories_id": [str(Category.objects.create(name="Action").id)],
+        "genres_id": [str(Genre.objects.create(name="Adventure").id)],
+        "cast_members_id": [
+            str(CastMember.objects.create(name="John Doe", type="ACTOR").id)
+        ],
+    }
+
+
+def create_video(title: str, rating: str, related_ids: dict):
+    return async_to_sync(AsyncClient().post)(
+        reverse("async-video-list"),
+        {
+            "title": title,
+            "description": f"{title} description",
+            "year_launched": 2022,
+            "opened": True,
+            "duration": "120.5",
+            "rating": rating,
+            **related_ids,
+        },
+        content_type="application/json",
+    )
+
+
+class TestCreateAPI:
+    def test_creates_video_with_relationships(self, related_ids):
+        response = create_video("Sample Video", "AGE_12", related_ids)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        video = Video.objects.get(id=response.json()["id"])
+        assert [str(id) for id in video.genres.values_list("id", flat=True)] == (
+            related_ids["genres_id"]
+        )
+        # Escrita síncrona: feed de alterações gravado na mesma transação
+        assert Change.objects.filter(entity_id=video.id).exists()
+
+    def test_when_related_entities_do_not_exist_then_return_400(self, related_ids):
+        response = create_video(
+            "Sample Video", "AGE_12", {**related_ids, "genres_id": [str(uuid.uuid4())]}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Invalid genres" in response.json()["error"]
+        assert not Video.objects.exists()
+
+
+class TestListAPI:
+    def test_filters_by_genre_and_rating(self, related_ids, django_assert_num_queries):
+        for title, rating in [
+            ("Bravo", "AGE_12"),
+            ("Alpha", "AGE_12"),
+            ("Charlie", "L"),
+        ]:
+            create_video(title, rating, related_ids)
+
+        # Página + COUNT + 1 consulta por relacionamento M2M, como na rota síncrona
+        with django_assert_num_queries(5):
+            response = async_to_sync(AsyncClient().get)(
+                reverse("async-video-list"),
+                {"genres_id": related_ids["genres_id"], "rating": "AGE_12"},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [video["title"] for video in response.json()["data"]] == [
+            "Alpha",
+            "Bravo",
+        ]
+
+    def test_invalid_filter_returns_400(self):
+        response = async_to_sync(AsyncClient().get)(
+            reverse("async-video-list"), {"media_status": "DONE"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestUploadMediaAPI:
+    def test_uploads_file_and_records_integration_event(self, related_ids):
+        video_id = create_video("Sample Video", "AGE_12", related_ids).json()["id"]
+
+        response = async_to_sync(AsyncClient().post)(
+            reverse("async-video-upload-media", kwargs={"pk": video_id}),
+            {"file": SimpleUploadedFile("video.mp4", b"video content", "video/mp4")},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        checksum = hashlib.sha256(b"video content").hexdigest()
+        media = AudioVideoMedia.objects.get()
+        assert media.raw_location == f"blobs/sha256/{checksum[:2]}/{checksum}"
+        assert media.checksum == checksum
+        message = OutboxMessage.objects.get()
+        assert message.payload == {
+            "resource_id": f"{video_id}.VIDEO",
+            "file_path": media.raw_location,
+        }
+
+    def test_when_video_does_not_exist_then_return_404(self):
+        response = async_to_sync(AsyncClient().post)(
+            reverse("async-video-upload-media", kwargs={"pk": uuid.uuid4()}),
+            {"file": SimpleUploadedFile("video.mp4", b"video content")},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_without_file_returns_400(self):
+        response = async_to_sync(AsyncClient().post)(
+            reverse("async-video-upload-media", kwargs={"pk": uuid.uuid4()}), {}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,311 @@
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from django.db import connection
+
+from src.core._shared.domain.pagination import PageQuery
+from src.core._shared.infra.storage.in_memory_storage import InMemoryStorage
+from src.core.video.domain.value_objects import (
+    AudioVideoMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_filter import VideoFilter
+from src.django_project.cast_member_app.models import CastMember
+from src.django_project.category_app.models import Category
+from src.django_project.genre_app.models import Genre
+from src.django_project.video_app.models import (
+    AudioVideoMedia as AudioVideoMediaORM,
+    MediaBlob,
+    Video as VideoORM,
+)
+from src.django_project.video_app.repository import (
+    DjangoORMMediaBlobRepository,
+    DjangoORMVideoRepository,
+    filter_videos,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def category() -> Category:
+    return Category.objects.create(name="Action", description="Action movies")
+
+
+@pytest.fixture
+def genre() -> Genre:
+    return Genre.objects.create(name="Adventure")
+
+
+@pytest.fixture
+def cast_member() -> CastMember:
+    return CastMember.objects.create(name="John Doe", type="ACTOR")
+
+
+def make_video(title: str, category, genre, cast_member) -> Video:
+    return Video(
+        title=title,
+        description=f"{title} description",
+        launch_year=2022,
+        duration=Decimal("120.50"),
+        rating=Rating.AGE_12,
+        opened=True,
+        categories={category.id},
+        genres={genre.id},
+        cast_members={cast_member.id},
+    )
+
+
+class TestList:
+    def test_query_count_does_not_grow_with_number_of_videos(
+        self, category, genre, cast_member, django_assert_num_queries
+    ):
+        repository = DjangoORMVideoRepository()
+        for index in range(10):
+            video = make_video(f"Video {index}", category, genre, cast_member)
+            repository.save(video)
+            video.update_video_media(
+                AudioVideoMedia(
+                    name="video.mp4",
+                    raw_location=f"videos/{video.id}/video.mp4",
+                    encoded_location="",
+                    status=MediaStatus.PENDING,
+                    media_type=MediaType.VIDEO,
+                )
+            )
+            repository.update(video)
+
+        with django_assert_num_queries(4):
+            videos = repository.list()
+
+        assert len(videos) == 10
+        for video in videos:
+            assert video.categories == {category.id}
+            assert video.genres == {genre.id}
+            assert video.cast_members == {cast_member.id}
+            assert video.rating == Rating.AGE_12
+            assert video.video.media_type == MediaType.VIDEO
+            assert video.video.status == MediaStatus.PENDING
+
+
+class TestGetById:
+    def test_returns_video_with_relationships(
+        self, category, genre, cast_member, django_assert_num_queries
+    ):
+        repository = DjangoORMVideoRepository()
+        video = make_video("Video", category, genre, cast_member)
+        repository.save(video)
+
+        with django_assert_num_queries(4):
+            saved_video = repository.get_by_id(video.id)
+
+        assert saved_video.title == "Video"
+        assert saved_video.categories == {category.id}
+        assert saved_video.genres == {genre.id}
+        assert saved_video.cast_members == {cast_member.id}
+        assert saved_video.video is None
+        assert saved_video.trailer is None
+        assert saved_video.banner is None
+
+
+class TestBulkSave:
+    def test_inserts_videos_and_relationships_in_batches(
+        self, category, genre, cast_member, django_assert_max_num_queries
+    ):
+        repository = DjangoORMVideoRepository()
+        videos = [
+            make_video(f"Video {index}", category, genre, cast_member)
+            for index in range(50)
+        ]
+
+        # vídeos + 3 tabelas M2M + feed de alterações + 3 do índice de busca
+        # (+ SAVEPOINT/RELEASE)
+        with django_assert_max_num_queries(10):
+            repository.bulk_save(videos)
+
+        saved_videos = repository.list()
+        assert {video.id for video in saved_videos} == {video.id for video in videos}
+        assert all(video.genres == {genre.id} for video in saved_videos)
+
+
+class TestPaginate:
+    @pytest.fixture
+    def repository(self, category, genre, cast_member) -> DjangoORMVideoRepository:
+        repository = DjangoORMVideoRepository()
+        other_genre = Genre.objects.create(name="Drama")
+        for title, genres, rating, published in [
+            ("Alpha", {genre.id}, Rating.AGE_12, True),
+            ("Bravo", {genre.id}, Rating.AGE_18, True),
+            ("Charlie", {genre.id}, Rating.AGE_12, False),
+            ("Delta", {other_genre.id}, Rating.AGE_12, True),
+            ("Echo", {genre.id, other_genre.id}, Rating.AGE_12, True),
+        ]:
+            video = make_video(title, category, genre, cast_member)
+            video.genres = genres
+            video.rating = rating
+            video.published = published
+            repository.save(video)
+        return repository
+
+    def test_filters_published_videos_of_rating_in_genre(
+        self, repository, genre, django_assert_num_queries
+    ):
+        video_filter = VideoFilter(
+            genres=frozenset({genre.id}),
+            ratings=frozenset({Rating.AGE_12}),
+            published=True,
+        )
+
+        # Página + COUNT + 1 consulta por relacionamento M2M
+        with django_assert_num_queries(5):
+            page = repository.paginate(
+                PageQuery(order_by="title", limit=10), video_filter
+            )
+
+        # Echo pertence a dois gêneros e aparece uma única vez
+        assert [video.title for video in page.items] == ["Alpha", "Echo"]
+        assert page.total == 2
+        assert page.items[1].genres == {
+            genre.id,
+            Genre.objects.get(name="Drama").id,
+        }
+
+    def test_filters_by_launch_year_and_media_status(self, repository):
+        video = next(v for v in repository.list() if v.title == "Alpha")
+        video.update_video_media(
+            AudioVideoMedia(
+                name="video.mp4",
+                raw_location="videos/video.mp4",
+                encoded_location="videos/video.m3u8",
+                status=MediaStatus.COMPLETED,
+                media_type=MediaType.VIDEO,
+            )
+        )
+        repository.update(video)
+
+        page = repository.paginate(
+            PageQuery(order_by="title", limit=10),
+            VideoFilter(
+                launch_year_min=2020,
+                launch_year_max=2022,
+                media_status=MediaStatus.COMPLETED,
+            ),
+        )
+        assert [video.title for video in page.items] == ["Alpha"]
+
+        page = repository.paginate(
+            PageQuery(order_by="title", limit=10), VideoFilter(launch_year_min=2023)
+        )
+        assert page.items == []
+
+    @pytest.mark.skipif(
+        connection.vendor != "sqlite", reason="plano de execução do SQLite"
+    )
+    def test_membership_filter_uses_through_table_index(self, genre):
+        queryset = filter_videos(
+            VideoORM.objects.all(), VideoFilter(genres=frozenset({genre.id}))
+        )
+
+        assert "video_genres_genre_id_video_idx" in queryset.explain()
+
+
+class TestFindEncodedMedia:
+    def test_returns_completed_media_with_same_checksum(
+        self, category, genre, cast_member
+    ):
+        repository = DjangoORMVideoRepository()
+        video = make_video("Video", category, genre, cast_member)
+        repository.save(video)
+        video.update_video_media(
+            AudioVideoMedia(
+                name="video.mp4",
+                raw_location="blobs/sha256/ab/abc",
+                encoded_location="",
+                status=MediaStatus.PENDING,
+                media_type=MediaType.VIDEO,
+                checksum="abc",
+            )
+        )
+        repository.update(video)
+        assert repository.find_encoded_media("abc") is None
+
+        video.process(MediaStatus.COMPLETED, "encoded/video.mp4")
+        repository.update(video)
+
+        encoded_media = repository.find_encoded_media("abc")
+        assert encoded_media.encoded_location == "encoded/video.mp4"
+        assert encoded_media.checksum == "abc"
+        assert repository.find_encoded_media("other") is None
+
+
+class TestDelete:
+    def attach_media(self, repository, video: Video, checksum: str) -> None:
+        video.update_video_media(
+            AudioVideoMedia(
+                name="video.mp4",
+                raw_location=f"blobs/sha256/{checksum[:2]}/{checksum}",
+                encoded_location="",
+                status=MediaStatus.PENDING,
+                media_type=MediaType.VIDEO,
+                checksum=checksum,
+            )
+        )
+        repository.update(video)
+        DjangoORMMediaBlobRepository().acquire(
+            checksum, f"blobs/sha256/{checksum[:2]}/{checksum}", stored=True
+        )
+
+    def test_releases_media_blobs_and_deletes_orphans_after_commit(
+        self, category, genre, cast_member, django_capture_on_commit_callbacks
+    ):
+        storage = InMemoryStorage()
+        storage.store(Path("blobs/sha256/ab/abc"), b"video")
+        repository = DjangoORMVideoRepository(storage_service=storage)
+        first = make_video("First", category, genre, cast_member)
+        second = make_video("Second", category, genre, cast_member)
+        for video in (first, second):
+            repository.save(video)
+            self.attach_media(repository, video, "abc")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            repository.delete(first.id)
+
+        # Ainda referenciado pelo segundo vídeo
+        assert MediaBlob.objects.get(pk="abc").ref_count == 1
+        assert storage.exists(Path("blobs/sha256/ab/abc"))
+        assert AudioVideoMediaORM.objects.count() == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            repository.delete(second.id)
+
+        assert MediaBlob.objects.get(pk="abc").ref_count == 0
+        assert not AudioVideoMediaORM.objects.exists()
+        assert not storage.exists(Path("blobs/sha256/ab/abc"))
+
+
+class TestMediaBlobRepository:
+    def test_release_returns_location_only_for_last_reference(self):
+        repository = DjangoORMMediaBlobRepository()
+        repository.acquire("abc", "blobs/sha256/ab/abc", stored=True)
+        repository.acquire("abc", "blobs/sha256/ab/abc", stored=False)
+
+        assert repository.release("abc") is None
+        assert MediaBlob.objects.get(pk="abc").ref_count == 1
+        assert repository.release("abc") == "blobs/sha256/ab/abc"
+        assert MediaBlob.objects.get(pk="abc").ref_count == 0
+        assert repository.release("abc") is None
+
+    def test_acquire_does_not_revive_released_blob_it_did_not_store(self):
+        repository = DjangoORMMediaBlobRepository()
+        repository.acquire("abc", "blobs/sha256/ab/abc", stored=True)
+        repository.release("abc")
+
+        assert repository.acquire("abc", "blobs/sha256/ab/abc", stored=False) is False
+        assert MediaBlob.objects.get(pk="abc").ref_count == 0
+
+        assert repository.acquire("abc", "blobs/sha256/ab/abc", stored=True) is True
+        assert MediaBlob.objects.get(pk="abc").ref_count == 1
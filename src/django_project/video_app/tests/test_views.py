@@ -1,16 +1,24 @@
+import hashlib
+import json
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
 pytestmark = pytest.mark.django_db
 
+from src.core._shared.application.use_cases.list_use_case import encode_cursor
+from src.core._shared.domain.pagination import SortDirection
 from src.django_project.category_app.models import Category
 from src.django_project.cast_member_app.models import CastMember
 from src.django_project.genre_app.models import Genre
+from src.django_project.outbox_app.models import OutboxMessage
+from src.django_project.video_app.models import AudioVideoMedia
+from src.django_project.video_app.serializers import BulkCreateVideoRequestSerializer
 
 
 class TestCreateVideoWithoutMedia:
@@ -233,3 +241,380 @@ class TestCreateVideoWithoutMedia:
         # Assert
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "error" in response.data
+
+
+class TestBulkCreateVideoWithoutMedia:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def category(self):
+        return Category.objects.create(name="Action", description="Action movies")
+
+    def make_item(self, title: str, category_id) -> dict:
+        return {
+            "title": title,
+            "description": "A test video description",
+            "year_launched": 2022,
+            "opened": True,
+            "duration": "120.5",
+            "rating": "AGE_12",
+            "categories_id": [str(category_id)],
+            "genres_id": [],
+            "cast_members_id": [],
+        }
+
+    def test_when_all_items_are_valid_then_return_201(
+        self, api_client: APIClient, category: Category
+    ):
+        url = reverse("video-bulk-create")
+        response = api_client.post(
+            url,
+            data={
+                "videos": [
+                    self.make_item("Video 1", category.id),
+                    self.make_item("Video 2", category.id),
+                ]
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data["data"]) == 2
+        assert all(item["error"] is None for item in response.data["data"])
+
+    def test_when_some_items_are_invalid_then_return_result_per_item(
+        self, api_client: APIClient, category: Category
+    ):
+        url = reverse("video-bulk-create")
+        response = api_client.post(
+            url,
+            data={
+                "videos": [
+                    self.make_item("Video 1", category.id),
+                    self.make_item("Video 2", uuid4()),
+                    {**self.make_item("Video 3", category.id), "rating": "INVALID"},
+                ]
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        first, second, third = response.data["data"]
+        assert first["id"] is not None and first["error"] is None
+        assert second["id"] is None
+        assert second["error"] == {"non_field_errors": ["Invalid categories"]}
+        assert third["id"] is None and list(third["error"]) == ["rating"]
+
+    def test_when_batch_is_too_large_then_return_400(
+        self, api_client: APIClient, category: Category
+    ):
+        item = self.make_item("Video", category.id)
+        url = reverse("video-bulk-create")
+        response = api_client.post(
+            url,
+            data={
+                "videos": [item] * (BulkCreateVideoRequestSerializer.MAX_VIDEOS + 1)
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "videos" in response.data
+
+
+class TestUploadSession:
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    @pytest.fixture
+    def video_id(self, api_client: APIClient):
+        category = Category.objects.create(name="Action", description="Action")
+        response = api_client.post(
+            reverse("video-list"),
+            data={
+                "title": "Sample Video",
+                "description": "A test video description",
+                "year_launched": 2022,
+                "opened": True,
+                "duration": "120.5",
+                "rating": "AGE_12",
+                "categories_id": [str(category.id)],
+                "genres_id": [],
+                "cast_members_id": [],
+            },
+            format="json",
+        )
+        return response.data["id"]
+
+    def upload_part(self, api_client, video_id, session_id, part_number, content):
+        return api_client.put(
+            f"/api/videos/{video_id}/upload-sessions/{session_id}/parts/{part_number}/",
+            {"file": SimpleUploadedFile("part", content)},
+            format="multipart",
+        )
+
+    def test_upload_parts_out_of_order_and_complete(
+        self, api_client: APIClient, video_id
+    ):
+        response = api_client.post(
+            f"/api/videos/{video_id}/upload-sessions/",
+            {"file_name": "video.mp4", "content_type": "video/mp4"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        session_id = response.data["id"]
+
+        for part_number, content in [(2, b"content"), (1, b"video ")]:
+            response = self.upload_part(
+                api_client, video_id, session_id, part_number, content
+            )
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        response = api_client.post(
+            f"/api/videos/{video_id}/upload-sessions/{session_id}/complete/"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        checksum = hashlib.sha256(b"video content").hexdigest()
+        blob_location = f"blobs/sha256/{checksum[:2]}/{checksum}"
+        assert AudioVideoMedia.objects.get().raw_location == blob_location
+        message = OutboxMessage.objects.get()
+        assert message.event_type == "AudioVideoMediaUpdatedIntegrationEvent"
+        assert message.payload == {
+            "resource_id": f"{video_id}.VIDEO",
+            "file_path": blob_location,
+        }
+
+    def test_complete_with_missing_parts_returns_409(
+        self, api_client: APIClient, video_id
+    ):
+        response = api_client.post(
+            f"/api/videos/{video_id}/upload-sessions/",
+            {"file_name": "video.mp4"},
+            format="json",
+        )
+        session_id = response.data["id"]
+        self.upload_part(api_client, video_id, session_id, 2, b"content")
+
+        response = api_client.post(
+            f"/api/videos/{video_id}/upload-sessions/{session_id}/complete/"
+        )
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert not OutboxMessage.objects.exists()
+
+    def test_abort_upload_session(self, api_client: APIClient, video_id):
+        response = api_client.post(
+            f"/api/videos/{video_id}/upload-sessions/",
+            {"file_name": "video.mp4"},
+            format="json",
+        )
+        session_id = response.data["id"]
+
+        response = api_client.delete(
+            f"/api/videos/{video_id}/upload-sessions/{session_id}/"
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        response = api_client.post(
+            f"/api/videos/{video_id}/upload-sessions/{session_id}/complete/"
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestExportVideos:
+    def test_streams_videos_with_related_ids(self):
+        category = Category.objects.create(name="Action")
+        genre = Genre.objects.create(name="Adventure")
+        cast_member = CastMember.objects.create(name="John Doe", type="ACTOR")
+        response = APIClient().post(
+            reverse("video-list"),
+            data={
+                "title": "Sample Video",
+                "description": "A test video description",
+                "year_launched": 2022,
+                "opened": True,
+                "duration": "120.5",
+                "rating": "AGE_12",
+                "categories_id": [str(category.id)],
+                "genres_id": [str(genre.id)],
+                "cast_members_id": [str(cast_member.id)],
+            },
+            format="json",
+        )
+        video_id = response.data["id"]
+
+        response = APIClient().get(reverse("video-export"))
+
+        assert response.status_code == status.HTTP_200_OK
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert len(lines) == 1
+        exported = json.loads(lines[0])
+        assert exported["id"] == str(video_id)
+        assert exported["title"] == "Sample Video"
+        assert exported["duration"] == "120.50"
+        assert exported["categories"] == [str(category.id)]
+        assert exported["genres"] == [str(genre.id)]
+        assert exported["cast_members"] == [str(cast_member.id)]
+
+
+class TestListVideos:
+    @pytest.fixture
+    def genre(self):
+        return Genre.objects.create(name="Adventure")
+
+    @pytest.fixture
+    def videos(self, genre):
+        category = Category.objects.create(name="Action")
+        cast_member = CastMember.objects.create(name="John Doe", type="ACTOR")
+        for title, rating in [
+            ("Bravo", "AGE_12"),
+            ("Alpha", "AGE_12"),
+            ("Charlie", "AGE_18"),
+        ]:
+            APIClient().post(
+                reverse("video-list"),
+                data={
+                    "title": title,
+                    "description": f"{title} description",
+                    "year_launched": 2022,
+                    "opened": True,
+                    "duration": "120.5",
+                    "rating": rating,
+                    "categories_id": [str(category.id)],
+                    "genres_id": [str(genre.id)],
+                    "cast_members_id": [str(cast_member.id)],
+                },
+                format="json",
+            )
+
+    def test_filters_by_genre_and_rating(self, videos, genre):
+        response = APIClient().get(
+            reverse("video-list"),
+            {"genres_id": [str(genre.id)], "rating": ["AGE_12"], "per_page": 10},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [video["title"] for video in response.data["data"]] == [
+            "Alpha",
+            "Bravo",
+        ]
+        assert response.data["meta"]["total"] == 2
+
+    def test_filters_by_published(self, videos):
+        response = APIClient().get(reverse("video-list"), {"published": "true"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"] == []
+
+    def test_unknown_genre_returns_empty_page(self, videos):
+        response = APIClient().get(reverse("video-list"), {"genres_id": str(uuid4())})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["meta"]["total"] == 0
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"rating": "AGE_99"},
+            {"genres_id": "not-a-uuid"},
+            {"media_status": "DONE"},
+            {"order_by": "description"},
+            {"cursor": "invalid"},
+            {
+                "order_by": "launch_year",
+                "cursor": encode_cursor(
+                    "launch_year", SortDirection.ASC, "abc", uuid4()
+                ),
+            },
+            {"per_page": 0},
+            {"current_page": "x"},
+        ],
+    )
+    def test_invalid_params_return_400(self, params):
+        response = APIClient().get(reverse("video-list"), params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestVideoMedia:
+    @pytest.fixture
+    def api_client(self):
+        # Mesmo client: o storage em memória do middleware é compartilhado
+        return APIClient()
+
+    @pytest.fixture
+    def video_id(self, api_client: APIClient):
+        category = Category.objects.create(name="Action")
+        response = api_client.post(
+            reverse("video-list"),
+            data={
+                "title": "Sample Video",
+                "description": "A test video description",
+                "year_launched": 2022,
+                "opened": True,
+                "duration": "120.5",
+                "rating": "AGE_12",
+                "categories_id": [str(category.id)],
+                "genres_id": [],
+                "cast_members_id": [],
+            },
+            format="json",
+        )
+        video_id = response.data["id"]
+        api_client.post(
+            f"/api/videos/{video_id}/upload-media/",
+            {"file": SimpleUploadedFile("video.mp4", b"video content", "video/mp4")},
+            format="multipart",
+        )
+        return video_id
+
+    def test_without_range_streams_whole_file(self, api_client: APIClient, video_id):
+        response = api_client.get(reverse("video-media", kwargs={"pk": video_id}))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content) == b"video content"
+        assert response["Content-Length"] == "13"
+        assert response["Accept-Ranges"] == "bytes"
+        assert response["Content-Type"] == "video/mp4"
+
+    def test_range_request_returns_partial_content(
+        self, api_client: APIClient, video_id
+    ):
+        response = api_client.get(
+            reverse("video-media", kwargs={"pk": video_id}), HTTP_RANGE="bytes=2-6"
+        )
+
+        assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert b"".join(response.streaming_content) == b"deo c"
+        assert response["Content-Length"] == "5"
+        assert response["Content-Range"] == "bytes 2-6/13"
+
+    def test_unsatisfiable_range_returns_416(self, api_client: APIClient, video_id):
+        response = api_client.get(
+            reverse("video-media", kwargs={"pk": video_id}), HTTP_RANGE="bytes=20-"
+        )
+
+        assert response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        assert response["Content-Range"] == "bytes */13"
+
+    def test_range_with_stale_if_range_returns_whole_file(
+        self, api_client: APIClient, video_id
+    ):
+        url = reverse("video-media", kwargs={"pk": video_id})
+        etag = api_client.get(url)["ETag"]
+
+        resumed = api_client.get(url, HTTP_RANGE="bytes=2-6", HTTP_IF_RANGE=etag)
+        stale = api_client.get(url, HTTP_RANGE="bytes=2-6", HTTP_IF_RANGE='"old"')
+
+        assert resumed.status_code == status.HTTP_206_PARTIAL_CONTENT
+        assert stale.status_code == status.HTTP_200_OK
+        assert b"".join(stale.streaming_content) == b"video content"
+
+    def test_video_without_media_returns_404(self, api_client: APIClient):
+        response = api_client.get(reverse("video-media", kwargs={"pk": uuid4()}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
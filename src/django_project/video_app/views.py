@@ -1,54 +1,125 @@
 from decimal import Decimal
 from uuid import UUID
 
+from django.db import transaction
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from rest_framework import viewsets
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
     HTTP_201_CREATED,
+    HTTP_204_NO_CONTENT,
+    HTTP_206_PARTIAL_CONTENT,
+    HTTP_207_MULTI_STATUS,
     HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
+    HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
     HTTP_200_OK,
 )
 from rest_framework.decorators import action
+from rest_framework.settings import api_settings
 
+from src.core.video.application.use_cases.abort_upload_session import (
+    AbortUploadSession,
+)
+from src.core.video.application.use_cases.bulk_create_video_without_media import (
+    BulkCreateVideoWithoutMedia,
+)
+from src.core.video.application.use_cases.complete_upload_session import (
+    CompleteUploadSession,
+)
 from src.core.video.application.use_cases.create_video_without_media import CreateVideoWithoutMedia
+from src.core.video.application.use_cases.get_video_media import GetVideoMedia
+from src.core.video.application.use_cases.initiate_upload_session import (
+    InitiateUploadSession,
+)
+from src.core.video.application.use_cases.list_video import (
+    ListVideo,
+    ListVideoRequest,
+)
+from src.core.video.application.use_cases.search_video import SearchVideo
+from src.core.video.application.use_cases.upload_part import UploadPart
 from src.core.video.application.use_cases.upload_video import UploadVideo
-from src.core.video.application.use_cases.exceptions import InvalidVideo, RelatedEntitiesNotFound, VideoNotFound
-from src.core.video.domain.value_objects import Rating
+from src.core.video.application.use_cases.exceptions import (
+    IncompleteUpload,
+    InvalidUploadPart,
+    InvalidVideo,
+    MediaBlobReleased,
+    MediaNotFound,
+    RelatedEntitiesNotFound,
+    UploadSessionNotFound,
+    VideoNotFound,
+)
+from src.core.video.domain.value_objects import MediaStatus, Rating
+from src.core.video.domain.video_filter import VideoFilter
+from src.core._shared.application.use_cases.exceptions import InvalidCursor
+from src.core._shared.infra.django.export import EXPORT_CHUNK_SIZE, ndjson_response
+from src.core._shared.infra.django.search import search_engine
+from src.core._shared.infra.django.views import SearchViewMixin
 from src.core._shared.infra.storage.abstract_storage import AbstractStorage
+from src.core._shared.infra.storage.byte_range import RangeNotSatisfiable
 from src.core._shared.events.message_bus import MessageBus
 from src.django_project.cast_member_app.repository import DjangoORMCastMemberRepository
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 from src.django_project.genre_app.repository import DjangoORMGenreRepository
-from src.django_project.video_app.repository import DjangoORMVideoRepository
+from src.django_project.video_app.repository import (
+    DjangoORMMediaBlobRepository,
+    DjangoORMUploadSessionRepository,
+    cached_video_repository,
+)
 from src.django_project.video_app.serializers import (
+    BulkCreateVideoRequestSerializer,
+    BulkCreateVideoResponseSerializer,
     CreateVideoRequestSerializer,
     CreateVideoResponseSerializer,
+    ExportVideoSerializer,
+    InitiateUploadSessionRequestSerializer,
+    InitiateUploadSessionResponseSerializer,
+    ListVideoOutputSerializer,
+    ListVideoRequestSerializer,
+    UploadSessionRequestSerializer,
 )
 
 
-class VideoViewSet(viewsets.ViewSet):
+class VideoViewSet(SearchViewMixin, viewsets.ViewSet):
+    def _get_search_use_case(self) -> SearchVideo:
+        return SearchVideo(
+            repository=cached_video_repository(), search_engine=search_engine()
+        )
+
+    def _get_response_serializer(self, output):
+        return ListVideoOutputSerializer(output)
+
+    def list(self, request: Request) -> Response:
+        serializer = ListVideoRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            output = ListVideo(repository=cached_video_repository()).execute(
+                to_list_request(serializer.validated_data)
+            )
+        except InvalidCursor as error:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"error": str(error)},
+            )
+
+        return Response(
+            status=HTTP_200_OK,
+            data=ListVideoOutputSerializer(output).data,
+        )
+
     def create(self, request: Request) -> Response:
         serializer = CreateVideoRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         # Convert serializer data to use case input
-        input_data = serializer.validated_data
-        use_case_input = CreateVideoWithoutMedia.Input(
-            title=input_data["title"],
-            description=input_data["description"],
-            launch_year=input_data["year_launched"],
-            opened=input_data["opened"],
-            duration=input_data["duration"],
-            rating=Rating[input_data["rating"]],
-            categories=set(input_data["categories_id"]),
-            genres=set(input_data["genres_id"]),
-            cast_members=set(input_data["cast_members_id"]),
-        )
+        use_case_input = to_create_input(serializer.validated_data)
 
         try:
             use_case = CreateVideoWithoutMedia(
-                video_repository=DjangoORMVideoRepository(),
+                video_repository=cached_video_repository(),
                 category_repository=DjangoORMCategoryRepository(),
                 genre_repository=DjangoORMGenreRepository(),
                 cast_member_repository=DjangoORMCastMemberRepository(),
@@ -66,6 +137,54 @@ class VideoViewSet(viewsets.ViewSet):
                 data={"error": str(e)},
             )
 
+    @action(detail=False, methods=["get"])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        return ndjson_response(
+            request,
+            cached_video_repository().iter_all(chunk_size=EXPORT_CHUNK_SIZE),
+            ExportVideoSerializer,
+            filename="videos.ndjson",
+        )
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        serializer = BulkCreateVideoRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        items = serializer.validated_data["videos"]
+        results = [None] * len(items)
+        use_case_inputs = []
+        positions = []
+        for position, item in enumerate(items):
+            item_serializer = CreateVideoRequestSerializer(data=item)
+            if not item_serializer.is_valid():
+                results[position] = {"id": None, "error": item_serializer.errors}
+                continue
+
+            use_case_inputs.append(
+                to_create_input(item_serializer.validated_data)
+            )
+            positions.append(position)
+
+        use_case = BulkCreateVideoWithoutMedia(
+            video_repository=cached_video_repository(),
+            category_repository=DjangoORMCategoryRepository(),
+            genre_repository=DjangoORMGenreRepository(),
+            cast_member_repository=DjangoORMCastMemberRepository(),
+        )
+        output = use_case.execute(
+            BulkCreateVideoWithoutMedia.Input(videos=use_case_inputs)
+        )
+        for position, result in zip(positions, output.results):
+            error = result.error and {api_settings.NON_FIELD_ERRORS_KEY: result.error}
+            results[position] = {"id": result.id, "error": error}
+
+        all_created = all(result["error"] is None for result in results)
+        return Response(
+            status=HTTP_201_CREATED if all_created else HTTP_207_MULTI_STATUS,
+            data=BulkCreateVideoResponseSerializer({"data": results}).data,
+        )
+
     @action(detail=True, methods=['post'], url_path='upload-media')
     def upload_media(self, request: Request, pk: str) -> Response:
         print(f"Debug: Iniciando upload para video ID: {pk}")
@@ -91,17 +210,18 @@ class VideoViewSet(viewsets.ViewSet):
 
         file = request.FILES['file']
         file_name = file.name
-        content = file.read()
         content_type = file.content_type
         
-        print(f"Debug: Arquivo recebido - Nome: {file_name}, Tipo: {content_type}, Tamanho: {len(content)}")
+        print(f"Debug: Arquivo recebido - Nome: {file_name}, Tipo: {content_type}, Tamanho: {file.size}")
 
         try:
             print(f"Debug: Criando use case UploadVideo")
             use_case = UploadVideo(
-                repository=DjangoORMVideoRepository(),
+                repository=cached_video_repository(),
                 storage_service=request.storage_service if hasattr(request, 'storage_service') else None,
                 message_bus=request.message_bus if hasattr(request, 'message_bus') else None,
+                blob_repository=DjangoORMMediaBlobRepository(),
+                unit_of_work=transaction.atomic,
             )
             
             print(f"Debug: Executando use case")
@@ -109,7 +229,8 @@ class VideoViewSet(viewsets.ViewSet):
                 UploadVideo.Input(
                     video_id=video_id,
                     file_name=file_name,
-                    content=content,
+                    # Repassa os blocos do arquivo, sem carregar o conteúdo inteiro
+                    content=file.chunks(),
                     content_type=content_type,
                 )
             )
@@ -125,6 +246,11 @@ class VideoViewSet(viewsets.ViewSet):
                 status=HTTP_400_BAD_REQUEST,
                 data={"error": str(e)},
             )
+        except MediaBlobReleased as e:
+            return Response(
+                status=HTTP_409_CONFLICT,
+                data={"error": str(e)},
+            )
         except Exception as e:
             print(f"Debug: Erro inesperado: {e}")
             import traceback
@@ -133,3 +259,233 @@ class VideoViewSet(viewsets.ViewSet):
                 status=HTTP_400_BAD_REQUEST,
                 data={"error": f"Upload failed: {str(e)}"},
             )
+
+    @action(detail=True, methods=["post"], url_path="upload-sessions")
+    def initiate_upload_session(self, request: Request, pk: str) -> Response:
+        try:
+            video_id = UUID(pk)
+        except ValueError:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"error": "Invalid video ID"},
+            )
+
+        serializer = InitiateUploadSessionRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        use_case = InitiateUploadSession(
+            video_repository=cached_video_repository(),
+            upload_session_repository=DjangoORMUploadSessionRepository(),
+        )
+        try:
+            output = use_case.execute(
+                InitiateUploadSession.Input(
+                    video_id=video_id,
+                    **serializer.validated_data,
+                )
+            )
+        except VideoNotFound:
+            return Response(
+                status=HTTP_404_NOT_FOUND,
+                data={"error": f"Video with id {pk} not found"},
+            )
+
+        return Response(
+            status=HTTP_201_CREATED,
+            data=InitiateUploadSessionResponseSerializer(output).data,
+        )
+
+    @action(
+        detail=True,
+        methods=["put"],
+        url_path=r"upload-sessions/(?P<session_id>[^/.]+)/parts/(?P<part_number>[0-9]{1,5})",
+    )
+    def upload_part(
+        self, request: Request, pk: str, session_id: str, part_number: str
+    ) -> Response:
+        serializer = UploadSessionRequestSerializer(
+            data={"video_id": pk, "session_id": session_id}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        if "file" not in request.FILES:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"error": "No file provided"},
+            )
+
+        use_case = UploadPart(
+            upload_session_repository=DjangoORMUploadSessionRepository(),
+            storage_service=request.storage_service,
+        )
+        try:
+            use_case.execute(
+                UploadPart.Input(
+                    **serializer.validated_data,
+                    part_number=int(part_number),
+                    content=request.FILES["file"].chunks(),
+                )
+            )
+        except UploadSessionNotFound:
+            return Response(
+                status=HTTP_404_NOT_FOUND,
+                data={"error": f"Upload session {session_id} not found"},
+            )
+        except InvalidUploadPart as error:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"error": str(error)},
+            )
+
+        return Response(status=HTTP_204_NO_CONTENT)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path=r"upload-sessions/(?P<session_id>[^/.]+)/complete",
+    )
+    def complete_upload_session(
+        self, request: Request, pk: str, session_id: str
+    ) -> Response:
+        serializer = UploadSessionRequestSerializer(
+            data={"video_id": pk, "session_id": session_id}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        use_case = CompleteUploadSession(
+            upload_session_repository=DjangoORMUploadSessionRepository(),
+            storage_service=request.storage_service,
+            upload_video=UploadVideo(
+                repository=cached_video_repository(),
+                storage_service=request.storage_service,
+                message_bus=request.message_bus,
+                blob_repository=DjangoORMMediaBlobRepository(),
+                unit_of_work=transaction.atomic,
+            ),
+        )
+        try:
+            use_case.execute(CompleteUploadSession.Input(**serializer.validated_data))
+        except (UploadSessionNotFound, VideoNotFound):
+            return Response(
+                status=HTTP_404_NOT_FOUND,
+                data={"error": f"Upload session {session_id} not found"},
+            )
+        except (IncompleteUpload, MediaBlobReleased) as error:
+            return Response(
+                status=HTTP_409_CONFLICT,
+                data={"error": str(error)},
+            )
+
+        return Response(
+            status=HTTP_200_OK,
+            data={"message": "Media uploaded successfully"},
+        )
+
+    @action(
+        detail=True,
+        methods=["delete"],
+        url_path=r"upload-sessions/(?P<session_id>[^/.]+)",
+    )
+    def abort_upload_session(
+        self, request: Request, pk: str, session_id: str
+    ) -> Response:
+        serializer = UploadSessionRequestSerializer(
+            data={"video_id": pk, "session_id": session_id}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        use_case = AbortUploadSession(
+            upload_session_repository=DjangoORMUploadSessionRepository(),
+            storage_service=request.storage_service,
+        )
+        try:
+            use_case.execute(AbortUploadSession.Input(**serializer.validated_data))
+        except UploadSessionNotFound:
+            return Response(
+                status=HTTP_404_NOT_FOUND,
+                data={"error": f"Upload session {session_id} not found"},
+            )
+
+        return Response(status=HTTP_204_NO_CONTENT)
+
+    @action(detail=True, methods=["get"], url_path="media")
+    def media(self, request: Request, pk: str) -> HttpResponse:
+        try:
+            video_id = UUID(pk)
+        except ValueError:
+            return Response(
+                status=HTTP_400_BAD_REQUEST,
+                data={"error": "Invalid video ID"},
+            )
+
+        use_case = GetVideoMedia(
+            repository=cached_video_repository(),
+            storage_service=request.storage_service,
+        )
+        try:
+            output = use_case.execute(
+                GetVideoMedia.Input(
+                    video_id=video_id,
+                    range=request.headers.get("Range"),
+                    if_range=request.headers.get("If-Range"),
+                )
+            )
+        except (VideoNotFound, MediaNotFound) as error:
+            return Response(status=HTTP_404_NOT_FOUND, data={"error": str(error)})
+        except RangeNotSatisfiable as error:
+            return HttpResponse(
+                status=HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{error.size}"},
+            )
+
+        # Streaming do intervalo pedido (sendfile no LocalStorage sob WSGI);
+        # o arquivo nunca é carregado inteiro
+        response = FileResponse(output.content, filename=output.name)
+        response["Accept-Ranges"] = "bytes"
+        response["ETag"] = output.etag
+        if output.byte_range is None:
+            response["Content-Length"] = output.size
+            return response
+
+        response.status_code = HTTP_206_PARTIAL_CONTENT
+        response["Content-Length"] = output.byte_range.length
+        response["Content-Range"] = (
+            f"bytes {output.byte_range.start}-{output.byte_range.end}/{output.size}"
+        )
+        return response
+
+
+def to_list_request(input_data: dict) -> ListVideoRequest:
+    media_status = input_data.get("media_status")
+    return ListVideoRequest(
+        order_by=input_data["order_by"],
+        current_page=input_data["current_page"],
+        cursor=input_data.get("cursor"),
+        per_page=input_data.get("per_page"),
+        filter=VideoFilter(
+            categories=frozenset(input_data.get("categories_id", [])),
+            genres=frozenset(input_data.get("genres_id", [])),
+            cast_members=frozenset(input_data.get("cast_members_id", [])),
+            ratings=frozenset(
+                Rating[rating] for rating in input_data.get("rating", [])
+            ),
+            published=input_data["published"],
+            launch_year_min=input_data.get("year_launched_min"),
+            launch_year_max=input_data.get("year_launched_max"),
+            media_status=MediaStatus[media_status] if media_status else None,
+        ),
+    )
+
+
+def to_create_input(input_data: dict) -> CreateVideoWithoutMedia.Input:
+    return CreateVideoWithoutMedia.Input(
+        title=input_data["title"],
+        description=input_data["description"],
+        launch_year=input_data["year_launched"],
+        opened=input_data["opened"],
+        duration=input_data["duration"],
+        rating=Rating[input_data["rating"]],
+        categories=set(input_data["categories_id"]),
+        genres=set(input_data["genres_id"]),
+        cast_members=set(input_data["cast_members_id"]),
+    )
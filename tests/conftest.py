@@ -0,0 +1,2 @@
+# Mesmo storage em memória dos testes em src/ (MEDIA_STORAGE via settings)
+from src.django_project.conftest import media_storage  # noqa: F401
@@ -4,7 +4,6 @@ import time
 import pika
 from rest_framework.test import APIClient
 from django.test import override_settings
-from unittest.mock import patch
 from uuid import UUID
 
 
@@ -108,31 +107,28 @@ class TestVideoMediaProcessing:
         # Criar um arquivo de teste
         test_file_content = b"fake video content for testing"
         
-        with patch('src.django_project.video_app.middleware.InMemoryStorage') as mock_storage:
-            mock_storage.return_value.store.return_value = None
-            
-            # Criar um arquivo temporário para o teste
-            from django.core.files.uploadedfile import SimpleUploadedFile
-            test_file = SimpleUploadedFile(
-                "test_video.mp4",
-                test_file_content,
-                content_type="video/mp4"
-            )
-            
-            upload_response = api_client.post(
-                f"/api/videos/{video_id}/upload-media/",
-                {"file": test_file},
-                format="multipart",
-            )
-            
-            # Debug: mostrar detalhes do erro
-            if upload_response.status_code != 200:
-                print(f"Erro na API de upload: {upload_response.status_code}")
-                print(f"Resposta: {upload_response.data}")
-                print(f"Headers: {upload_response.headers}")
-            
-            assert upload_response.status_code == 200
-            print(f"Mídia enviada para o video: {video_id}")
+        # Criar um arquivo temporário para o teste (storage em memória: conftest)
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        test_file = SimpleUploadedFile(
+            "test_video.mp4",
+            test_file_content,
+            content_type="video/mp4"
+        )
+        
+        upload_response = api_client.post(
+            f"/api/videos/{video_id}/upload-media/",
+            {"file": test_file},
+            format="multipart",
+        )
+        
+        # Debug: mostrar detalhes do erro
+        if upload_response.status_code != 200:
+            print(f"Erro na API de upload: {upload_response.status_code}")
+            print(f"Resposta: {upload_response.data}")
+            print(f"Headers: {upload_response.headers}")
+        
+        assert upload_response.status_code == 200
+        print(f"Mídia enviada para o video: {video_id}")
         
         # 6. Publicar evento na fila videos.converted
         message = {
@@ -248,23 +244,20 @@ class TestVideoMediaProcessingWithError:
         # Upload de mídia
         test_file_content = b"fake video content for testing"
         
-        with patch('src.django_project.video_app.middleware.InMemoryStorage') as mock_storage:
-            mock_storage.return_value.store.return_value = None
-            
-            # Criar um arquivo temporário para o teste
-            from django.core.files.uploadedfile import SimpleUploadedFile
-            test_file = SimpleUploadedFile(
-                "test_video.mp4",
-                test_file_content,
-                content_type="video/mp4"
-            )
-            
-            upload_response = api_client.post(
-                f"/api/videos/{video_id}/upload-media/",
-                {"file": test_file},
-                format="multipart",
-            )
-            assert upload_response.status_code == 200
+        # Criar um arquivo temporário para o teste (storage em memória: conftest)
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        test_file = SimpleUploadedFile(
+            "test_video.mp4",
+            test_file_content,
+            content_type="video/mp4"
+        )
+        
+        upload_response = api_client.post(
+            f"/api/videos/{video_id}/upload-media/",
+            {"file": test_file},
+            format="multipart",
+        )
+        assert upload_response.status_code == 200
         
         # Publicar evento de erro
         error_message = {